@@ -0,0 +1,437 @@
+"""
+Bulk maintenance tool for users and messages
+Streams rows in keyset batches, checks uniqueness once per batch and
+writes with bulk UPDATE ... FROM (VALUES ...) or COPY.
+Progress is checkpointed after every batch, so an interrupted run resumes.
+
+Usage:
+    python bulk_tool.py backfill-share-codes
+    python bulk_tool.py regenerate-identifiers [--all]
+    python bulk_tool.py export users --output users.csv
+    python bulk_tool.py export messages --output messages.jsonl --format jsonl
+    python bulk_tool.py import users --input users.csv
+
+Common options: --batch-size N, --from-start (ignore saved checkpoint)
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import time
+from datetime import datetime, date
+from sqlalchemy import text, update, Integer, String
+from sqlalchemy.exc import IntegrityError
+from database import Session
+from models.user import User
+from models.message import AnonymousMessage
+from models.identifier import generate_unique_identifiers, parse_identifier
+from utils.share_code import generate_unique_share_codes
+from utils.helpers import values_table
+
+CHECKPOINT_FILE = ".bulk_tool_state.json"
+DEFAULT_BATCH_SIZE = 1000
+
+# Retries when a concurrent write takes a code between check and update
+MAX_BATCH_RETRIES = 3
+
+TABLES = {
+    "users": User,
+    "messages": AnonymousMessage
+}
+
+# NULL marker used in COPY input
+COPY_NULL = "\\N"
+
+
+# ==================== Checkpoints & Progress ====================
+
+def load_checkpoint(job: str) -> dict:
+    """Get saved state of a job (empty dict if none)"""
+    if not os.path.exists(CHECKPOINT_FILE):
+        return {}
+    with open(CHECKPOINT_FILE, encoding="utf-8") as f:
+        return json.load(f).get(job, {})
+
+
+def save_checkpoint(job: str, state: dict):
+    """Save job state atomically"""
+    data = {}
+    if os.path.exists(CHECKPOINT_FILE):
+        with open(CHECKPOINT_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+
+    if state is None:
+        data.pop(job, None)
+    else:
+        data[job] = state
+
+    tmp_path = CHECKPOINT_FILE + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, CHECKPOINT_FILE)
+
+
+def clear_checkpoint(job: str):
+    save_checkpoint(job, None)
+
+
+class Progress:
+    """Prints one progress line per batch"""
+
+    def __init__(self, label: str, total: int = None, done: int = 0):
+        self.label = label
+        self.total = total
+        self.done = done
+        self.started = time.monotonic()
+
+    def update(self, count: int):
+        self.done += count
+        elapsed = time.monotonic() - self.started
+        rate = self.done / elapsed if elapsed else 0
+        total = f"/{self.total}" if self.total is not None else ""
+        print(f"  [{self.done}{total}] {self.label} ({rate:.0f} rows/s)")
+
+    def finish(self):
+        elapsed = time.monotonic() - self.started
+        print(f"✅ {self.label}: {self.done} rows in {elapsed:.1f}s")
+
+
+def iter_keyset(db, model, columns: list, batch_size: int, after_id: int = 0, criteria: list = None):
+    """
+    Yield batches of rows ordered by id using keyset pagination
+    (WHERE id > last_id ORDER BY id LIMIT n), never OFFSET or .all()
+    """
+    last_id = after_id
+    while True:
+        rows = db.query(model.id, *columns).filter(
+            model.id > last_id,
+            *(criteria or [])
+        ).order_by(model.id).limit(batch_size).all()
+
+        if not rows:
+            return
+
+        yield rows
+        last_id = rows[-1].id
+
+
+def _run_batch(db, write):
+    """Run one batch write with retries on unique violations"""
+    for attempt in range(1, MAX_BATCH_RETRIES + 1):
+        try:
+            write()
+            db.commit()
+            return
+        except IntegrityError:
+            db.rollback()
+            if attempt == MAX_BATCH_RETRIES:
+                raise
+            print("  ⚠️ Unique collision in batch, retrying with new values...")
+
+
+# ==================== Backfills ====================
+
+def backfill_share_codes(batch_size: int = DEFAULT_BATCH_SIZE, from_start: bool = False) -> int:
+    """
+    Give every user without a share code a unique one
+
+    Returns:
+        Number of users updated
+    """
+    job = "backfill-share-codes"
+    state = {} if from_start else load_checkpoint(job)
+    after_id = state.get("last_id", 0)
+
+    db = Session()
+    try:
+        missing = (User.share_code == None) | (User.share_code == '')  # noqa: E711
+        total = db.query(User.id).filter(missing, User.id > after_id).count()
+        progress = Progress("share codes", total)
+
+        for rows in iter_keyset(db, User, [], batch_size, after_id, [missing]):
+            def write():
+                codes = generate_unique_share_codes(len(rows), db)
+                v = values_table("v", {"id": Integer(), "share_code": String(9)}, [
+                    {"id": row.id, "share_code": code} for row, code in zip(rows, codes)
+                ])
+                db.execute(update(User).where(User.id == v.c.id).values(
+                    share_code=v.c.share_code,
+                    updated_at=User.updated_at
+                ).execution_options(synchronize_session=False))
+
+            _run_batch(db, write)
+            save_checkpoint(job, {"last_id": rows[-1].id})
+            progress.update(len(rows))
+
+        clear_checkpoint(job)
+        progress.finish()
+        return progress.done
+    finally:
+        db.close()
+
+
+def regenerate_identifiers(batch_size: int = DEFAULT_BATCH_SIZE, all_users: bool = False,
+                           from_start: bool = False) -> int:
+    """
+    Regenerate user identifiers
+
+    By default only identifiers that don't parse as user identifiers are
+    replaced; with all_users every user gets a new one. Identifiers copied
+    into anonymous_messages are rewritten in the same transaction.
+
+    Returns:
+        Number of users updated
+    """
+    job = "regenerate-identifiers"
+    state = {} if from_start else load_checkpoint(job)
+    after_id = state.get("last_id", 0)
+
+    db = Session()
+    try:
+        progress = Progress("identifiers", done=state.get("updated", 0))
+
+        for rows in iter_keyset(db, User, [User.identifier, User.member_number], batch_size, after_id):
+            targets = [
+                row for row in rows
+                if all_users or parse_identifier(row.identifier)["type"] != "user"
+            ]
+
+            if targets:
+                def write():
+                    new_ids = generate_unique_identifiers(
+                        "Ua", [row.member_number for row in targets], db
+                    )
+                    mapping = [
+                        {"id": row.id, "old": row.identifier, "new": new_id}
+                        for row, new_id in zip(targets, new_ids)
+                    ]
+                    v = values_table("v", {
+                        "id": Integer(), "old": String(20), "new": String(20)
+                    }, mapping)
+
+                    db.execute(update(User).where(User.id == v.c.id).values(
+                        identifier=v.c.new,
+                        updated_at=User.updated_at
+                    ).execution_options(synchronize_session=False))
+
+                    for column in ("sender_identifier", "recipient_identifier"):
+                        db.execute(update(AnonymousMessage).where(
+                            getattr(AnonymousMessage, column) == v.c.old
+                        ).values(**{
+                            column: v.c.new,
+                            "updated_at": AnonymousMessage.updated_at
+                        }).execution_options(synchronize_session=False))
+
+                _run_batch(db, write)
+                progress.update(len(targets))
+
+            save_checkpoint(job, {"last_id": rows[-1].id, "updated": progress.done})
+
+        clear_checkpoint(job)
+        progress.finish()
+        return progress.done
+    finally:
+        db.close()
+
+
+# ==================== Export / Import ====================
+
+def _serialize(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def export_table(name: str, path: str, fmt: str = "csv", batch_size: int = DEFAULT_BATCH_SIZE,
+                 from_start: bool = False) -> int:
+    """
+    Stream a table to CSV or JSONL
+
+    A resumed export appends to the existing file after the last written id.
+
+    Returns:
+        Number of rows written
+    """
+    model = TABLES[name]
+    columns = [column.name for column in model.__table__.columns]
+    job = f"export-{name}:{path}"
+    state = {} if from_start else load_checkpoint(job)
+    after_id = state.get("last_id", 0)
+    resuming = after_id > 0 and os.path.exists(path)
+
+    db = Session()
+    try:
+        total = db.query(model.id).filter(model.id > after_id).count()
+        progress = Progress(f"export {name}", total)
+
+        with open(path, "a" if resuming else "w", encoding="utf-8", newline="") as f:
+            writer = None
+            if fmt == "csv":
+                writer = csv.writer(f)
+                if not resuming:
+                    writer.writerow(columns)
+
+            table_columns = [getattr(model, column) for column in columns if column != "id"]
+            for rows in iter_keyset(db, model, table_columns, batch_size, after_id):
+                for row in rows:
+                    values = [_serialize(getattr(row, column)) for column in columns]
+                    if writer:
+                        writer.writerow(values)
+                    else:
+                        f.write(json.dumps(dict(zip(columns, values)), ensure_ascii=False) + "\n")
+
+                f.flush()
+                save_checkpoint(job, {"last_id": rows[-1].id})
+                progress.update(len(rows))
+
+        clear_checkpoint(job)
+        progress.finish()
+        return progress.done
+    finally:
+        db.close()
+
+
+def _read_records(path: str, fmt: str):
+    """Yield input records as dicts; CSV empty fields become None"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for record in csv.DictReader(f):
+                yield {key: (value if value != "" else None) for key, value in record.items()}
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _copy_batch(db, table: str, columns: list, records: list) -> int:
+    """
+    COPY a batch into a temp table and merge it with INSERT ... ON CONFLICT DO NOTHING
+
+    Returns:
+        Number of rows inserted
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow([
+            COPY_NULL if record.get(column) is None else record[column]
+            for column in columns
+        ])
+    buffer.seek(0)
+
+    column_list = ", ".join(columns)
+    staging = f"import_{table}"
+
+    db.execute(text(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"))
+
+    cursor = db.connection().connection.cursor()
+    cursor.copy_expert(
+        f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+        buffer
+    )
+
+    result = db.execute(text(
+        f"INSERT INTO {table} ({column_list}) "
+        f"SELECT {column_list} FROM {staging} ON CONFLICT DO NOTHING"
+    ))
+    db.commit()
+    return result.rowcount
+
+
+def import_table(name: str, path: str, fmt: str = "csv", batch_size: int = DEFAULT_BATCH_SIZE,
+                 from_start: bool = False) -> int:
+    """
+    Load a CSV/JSONL file produced by export_table
+
+    Rows whose id or unique keys already exist are skipped, so re-running
+    an import is safe. The id sequence is moved past the imported ids.
+
+    Returns:
+        Number of rows inserted
+    """
+    model = TABLES[name]
+    table = model.__tablename__
+    table_columns = [column.name for column in model.__table__.columns]
+    job = f"import-{name}:{path}"
+    state = {} if from_start else load_checkpoint(job)
+    skip = state.get("records", 0)
+
+    db = Session()
+    try:
+        progress = Progress(f"import {name}", done=state.get("inserted", 0))
+        consumed = 0
+        columns = None
+        batch = []
+
+        def flush():
+            nonlocal batch
+            if batch:
+                inserted = _copy_batch(db, table, columns, batch)
+                save_checkpoint(job, {"records": consumed, "inserted": progress.done + inserted})
+                progress.update(inserted)
+                batch = []
+
+        for record in _read_records(path, fmt):
+            consumed += 1
+            if consumed <= skip:
+                continue
+
+            if columns is None:
+                columns = [column for column in table_columns if column in record]
+
+            batch.append(record)
+            if len(batch) >= batch_size:
+                flush()
+
+        flush()
+
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 1))"
+        ))
+        db.commit()
+
+        clear_checkpoint(job)
+        progress.finish()
+        return progress.done
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="eynVu bulk maintenance tool")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--from-start", action="store_true", help="Ignore saved checkpoint")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("backfill-share-codes", help="Generate missing share codes")
+
+    regenerate = commands.add_parser("regenerate-identifiers", help="Replace malformed identifiers")
+    regenerate.add_argument("--all", action="store_true", help="Regenerate every user's identifier")
+
+    export = commands.add_parser("export", help="Export a table to CSV/JSONL")
+    export.add_argument("table", choices=list(TABLES))
+    export.add_argument("--output", required=True)
+    export.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+
+    load = commands.add_parser("import", help="Import a table from CSV/JSONL")
+    load.add_argument("table", choices=list(TABLES))
+    load.add_argument("--input", required=True)
+    load.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print(f"BULK TOOL: {args.command}")
+    print("=" * 50)
+
+    if args.command == "backfill-share-codes":
+        backfill_share_codes(args.batch_size, args.from_start)
+    elif args.command == "regenerate-identifiers":
+        regenerate_identifiers(args.batch_size, args.all, args.from_start)
+    elif args.command == "export":
+        export_table(args.table, args.output, args.format, args.batch_size, args.from_start)
+    elif args.command == "import":
+        import_table(args.table, args.input, args.format, args.batch_size, args.from_start)
@@ -48,7 +48,106 @@ class Config:
     # Limits
     MAX_NICKNAME_LENGTH = 13
     MAX_PLAYLIST_SONGS = 9
+    MAX_PLAYLISTS_PER_USER = 5
     GALLERY_SLIDE_INTERVAL = 900  # 15 minutes in seconds
+    GALLERY_TICK_INTERVAL = 30  # Slideshow slot length (chats are spread over SLIDE / TICK slots)
+    
+    # Background Jobs (seconds)
+    METRICS_FLUSH_INTERVAL = 30
+    ACTIVITY_FLUSH_INTERVAL = 60
+    PRESENCE_FLUSH_INTERVAL = 60
+    PODCAST_PROGRESS_FLUSH_INTERVAL = 60
+    BILLBOARD_FLUSH_INTERVAL = 60
+    BILLBOARD_REFRESH_INTERVAL = 60  # Rotation rebuild (campaign start/end times)
+    
+    # Library Search ("memory" = in-process inverted index, "postgres" = full-text search)
+    LIBRARY_SEARCH_BACKEND = os.getenv("LIBRARY_SEARCH_BACKEND", "memory")
+    LIBRARY_PAGE_SIZE = 8
+    
+    # Radio
+    RADIO_PAGE_SIZE = 10
+    STATION_LISTING_TTL = 60  # Seconds a cached listing page is served
+    BROADCAST_BATCH_SIZE = 500  # Subscribers loaded per query
+    BROADCAST_PROGRESS_INTERVAL = 5  # Seconds between progress message edits
+    
+    # Podcasts
+    PODCAST_PAGE_SIZE = 8
+    PODCAST_CACHE_TTL = 300  # Seconds an episode / catalog page is served from memory
+    
+    # Code Cafe
+    CODE_CAFE_PAGE_SIZE = 10
+    CODE_CAFE_CACHE_TTL = 6 * 3600  # Rendered pages are keyed by content version; TTL only bounds memory
+    CODE_CAFE_VERSION_TTL = 30  # Seconds before versions are re-read (edits from other processes)
+    
+    # Global Search (/search and inline mode)
+    SEARCH_RESULT_LIMIT = 20  # Hits per query (inline answers allow up to 50)
+    SEARCH_PAGE_SIZE = 10  # Hits shown as buttons under /search
+    SEARCH_MIN_QUERY_LENGTH = 2
+    SEARCH_INLINE_DEBOUNCE = 0.3  # Seconds an inline keystroke waits for the next one
+    SEARCH_CACHE_TTL = 30  # Seconds a result is served from memory (and by Telegram's inline cache)
+    
+    # Billboard
+    BILLBOARD_DAILY_CAP = 3  # Default impressions per user per campaign per day
+    BILLBOARD_CAP_KEYS = 300_000  # Expected (campaign, user) pairs seen a day; sizes the cap sketch (~4 MB)
+    BILLBOARD_CAP_ERROR = 0.001  # Share of users under a cap the sketch may wrongly count as capped
+    
+    # Group Manager
+    GROUP_SETTINGS_TTL = 300  # Seconds per-group data (roles, word filters, link / forward rules, warnings) is served from memory
+    GROUP_SETTINGS_SYNC_INTERVAL = 5  # Seconds between checks for settings other workers changed
+    GROUP_SETTINGS_SYNC_SLACK = 30  # Seconds each check overlaps the previous one (commit delays)
+    MAX_BANNED_WORDS = 2000  # Per group (and for the global list)
+    MAX_LINK_RULES = 5000  # Allowed + denied domains per group
+    MAX_FORWARD_RULES = 1000  # Allowed + denied forward sources per group
+    
+    # Anti-Spam (features/group_manager/filters/spam.py)
+    SPAM_DEFAULT_ACTION = "mute"  # off / warn / mute / ban
+    SPAM_FLOOD_LIMIT = 6  # Messages per user per window
+    SPAM_FLOOD_WINDOW = 10  # Seconds
+    SPAM_REPEAT_LIMIT = 2  # Earlier copies of a text (near-duplicates) allowed per window
+    SPAM_REPEAT_WINDOW = 120  # Seconds
+    SPAM_REPEAT_DISTANCE = 10  # SimHash bits two texts may differ by (one changed word in ~15 is ~8-9 bits)
+    SPAM_REPEAT_MIN_LENGTH = 20  # Shorter messages ("سلام", "مرسی") are never fingerprinted
+    SPAM_REPEAT_MAX_LENGTH = 1000  # Characters fingerprinted per message
+    SPAM_MUTE_SECONDS = 3600
+    SPAM_PUNISH_COOLDOWN = 60  # Seconds before the same user is punished again
+    SPAM_MAX_KEYS = 100_000  # Bound on tracked users / chats per counter
+    SPAM_NOTICE_WINDOW = 15  # Seconds spam actions in a chat are collected into one notice
+    SPAM_NOTICE_MAX_MENTIONS = 10  # Users named per action in one notice ("+N more" after that)
+    SPAM_NOTICE_FLUSH_INTERVAL = 1  # Seconds between checks for due notices
+    RAID_WINDOW = 60  # Seconds
+    RAID_CHAT_JOINS = 30  # Joins per chat per window that start raid mode
+    RAID_USER_CHATS = 4  # Groups one account may join per window
+    RAID_GLOBAL_JOINS = 300  # Joins across all groups per window that start raid mode everywhere
+    RAID_MODE_SECONDS = 600
+    CAPTCHA_DEFAULT_MODE = "off"  # off / raid / on
+    CAPTCHA_KINDS = ("image", "math", "button")  # Image needs Pillow; skipped without it
+    CAPTCHA_TIMEOUT = 120  # Seconds to answer before being kicked
+    CAPTCHA_MAX_ATTEMPTS = 2  # Wrong answers before being kicked
+    CAPTCHA_BATCH_SIZE = 20  # Joiners sharing one challenge message
+    CAPTCHA_FLUSH_INTERVAL = 1.5  # Seconds between batches of restrict / challenge / kick calls
+    CAPTCHA_POOL_SIZE = 200  # Image challenges kept rendered
+    CAPTCHA_RENDER_WORKERS = 2  # Processes rendering images
+    WARN_LIMIT = 3  # Warnings before WARN_ACTION
+    WARN_ACTION = "mute"  # mute / ban
+    WARN_ACTION_SECONDS = 86400  # Length of that mute / ban (0 = until lifted by hand)
+    SANCTION_TICK_INTERVAL = 5  # Seconds between checks for expired mutes / bans
+    SANCTION_BATCH_SIZE = 500  # Expired sanctions lifted per query
+    SANCTION_RETRY_SECONDS = 60  # Lease on a sanction being lifted: retried after this if the lift failed or was cut off
+    SANCTION_MAX_LIFT_ATTEMPTS = 10  # Failed lifts before the record is dropped (bot lost its rights, ...)
+    WELCOME_WINDOW = 5  # Seconds joins are collected into one welcome
+    WELCOME_MIN_INTERVAL = 30  # Seconds between two welcomes in one group
+    WELCOME_MAX_MENTIONS = 30  # Members named in one welcome ("+N more" after that)
+    WELCOME_MAX_LENGTH = 1000  # Characters of a custom template
+    WELCOME_FLUSH_INTERVAL = 1  # Seconds between checks for due welcomes
+    AUTO_LOCK_UTC_OFFSET = 210  # Minutes; schedule times are Iran time (UTC+3:30)
+    AUTO_LOCK_TICK_INTERVAL = 15  # Seconds between checks for due lock windows
+    AUTO_LOCK_CATCHUP = 300  # Seconds of transitions still applied after a restart
+    MAX_LOCK_SCHEDULES = 10  # Windows per group
+    ADMIN_CACHE_TTL = 600  # Seconds a chat's admin list is trusted (chat_member updates patch it sooner)
+    
+    # Bulk Sender (utils/sender.py)
+    SENDER_RATE = 25  # Messages per second, under Telegram's ~30/s limit
+    SENDER_CONCURRENCY = 10  # Requests in flight
     
     # Identifier Format
     IDENTIFIER_PREFIX = "Ua"  # User anonymous
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine, text
+import os
+from sqlalchemy import create_engine, text, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from config import Config
@@ -26,12 +27,52 @@ Session = scoped_session(SessionLocal)
 Base = declarative_base()
 
 
+def run_migrations(revision: str = "head"):
+    """Apply Alembic migrations (same as `alembic upgrade head`)"""
+    from alembic import command
+    command.upgrade(get_alembic_config(), revision)
+
+
+def get_alembic_config():
+    """Alembic config that works regardless of the working directory"""
+    from alembic.config import Config as AlembicConfig
+    
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    alembic_cfg = AlembicConfig(os.path.join(base_dir, "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", os.path.join(base_dir, "migrations"))
+    alembic_cfg.attributes["configure_logger"] = False
+    return alembic_cfg
+
+
 def init_db():
-    """Initialize database and create all tables"""
+    """
+    Initialize database schema
+    
+    - Fresh database: create all tables and stamp the Alembic head
+    - Database managed by Alembic: apply pending migrations
+    - Database created before Alembic: only create missing tables;
+      run `alembic stamp 0001 && alembic upgrade head` once to adopt it
+    
+    Changes to existing tables (columns, indexes, constraints) go through
+    Alembic revisions (see migrations/online.py), never through create_all.
+    """
     try:
-        from models import user, identifier, log, message
-        Base.metadata.create_all(bind=engine)
-        print("✅ Database tables created successfully!")
+        from models import user, identifier, log, message, metric, presence, book, station, station_post, gallery, playlist, podcast, code_resource, billboard, bookmark, group
+        
+        tables = inspect(engine).get_table_names()
+        
+        if "alembic_version" in tables:
+            run_migrations()
+        elif "users" not in tables:
+            from alembic import command
+            Base.metadata.create_all(bind=engine)
+            command.stamp(get_alembic_config(), "head")
+        else:
+            Base.metadata.create_all(bind=engine)
+            print("⚠️  Database is not managed by Alembic yet. Run once: "
+                  "alembic stamp 0001 && alembic upgrade head")
+        
+        print("✅ Database schema is up to date!")
         return True
     except Exception as e:
         print(f"❌ Database initialization failed: {e}")
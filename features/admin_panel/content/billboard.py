@@ -0,0 +1,122 @@
+"""
+Admin: billboard campaigns
+Changes rebuild the rotation immediately.
+
+/addbillboard  - /addbillboard <weight> text | details | url
+/billboards    - active campaigns with impressions and clicks
+/bbweight      - /bbweight <id> <weight>
+/delbillboard  - /delbillboard <id>
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.billboard.manager import (
+    add_campaign,
+    set_weight,
+    deactivate_campaign,
+    list_campaigns,
+    flush_billboard_counters
+)
+from config import Config
+
+
+async def add_billboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addbillboard <weight> text | details | url"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    args = context.args or []
+    parts = [part.strip() for part in " ".join(args[1:]).split("|")]
+    if not args or not args[0].isdigit() or not parts[0]:
+        await update.message.reply_text(
+            "📢 استفاده:\n/addbillboard <وزن> متن | توضیحات | لینک\n\n"
+            "وزن بیشتر = نمایش بیشتر. توضیحات و لینک اختیاری‌اند."
+        )
+        return
+
+    url = parts[2] if len(parts) > 2 and parts[2].startswith(("http://", "https://")) else None
+    db = Session()
+    try:
+        campaign = add_campaign(
+            db,
+            text=parts[0],
+            details=parts[1] if len(parts) > 1 and parts[1] else None,
+            url=url,
+            weight=int(args[0]),
+            added_by=update.effective_user.id
+        )
+        await update.message.reply_text(f"✅ بیلبورد اضافه شد! (🆔 {campaign.id})")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding billboard: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در افزودن بیلبورد!")
+    finally:
+        db.close()
+
+
+async def list_billboards_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /billboards"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    flush_billboard_counters()
+    db = Session()
+    try:
+        campaigns = list_campaigns(db)
+        if not campaigns:
+            await update.message.reply_text("📢 بیلبورد فعالی نیست.")
+            return
+
+        lines = ["📢 بیلبوردهای فعال\n"]
+        for campaign in campaigns:
+            ctr = campaign.clicks / campaign.impressions * 100 if campaign.impressions else 0
+            lines.append(
+                f"🆔 {campaign.id} | ⚖️ {campaign.weight}\n"
+                f"{campaign.text[:60]}\n"
+                f"👁️ {campaign.impressions} | 👆 {campaign.clicks} ({ctr:.1f}%)\n"
+            )
+        await update.message.reply_text("\n".join(lines))
+    finally:
+        db.close()
+
+
+async def billboard_weight_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /bbweight <id> <weight>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    args = context.args or []
+    if len(args) != 2 or not args[0].isdigit() or not args[1].isdigit():
+        await update.message.reply_text("استفاده: /bbweight <id> <وزن>")
+        return
+
+    db = Session()
+    try:
+        if set_weight(db, int(args[0]), int(args[1])):
+            await update.message.reply_text("✅ وزن بیلبورد تغییر کرد.")
+        else:
+            await update.message.reply_text("❌ بیلبوردی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
+
+
+async def delete_billboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delbillboard <id>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    if not context.args or not context.args[0].isdigit():
+        await update.message.reply_text("استفاده: /delbillboard <id>")
+        return
+
+    db = Session()
+    try:
+        if deactivate_campaign(db, int(context.args[0])):
+            await update.message.reply_text("🗑️ بیلبورد حذف شد.")
+        else:
+            await update.message.reply_text("❌ بیلبوردی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
@@ -0,0 +1,101 @@
+"""
+Admin: library books
+Books are searchable as soon as they are added; the search index is
+updated in place (see features/cafe/library/search.py).
+
+/addbook  - reply to a document with: title | author | category | description
+/delbook  - /delbook <id>
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.library.books import add_book, deactivate_book
+from features.cafe.library.categories import CATEGORIES, get_category_label
+from config import Config
+
+
+def parse_book_caption(text: str) -> dict:
+    """
+    Parse "title | author | category | description" (only title is required)
+
+    Returns:
+        dict with title/author/category/description, or None if there is no title
+    """
+    parts = [part.strip() for part in (text or "").split("|")]
+    parts += [""] * (4 - len(parts))
+    title, author, category = parts[0], parts[1], parts[2]
+    description = " | ".join(parts[3:]).strip()
+
+    if not title:
+        return None
+
+    return {
+        "title": title,
+        "author": author or None,
+        "category": category if category in CATEGORIES else "other",
+        "description": description or None
+    }
+
+
+async def add_book_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addbook (as a reply to the book document)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    message = update.message
+    replied = message.reply_to_message
+    if not replied or not replied.document:
+        await message.reply_text(
+            "📚 روی فایل کتاب ریپلای کن و بنویس:\n"
+            "/addbook عنوان | نویسنده | دسته | توضیحات\n\n"
+            f"دسته‌ها: {', '.join(CATEGORIES)}"
+        )
+        return
+
+    fields = parse_book_caption(" ".join(context.args))
+    if not fields:
+        await message.reply_text("❌ عنوان کتاب رو وارد کن!")
+        return
+
+    db = Session()
+    try:
+        book = add_book(
+            db,
+            file_id=replied.document.file_id,
+            added_by=update.effective_user.id,
+            **fields
+        )
+        await message.reply_text(
+            f"✅ کتاب اضافه شد!\n\n"
+            f"🆔 {book.id}\n"
+            f"📖 {book.title}\n"
+            f"🗂️ {get_category_label(book.category)}"
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding book: {e}")
+        traceback.print_exc()
+        await message.reply_text("❌ خطا در افزودن کتاب!")
+    finally:
+        db.close()
+
+
+async def delete_book_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delbook <id>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    if not context.args or not context.args[0].isdigit():
+        await update.message.reply_text("استفاده: /delbook <id>")
+        return
+
+    db = Session()
+    try:
+        if deactivate_book(db, int(context.args[0])):
+            await update.message.reply_text("🗑️ کتاب حذف شد.")
+        else:
+            await update.message.reply_text("❌ کتابی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
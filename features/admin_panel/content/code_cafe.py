@@ -0,0 +1,140 @@
+"""
+Admin: code cafe resources
+Every change bumps the language's content version, so only that
+language's cached pages are re-rendered.
+
+/addsnippet    - reply to the code with: /addsnippet <language> title | description
+/addlink       - /addlink <language> <url> title | description
+/editresource  - /editresource <id> [title | description] (reply to new code/URL to replace it)
+/delresource   - /delresource <id>
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.code_cafe.resources import add_resource, update_resource, deactivate_resource
+from features.cafe.code_cafe.languages import LANGUAGES, is_valid_language
+from config import Config
+
+
+def parse_title(text: str) -> tuple:
+    """Split "title | description" (description is optional)"""
+    title, _, description = (text or "").partition("|")
+    return title.strip(), description.strip() or None
+
+
+async def _save_resource(update: Update, language: str, kind: str, content: str, text: str):
+    title, description = parse_title(text)
+    if not title:
+        await update.message.reply_text("❌ عنوان رو وارد کن!")
+        return
+
+    db = Session()
+    try:
+        resource = add_resource(
+            db,
+            language=language,
+            kind=kind,
+            title=title,
+            content=content,
+            description=description,
+            added_by=update.effective_user.id
+        )
+        await update.message.reply_text(f"✅ اضافه شد! (🆔 {resource.id})")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding code resource: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در افزودن منبع!")
+    finally:
+        db.close()
+
+
+async def add_snippet_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addsnippet <language> title | description (as a reply to the code)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    replied = update.message.reply_to_message
+    if not replied or not replied.text or not context.args or not is_valid_language(context.args[0]):
+        await update.message.reply_text(
+            "📄 روی پیام کد ریپلای کن و بنویس:\n"
+            "/addsnippet <زبان> عنوان | توضیحات\n\n"
+            f"زبان‌ها: {', '.join(LANGUAGES)}"
+        )
+        return
+
+    await _save_resource(update, context.args[0], "snippet", replied.text, " ".join(context.args[1:]))
+
+
+async def add_link_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addlink <language> <url> title | description"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    args = context.args or []
+    if len(args) < 3 or not is_valid_language(args[0]) or not args[1].startswith(("http://", "https://")):
+        await update.message.reply_text(
+            "🔗 استفاده:\n/addlink <زبان> <لینک> عنوان | توضیحات\n\n"
+            f"زبان‌ها: {', '.join(LANGUAGES)}"
+        )
+        return
+
+    await _save_resource(update, args[0], "link", args[1], " ".join(args[2:]))
+
+
+async def edit_resource_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /editresource <id> [title | description] (optionally as a reply to the new content)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    replied = update.message.reply_to_message
+    content = replied.text if replied and replied.text else None
+    if not context.args or not context.args[0].isdigit() or (len(context.args) < 2 and not content):
+        await update.message.reply_text(
+            "✏️ استفاده: /editresource <id> عنوان | توضیحات\n"
+            "برای تغییر کد یا لینک، روی متن جدید ریپلای کن."
+        )
+        return
+
+    title, description = parse_title(" ".join(context.args[1:]))
+    db = Session()
+    try:
+        resource = update_resource(
+            db,
+            int(context.args[0]),
+            title=title or None,
+            description=description,
+            content=content
+        )
+        if resource:
+            await update.message.reply_text("✅ منبع ویرایش شد.")
+        else:
+            await update.message.reply_text("❌ منبعی با این شناسه پیدا نشد!")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error editing code resource: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ویرایش منبع!")
+    finally:
+        db.close()
+
+
+async def delete_resource_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delresource <id>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    if not context.args or not context.args[0].isdigit():
+        await update.message.reply_text("استفاده: /delresource <id>")
+        return
+
+    db = Session()
+    try:
+        if deactivate_resource(db, int(context.args[0])):
+            await update.message.reply_text("🗑️ منبع حذف شد.")
+        else:
+            await update.message.reply_text("❌ منبعی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
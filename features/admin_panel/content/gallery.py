@@ -0,0 +1,62 @@
+"""
+Admin: gallery images
+New images join the slideshow rotation on the next tick.
+
+/addimage  - reply to a photo (optional caption after the command)
+/delimage  - /delimage <id>
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.gallery.manager import add_image, deactivate_image
+from config import Config
+
+
+async def add_image_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addimage (as a reply to the photo)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    message = update.message
+    replied = message.reply_to_message
+    if not replied or not replied.photo:
+        await message.reply_text("🖼️ روی عکس ریپلای کن و بنویس:\n/addimage کپشن (اختیاری)")
+        return
+
+    db = Session()
+    try:
+        image = add_image(
+            db,
+            file_id=replied.photo[-1].file_id,
+            caption=" ".join(context.args) or replied.caption,
+            added_by=update.effective_user.id
+        )
+        await message.reply_text(f"✅ عکس به گالری اضافه شد! (🆔 {image.id})")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding gallery image: {e}")
+        traceback.print_exc()
+        await message.reply_text("❌ خطا در افزودن عکس!")
+    finally:
+        db.close()
+
+
+async def delete_image_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delimage <id>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    if not context.args or not context.args[0].isdigit():
+        await update.message.reply_text("استفاده: /delimage <id>")
+        return
+
+    db = Session()
+    try:
+        if deactivate_image(db, int(context.args[0])):
+            await update.message.reply_text("🗑️ عکس از گالری حذف شد.")
+        else:
+            await update.message.reply_text("❌ عکسی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
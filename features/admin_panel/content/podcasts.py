@@ -0,0 +1,129 @@
+"""
+Admin: podcast episodes
+The replied audio is stored by file_id, so it is never uploaded again;
+replying to an audio that is already an episode returns that episode.
+
+/addepisode  - reply to an audio with: title | show | description
+/addchapter  - reply to an audio with: /addchapter <episode_id> [mm:ss] title
+/delepisode  - /delepisode <id>
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.podcast.catalog import add_episode, add_chapter, deactivate_episode
+from config import Config
+
+
+def parse_timestamp(text: str) -> int:
+    """Parse mm:ss or hh:mm:ss into seconds (None if it isn't a timestamp)"""
+    parts = text.split(":")
+    if not 2 <= len(parts) <= 3 or not all(part.isdigit() for part in parts):
+        return None
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + int(part)
+    return seconds
+
+
+async def add_episode_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addepisode (as a reply to the full episode audio, or any message for chapter-only episodes)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    message = update.message
+    replied = message.reply_to_message
+    parts = [part.strip() for part in " ".join(context.args).split("|")]
+    if not replied or not parts[0]:
+        await message.reply_text(
+            "🎙️ روی فایل صوتی اپیزود ریپلای کن و بنویس:\n"
+            "/addepisode عنوان | برنامه | توضیحات\n\n"
+            "برای اپیزودی که فقط فصل‌به‌فصل پخش می‌شه، روی هر پیامی ریپلای کن و بعد با /addchapter فصل‌ها رو اضافه کن."
+        )
+        return
+
+    audio = replied.audio
+    db = Session()
+    try:
+        episode, created = add_episode(
+            db,
+            title=parts[0],
+            show=parts[1] if len(parts) > 1 and parts[1] else None,
+            description=" | ".join(parts[2:]).strip() or None,
+            file_id=audio.file_id if audio else None,
+            file_unique_id=audio.file_unique_id if audio else None,
+            duration=audio.duration if audio else None,
+            added_by=update.effective_user.id
+        )
+        if created:
+            await message.reply_text(f"✅ اپیزود اضافه شد! (🆔 {episode.id})")
+        else:
+            await message.reply_text(f"ℹ️ این فایل قبلاً اضافه شده: 🆔 {episode.id} - {episode.title}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding podcast episode: {e}")
+        traceback.print_exc()
+        await message.reply_text("❌ خطا در افزودن اپیزود!")
+    finally:
+        db.close()
+
+
+async def add_chapter_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addchapter <episode_id> [mm:ss] title (as a reply to the chapter audio)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    message = update.message
+    replied = message.reply_to_message
+    if not replied or not replied.audio or not context.args or not context.args[0].isdigit():
+        await message.reply_text("📖 روی فایل صوتی فصل ریپلای کن و بنویس:\n/addchapter <id اپیزود> [mm:ss] عنوان")
+        return
+
+    args = context.args[1:]
+    start_seconds = parse_timestamp(args[0]) if args else None
+    if start_seconds is not None:
+        args = args[1:]
+
+    audio = replied.audio
+    db = Session()
+    try:
+        chapter = add_chapter(
+            db,
+            episode_id=int(context.args[0]),
+            file_id=audio.file_id,
+            file_unique_id=audio.file_unique_id,
+            duration=audio.duration,
+            start_seconds=start_seconds,
+            title=" ".join(args) or None
+        )
+        if chapter:
+            await message.reply_text(f"✅ فصل {chapter.number} اضافه شد!")
+        else:
+            await message.reply_text("❌ اپیزودی با این شناسه پیدا نشد!")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding podcast chapter: {e}")
+        traceback.print_exc()
+        await message.reply_text("❌ خطا در افزودن فصل!")
+    finally:
+        db.close()
+
+
+async def delete_episode_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delepisode <id>"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    if not context.args or not context.args[0].isdigit():
+        await update.message.reply_text("استفاده: /delepisode <id>")
+        return
+
+    db = Session()
+    try:
+        if deactivate_episode(db, int(context.args[0])):
+            await update.message.reply_text("🗑️ اپیزود حذف شد.")
+        else:
+            await update.message.reply_text("❌ اپیزودی با این شناسه پیدا نشد!")
+    finally:
+        db.close()
@@ -0,0 +1,245 @@
+"""
+Admin dashboard
+Signups, messages, active users and error rate over time.
+All numbers come from metric_buckets (see utils/metrics.py) and
+presence sketches (see utils/presence.py), so opening the dashboard
+never scans logs or anonymous_messages.
+
+JSON export without Telegram:
+    python -m features.admin_panel.dashboard --granularity hour --periods 24 --output stats.json
+"""
+
+import argparse
+import asyncio
+import json
+from datetime import datetime, timezone, timedelta
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from database import Session
+from models.metric import MetricBucket
+from utils.metrics import GRANULARITIES, bucket_start, flush_metrics
+from utils.presence import get_active_summary
+from config import Config
+
+DASHBOARD_METRICS = ["signups", "messages", "active_users", "events", "errors"]
+
+# Default number of buckets shown per granularity
+DEFAULT_PERIODS = {
+    "minute": 60,
+    "hour": 24
+}
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+# Features shown by /active (see handlers/tracking.py)
+PRESENCE_FEATURES = {
+    "all": "👥 همه",
+    "menu": "🏠 منو",
+    "send": "📨 ارسال نامه",
+    "cafe": "☕ کافه",
+    "rules": "📋 قوانین"
+}
+
+
+def get_dashboard_data(db, granularity: str = "hour", periods: int = None,
+                       now: datetime = None) -> dict:
+    """
+    Build dashboard series from metric buckets
+
+    Args:
+        db: Database session
+        granularity: "minute" or "hour"
+        periods: Number of buckets to include (ending with the current one)
+        now: Reference time (defaults to now, UTC)
+
+    Returns:
+        Dictionary with bucket labels, per-metric series, totals and error rate
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    periods = periods or DEFAULT_PERIODS[granularity]
+    step = timedelta(seconds=GRANULARITIES[granularity])
+    last = bucket_start(now or datetime.now(timezone.utc), granularity)
+    first = last - step * (periods - 1)
+
+    buckets = [first + step * i for i in range(periods)]
+    index = {start: i for i, start in enumerate(buckets)}
+    series = {metric: [0] * periods for metric in DASHBOARD_METRICS}
+
+    for row in MetricBucket.get_series(db, granularity, first):
+        start = row.bucket_start
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        i = index.get(start)
+        if i is not None and row.metric in series:
+            series[row.metric][i] = row.value
+
+    totals = {metric: sum(values) for metric, values in series.items()}
+    # Distinct users can't be summed across buckets, report the peak instead
+    totals["active_users"] = max(series["active_users"], default=0)
+
+    error_rate = totals["errors"] / totals["events"] if totals["events"] else 0.0
+
+    return {
+        "granularity": granularity,
+        "periods": periods,
+        "buckets": [start.isoformat() for start in buckets],
+        "series": series,
+        "totals": totals,
+        "error_rate": round(error_rate, 4),
+        "presence": get_active_summary(db)
+    }
+
+
+def sparkline(values: list) -> str:
+    """Render a list of numbers as a one-line bar chart"""
+    peak = max(values, default=0)
+    if not peak:
+        return SPARK_CHARS[0] * len(values)
+    scale = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[round(v / peak * scale)] for v in values)
+
+
+def format_dashboard_text(data: dict) -> str:
+    """Format dashboard data as a Telegram message"""
+    unit = "دقیقه" if data["granularity"] == "minute" else "ساعت"
+    totals = data["totals"]
+    series = data["series"]
+    presence = data["presence"]
+
+    return f"""
+📊 داشبورد eynVu
+
+⏱️ بازه: {data['periods']} {unit} اخیر
+
+━━━━━━━━━━━━━━━━━━━━
+
+🆕 عضو جدید: {totals['signups']}
+{sparkline(series['signups'])}
+
+📨 پیام ناشناس: {totals['messages']}
+{sparkline(series['messages'])}
+
+👥 کاربر فعال (بیشینه در {unit}): {totals['active_users']}
+{sparkline(series['active_users'])}
+
+⚠️ خطاها: {totals['errors']} از {totals['events']} رویداد ({data['error_rate'] * 100:.1f}%)
+{sparkline(series['errors'])}
+
+━━━━━━━━━━━━━━━━━━━━
+
+📅 DAU: {presence['dau']} | WAU: {presence['wau']} | MAU: {presence['mau']}
+"""
+
+
+def format_presence_text(summaries: list) -> str:
+    """Format per-feature DAU/WAU/MAU as a Telegram message"""
+    lines = ["📅 کاربران فعال (تخمینی)", "", "بخش: روز / هفته / ماه", ""]
+    for summary in summaries:
+        label = PRESENCE_FEATURES.get(summary["feature"], summary["feature"])
+        lines.append(f"{label}: {summary['dau']} / {summary['wau']} / {summary['mau']}")
+    return "\n".join(lines)
+
+
+def export_dashboard_json(data: dict) -> str:
+    """Serialize dashboard data as JSON"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def get_dashboard_keyboard(granularity: str):
+    """Switch between minute/hour views and refresh"""
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                ("• " if granularity == "minute" else "") + "⏱️ دقیقه‌ای",
+                callback_data="dashboard_minute"
+            ),
+            InlineKeyboardButton(
+                ("• " if granularity == "hour" else "") + "🕐 ساعتی",
+                callback_data="dashboard_hour"
+            )
+        ],
+        [InlineKeyboardButton("🔄 بروزرسانی", callback_data=f"dashboard_{granularity}")]
+    ]
+    return InlineKeyboardMarkup(keyboard)
+
+
+def render_dashboard(granularity: str = "hour"):
+    """Flush pending counters and build dashboard text (blocking: call from a thread in handlers)"""
+    flush_metrics()
+
+    db = Session()
+    try:
+        return format_dashboard_text(get_dashboard_data(db, granularity))
+    finally:
+        db.close()
+
+
+async def dashboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /dashboard command (admins only)"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    await update.message.reply_text(
+        await asyncio.to_thread(render_dashboard, "hour"),
+        reply_markup=get_dashboard_keyboard("hour")
+    )
+
+
+async def active_users_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /active command (admins only) - DAU/WAU/MAU per feature"""
+    if not Config.is_admin(update.effective_user.id):
+        return
+
+    db = Session()
+    try:
+        summaries = [get_active_summary(db, feature) for feature in PRESENCE_FEATURES]
+    finally:
+        db.close()
+
+    await update.message.reply_text(format_presence_text(summaries))
+
+
+async def handle_dashboard_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle dashboard view switch / refresh"""
+    query = update.callback_query
+
+    if not Config.is_admin(update.effective_user.id):
+        await query.answer("⛔ فقط ادمین‌ها", show_alert=True)
+        return
+
+    await query.answer()
+
+    granularity = query.data.split("_")[-1]
+    try:
+        await query.edit_message_text(
+            await asyncio.to_thread(render_dashboard, granularity),
+            reply_markup=get_dashboard_keyboard(granularity)
+        )
+    except Exception as e:
+        # Telegram rejects edits that don't change the message
+        if "not modified" not in str(e):
+            raise
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export eynVu dashboard as JSON")
+    parser.add_argument("--granularity", choices=list(GRANULARITIES), default="hour")
+    parser.add_argument("--periods", type=int, default=None)
+    parser.add_argument("--output", help="Write JSON to this file instead of stdout")
+    args = parser.parse_args()
+
+    flush_metrics()
+    db = Session()
+    try:
+        output = export_dashboard_json(get_dashboard_data(db, args.granularity, args.periods))
+    finally:
+        db.close()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"✅ Dashboard exported to {args.output}")
+    else:
+        print(output)
@@ -5,7 +5,9 @@ from models.user import User
 from models.message import AnonymousMessage
 from models.log import Log
 from models.identifier import generate_identifier
+from features.lists.bookmarks import get_bookmark_button, KIND_MESSAGE
 from utils.state import set_state, get_state, clear_state, STATE_WAITING_MESSAGE, STATE_WAITING_CONFIRMATION
+from utils import metrics
 from config import Config
 
 
@@ -287,6 +289,10 @@ async def confirm_send(update: Update, context: ContextTypes.DEFAULT_TYPE):
         db.add(anon_msg)
         db.commit()
         
+        # Feed dashboard aggregates
+        metrics.record("messages")
+        metrics.record_distinct("active_users", sender.telegram_id)
+        
         # Send to recipient
         admin_text = f"📩 پیام ناشناس!\n\n👤 از: {sender.identifier}"
         if sender.nickname:
@@ -294,7 +300,10 @@ async def confirm_send(update: Update, context: ContextTypes.DEFAULT_TYPE):
         admin_text += "\n━━━━━━━━━━━━━━━━━━━━\n\n"
         
         admin_keyboard = [
-            [InlineKeyboardButton("💬 پاسخ", callback_data=f"reply_{sender.identifier}")],
+            [
+                InlineKeyboardButton("💬 پاسخ", callback_data=f"reply_{sender.identifier}"),
+                get_bookmark_button(KIND_MESSAGE, anon_msg.id)
+            ],
             [
                 InlineKeyboardButton("🗑️ حذف", callback_data=f"delete_msg_{anon_msg.id}"),
                 InlineKeyboardButton("🚫 بلاک", callback_data=f"block_{sender.identifier}")
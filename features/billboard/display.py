@@ -0,0 +1,55 @@
+"""
+Billboards under menu renders
+with_billboard() costs one alias-table pick and one sketch update (a few
+microseconds, no I/O); the impression itself is flushed later in a batch.
+"""
+
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from features.billboard.manager import get_rotation, caps, record_impression, record_click
+from features.billboard.rotation import choose
+
+
+def with_billboard(text: str, reply_markup: InlineKeyboardMarkup, user_id: int) -> tuple:
+    """
+    Attach a billboard to a menu
+
+    Returns:
+        (text, reply_markup), unchanged if no campaign is due for this user
+    """
+    campaign = choose(get_rotation(), caps, user_id)
+    if not campaign:
+        return text, reply_markup
+
+    record_impression(campaign["id"])
+    text = f"{text.rstrip()}\n\n━━━━━━━━━━━━━━━━━━━━\n📢 {campaign['text']}"
+
+    if campaign["details"] or campaign["url"]:
+        button = InlineKeyboardButton("📢 بیشتر بدونم", callback_data=f"bb_{campaign['id']}")
+        rows = tuple(reply_markup.inline_keyboard) if reply_markup else ()
+        reply_markup = InlineKeyboardMarkup(rows + ((button,),))
+
+    return text, reply_markup
+
+
+async def handle_billboard_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """bb_{campaign_id}: count the click and show the details"""
+    query = update.callback_query
+    campaign_id = int(query.data[len("bb_"):])
+
+    campaign = next((c for c in get_rotation().campaigns if c["id"] == campaign_id), None)
+    if not campaign:
+        await query.answer("⌛ این اطلاعیه تموم شده!", show_alert=True)
+        return
+
+    record_click(campaign_id)
+    await query.answer()
+
+    keyboard = None
+    if campaign["url"]:
+        keyboard = InlineKeyboardMarkup([[InlineKeyboardButton("🔗 باز کردن", url=campaign["url"])]])
+    await context.bot.send_message(
+        update.effective_chat.id,
+        f"📢 {campaign['details'] or campaign['text']}",
+        reply_markup=keyboard
+    )
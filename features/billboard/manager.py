@@ -0,0 +1,202 @@
+"""
+Billboard campaigns: storage, the live rotation and batched counters
+The rotation (campaigns + alias table) is rebuilt after admin changes and
+every BILLBOARD_REFRESH_INTERVAL by a background job (start/end times),
+never on the menu path. Impressions and clicks are counted in memory and
+added to the campaign rows by flush_billboard_counters().
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from sqlalchemy import or_
+from models.billboard import BillboardCampaign
+from features.billboard.rotation import Rotation, FrequencyCap
+from config import Config
+
+# Rows per UPDATE statement
+FLUSH_CHUNK_SIZE = 1000
+
+_rotation = Rotation([])
+caps = FrequencyCap()
+
+# Pending counts: campaign_id -> n
+_impressions = Counter()
+_clicks = Counter()
+_lock = threading.Lock()
+
+
+# ==================== Admin ====================
+
+def add_campaign(db, text: str, details: str = None, url: str = None, weight: int = 1,
+                 daily_cap: int = None, ends_at: datetime = None, added_by: int = None) -> BillboardCampaign:
+    campaign = BillboardCampaign(
+        text=text,
+        details=details,
+        url=url,
+        weight=weight,
+        daily_cap=daily_cap,
+        ends_at=ends_at,
+        impressions=0,
+        clicks=0,
+        is_active=True,
+        added_by=added_by
+    )
+    db.add(campaign)
+    db.commit()
+    db.refresh(campaign)
+
+    refresh_rotation(db)
+    return campaign
+
+
+def set_weight(db, campaign_id: int, weight: int) -> bool:
+    updated = db.query(BillboardCampaign).filter(
+        BillboardCampaign.id == campaign_id,
+        BillboardCampaign.is_active == True
+    ).update({BillboardCampaign.weight: weight}, synchronize_session=False)
+    db.commit()
+
+    refresh_rotation(db)
+    return bool(updated)
+
+
+def deactivate_campaign(db, campaign_id: int) -> bool:
+    updated = db.query(BillboardCampaign).filter(
+        BillboardCampaign.id == campaign_id,
+        BillboardCampaign.is_active == True
+    ).update({BillboardCampaign.is_active: False}, synchronize_session=False)
+    db.commit()
+
+    refresh_rotation(db)
+    return bool(updated)
+
+
+def list_campaigns(db) -> list:
+    return db.query(BillboardCampaign).filter(
+        BillboardCampaign.is_active == True
+    ).order_by(BillboardCampaign.id).all()
+
+
+# ==================== Rotation ====================
+
+def load_live_campaigns(db) -> list:
+    """Active campaigns inside their time window, as plain dicts"""
+    now = datetime.now(timezone.utc)
+    rows = db.query(BillboardCampaign).filter(
+        BillboardCampaign.is_active == True,
+        BillboardCampaign.weight > 0,
+        or_(BillboardCampaign.starts_at.is_(None), BillboardCampaign.starts_at <= now),
+        or_(BillboardCampaign.ends_at.is_(None), BillboardCampaign.ends_at > now)
+    ).order_by(BillboardCampaign.id).all()
+
+    return [
+        {
+            "id": row.id,
+            "text": row.text,
+            "details": row.details,
+            "url": row.url,
+            "weight": row.weight,
+            "cap": row.daily_cap or Config.BILLBOARD_DAILY_CAP
+        }
+        for row in rows
+    ]
+
+
+def refresh_rotation(db=None) -> int:
+    """
+    Rebuild the rotation from the database
+
+    Returns:
+        Number of live campaigns
+    """
+    global _rotation
+
+    if db is None:
+        from database import Session
+        db = Session()
+        try:
+            return refresh_rotation(db)
+        finally:
+            db.close()
+
+    rotation = Rotation(load_live_campaigns(db))
+    _rotation = rotation  # Swapped atomically; readers keep the old one until done
+    return len(rotation)
+
+
+def get_rotation() -> Rotation:
+    return _rotation
+
+
+# ==================== Counters ====================
+
+def record_impression(campaign_id: int):
+    with _lock:
+        _impressions[campaign_id] += 1
+
+
+def record_click(campaign_id: int):
+    with _lock:
+        _clicks[campaign_id] += 1
+
+
+def take_pending() -> list:
+    """Swap out pending counts as {"id", "impressions", "clicks"} rows"""
+    global _impressions, _clicks
+
+    with _lock:
+        impressions, _impressions = _impressions, Counter()
+        clicks, _clicks = _clicks, Counter()
+
+    return [
+        {"id": campaign_id, "impressions": impressions[campaign_id], "clicks": clicks[campaign_id]}
+        for campaign_id in impressions.keys() | clicks.keys()
+    ]
+
+
+def _restore(rows: list):
+    with _lock:
+        for row in rows:
+            _impressions[row["id"]] += row["impressions"]
+            _clicks[row["id"]] += row["clicks"]
+
+
+def flush_billboard_counters() -> int:
+    """
+    Add pending impressions / clicks to billboard_campaigns
+
+    Returns:
+        Number of campaigns updated
+    """
+    from sqlalchemy import update, Integer, BigInteger
+    from database import Session
+    from utils.helpers import chunked, values_table
+
+    rows = take_pending()
+    if not rows:
+        return 0
+
+    db = Session()
+    try:
+        for chunk in chunked(rows, FLUSH_CHUNK_SIZE):
+            v = values_table("v", {"id": Integer(), "impressions": BigInteger(), "clicks": BigInteger()}, chunk)
+            db.execute(
+                update(BillboardCampaign)
+                .where(BillboardCampaign.id == v.c.id)
+                .values(
+                    impressions=BillboardCampaign.impressions + v.c.impressions,
+                    clicks=BillboardCampaign.clicks + v.c.clicks,
+                    updated_at=BillboardCampaign.updated_at  # counters are not an edit
+                )
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        _restore(rows)
+        print(f"❌ Billboard flush failed: {e}")
+        return 0
+    finally:
+        db.close()
@@ -0,0 +1,27 @@
+# Language key -> display label (keys are used in callback data: no "_")
+LANGUAGES = {
+    "python": "🐍 Python",
+    "javascript": "🟨 JavaScript",
+    "typescript": "🔷 TypeScript",
+    "go": "🐹 Go",
+    "rust": "🦀 Rust",
+    "java": "☕ Java",
+    "cpp": "⚙️ C / C++",
+    "sql": "🗄️ SQL",
+    "bash": "🐚 Bash",
+    "other": "💻 سایر"
+}
+
+# Resource kinds
+KINDS = {
+    "snippet": "📄",
+    "link": "🔗"
+}
+
+
+def is_valid_language(language: str) -> bool:
+    return language in LANGUAGES
+
+
+def get_language_label(language: str) -> str:
+    return LANGUAGES.get(language, LANGUAGES["other"])
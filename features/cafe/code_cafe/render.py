@@ -0,0 +1,198 @@
+"""
+Code cafe page rendering
+Pure functions: plain resource rows in, finished Telegram pages (HTML
+text + keyboard) out. render_language() renders every list page and
+resource page of a language in one pass so they can be cached together.
+
+Benchmark:
+    python -m features.cafe.code_cafe.render
+"""
+
+import html
+from collections import namedtuple
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from features.cafe.code_cafe.languages import LANGUAGES, KINDS, get_language_label
+from config import Config
+
+# Telegram message limit; a resource page's HTML (markup and entities included) stays under it
+MAX_MESSAGE_LENGTH = 4096
+MAX_SNIPPET_LENGTH = 3500
+MAX_DESCRIPTION_PREVIEW = 60
+
+# A finished page, sent with parse_mode="HTML"
+RenderedPage = namedtuple("RenderedPage", ["text", "reply_markup"])
+
+
+def render_home(counts: dict) -> RenderedPage:
+    """Code cafe home: one button per language that has resources"""
+    total = sum(counts.values())
+    text = "💻 طبقه بالا (کُد کافه)\n\n"
+    text += f"📚 {total} منبع و اسنیپت. یه زبان انتخاب کن:" if total else "هنوز منبعی اضافه نشده!"
+
+    keyboard = []
+    row = []
+    for key, label in LANGUAGES.items():
+        if not counts.get(key):
+            continue
+        row.append(InlineKeyboardButton(f"{label} ({counts[key]})", callback_data=f"code_lang_{key}_0"))
+        if len(row) == 2:
+            keyboard.append(row)
+            row = []
+    if row:
+        keyboard.append(row)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+    return RenderedPage(text, InlineKeyboardMarkup(keyboard))
+
+
+def _render_list_page(language: str, rows: list, page: int, pages: int, total: int) -> RenderedPage:
+    label = html.escape(get_language_label(language))
+    first = page * Config.CODE_CAFE_PAGE_SIZE
+
+    lines = [f"<b>{label}</b>", f"📚 {total} منبع (صفحه {page + 1} از {pages})", ""]
+    keyboard = []
+    for number, row in enumerate(rows, first + 1):
+        icon = KINDS.get(row["kind"], "📄")
+        line = f"{number}. {icon} {html.escape(row['title'])}"
+        if row["description"]:
+            description = row["description"]
+            if len(description) > MAX_DESCRIPTION_PREVIEW:
+                description = description[:MAX_DESCRIPTION_PREVIEW] + "..."
+            line += f"\n    <i>{html.escape(description)}</i>"
+        lines.append(line)
+        keyboard.append([InlineKeyboardButton(
+            f"{number}. {icon} {row['title']}"[:60],
+            callback_data=f"code_res_{language}_{row['id']}"
+        )])
+
+    nav = []
+    if page > 0:
+        nav.append(InlineKeyboardButton("⬅️ قبلی", callback_data=f"code_lang_{language}_{page - 1}"))
+    if page + 1 < pages:
+        nav.append(InlineKeyboardButton("بعدی ➡️", callback_data=f"code_lang_{language}_{page + 1}"))
+    if nav:
+        keyboard.append(nav)
+    keyboard.append([InlineKeyboardButton("🔙 زبان‌ها", callback_data="cafe_code")])
+
+    return RenderedPage("\n".join(lines), InlineKeyboardMarkup(keyboard))
+
+
+def _escape_within(text: str, limit: int, suffix: str = "\n...") -> str:
+    """
+    Escape text for HTML in at most `limit` characters
+
+    Cuts the raw text, never the escaped HTML (which would leave a broken
+    entity like "&l"), and marks the cut with `suffix`.
+    """
+    escaped = html.escape(text)
+    if len(escaped) <= limit:
+        return escaped
+
+    budget = limit - len(suffix)
+    length = 0
+    for end, char in enumerate(text):
+        length += len(html.escape(char))
+        if length > budget:
+            return html.escape(text[:end]) + suffix
+    return escaped
+
+
+def _render_resource(language: str, row: dict, page: int) -> RenderedPage:
+    text = f"{KINDS.get(row['kind'], '📄')} <b>{html.escape(row['title'])}</b>\n"
+    text += f"{html.escape(get_language_label(language))}\n"
+    if row["description"]:
+        text += f"\n{html.escape(row['description'][:MAX_DESCRIPTION_PREVIEW * 5])}\n"
+
+    keyboard = []
+    if row["kind"] == "link":
+        text += "\n" + _escape_within(row["content"], MAX_MESSAGE_LENGTH - len(text) - 1, "...")
+        keyboard.append([InlineKeyboardButton("🔗 باز کردن لینک", url=row["content"])])
+    else:
+        opening, closing = f'\n<pre><code class="language-{language}">', "</code></pre>"
+        code = row["content"]
+        if len(code) > MAX_SNIPPET_LENGTH:
+            code = code[:MAX_SNIPPET_LENGTH] + "\n..."
+        text += opening + _escape_within(code, MAX_MESSAGE_LENGTH - len(text) - len(opening) - len(closing)) + closing
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت", callback_data=f"code_lang_{language}_{page}")])
+    return RenderedPage(text, InlineKeyboardMarkup(keyboard))
+
+
+def render_language(language: str, rows: list) -> dict:
+    """
+    Render every page of a language
+
+    Args:
+        rows: Resource rows in display order
+              ({"id", "kind", "title", "content", "description"})
+
+    Returns:
+        {("page", n): RenderedPage, ("res", resource_id): RenderedPage}
+    """
+    size = Config.CODE_CAFE_PAGE_SIZE
+    pages = max(1, (len(rows) + size - 1) // size)
+
+    rendered = {}
+    for page in range(pages):
+        page_rows = rows[page * size:(page + 1) * size]
+        rendered[("page", page)] = _render_list_page(language, page_rows, page, pages, len(rows))
+        for row in page_rows:
+            rendered[("res", row["id"])] = _render_resource(language, row, page)
+    return rendered
+
+
+def _benchmark(per_language: int = 2000, lookups: int = 100_000):
+    """Compare rendering a language against serving its pages from the render cache"""
+    import random
+    import time
+    from utils.cache import TTLCache
+
+    random.seed(7)
+    words = ["list", "dict", "async", "query", "parse", "format", "sort", "cache", "http", "json"]
+
+    def make_rows(language):
+        return [
+            {
+                "id": i,
+                "kind": random.choice(list(KINDS)),
+                "title": " ".join(random.choices(words, k=4)),
+                "content": "\n".join(" ".join(random.choices(words, k=8)) for _ in range(30)),
+                "description": " ".join(random.choices(words, k=15))
+            }
+            for i in range(per_language)
+        ]
+
+    catalog = {language: make_rows(language) for language in LANGUAGES}
+
+    started = time.perf_counter()
+    rendered = {language: render_language(language, rows) for language, rows in catalog.items()}
+    render_time = time.perf_counter() - started
+    page_count = sum(len(pages) for pages in rendered.values())
+
+    cache = TTLCache(ttl=Config.CODE_CAFE_CACHE_TTL, max_size=len(LANGUAGES) * 2)
+    for language, pages in rendered.items():
+        cache.set((language, 1), pages)
+
+    keys = [
+        (random.choice(list(LANGUAGES)), ("page", random.randrange(per_language // Config.CODE_CAFE_PAGE_SIZE)))
+        for _ in range(lookups)
+    ]
+    started = time.perf_counter()
+    for language, key in keys:
+        cache.get((language, 1))[key]
+    lookup_time = time.perf_counter() - started
+
+    single = catalog["python"][:Config.CODE_CAFE_PAGE_SIZE]
+    started = time.perf_counter()
+    for _ in range(1000):
+        _render_list_page("python", single, 0, 1, len(single))
+    page_time = (time.perf_counter() - started) / 1000
+
+    print(f"🖨️ {page_count} pages for {len(LANGUAGES)} languages rendered in {render_time:.2f}s "
+          f"({render_time / page_count * 1e6:.0f}µs/page)")
+    print(f"📄 One list page rendered on demand: {page_time * 1e6:.0f}µs")
+    print(f"⚡ {lookups} cached page lookups: {lookup_time / lookups * 1e6:.2f}µs each")
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,205 @@
+"""
+Code cafe resource catalog
+Pages are rendered once per content version (render.py) and cached under
+(language, version). Browsing is a dictionary lookup; the database is only
+read when a language's version changed or the version map is refreshed
+(every CODE_CAFE_VERSION_TTL seconds, to pick up edits from other processes).
+Edits bump the language version in the same transaction and drop only
+that language's pages and the home page.
+"""
+
+import threading
+import time
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from sqlalchemy import func
+from database import Session
+from models.code_resource import CodeResource, CodeCatalogVersion
+from features.cafe.code_cafe.render import render_home, render_language
+from utils.cache import TTLCache
+from config import Config
+
+HOME = "home"
+
+# (language, version) -> rendered pages; ("home", versions) -> RenderedPage
+page_cache = TTLCache(ttl=Config.CODE_CAFE_CACHE_TTL, max_size=200)
+
+# language -> version, refreshed from the database every CODE_CAFE_VERSION_TTL
+_versions = {}
+_versions_loaded_at = None
+_lock = threading.Lock()
+
+
+# ==================== Versions ====================
+
+def get_versions() -> dict:
+    global _versions, _versions_loaded_at
+
+    with _lock:
+        if _versions_loaded_at is not None and time.monotonic() - _versions_loaded_at < Config.CODE_CAFE_VERSION_TTL:
+            return _versions
+
+    db = Session()
+    try:
+        versions = dict(db.query(CodeCatalogVersion.language, CodeCatalogVersion.version).all())
+    finally:
+        db.close()
+
+    with _lock:
+        _versions, _versions_loaded_at = versions, time.monotonic()
+    return versions
+
+
+def _bump_version(db, language: str):
+    """Increment a language's version (part of the caller's transaction)"""
+    bumped = db.query(CodeCatalogVersion).filter(CodeCatalogVersion.language == language).update(
+        {CodeCatalogVersion.version: CodeCatalogVersion.version + 1}, synchronize_session=False
+    )
+    if not bumped:
+        db.add(CodeCatalogVersion(language=language, version=1))
+
+
+def _invalidate(db, language: str):
+    """After a committed edit: publish the new version and drop the stale pages"""
+    global _versions
+
+    version = db.query(CodeCatalogVersion.version).filter(CodeCatalogVersion.language == language).scalar()
+    with _lock:
+        _versions = {**_versions, language: version}
+    page_cache.invalidate(lambda key: key[0] in (language, HOME))
+
+
+# ==================== Admin ====================
+
+def add_resource(db, language: str, kind: str, title: str, content: str,
+                 description: str = None, added_by: int = None) -> CodeResource:
+    resource = CodeResource(
+        language=language,
+        kind=kind,
+        title=title[:128],
+        content=content,
+        description=description,
+        is_active=True,
+        added_by=added_by
+    )
+    db.add(resource)
+    _bump_version(db, language)
+    db.commit()
+    db.refresh(resource)
+
+    _invalidate(db, language)
+    return resource
+
+
+def update_resource(db, resource_id: int, **fields) -> CodeResource:
+    """Change title / content / description; returns None if not found"""
+    resource = db.query(CodeResource).filter(
+        CodeResource.id == resource_id,
+        CodeResource.is_active == True
+    ).first()
+    if not resource:
+        return None
+
+    for name in ("title", "content", "description"):
+        if fields.get(name) is not None:
+            setattr(resource, name, fields[name])
+    _bump_version(db, resource.language)
+    db.commit()
+
+    _invalidate(db, resource.language)
+    return resource
+
+
+def deactivate_resource(db, resource_id: int) -> bool:
+    resource = db.query(CodeResource).filter(
+        CodeResource.id == resource_id,
+        CodeResource.is_active == True
+    ).first()
+    if not resource:
+        return False
+
+    resource.is_active = False
+    _bump_version(db, resource.language)
+    db.commit()
+
+    _invalidate(db, resource.language)
+    return True
+
+
+# ==================== Rendered pages ====================
+
+def load_language_rows(db, language: str) -> list:
+    return [
+        {
+            "id": row.id,
+            "kind": row.kind,
+            "title": row.title,
+            "content": row.content,
+            "description": row.description
+        }
+        for row in db.query(
+            CodeResource.id, CodeResource.kind, CodeResource.title,
+            CodeResource.content, CodeResource.description
+        ).filter(
+            CodeResource.language == language,
+            CodeResource.is_active == True
+        ).order_by(CodeResource.id)
+    ]
+
+
+def _load(loader):
+    db = Session()
+    try:
+        return loader(db)
+    finally:
+        db.close()
+
+
+def get_home_page():
+    versions = get_versions()
+
+    def load(db):
+        counts = dict(db.query(CodeResource.language, func.count(CodeResource.id)).filter(
+            CodeResource.is_active == True
+        ).group_by(CodeResource.language).all())
+        return render_home(counts)
+
+    return page_cache.get_or_set((HOME, tuple(sorted(versions.items()))), lambda: _load(load))
+
+
+def get_language_pages(language: str) -> dict:
+    version = get_versions().get(language, 0)
+    return page_cache.get_or_set(
+        (language, version),
+        lambda: _load(lambda db: render_language(language, load_language_rows(db, language)))
+    )
+
+
+# ==================== Handlers ====================
+
+async def code_cafe_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Code cafe home (cafe_code callback)"""
+    query = update.callback_query
+    await query.answer()
+
+    page = get_home_page()
+    await query.edit_message_text(page.text, reply_markup=page.reply_markup, parse_mode="HTML")
+
+
+async def handle_code_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """code_lang_{language}_{page} / code_res_{language}_{resource_id}"""
+    query = update.callback_query
+    _, kind, language, number = query.data.split("_", 3)
+
+    try:
+        page = get_language_pages(language).get(("page" if kind == "lang" else "res", int(number)))
+        if not page:
+            await query.answer("❌ این صفحه دیگه وجود نداره!", show_alert=True)
+            return
+
+        await query.answer()
+        await query.edit_message_text(page.text, reply_markup=page.reply_markup, parse_mode="HTML")
+    except Exception as e:
+        print(f"❌ Code cafe callback error: {e}")
+        traceback.print_exc()
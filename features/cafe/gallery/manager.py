@@ -0,0 +1,149 @@
+import random
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from database import Session
+from models.gallery import GalleryImage, GallerySubscription
+from features.cafe.gallery.slideshow import engine, slot_for
+from features.group_manager.permissions.admins import is_group_admin
+from config import Config
+
+
+# ==================== Data ====================
+
+def add_image(db, file_id: str, caption: str = None, added_by: int = None) -> GalleryImage:
+    image = GalleryImage(file_id=file_id, caption=caption, added_by=added_by)
+    db.add(image)
+    db.commit()
+    db.refresh(image)
+
+    engine.invalidate_rotation()
+    return image
+
+
+def deactivate_image(db, image_id: int) -> bool:
+    updated = db.query(GalleryImage).filter(
+        GalleryImage.id == image_id,
+        GalleryImage.is_active == True
+    ).update({GalleryImage.is_active: False}, synchronize_session=False)
+    db.commit()
+
+    engine.invalidate_rotation()
+    return bool(updated)
+
+
+def is_subscribed(db, chat_id: int) -> bool:
+    subscription = db.get(GallerySubscription, chat_id)
+    return bool(subscription and subscription.is_active)
+
+
+def subscribe(db, chat_id: int):
+    """Start the slideshow for a chat (keeps the old cursor when re-subscribing)"""
+    subscription = db.get(GallerySubscription, chat_id)
+    if subscription:
+        subscription.is_active = True
+    else:
+        db.add(GallerySubscription(chat_id=chat_id, slot=slot_for(chat_id), last_image_id=0))
+    db.commit()
+
+
+def unsubscribe(db, chat_id: int):
+    db.query(GallerySubscription).filter(GallerySubscription.chat_id == chat_id).update(
+        {GallerySubscription.is_active: False}, synchronize_session=False
+    )
+    db.commit()
+
+
+# ==================== Handlers ====================
+
+def get_gallery_keyboard(subscribed: bool):
+    keyboard = [[InlineKeyboardButton("🖼️ یه عکس نشونم بده", callback_data="gallery_random")]]
+    if subscribed:
+        keyboard.append([InlineKeyboardButton("⏹️ توقف اسلایدشو", callback_data="gallery_stop")])
+    else:
+        keyboard.append([InlineKeyboardButton("▶️ شروع اسلایدشو", callback_data="gallery_start")])
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+def get_gallery_text(subscribed: bool) -> str:
+    minutes = Config.GALLERY_SLIDE_INTERVAL // 60
+    text = f"🖼️ گوشه گالری\n\n{len(engine.get_rotation())} عکس روی دیوار.\n"
+    if subscribed:
+        text += f"▶️ اسلایدشو روشنه: هر {minutes} دقیقه یه عکس جدید برات میاد."
+    else:
+        text += f"اسلایدشو رو روشن کن تا هر {minutes} دقیقه یه عکس جدید برات بیاد."
+    return text
+
+
+async def gallery_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Gallery home (cafe_gallery callback)"""
+    query = update.callback_query
+    await query.answer()
+
+    db = Session()
+    try:
+        subscribed = is_subscribed(db, update.effective_chat.id)
+        await query.edit_message_text(get_gallery_text(subscribed), reply_markup=get_gallery_keyboard(subscribed))
+    finally:
+        db.close()
+
+
+async def handle_gallery_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """gallery_start / gallery_stop / gallery_random"""
+    query = update.callback_query
+    chat_id = update.effective_chat.id
+    action = query.data[len("gallery_"):]
+
+    db = Session()
+    try:
+        if action == "random":
+            rotation = engine.get_rotation()
+            if not rotation:
+                await query.answer("🖼️ هنوز عکسی تو گالری نیست!", show_alert=True)
+                return
+            await query.answer()
+            file_id, caption = rotation.images[random.choice(rotation.ids)]
+            await context.bot.send_photo(chat_id, file_id, caption=caption)
+            return
+
+        if action == "start":
+            subscribe(db, chat_id)
+        else:
+            unsubscribe(db, chat_id)
+
+        await query.answer()
+        subscribed = action == "start"
+        await query.edit_message_text(get_gallery_text(subscribed), reply_markup=get_gallery_keyboard(subscribed))
+    except Exception as e:
+        print(f"❌ Gallery callback error: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+async def slideshow_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /slideshow on|off (private chats, or group admins in groups)"""
+    chat = update.effective_chat
+    user_id = update.effective_user.id
+
+    if chat.type != "private" and not await is_group_admin(context.bot, chat.id, user_id):
+        await update.message.reply_text("❌ فقط ادمین‌های گروه می‌تونن اسلایدشو رو تنظیم کنن!")
+        return
+
+    action = context.args[0].lower() if context.args else ""
+    db = Session()
+    try:
+        if action == "on":
+            subscribe(db, chat.id)
+            await update.message.reply_text(
+                f"▶️ اسلایدشو روشن شد! هر {Config.GALLERY_SLIDE_INTERVAL // 60} دقیقه یه عکس میاد."
+            )
+        elif action == "off":
+            unsubscribe(db, chat.id)
+            await update.message.reply_text("⏹️ اسلایدشو خاموش شد.")
+        else:
+            status = "روشن ▶️" if is_subscribed(db, chat.id) else "خاموش ⏹️"
+            await update.message.reply_text(f"🖼️ اسلایدشو: {status}\n\nاستفاده: /slideshow on یا /slideshow off")
+    finally:
+        db.close()
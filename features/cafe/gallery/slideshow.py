@@ -0,0 +1,191 @@
+"""
+Gallery slideshow engine
+Instead of one timer per chat, GALLERY_SLIDE_INTERVAL is split into
+slots of GALLERY_TICK_INTERVAL seconds and every chat is assigned to a
+slot. One background tick loads only the chats of the current slot
+(indexed), picks each chat's next image from the in-memory rotation and
+delivers the batch through the rate-limited sender. Cursors
+(last_image_id) are saved per batch, so a restart resumes each chat's
+rotation where it stopped.
+
+Testing with a fake clock and bot (tests/test_slideshow.py):
+    engine = SlideshowEngine(clock=lambda: now, sender=Sender(bot=FakeBot()))
+    await engine.tick()
+"""
+
+import asyncio
+import time
+import traceback
+from bisect import bisect_right
+from functools import partial
+from database import Session
+from models.gallery import GalleryImage, GallerySubscription
+from utils.sender import get_sender, SENT, BLOCKED
+from config import Config
+
+# Chats loaded per query within a slot
+SLOT_BATCH_SIZE = 500
+
+SLOT_COUNT = max(1, Config.GALLERY_SLIDE_INTERVAL // Config.GALLERY_TICK_INTERVAL)
+
+
+def slot_for(chat_id: int) -> int:
+    """Time slot of a chat (stable, spreads chats evenly)"""
+    return chat_id % SLOT_COUNT
+
+
+class Rotation:
+    """Active images in display order; next_after() wraps around"""
+
+    def __init__(self, images: list):
+        self.ids = [image_id for image_id, _, _ in images]  # ascending
+        self.images = {image_id: (file_id, caption) for image_id, file_id, caption in images}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def next_after(self, image_id: int) -> int:
+        i = bisect_right(self.ids, image_id)
+        return self.ids[i] if i < len(self.ids) else self.ids[0]
+
+
+def load_rotation(db) -> Rotation:
+    rows = db.query(GalleryImage.id, GalleryImage.file_id, GalleryImage.caption).filter(
+        GalleryImage.is_active == True
+    ).order_by(GalleryImage.id).all()
+    return Rotation(rows)
+
+
+class SlideshowEngine:
+    def __init__(self, clock=time.time, sender=None, session_factory=Session):
+        self.clock = clock
+        self.sender = sender
+        self.session_factory = session_factory
+        self.last_tick = None  # Absolute tick number last processed
+        self._rotation = None
+
+    def invalidate_rotation(self):
+        """Call after images are added or removed"""
+        self._rotation = None
+
+    def get_rotation(self) -> Rotation:
+        if self._rotation is None:
+            db = self.session_factory()
+            try:
+                self._rotation = load_rotation(db)
+            finally:
+                db.close()
+        return self._rotation
+
+    # ==================== Storage ====================
+
+    def _load_slot_batch(self, slot: int, after_chat_id) -> list:
+        db = self.session_factory()
+        try:
+            query = db.query(GallerySubscription.chat_id, GallerySubscription.last_image_id).filter(
+                GallerySubscription.slot == slot,
+                GallerySubscription.is_active == True
+            )
+            if after_chat_id is not None:
+                query = query.filter(GallerySubscription.chat_id > after_chat_id)
+            return query.order_by(GallerySubscription.chat_id).limit(SLOT_BATCH_SIZE).all()
+        finally:
+            db.close()
+
+    def _save_batch(self, cursors: list, blocked: list):
+        """Persist advanced cursors (one UPDATE ... FROM VALUES) and drop blocked chats"""
+        from sqlalchemy import update, BigInteger, Integer
+        from utils.helpers import values_table
+
+        db = self.session_factory()
+        try:
+            if cursors:
+                v = values_table("v", {"chat_id": BigInteger(), "last_image_id": Integer()}, cursors)
+                db.execute(
+                    update(GallerySubscription)
+                    .where(GallerySubscription.chat_id == v.c.chat_id)
+                    .values(last_image_id=v.c.last_image_id, updated_at=GallerySubscription.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            if blocked:
+                db.query(GallerySubscription).filter(
+                    GallerySubscription.chat_id.in_(blocked)
+                ).update({GallerySubscription.is_active: False}, synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ==================== Ticks ====================
+
+    @staticmethod
+    def _send_image(chat_id: int, image: tuple, bot):
+        file_id, caption = image
+        return bot.send_photo(chat_id, file_id, caption=caption)
+
+    async def run_slot(self, slot: int) -> dict:
+        """
+        Send the next image to every chat in a slot
+
+        Returns:
+            {"sent": n, "blocked": n, "failed": n}
+        """
+        stats = {"sent": 0, "blocked": 0, "failed": 0}
+        rotation = await asyncio.to_thread(self.get_rotation)
+        if not rotation:
+            return stats
+
+        sender = self.sender or get_sender()
+        after = None
+        while True:
+            batch = await asyncio.to_thread(self._load_slot_batch, slot, after)
+            if not batch:
+                break
+            after = batch[-1].chat_id
+
+            picks = [(row.chat_id, rotation.next_after(row.last_image_id)) for row in batch]
+            results = await asyncio.gather(*(
+                sender.send(partial(self._send_image, chat_id, rotation.images[image_id]))
+                for chat_id, image_id in picks
+            ))
+
+            cursors, blocked = [], []
+            for (chat_id, image_id), result in zip(picks, results):
+                if result == SENT:
+                    cursors.append({"chat_id": chat_id, "last_image_id": image_id})
+                    stats["sent"] += 1
+                elif result == BLOCKED:
+                    blocked.append(chat_id)
+                    stats["blocked"] += 1
+                else:
+                    stats["failed"] += 1  # Cursor not advanced: same image next round
+
+            await asyncio.to_thread(self._save_batch, cursors, blocked)
+
+        return stats
+
+    async def tick(self):
+        """
+        Run every slot due since the last tick (called every GALLERY_TICK_INTERVAL)
+
+        After a stall, at most one full round is caught up; every chat is
+        in exactly one slot, so a catch-up never sends a chat two images.
+        """
+        now_tick = int(self.clock() // Config.GALLERY_TICK_INTERVAL)
+        first = now_tick if self.last_tick is None else self.last_tick + 1
+        first = max(first, now_tick - SLOT_COUNT + 1)
+
+        for tick_number in range(first, now_tick + 1):
+            try:
+                await self.run_slot(tick_number % SLOT_COUNT)
+            except Exception as e:
+                print(f"❌ Slideshow slot {tick_number % SLOT_COUNT} failed: {e}")
+                traceback.print_exc()
+
+        self.last_tick = now_tick
+
+
+# Shared engine used by the background job and the gallery handlers
+engine = SlideshowEngine()
@@ -0,0 +1,222 @@
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from sqlalchemy import func
+from database import Session
+from models.book import Book
+from features.cafe.library.categories import get_categories_keyboard, get_category_label, is_valid_category
+from features.cafe.library.display import format_book_text, format_results_text, get_results_keyboard, get_book_keyboard
+from features.cafe.library.search import search_books, on_book_saved, on_book_removed
+from features.search import global_search
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_LIBRARY_SEARCH
+from config import Config
+
+# Last search query per user, for result paging callbacks
+last_queries = {}
+
+
+# ==================== Data ====================
+
+def add_book(db, title: str, file_id: str, author: str = None, category: str = "other",
+             description: str = None, cover_file_id: str = None, added_by: int = None) -> Book:
+    """Create a book and add it to the search index"""
+    book = Book(
+        title=title,
+        author=author,
+        category=category if is_valid_category(category) else "other",
+        description=description,
+        file_id=file_id,
+        cover_file_id=cover_file_id,
+        added_by=added_by
+    )
+    book.refresh_search_text()
+    db.add(book)
+    db.commit()
+    db.refresh(book)
+
+    on_book_saved(book)
+    global_search.on_book_saved(book)
+    return book
+
+
+def get_book(db, book_id: int) -> Book:
+    return db.query(Book).filter(Book.id == book_id, Book.is_active == True).first()
+
+
+def deactivate_book(db, book_id: int) -> bool:
+    """Hide a book from the library and the search index"""
+    book = get_book(db, book_id)
+    if not book:
+        return False
+
+    book.is_active = False
+    db.commit()
+
+    on_book_removed(book_id)
+    global_search.on_item_removed("book", book_id)
+    return True
+
+
+def get_category_counts(db) -> dict:
+    """{category: number of active books}"""
+    rows = db.query(Book.category, func.count(Book.id)).filter(
+        Book.is_active == True
+    ).group_by(Book.category).all()
+    return dict(rows)
+
+
+def list_category(db, category: str, page: int = 0) -> dict:
+    """Active books of a category, most downloaded first (same shape as search_books)"""
+    books = db.query(Book).filter(Book.is_active == True, Book.category == category)
+    total = books.count()
+    page_books = books.order_by(Book.download_count.desc(), Book.id).offset(
+        page * Config.LIBRARY_PAGE_SIZE
+    ).limit(Config.LIBRARY_PAGE_SIZE).all()
+    return {"books": page_books, "total": total, "facets": {}, "page": page}
+
+
+def record_download(db, book_id: int):
+    db.query(Book).filter(Book.id == book_id).update(
+        {Book.download_count: func.coalesce(Book.download_count, 0) + 1,
+         Book.updated_at: Book.updated_at},
+        synchronize_session=False
+    )
+    db.commit()
+
+
+# ==================== Handlers ====================
+
+async def _send_search_results(message, db, user_id: int, query: str, page: int = 0, edit: bool = False):
+    result = search_books(db, query, page=page)
+    last_queries[user_id] = query
+
+    text = format_results_text(f"🔍 {query}", result)
+    keyboard = get_results_keyboard(result, "library_res_")
+    if edit:
+        await message.edit_text(text, reply_markup=keyboard)
+    else:
+        await message.reply_text(text, reply_markup=keyboard)
+
+
+async def library_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Library home (cafe_library callback and /library)"""
+    db = Session()
+    try:
+        counts = get_category_counts(db)
+        text = f"📚 میز کتابخانه\n\n{sum(counts.values())} کتاب در قفسه‌هاست. دنبال چی هستی؟"
+        keyboard = get_categories_keyboard(counts)
+
+        if update.callback_query:
+            await update.callback_query.answer()
+            await update.callback_query.edit_message_text(text, reply_markup=keyboard)
+        else:
+            await update.message.reply_text(text, reply_markup=keyboard)
+    finally:
+        db.close()
+
+
+async def start_library_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Ask for a search query"""
+    query = update.callback_query
+    await query.answer()
+
+    set_state(update.effective_user.id, STATE_LIBRARY_SEARCH)
+    await query.edit_message_text(
+        "🔍 اسم کتاب، نویسنده یا یه کلمه از توضیحاتش رو بفرست:",
+        reply_markup=get_back_button("cafe_library")
+    )
+
+
+async def handle_library_search_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Search query typed after start_library_search"""
+    user_id = update.effective_user.id
+    if get_state(user_id)["state"] != STATE_LIBRARY_SEARCH or not update.message.text:
+        return
+
+    clear_state(user_id)
+    db = Session()
+    try:
+        await _send_search_results(update.message, db, user_id, update.message.text.strip())
+    except Exception as e:
+        print(f"❌ Library search error: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در جستجو! دوباره تلاش کن.")
+    finally:
+        db.close()
+
+
+async def book_search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /book <query>"""
+    if not context.args:
+        await update.message.reply_text("🔍 استفاده: /book اسم کتاب یا نویسنده")
+        return
+
+    db = Session()
+    try:
+        await _send_search_results(update.message, db, update.effective_user.id, " ".join(context.args))
+    except Exception as e:
+        print(f"❌ Library search error: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در جستجو! دوباره تلاش کن.")
+    finally:
+        db.close()
+
+
+async def handle_library_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Category pages, result pages, book details and downloads"""
+    query = update.callback_query
+    data = query.data
+    user_id = update.effective_user.id
+
+    db = Session()
+    try:
+        # library_cat_{category}_{page}
+        if data.startswith("library_cat_"):
+            category, page = data[len("library_cat_"):].rsplit("_", 1)
+            await query.answer()
+            result = list_category(db, category, int(page))
+            await query.edit_message_text(
+                format_results_text(get_category_label(category), result),
+                reply_markup=get_results_keyboard(result, f"library_cat_{category}_")
+            )
+
+        # library_res_{page}
+        elif data.startswith("library_res_"):
+            search_query = last_queries.get(user_id)
+            if not search_query:
+                await query.answer("⏰ جستجو منقضی شده، دوباره جستجو کن.", show_alert=True)
+                return
+            await query.answer()
+            await _send_search_results(
+                query.message, db, user_id, search_query, int(data.rsplit("_", 1)[1]), edit=True
+            )
+
+        # library_book_{id}
+        elif data.startswith("library_book_"):
+            book = get_book(db, int(data.rsplit("_", 1)[1]))
+            if not book:
+                await query.answer("❌ این کتاب دیگه در دسترس نیست!", show_alert=True)
+                return
+            await query.answer()
+            await query.edit_message_text(format_book_text(book), reply_markup=get_book_keyboard(book))
+
+        # library_get_{id}
+        elif data.startswith("library_get_"):
+            book = get_book(db, int(data.rsplit("_", 1)[1]))
+            if not book:
+                await query.answer("❌ این کتاب دیگه در دسترس نیست!", show_alert=True)
+                return
+            await query.answer("📤 در حال ارسال...")
+            await context.bot.send_document(
+                chat_id=user_id,
+                document=book.file_id,
+                caption=f"📖 {book.title}" + (f"\n✍️ {book.author}" if book.author else "")
+            )
+            record_download(db, book.id)
+
+    except Exception as e:
+        print(f"❌ Library callback error: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
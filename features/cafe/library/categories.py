@@ -0,0 +1,47 @@
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+# Category key -> display label
+CATEGORIES = {
+    "novel": "📖 رمان و داستان",
+    "poetry": "🪶 شعر",
+    "history": "🏛️ تاریخ",
+    "philosophy": "🤔 فلسفه",
+    "psychology": "🧠 روانشناسی",
+    "science": "🔬 علمی",
+    "programming": "💻 برنامه‌نویسی",
+    "kids": "🧸 کودک و نوجوان",
+    "other": "📚 سایر"
+}
+
+
+def is_valid_category(category: str) -> bool:
+    return category in CATEGORIES
+
+
+def get_category_label(category: str) -> str:
+    return CATEGORIES.get(category, CATEGORIES["other"])
+
+
+def get_categories_keyboard(counts: dict = None):
+    """
+    Library home keyboard: search + one button per category
+
+    Args:
+        counts: Optional {category: number of books} shown on buttons
+    """
+    keyboard = [[InlineKeyboardButton("🔍 جستجوی کتاب", callback_data="library_search")]]
+
+    row = []
+    for key, label in CATEGORIES.items():
+        if counts is not None and not counts.get(key):
+            continue
+        text = f"{label} ({counts[key]})" if counts else label
+        row.append(InlineKeyboardButton(text, callback_data=f"library_cat_{key}_0"))
+        if len(row) == 2:
+            keyboard.append(row)
+            row = []
+    if row:
+        keyboard.append(row)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+    return InlineKeyboardMarkup(keyboard)
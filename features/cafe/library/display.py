@@ -0,0 +1,89 @@
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from features.cafe.library.categories import get_category_label
+from features.lists.bookmarks import get_bookmark_button, KIND_BOOK
+from config import Config
+
+MAX_DESCRIPTION_PREVIEW = 300
+
+
+def format_book_text(book) -> str:
+    """Book details message"""
+    text = f"📖 {book.title}\n"
+    if book.author:
+        text += f"✍️ {book.author}\n"
+    text += f"🗂️ {get_category_label(book.category)}\n"
+    text += f"⬇️ {book.download_count or 0} دانلود\n"
+
+    if book.description:
+        description = book.description
+        if len(description) > MAX_DESCRIPTION_PREVIEW:
+            description = description[:MAX_DESCRIPTION_PREVIEW] + "..."
+        text += f"\n{description}"
+
+    return text
+
+
+def format_results_text(title: str, result: dict) -> str:
+    """
+    Header for a page of books (search results or a category)
+
+    Args:
+        title: First line (e.g. the query or category label)
+        result: Dict returned by search_books() / list_category()
+    """
+    total = result["total"]
+    if not total:
+        return f"{title}\n\n😕 کتابی پیدا نشد."
+
+    pages = (total + Config.LIBRARY_PAGE_SIZE - 1) // Config.LIBRARY_PAGE_SIZE
+    text = f"{title}\n\n📚 {total} کتاب (صفحه {result['page'] + 1} از {pages})"
+
+    facets = result.get("facets")
+    if facets and len(facets) > 1:
+        text += "\n\n" + "\n".join(
+            f"{get_category_label(key)}: {count}"
+            for key, count in sorted(facets.items(), key=lambda item: -item[1])
+        )
+
+    return text
+
+
+def get_results_keyboard(result: dict, page_callback: str, back_callback: str = "cafe_library"):
+    """
+    One button per book plus prev/next navigation
+
+    Args:
+        result: Dict returned by search_books() / list_category()
+        page_callback: Callback prefix; the page number is appended
+        back_callback: Callback for the back button
+    """
+    keyboard = []
+    for book in result["books"]:
+        label = f"📖 {book.title}"
+        if book.author:
+            label += f" - {book.author}"
+        keyboard.append([InlineKeyboardButton(label[:60], callback_data=f"library_book_{book.id}")])
+
+    page = result["page"]
+    navigation = []
+    if page > 0:
+        navigation.append(InlineKeyboardButton("◀️ قبلی", callback_data=f"{page_callback}{page - 1}"))
+    if (page + 1) * Config.LIBRARY_PAGE_SIZE < result["total"]:
+        navigation.append(InlineKeyboardButton("بعدی ▶️", callback_data=f"{page_callback}{page + 1}"))
+    if navigation:
+        keyboard.append(navigation)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت", callback_data=back_callback)])
+    return InlineKeyboardMarkup(keyboard)
+
+
+def get_book_keyboard(book):
+    """Download + back buttons under a book"""
+    keyboard = [
+        [
+            InlineKeyboardButton("⬇️ دریافت کتاب", callback_data=f"library_get_{book.id}"),
+            get_bookmark_button(KIND_BOOK, book.id)
+        ],
+        [InlineKeyboardButton("🔙 برگشت به کتابخانه", callback_data="cafe_library")]
+    ]
+    return InlineKeyboardMarkup(keyboard)
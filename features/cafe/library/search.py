@@ -0,0 +1,164 @@
+"""
+Library search
+Two interchangeable backends, picked by Config.LIBRARY_SEARCH_BACKEND:
+
+- memory (default): utils.search_index.SearchIndex built once from the
+  books table and kept up to date by add/remove calls from books.py,
+  so queries never touch the database except to load the hit page
+- postgres: to_tsvector/to_tsquery over books.search_text (GIN index
+  ix_books_search_text_fts), for deployments running several workers
+"""
+
+import threading
+from sqlalchemy import func, literal_column
+from models.book import Book
+from utils.search_index import SearchIndex
+from utils.persian import tokenize
+from config import Config
+
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "author": 2.0,
+    "description": 1.0
+}
+
+# Books loaded per query while building the memory index
+BUILD_BATCH_SIZE = 1000
+
+_index = None
+_index_lock = threading.Lock()
+
+
+# ==================== Memory backend ====================
+
+def _index_book(index: SearchIndex, book: Book):
+    index.add(book.id, book.get_search_fields(), facets={"category": book.category})
+
+
+def get_index(db) -> SearchIndex:
+    """Return the memory index, building it from the books table on first use"""
+    global _index
+    if _index is not None:
+        return _index
+
+    with _index_lock:
+        if _index is None:
+            index = SearchIndex(FIELD_WEIGHTS)
+            last_id = 0
+            while True:
+                batch = db.query(Book).filter(
+                    Book.is_active == True,
+                    Book.id > last_id
+                ).order_by(Book.id).limit(BUILD_BATCH_SIZE).all()
+                if not batch:
+                    break
+                for book in batch:
+                    _index_book(index, book)
+                last_id = batch[-1].id
+            _index = index
+            print(f"📚 Library index built: {len(index)} books")
+    return _index
+
+
+def on_book_saved(book: Book):
+    """Keep the memory index in sync after a book is added or edited"""
+    if _index is None:
+        return  # Not built yet; the first search will load the book
+    with _index_lock:
+        if book.is_active:
+            _index_book(_index, book)
+        else:
+            _index.remove(book.id)
+
+
+def on_book_removed(book_id: int):
+    """Drop a book from the memory index"""
+    if _index is None:
+        return
+    with _index_lock:
+        _index.remove(book_id)
+
+
+def _search_memory(db, query: str, category: str, offset: int, limit: int):
+    result = get_index(db).search(
+        query,
+        limit=limit,
+        offset=offset,
+        filters={"category": category} if category else None
+    )
+    return result.ids, result.total, result.facets.get("category", {})
+
+
+# ==================== Postgres backend ====================
+
+def _build_tsquery(query: str) -> str:
+    """All words must match; the last one as a prefix (search-as-you-type)"""
+    words = list(dict.fromkeys(tokenize(query)))
+    if not words:
+        return ""
+    words[-1] += ":*"
+    return " & ".join(words)
+
+
+def _search_postgres(db, query: str, category: str, offset: int, limit: int):
+    tsquery = _build_tsquery(query)
+    if not tsquery:
+        return [], 0, {}
+
+    vector = func.to_tsvector(literal_column("'simple'"), Book.search_text)
+    ts_query = func.to_tsquery(literal_column("'simple'"), tsquery)
+    matches = db.query(Book).filter(Book.is_active == True, vector.op("@@")(ts_query))
+
+    facets = dict(
+        matches.with_entities(Book.category, func.count(Book.id)).group_by(Book.category).all()
+    )
+
+    if category:
+        matches = matches.filter(Book.category == category)
+    total = facets.get(category, 0) if category else sum(facets.values())
+
+    rows = matches.with_entities(Book.id).order_by(
+        func.ts_rank_cd(vector, ts_query).desc(),
+        Book.download_count.desc(),
+        Book.id
+    ).offset(offset).limit(limit).all()
+
+    return [row.id for row in rows], total, facets
+
+
+# ==================== Public API ====================
+
+def search_books(db, query: str, category: str = None, page: int = 0,
+                 page_size: int = None) -> dict:
+    """
+    Search active books
+
+    Args:
+        db: Database session
+        query: Free text (Persian/English)
+        category: Optional category key filter
+        page: Page number (0-based)
+        page_size: Results per page (default Config.LIBRARY_PAGE_SIZE)
+
+    Returns:
+        {"books": [Book], "total": int, "facets": {category: count}, "page": int}
+    """
+    page_size = page_size or Config.LIBRARY_PAGE_SIZE
+    offset = page * page_size
+
+    if Config.LIBRARY_SEARCH_BACKEND == "postgres":
+        ids, total, facets = _search_postgres(db, query, category, offset, page_size)
+    else:
+        ids, total, facets = _search_memory(db, query, category, offset, page_size)
+
+    # Load the page in one query, keeping rank order
+    books = {}
+    if ids:
+        books = {book.id: book for book in db.query(Book).filter(Book.id.in_(ids)).all()}
+
+    return {
+        "books": [books[book_id] for book_id in ids if book_id in books],
+        "total": total,
+        "facets": facets,
+        "page": page
+    }
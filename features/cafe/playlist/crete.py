@@ -0,0 +1,67 @@
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.playlist.manage import create_playlist, get_user_playlists
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_PLAYLIST_CREATE
+from config import Config
+
+MAX_NAME_LENGTH = 64
+
+
+async def start_create_playlist(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Ask for the playlist name"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+
+    db = Session()
+    try:
+        if len(get_user_playlists(db, user_id)) >= Config.MAX_PLAYLISTS_PER_USER:
+            await query.answer(f"❌ حداکثر {Config.MAX_PLAYLISTS_PER_USER} پلی‌لیست می‌تونی داشته باشی!", show_alert=True)
+            return
+    finally:
+        db.close()
+
+    await query.answer()
+    set_state(user_id, STATE_PLAYLIST_CREATE)
+    await query.edit_message_text(
+        "➕ ساخت پلی‌لیست\n\nاسم پلی‌لیستت رو بفرست:",
+        reply_markup=get_back_button("cafe_playlist")
+    )
+
+
+async def handle_create_playlist_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Playlist name typed after start_create_playlist"""
+    user_id = update.effective_user.id
+    if get_state(user_id)["state"] != STATE_PLAYLIST_CREATE or not update.message.text:
+        return
+
+    name = " ".join(update.message.text.split())
+    if not name:
+        await update.message.reply_text("❌ اسم پلی‌لیست نمی‌تونه خالی باشه!")
+        return
+
+    clear_state(user_id)
+    db = Session()
+    try:
+        if len(get_user_playlists(db, user_id)) >= Config.MAX_PLAYLISTS_PER_USER:
+            await update.message.reply_text(f"❌ حداکثر {Config.MAX_PLAYLISTS_PER_USER} پلی‌لیست می‌تونی داشته باشی!")
+            return
+
+        playlist = create_playlist(db, user_id, name[:MAX_NAME_LENGTH])
+        keyboard = [
+            [InlineKeyboardButton("➕ افزودن آهنگ", callback_data=f"pl_add_{playlist.id}")],
+            [InlineKeyboardButton("🎵 پلی‌لیست‌هام", callback_data="cafe_playlist")]
+        ]
+        await update.message.reply_text(
+            f"✅ پلی‌لیست «{playlist.name}» ساخته شد!\nتا {Config.MAX_PLAYLIST_SONGS} آهنگ می‌تونی بهش اضافه کنی.",
+            reply_markup=InlineKeyboardMarkup(keyboard)
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error creating playlist: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ساخت پلی‌لیست! دوباره تلاش کن.")
+    finally:
+        db.close()
@@ -0,0 +1,326 @@
+"""
+Playlists: storage helpers and the playlist pages
+
+The MAX_PLAYLIST_SONGS cap is enforced by the database: add_track()
+reserves a slot with a conditional UPDATE on playlists.track_count
+(row-locked, so concurrent adds can't overshoot) and the
+ck_playlists_track_count constraint rejects anything that slips past.
+"""
+
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from sqlalchemy import func
+from database import Session
+from models.playlist import Playlist, PlaylistTrack
+from features.lists.bookmarks import get_bookmark_button, KIND_PLAYLIST
+from features.search import global_search
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_PLAYLIST_ADD
+from config import Config
+
+GAP = PlaylistTrack.POSITION_GAP
+
+
+# ==================== Data ====================
+
+def create_playlist(db, owner_id: int, name: str) -> Playlist:
+    playlist = Playlist(owner_id=owner_id, name=name[:64], track_count=0)
+    db.add(playlist)
+    db.commit()
+    db.refresh(playlist)
+
+    global_search.on_playlist_saved(playlist)
+    return playlist
+
+
+def get_playlist(db, playlist_id: int, owner_id: int = None) -> Playlist:
+    query = db.query(Playlist).filter(Playlist.id == playlist_id)
+    if owner_id is not None:
+        query = query.filter(Playlist.owner_id == owner_id)
+    return query.first()
+
+
+def get_user_playlists(db, owner_id: int) -> list:
+    return db.query(Playlist).filter(Playlist.owner_id == owner_id).order_by(Playlist.id).all()
+
+
+def get_tracks(db, playlist_id: int) -> list:
+    return db.query(PlaylistTrack).filter(
+        PlaylistTrack.playlist_id == playlist_id
+    ).order_by(PlaylistTrack.position, PlaylistTrack.id).all()
+
+
+def get_owned_track(db, track_id: int, owner_id: int) -> PlaylistTrack:
+    return db.query(PlaylistTrack).join(
+        Playlist, Playlist.id == PlaylistTrack.playlist_id
+    ).filter(PlaylistTrack.id == track_id, Playlist.owner_id == owner_id).first()
+
+
+def add_track(db, playlist_id: int, file_id: str, title: str = None,
+              performer: str = None, duration: int = None) -> PlaylistTrack:
+    """
+    Append a song
+
+    Returns:
+        The new track, or None if the playlist is full
+    """
+    reserved = db.query(Playlist).filter(
+        Playlist.id == playlist_id,
+        Playlist.track_count < Config.MAX_PLAYLIST_SONGS
+    ).update({Playlist.track_count: Playlist.track_count + 1}, synchronize_session=False)
+
+    if not reserved:
+        db.rollback()
+        return None
+
+    last_position = db.query(func.max(PlaylistTrack.position)).filter(
+        PlaylistTrack.playlist_id == playlist_id
+    ).scalar()
+
+    track = PlaylistTrack(
+        playlist_id=playlist_id,
+        position=(last_position or 0) + GAP,
+        file_id=file_id,
+        title=title[:128] if title else None,
+        performer=performer[:128] if performer else None,
+        duration=duration
+    )
+    db.add(track)
+    db.commit()
+    return track
+
+
+def remove_track(db, track: PlaylistTrack):
+    db.query(Playlist).filter(Playlist.id == track.playlist_id).update(
+        {Playlist.track_count: Playlist.track_count - 1}, synchronize_session=False
+    )
+    db.delete(track)
+    db.commit()
+
+
+def move_track(db, track: PlaylistTrack, new_index: int) -> bool:
+    """
+    Move a track to new_index (0-based)
+
+    Only the moved row is updated, at the midpoint between its new
+    neighbours; the playlist is renumbered only when there is no gap left.
+
+    Returns:
+        False if new_index is out of range or unchanged
+    """
+    tracks = get_tracks(db, track.playlist_id)
+    others = [t for t in tracks if t.id != track.id]
+    if not 0 <= new_index <= len(others) or tracks[new_index].id == track.id:
+        return False
+
+    before = others[new_index - 1].position if new_index > 0 else None
+    after = others[new_index].position if new_index < len(others) else None
+
+    if before is None and after is None:
+        track.position = GAP
+    elif before is None:
+        track.position = after - GAP
+    elif after is None:
+        track.position = before + GAP
+    elif after - before >= 2:
+        track.position = (before + after) // 2
+    else:
+        others.insert(new_index, track)
+        for i, t in enumerate(others):
+            t.position = (i + 1) * GAP
+
+    db.commit()
+    return True
+
+
+def delete_playlist(db, playlist: Playlist):
+    db.query(PlaylistTrack).filter(PlaylistTrack.playlist_id == playlist.id).delete(synchronize_session=False)
+    playlist_id = playlist.id
+    db.delete(playlist)
+    db.commit()
+
+    global_search.on_item_removed("playlist", playlist_id)
+
+
+# ==================== Display ====================
+
+def format_playlist_text(playlist: Playlist, tracks: list) -> str:
+    text = f"🎵 {playlist.name}\n"
+    text += f"📀 {playlist.track_count} از {Config.MAX_PLAYLIST_SONGS} آهنگ\n\n"
+    if not tracks:
+        return text + "هنوز آهنگی اضافه نکردی!"
+    return text + "\n".join(f"{i}. {track.get_label()}" for i, track in enumerate(tracks, 1))
+
+
+def get_playlist_keyboard(playlist: Playlist):
+    keyboard = []
+    if playlist.track_count:
+        keyboard.append([InlineKeyboardButton("▶️ پخش کل پلی‌لیست", callback_data=f"pl_play_{playlist.id}")])
+    if not playlist.is_full():
+        keyboard.append([InlineKeyboardButton("➕ افزودن آهنگ", callback_data=f"pl_add_{playlist.id}")])
+    if playlist.track_count:
+        keyboard.append([InlineKeyboardButton("✏️ ویرایش ترتیب", callback_data=f"pl_edit_{playlist.id}")])
+    keyboard.append([
+        get_bookmark_button(KIND_PLAYLIST, playlist.id),
+        InlineKeyboardButton("🗑️ حذف پلی‌لیست", callback_data=f"pl_delete_{playlist.id}")
+    ])
+    keyboard.append([InlineKeyboardButton("🔙 برگشت", callback_data="cafe_playlist")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+def get_edit_keyboard(playlist: Playlist, tracks: list):
+    keyboard = [
+        [
+            InlineKeyboardButton(f"{i}. {track.get_label()}"[:30], callback_data=f"pl_view_{playlist.id}"),
+            InlineKeyboardButton("⬆️", callback_data=f"pl_up_{track.id}"),
+            InlineKeyboardButton("⬇️", callback_data=f"pl_down_{track.id}"),
+            InlineKeyboardButton("❌", callback_data=f"pl_rm_{track.id}")
+        ]
+        for i, track in enumerate(tracks, 1)
+    ]
+    keyboard.append([InlineKeyboardButton("✅ تمام", callback_data=f"pl_view_{playlist.id}")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+# ==================== Handlers ====================
+
+async def playlist_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """My playlists (cafe_playlist callback)"""
+    query = update.callback_query
+    await query.answer()
+
+    db = Session()
+    try:
+        playlists = get_user_playlists(db, update.effective_user.id)
+        keyboard = [
+            [InlineKeyboardButton(f"🎵 {p.name} ({p.track_count})", callback_data=f"pl_view_{p.id}")]
+            for p in playlists
+        ]
+        if len(playlists) < Config.MAX_PLAYLISTS_PER_USER:
+            keyboard.append([InlineKeyboardButton("➕ ساخت پلی‌لیست", callback_data="playlist_create")])
+        keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+
+        text = "🎵 میز پلی‌لیست\n\n"
+        text += "پلی‌لیست‌هات:" if playlists else f"هر پلی‌لیست تا {Config.MAX_PLAYLIST_SONGS} آهنگ جا داره. اولی رو بساز!"
+        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+    finally:
+        db.close()
+
+
+async def handle_playlist_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """pl_view / pl_edit / pl_add / pl_delete (playlist id) and pl_up / pl_down / pl_rm (track id)"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    _, action, item_id = query.data.split("_", 2)
+    item_id = int(item_id)
+
+    db = Session()
+    try:
+        if action in ("up", "down", "rm"):
+            track = get_owned_track(db, item_id, user_id)
+            if not track:
+                await query.answer("❌ این آهنگ پیدا نشد!", show_alert=True)
+                return
+            playlist_id = track.playlist_id
+
+            if action == "rm":
+                remove_track(db, track)
+            else:
+                index = [t.id for t in get_tracks(db, playlist_id)].index(track.id)
+                move_track(db, track, index - 1 if action == "up" else index + 1)
+            action = "edit"
+        else:
+            playlist_id = item_id
+
+        playlist = get_playlist(db, playlist_id, owner_id=user_id)
+        if not playlist:
+            await query.answer("❌ این پلی‌لیست پیدا نشد!", show_alert=True)
+            return
+
+        if action == "delete":
+            delete_playlist(db, playlist)
+            await query.answer("🗑️ پلی‌لیست حذف شد")
+            await query.edit_message_text("🗑️ پلی‌لیست حذف شد.", reply_markup=get_back_button("cafe_playlist"))
+            return
+
+        if action == "add":
+            set_state(user_id, STATE_PLAYLIST_ADD, {"playlist_id": playlist.id})
+            await query.answer()
+            await query.edit_message_text(
+                f"🎵 آهنگ‌ها رو (فایل صوتی) یکی‌یکی بفرست.\n"
+                f"جای خالی: {Config.MAX_PLAYLIST_SONGS - playlist.track_count}",
+                reply_markup=InlineKeyboardMarkup([[
+                    InlineKeyboardButton("✅ تمام", callback_data=f"pl_view_{playlist.id}")
+                ]])
+            )
+            return
+
+        if get_state(user_id)["state"] == STATE_PLAYLIST_ADD:
+            clear_state(user_id)
+
+        await query.answer()
+        tracks = get_tracks(db, playlist.id)
+        if action == "edit" and tracks:
+            await query.edit_message_text(
+                format_playlist_text(playlist, tracks),
+                reply_markup=get_edit_keyboard(playlist, tracks)
+            )
+        else:
+            await query.edit_message_text(
+                format_playlist_text(playlist, tracks),
+                reply_markup=get_playlist_keyboard(playlist)
+            )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Playlist callback error: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+async def handle_add_track_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Audio file sent after pl_add_{id}"""
+    user_id = update.effective_user.id
+    state = get_state(user_id)
+    if state["state"] != STATE_PLAYLIST_ADD:
+        return
+
+    audio = update.message.audio
+    if not audio:
+        await update.message.reply_text("🎵 فقط فایل صوتی (آهنگ) قبول می‌شه!")
+        return
+
+    db = Session()
+    try:
+        playlist = get_playlist(db, state["data"]["playlist_id"], owner_id=user_id)
+        if not playlist:
+            clear_state(user_id)
+            return
+
+        track = add_track(db, playlist.id, audio.file_id, audio.title, audio.performer, audio.duration)
+        db.refresh(playlist)
+        keyboard = InlineKeyboardMarkup([[InlineKeyboardButton("✅ تمام", callback_data=f"pl_view_{playlist.id}")]])
+
+        if not track:
+            clear_state(user_id)
+            await update.message.reply_text(
+                f"❌ پلی‌لیست پره! (حداکثر {Config.MAX_PLAYLIST_SONGS} آهنگ)", reply_markup=keyboard
+            )
+        elif playlist.is_full():
+            clear_state(user_id)
+            await update.message.reply_text(
+                f"✅ {track.get_label()} اضافه شد.\n📀 پلی‌لیست کامل شد!", reply_markup=keyboard
+            )
+        else:
+            await update.message.reply_text(
+                f"✅ {track.get_label()} اضافه شد. ({playlist.track_count}/{Config.MAX_PLAYLIST_SONGS})",
+                reply_markup=keyboard
+            )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding track: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در افزودن آهنگ!")
+    finally:
+        db.close()
@@ -0,0 +1,50 @@
+"""
+Play a whole playlist
+All file_ids come from one ordered query and go out as a single media
+group (Telegram albums hold up to 10 audios, MAX_PLAYLIST_SONGS is 9).
+"""
+
+import traceback
+from telegram import Update, InputMediaAudio
+from telegram.ext import ContextTypes
+from database import Session
+from models.playlist import Playlist, PlaylistTrack
+
+
+def load_playlist_media(db, playlist_id: int, owner_id: int) -> list:
+    """file_ids of an owned playlist in play order (empty if not found)"""
+    rows = db.query(PlaylistTrack.file_id).join(
+        Playlist, Playlist.id == PlaylistTrack.playlist_id
+    ).filter(
+        Playlist.id == playlist_id,
+        Playlist.owner_id == owner_id
+    ).order_by(PlaylistTrack.position, PlaylistTrack.id).all()
+    return [row.file_id for row in rows]
+
+
+async def play_playlist(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """pl_play_{playlist_id}"""
+    query = update.callback_query
+    playlist_id = int(query.data[len("pl_play_"):])
+
+    db = Session()
+    try:
+        file_ids = load_playlist_media(db, playlist_id, update.effective_user.id)
+    finally:
+        db.close()
+
+    if not file_ids:
+        await query.answer("🎵 این پلی‌لیست خالیه!", show_alert=True)
+        return
+
+    await query.answer("▶️ در حال پخش...")
+    chat_id = update.effective_chat.id
+    try:
+        if len(file_ids) == 1:
+            await context.bot.send_audio(chat_id, file_ids[0])
+        else:
+            await context.bot.send_media_group(chat_id, [InputMediaAudio(file_id) for file_id in file_ids])
+    except Exception as e:
+        print(f"❌ Error playing playlist {playlist_id}: {e}")
+        traceback.print_exc()
+        await context.bot.send_message(chat_id, "❌ خطا در پخش پلی‌لیست!")
@@ -0,0 +1,170 @@
+"""
+Podcast catalog: episodes, chapters and catalog pages
+Episodes are read on every play, so each one is cached with its chapter
+file_ids (one query per miss); catalog pages use keyset pagination on
+ix_podcast_episodes_catalog. Both caches are dropped on admin changes.
+"""
+
+from models.podcast import PodcastEpisode, PodcastChapter
+from utils.cache import TTLCache
+from config import Config
+
+# episode_id -> plain dict with chapters
+episode_cache = TTLCache(ttl=Config.PODCAST_CACHE_TTL, max_size=1000)
+# before_id -> catalog page
+catalog_cache = TTLCache(ttl=Config.PODCAST_CACHE_TTL, max_size=200)
+
+
+def _invalidate(episode_id: int = None):
+    catalog_cache.invalidate()
+    if episode_id is not None:
+        episode_cache.invalidate(episode_id)
+
+
+# ==================== Admin ====================
+
+def add_episode(db, title: str, file_id: str = None, file_unique_id: str = None, duration: int = None,
+                show: str = None, description: str = None, added_by: int = None) -> tuple:
+    """
+    Store an episode (an already stored audio file is reused, not duplicated)
+
+    Returns:
+        (episode, created)
+    """
+    if file_unique_id:
+        existing = db.query(PodcastEpisode).filter(PodcastEpisode.file_unique_id == file_unique_id).first()
+        if existing:
+            return existing, False
+
+    episode = PodcastEpisode(
+        title=title[:128],
+        show=show[:64] if show else None,
+        description=description,
+        file_id=file_id,
+        file_unique_id=file_unique_id,
+        duration=duration,
+        chapter_count=0,
+        play_count=0,
+        is_active=True,
+        added_by=added_by
+    )
+    db.add(episode)
+    db.commit()
+    db.refresh(episode)
+
+    _invalidate()
+    return episode, True
+
+
+def add_chapter(db, episode_id: int, file_id: str, title: str = None, start_seconds: int = None,
+                duration: int = None, file_unique_id: str = None) -> PodcastChapter:
+    """Append a chapter; returns None if the episode doesn't exist"""
+    numbered = db.query(PodcastEpisode).filter(PodcastEpisode.id == episode_id).update(
+        {PodcastEpisode.chapter_count: PodcastEpisode.chapter_count + 1}, synchronize_session=False
+    )
+    if not numbered:
+        db.rollback()
+        return None
+
+    number = db.query(PodcastEpisode.chapter_count).filter(PodcastEpisode.id == episode_id).scalar()
+    chapter = PodcastChapter(
+        episode_id=episode_id,
+        number=number,
+        title=title[:128] if title else None,
+        start_seconds=start_seconds,
+        duration=duration,
+        file_id=file_id,
+        file_unique_id=file_unique_id
+    )
+    db.add(chapter)
+    db.commit()
+
+    _invalidate(episode_id)
+    return chapter
+
+
+def deactivate_episode(db, episode_id: int) -> bool:
+    updated = db.query(PodcastEpisode).filter(
+        PodcastEpisode.id == episode_id,
+        PodcastEpisode.is_active == True
+    ).update({PodcastEpisode.is_active: False}, synchronize_session=False)
+    db.commit()
+
+    _invalidate(episode_id)
+    return bool(updated)
+
+
+# ==================== Reads ====================
+
+def get_episode(db, episode_id: int) -> dict:
+    """
+    Active episode with its chapters (cached)
+
+    Returns:
+        {"id", "title", "show", "description", "duration", "file_id", "play_count",
+         "chapters": [{"number", "title", "start_seconds", "file_id"}, ...]} or None
+    """
+    def load():
+        episode = db.query(PodcastEpisode).filter(
+            PodcastEpisode.id == episode_id,
+            PodcastEpisode.is_active == True
+        ).first()
+        if not episode:
+            return None
+
+        chapters = []
+        if episode.chapter_count:
+            chapters = [
+                {
+                    "number": chapter.number,
+                    "title": chapter.title,
+                    "start_seconds": chapter.start_seconds,
+                    "file_id": chapter.file_id
+                }
+                for chapter in db.query(PodcastChapter).filter(
+                    PodcastChapter.episode_id == episode_id
+                ).order_by(PodcastChapter.number)
+            ]
+
+        return {
+            "id": episode.id,
+            "title": episode.title,
+            "show": episode.show,
+            "description": episode.description,
+            "duration": episode.duration,
+            "file_id": episode.file_id,
+            "play_count": episode.play_count,
+            "chapters": chapters
+        }
+
+    return episode_cache.get_or_set(episode_id, load)
+
+
+def get_catalog_page(db, before_id: int = None) -> dict:
+    """
+    Newest episodes first; before_id is the last id of the previous page
+
+    Returns:
+        {"rows": [{"id", "title", "show"}, ...], "next": before_id of the next page or None}
+    """
+    def load():
+        query = db.query(PodcastEpisode.id, PodcastEpisode.title, PodcastEpisode.show).filter(
+            PodcastEpisode.is_active == True
+        )
+        if before_id:
+            query = query.filter(PodcastEpisode.id < before_id)
+        rows = query.order_by(PodcastEpisode.id.desc()).limit(Config.PODCAST_PAGE_SIZE + 1).all()
+
+        has_next = len(rows) > Config.PODCAST_PAGE_SIZE
+        rows = [{"id": row.id, "title": row.title, "show": row.show} for row in rows[:Config.PODCAST_PAGE_SIZE]]
+        return {"rows": rows, "next": rows[-1]["id"] if has_next else None}
+
+    return catalog_cache.get_or_set(before_id, load)
+
+
+def format_seconds(seconds: int) -> str:
+    if seconds is None:
+        return ""
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
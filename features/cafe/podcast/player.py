@@ -0,0 +1,173 @@
+"""
+Podcast desk: catalog, episode pages and chapter playback
+Audio is always sent by cached file_id (nothing is re-uploaded); long
+episodes go out one chapter at a time, each with a button for the next.
+"""
+
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.podcast.catalog import get_catalog_page, get_episode, format_seconds
+from features.cafe.podcast.progress import get_progress, record_progress, record_play
+
+
+# ==================== Display ====================
+
+def get_catalog_keyboard(page: dict, is_first: bool):
+    keyboard = [
+        [InlineKeyboardButton(
+            f"🎙️ {row['title']}" + (f" | {row['show']}" if row["show"] else ""),
+            callback_data=f"pod_ep_{row['id']}"
+        )]
+        for row in page["rows"]
+    ]
+
+    nav = []
+    if not is_first:
+        nav.append(InlineKeyboardButton("⏮️ اول", callback_data="cafe_podcast"))
+    if page["next"]:
+        nav.append(InlineKeyboardButton("⏭️ بعدی", callback_data=f"pod_page_{page['next']}"))
+    if nav:
+        keyboard.append(nav)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+def format_episode_text(episode: dict, progress: dict) -> str:
+    text = f"🎙️ {episode['title']}\n"
+    if episode["show"]:
+        text += f"📻 {episode['show']}\n"
+    if episode["duration"]:
+        text += f"⏱️ {format_seconds(episode['duration'])}\n"
+    text += f"🎧 {episode['play_count']} بار پخش\n"
+
+    if episode["description"]:
+        text += f"\n{episode['description']}\n"
+
+    if episode["chapters"]:
+        text += "\n📖 فصل‌ها:\n"
+        for chapter in episode["chapters"]:
+            start = f" ({format_seconds(chapter['start_seconds'])})" if chapter["start_seconds"] is not None else ""
+            text += f"{chapter['number']}. {chapter['title'] or 'فصل ' + str(chapter['number'])}{start}\n"
+
+    if progress:
+        text += "\n✅ کامل گوش دادی" if progress["completed"] else f"\n⏸️ تا فصل {progress['chapter']} گوش دادی"
+    return text
+
+
+def get_episode_keyboard(episode: dict, progress: dict):
+    keyboard = []
+    chapters = episode["chapters"]
+
+    if chapters and progress and not progress["completed"] and progress["chapter"] < len(chapters):
+        keyboard.append([InlineKeyboardButton(
+            f"⏯️ ادامه از فصل {progress['chapter'] + 1}",
+            callback_data=f"pod_ch_{episode['id']}_{progress['chapter'] + 1}"
+        )])
+    if episode["file_id"]:
+        keyboard.append([InlineKeyboardButton("▶️ پخش کامل", callback_data=f"pod_ch_{episode['id']}_0")])
+
+    row = []
+    for chapter in chapters:
+        row.append(InlineKeyboardButton(f"📖 {chapter['number']}", callback_data=f"pod_ch_{episode['id']}_{chapter['number']}"))
+        if len(row) == 5:
+            keyboard.append(row)
+            row = []
+    if row:
+        keyboard.append(row)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت", callback_data="cafe_podcast")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+# ==================== Handlers ====================
+
+async def podcast_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Podcast catalog (cafe_podcast / pod_page_{before_id} callbacks)"""
+    query = update.callback_query
+    await query.answer()
+
+    before_id = int(query.data[len("pod_page_"):]) if query.data.startswith("pod_page_") else None
+
+    db = Session()
+    try:
+        page = get_catalog_page(db, before_id)
+    finally:
+        db.close()
+
+    if not page["rows"]:
+        text = "🎙️ میز پادکست\n\nهنوز اپیزودی منتشر نشده!"
+    else:
+        text = "🎙️ میز پادکست\n\nجدیدترین اپیزودها:"
+    await query.edit_message_text(text, reply_markup=get_catalog_keyboard(page, is_first=before_id is None))
+
+
+async def show_episode(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """pod_ep_{episode_id}"""
+    query = update.callback_query
+    episode_id = int(query.data[len("pod_ep_"):])
+
+    db = Session()
+    try:
+        episode = get_episode(db, episode_id)
+        if not episode:
+            await query.answer("❌ این اپیزود پیدا نشد!", show_alert=True)
+            return
+        progress = get_progress(db, update.effective_user.id, episode_id)
+    finally:
+        db.close()
+
+    await query.answer()
+    await query.edit_message_text(
+        format_episode_text(episode, progress),
+        reply_markup=get_episode_keyboard(episode, progress)
+    )
+
+
+async def play_chapter(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """pod_ch_{episode_id}_{number} (0 = full episode)"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    episode_id, number = (int(part) for part in query.data[len("pod_ch_"):].split("_"))
+
+    db = Session()
+    try:
+        episode = get_episode(db, episode_id)
+    finally:
+        db.close()
+
+    chapters = episode["chapters"] if episode else []
+    if not episode or (number == 0 and not episode["file_id"]) or number > len(chapters):
+        await query.answer("❌ این قسمت پیدا نشد!", show_alert=True)
+        return
+
+    if number == 0:
+        file_id = episode["file_id"]
+        caption = f"🎙️ {episode['title']}"
+        keyboard = None
+    else:
+        chapter = chapters[number - 1]
+        file_id = chapter["file_id"]
+        caption = f"🎙️ {episode['title']}\n📖 فصل {number} از {len(chapters)}"
+        if chapter["title"]:
+            caption += f": {chapter['title']}"
+        keyboard = None
+        if number < len(chapters):
+            keyboard = InlineKeyboardMarkup([[
+                InlineKeyboardButton("⏭️ فصل بعد", callback_data=f"pod_ch_{episode_id}_{number + 1}")
+            ]])
+
+    await query.answer()
+    try:
+        await context.bot.send_audio(update.effective_chat.id, file_id, caption=caption, reply_markup=keyboard)
+    except Exception as e:
+        print(f"❌ Error sending podcast {episode_id} chapter {number}: {e}")
+        traceback.print_exc()
+        await context.bot.send_message(update.effective_chat.id, "❌ خطا در پخش اپیزود!")
+        return
+
+    if number <= 1:
+        record_play(episode_id)
+    record_progress(user_id, episode_id, number, completed=number == 0 or number == len(chapters))
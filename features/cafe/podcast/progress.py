@@ -0,0 +1,142 @@
+"""
+Batched podcast progress and play counts
+record_progress() / record_play() only update memory; a user skipping
+through ten chapters between flushes still becomes one row.
+flush_podcast_progress() upserts every pending row in chunks and adds
+play counts with one UPDATE ... FROM (VALUES ...).
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+
+# Rows per statement
+FLUSH_CHUNK_SIZE = 1000
+
+# Pending progress: (user_id, episode_id) -> {"chapter", "completed", "updated_at"}
+_pending = {}
+# Pending plays: episode_id -> count
+_plays = Counter()
+_lock = threading.Lock()
+
+
+def _merge(current: dict, chapter: int, completed: bool, at: datetime) -> dict:
+    """Latest chapter wins; once completed stays completed"""
+    if current is None:
+        return {"chapter": chapter, "completed": completed, "updated_at": at}
+    if at >= current["updated_at"]:
+        return {"chapter": chapter, "completed": completed or current["completed"], "updated_at": at}
+    return {**current, "completed": completed or current["completed"]}
+
+
+def record_progress(user_id: int, episode_id: int, chapter: int, completed: bool = False, at: datetime = None):
+    at = at or datetime.now(timezone.utc)
+    with _lock:
+        key = (user_id, episode_id)
+        _pending[key] = _merge(_pending.get(key), chapter, completed, at)
+
+
+def record_play(episode_id: int):
+    with _lock:
+        _plays[episode_id] += 1
+
+
+def get_progress(db, user_id: int, episode_id: int) -> dict:
+    """
+    Progress including writes not flushed yet
+
+    Returns:
+        {"chapter", "completed"} or None if the user never played the episode
+    """
+    from models.podcast import PodcastProgress
+
+    with _lock:
+        pending = _pending.get((user_id, episode_id))
+    if pending:
+        return {"chapter": pending["chapter"], "completed": pending["completed"]}
+
+    row = db.get(PodcastProgress, (user_id, episode_id))
+    if row:
+        return {"chapter": row.chapter, "completed": row.completed}
+    return None
+
+
+def take_pending() -> tuple:
+    """Swap out pending progress rows and play counts"""
+    global _pending, _plays
+
+    with _lock:
+        pending, _pending = _pending, {}
+        plays, _plays = _plays, Counter()
+
+    rows = [
+        {"user_id": user_id, "episode_id": episode_id, **progress}
+        for (user_id, episode_id), progress in pending.items()
+    ]
+    play_rows = [{"episode_id": episode_id, "plays": count} for episode_id, count in plays.items()]
+    return rows, play_rows
+
+
+def _restore(rows: list, play_rows: list):
+    """Put rows back after a failed flush (newer in-memory progress wins)"""
+    with _lock:
+        for row in rows:
+            key = (row["user_id"], row["episode_id"])
+            current = _pending.get(key)
+            restored = {"chapter": row["chapter"], "completed": row["completed"], "updated_at": row["updated_at"]}
+            if current:
+                restored = _merge(restored, current["chapter"], current["completed"], current["updated_at"])
+            _pending[key] = restored
+        for row in play_rows:
+            _plays[row["episode_id"]] += row["plays"]
+
+
+def flush_podcast_progress() -> int:
+    """
+    Write pending progress to podcast_progress and plays to podcast_episodes
+
+    Returns:
+        Number of progress rows flushed
+    """
+    from sqlalchemy import update, or_, Integer
+    from sqlalchemy.dialects.postgresql import insert
+    from database import Session
+    from models.podcast import PodcastEpisode, PodcastProgress
+    from utils.helpers import chunked, values_table
+
+    rows, play_rows = take_pending()
+    if not rows and not play_rows:
+        return 0
+
+    db = Session()
+    try:
+        for chunk in chunked(rows, FLUSH_CHUNK_SIZE):
+            stmt = insert(PodcastProgress).values(chunk)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["user_id", "episode_id"],
+                set_={
+                    "chapter": stmt.excluded.chapter,
+                    "completed": or_(PodcastProgress.completed, stmt.excluded.completed),
+                    "updated_at": stmt.excluded.updated_at
+                },
+                where=PodcastProgress.updated_at <= stmt.excluded.updated_at
+            ))
+
+        for chunk in chunked(play_rows, FLUSH_CHUNK_SIZE):
+            v = values_table("v", {"episode_id": Integer(), "plays": Integer()}, chunk)
+            db.execute(
+                update(PodcastEpisode)
+                .where(PodcastEpisode.id == v.c.episode_id)
+                .values(play_count=PodcastEpisode.play_count + v.c.plays)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.commit()
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        _restore(rows, play_rows)
+        print(f"❌ Podcast progress flush failed: {e}")
+        return 0
+    finally:
+        db.close()
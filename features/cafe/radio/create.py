@@ -0,0 +1,107 @@
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from database import Session
+from features.cafe.radio.station import (
+    create_station,
+    get_owned_station,
+    parse_tags,
+    format_station_text,
+    MAX_NAME_LENGTH,
+    MAX_TAGS
+)
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_RADIO_CREATE
+
+
+def parse_station_input(text: str) -> dict:
+    """
+    Parse the create-station message
+
+    Format:
+        first line: station name
+        any #hashtags: tags
+        other lines: description
+
+    Returns:
+        {"name", "tags", "description"}, or None if there is no name
+    """
+    lines = [line.strip() for line in (text or "").strip().splitlines()]
+    if not lines or not lines[0]:
+        return None
+
+    name = " ".join(word for word in lines[0].split() if not word.startswith("#"))
+    description = "\n".join(
+        line for line in lines[1:]
+        if line and not all(word.startswith("#") for word in line.split())
+    )
+
+    if not name:
+        return None
+
+    return {
+        "name": name[:MAX_NAME_LENGTH],
+        "tags": parse_tags(text),
+        "description": description or None
+    }
+
+
+async def start_create_station(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Ask for station name, tags and description"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+
+    db = Session()
+    try:
+        if get_owned_station(db, user_id):
+            await query.answer("📻 تو از قبل یه ایستگاه داری!", show_alert=True)
+            return
+    finally:
+        db.close()
+
+    await query.answer()
+    set_state(user_id, STATE_RADIO_CREATE)
+    await query.edit_message_text(
+        "➕ ساخت ایستگاه\n\n"
+        "خط اول: اسم ایستگاه\n"
+        f"تگ‌ها: با # (حداکثر {MAX_TAGS} تا)\n"
+        "بقیه‌ی خط‌ها: توضیحات\n\n"
+        "مثال:\n"
+        "رادیو شب\n"
+        "#موسیقی #آرام\n"
+        "آهنگ‌های آرام برای آخر شب",
+        reply_markup=get_back_button("cafe_radio")
+    )
+
+
+async def handle_create_station_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Station details typed after start_create_station"""
+    user_id = update.effective_user.id
+    if get_state(user_id)["state"] != STATE_RADIO_CREATE or not update.message.text:
+        return
+
+    fields = parse_station_input(update.message.text)
+    if not fields:
+        await update.message.reply_text("❌ خط اول باید اسم ایستگاه باشه!")
+        return
+
+    clear_state(user_id)
+    db = Session()
+    try:
+        if get_owned_station(db, user_id):
+            await update.message.reply_text("📻 تو از قبل یه ایستگاه داری!")
+            return
+
+        station = create_station(db, owner_id=user_id, **fields)
+        keyboard = [[InlineKeyboardButton("📻 ایستگاه من", callback_data=f"radio_st_{station.id}")]]
+        await update.message.reply_text(
+            f"✅ ایستگاهت ساخته شد!\n\n{format_station_text(station)}",
+            reply_markup=InlineKeyboardMarkup(keyboard)
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error creating station: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ساخت ایستگاه! دوباره تلاش کن.")
+    finally:
+        db.close()
@@ -0,0 +1,203 @@
+"""
+Station listings: most listened and newest stations
+Pages use keyset pagination on ix_stations_ranking / the primary key
+(cost stays flat however deep the user browses) and are cached in
+station.listing_cache, so repeated browsing doesn't hit the database.
+"""
+
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from sqlalchemy import and_, or_
+from database import Session
+from models.station import Station, StationTag
+from features.cafe.radio.station import listing_cache, is_subscribed_to_tag, subscribe_tag, unsubscribe_tag
+from config import Config
+
+
+def to_listing_rows(stations: list) -> list:
+    """Plain rows (safe to cache after the session closes)"""
+    return [
+        {
+            "id": station.id,
+            "name": station.name,
+            "identifier": station.identifier,
+            "listener_count": station.listener_count
+        }
+        for station in stations
+    ]
+
+
+def _page(rows: list, cursor_of) -> dict:
+    """Split one extra row off to know whether there is a next page"""
+    size = Config.RADIO_PAGE_SIZE
+    has_next = len(rows) > size
+    rows = rows[:size]
+    return {
+        "rows": rows,
+        "next": cursor_of(rows[-1]) if has_next else None
+    }
+
+
+def get_top_page(db, after: tuple = None) -> dict:
+    """
+    Stations by listener count (ties: newest first)
+
+    Args:
+        after: (listener_count, id) of the last row of the previous page
+
+    Returns:
+        {"rows": [...], "next": cursor or None}
+    """
+    def load():
+        stations = db.query(Station).filter(Station.is_active == True)
+        if after:
+            count, station_id = after
+            stations = stations.filter(or_(
+                Station.listener_count < count,
+                and_(Station.listener_count == count, Station.id < station_id)
+            ))
+        stations = stations.order_by(
+            Station.listener_count.desc(), Station.id.desc()
+        ).limit(Config.RADIO_PAGE_SIZE + 1).all()
+        return _page(to_listing_rows(stations), lambda row: (row["listener_count"], row["id"]))
+
+    return listing_cache.get_or_set(("top", after), load)
+
+
+def get_new_page(db, before_id: int = None) -> dict:
+    """Newest stations first; before_id is the last id of the previous page"""
+    def load():
+        stations = db.query(Station).filter(Station.is_active == True)
+        if before_id:
+            stations = stations.filter(Station.id < before_id)
+        stations = stations.order_by(Station.id.desc()).limit(Config.RADIO_PAGE_SIZE + 1).all()
+        return _page(to_listing_rows(stations), lambda row: row["id"])
+
+    return listing_cache.get_or_set(("new", before_id), load)
+
+
+def get_tag_page(db, tag: str, before_id: int = None) -> dict:
+    """Stations with a tag (range scan on station_tags), newest first"""
+    def load():
+        station_ids = db.query(StationTag.station_id).filter(StationTag.tag == tag)
+        if before_id:
+            station_ids = station_ids.filter(StationTag.station_id < before_id)
+        station_ids = station_ids.order_by(StationTag.station_id.desc()).limit(Config.RADIO_PAGE_SIZE + 1)
+
+        stations = db.query(Station).filter(
+            Station.id.in_(station_ids.scalar_subquery()),
+            Station.is_active == True
+        ).order_by(Station.id.desc()).all()
+        return _page(to_listing_rows(stations), lambda row: row["id"])
+
+    return listing_cache.get_or_set(("tag", tag, before_id), load)
+
+
+def get_tag_subscription_button(tag: str, subscribed: bool):
+    if subscribed:
+        return InlineKeyboardButton(f"🔕 لغو دنبال کردن #{tag}", callback_data=f"radio_tunsub_{tag}")
+    return InlineKeyboardButton(f"🔔 دنبال کردن #{tag}", callback_data=f"radio_tsub_{tag}")
+
+
+def get_listing_keyboard(page: dict, next_callback: str = None, first_callback: str = None,
+                         top_row: list = None):
+    """
+    One button per station plus navigation
+
+    Args:
+        page: Dict returned by get_*_page()
+        next_callback: Callback for the next page (None hides the button)
+        first_callback: Callback for the first page (None hides the button)
+        top_row: Optional buttons shown above the stations
+    """
+    keyboard = [top_row] if top_row else []
+    keyboard += [
+        [InlineKeyboardButton(
+            f"📻 {row['name']} | 🎧 {row['listener_count']}",
+            callback_data=f"radio_st_{row['id']}"
+        )]
+        for row in page["rows"]
+    ]
+
+    navigation = []
+    if first_callback:
+        navigation.append(InlineKeyboardButton("⏮️ اول", callback_data=first_callback))
+    if next_callback and page["next"] is not None:
+        navigation.append(InlineKeyboardButton("بعدی ▶️", callback_data=next_callback))
+    if navigation:
+        keyboard.append(navigation)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به رادیو", callback_data="cafe_radio")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+async def handle_listing_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    radio_top / radio_top_{count}_{id}
+    radio_new / radio_new_{id}
+    radio_tag_{tag} / radio_tag_{tag}_{id}
+    """
+    query = update.callback_query
+    parts = query.data.split("_")
+    kind = parts[1]
+    top_row = None
+
+    db = Session()
+    try:
+        if kind == "top":
+            after = (int(parts[2]), int(parts[3])) if len(parts) == 4 else None
+            page = get_top_page(db, after)
+            title = "🏆 پرشنونده‌ترین ایستگاه‌ها"
+            next_callback = f"radio_top_{page['next'][0]}_{page['next'][1]}" if page["next"] else None
+            first_callback = "radio_top" if after else None
+
+        elif kind == "new":
+            before_id = int(parts[2]) if len(parts) == 3 else None
+            page = get_new_page(db, before_id)
+            title = "🆕 تازه‌ترین ایستگاه‌ها"
+            next_callback = f"radio_new_{page['next']}" if page["next"] else None
+            first_callback = "radio_new" if before_id else None
+
+        else:
+            tag = parts[2]
+            before_id = int(parts[3]) if len(parts) == 4 else None
+            page = get_tag_page(db, tag, before_id)
+            title = f"🏷️ #{tag}"
+            next_callback = f"radio_tag_{tag}_{page['next']}" if page["next"] else None
+            first_callback = f"radio_tag_{tag}" if before_id else None
+            top_row = [get_tag_subscription_button(
+                tag, is_subscribed_to_tag(db, tag, update.effective_user.id)
+            )]
+
+        await query.answer()
+        if not page["rows"]:
+            title += "\n\n😕 ایستگاهی پیدا نشد."
+        await query.edit_message_text(
+            title,
+            reply_markup=get_listing_keyboard(page, next_callback, first_callback, top_row)
+        )
+    finally:
+        db.close()
+
+
+async def handle_tag_subscription_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """radio_tsub_{tag} / radio_tunsub_{tag}"""
+    query = update.callback_query
+    _, action, tag = query.data.split("_", 2)
+    user_id = update.effective_user.id
+
+    db = Session()
+    try:
+        if action == "tsub":
+            subscribe_tag(db, tag, user_id)
+            await query.answer(f"🔔 پست‌های ایستگاه‌های #{tag} برات ارسال می‌شه")
+        else:
+            unsubscribe_tag(db, tag, user_id)
+            await query.answer(f"🔕 دنبال کردن #{tag} لغو شد")
+
+        keyboard = query.message.reply_markup.inline_keyboard
+        rows = [list(row) for row in keyboard]
+        rows[0] = [get_tag_subscription_button(tag, action == "tsub")]
+        await query.edit_message_reply_markup(InlineKeyboardMarkup(rows))
+    finally:
+        db.close()
@@ -0,0 +1,318 @@
+"""
+Station broadcasts
+A post by a station owner is delivered to every listener of the station
+and every subscriber of one of its tags, each user exactly once.
+
+- subscribers are streamed in keyset batches ordered by user_id; the
+  UNION of listeners and tag subscribers dedupes inside the database,
+  so memory is one batch however many listeners a station has
+- delivery goes through the shared rate-limited sender (utils/sender.py)
+  on the background loop, so the webhook returns immediately
+- progress (counters + last_user_id cursor) is saved after every batch;
+  unfinished posts resume from the cursor after a restart
+"""
+
+import asyncio
+import time
+import traceback
+from collections import Counter
+from datetime import datetime, timezone
+from functools import partial
+from telegram import Update
+from telegram.ext import ContextTypes
+from sqlalchemy import select, union
+from database import Session
+from models.station import Station, StationListener, TagSubscription
+from models.station_post import StationPost
+from features.cafe.radio.station import get_station
+from utils.background import submit
+from utils.sender import get_sender, SENT, BLOCKED, FAILED
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_RADIO_POST
+from config import Config
+
+
+# ==================== Subscribers ====================
+
+def load_subscriber_batch(db, station_id: int, tags: list, after: int, size: int,
+                          exclude: int = None) -> list:
+    """
+    Next batch of subscriber ids (ascending, unique) after the cursor
+
+    Every source is limited to `size` rows on its own index range before
+    the UNION, so each batch costs O(size) however deep the cursor is.
+    """
+    sources = [
+        select(StationListener.user_id.label("user_id")).where(
+            StationListener.station_id == station_id,
+            StationListener.user_id > after
+        ).order_by(StationListener.user_id).limit(size)
+    ]
+    for tag in tags:
+        sources.append(
+            select(TagSubscription.user_id.label("user_id")).where(
+                TagSubscription.tag == tag,
+                TagSubscription.user_id > after
+            ).order_by(TagSubscription.user_id).limit(size)
+        )
+
+    subscribers = union(*[select(source.subquery().c.user_id) for source in sources]).subquery()
+    batch = select(subscribers.c.user_id).order_by(subscribers.c.user_id).limit(size)
+    if exclude is not None:
+        batch = batch.where(subscribers.c.user_id != exclude)
+
+    return list(db.execute(batch).scalars())
+
+
+# ==================== Progress ====================
+
+def _load_post(post_id: int) -> dict:
+    """Post + station as plain data for the background loop"""
+    db = Session()
+    try:
+        post = db.get(StationPost, post_id)
+        station = db.get(Station, post.station_id) if post else None
+        if not post or not station:
+            return None
+
+        if post.status == "pending":
+            post.status = "sending"
+            db.commit()
+
+        return {
+            "id": post.id,
+            "station_id": station.id,
+            "station_name": station.name,
+            "station_identifier": station.identifier,
+            "tags": station.get_tags(),
+            "author_id": post.author_id,
+            "message_type": post.message_type,
+            "message_text": post.message_text,
+            "message_file_id": post.message_file_id,
+            "last_user_id": post.last_user_id,
+            "progress": post.get_progress(),
+            "progress_chat_id": post.progress_chat_id,
+            "progress_message_id": post.progress_message_id
+        }
+    finally:
+        db.close()
+
+
+def _load_batch(post: dict, after: int) -> list:
+    db = Session()
+    try:
+        return load_subscriber_batch(
+            db, post["station_id"], post["tags"], after,
+            Config.BROADCAST_BATCH_SIZE, exclude=post["author_id"]
+        )
+    finally:
+        db.close()
+
+
+def _save_progress(post_id: int, last_user_id: int, counts: Counter, status: str = None):
+    db = Session()
+    try:
+        values = {
+            StationPost.sent_count: StationPost.sent_count + counts[SENT],
+            StationPost.blocked_count: StationPost.blocked_count + counts[BLOCKED],
+            StationPost.failed_count: StationPost.failed_count + counts[FAILED]
+        }
+        if last_user_id is not None:
+            values[StationPost.last_user_id] = last_user_id
+        if status:
+            values[StationPost.status] = status
+            values[StationPost.finished_at] = datetime.now(timezone.utc)
+
+        db.query(StationPost).filter(StationPost.id == post_id).update(values, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def format_progress_text(post: dict, progress: dict, done: bool = False) -> str:
+    text = "✅ پست ارسال شد!\n\n" if done else "📢 در حال ارسال پست...\n\n"
+    text += f"📻 {post['station_name']}\n"
+    text += f"📨 رسیده: {progress['sent']}\n"
+    if progress["blocked"]:
+        text += f"🚫 ربات رو بلاک کردن: {progress['blocked']}\n"
+    if progress["failed"]:
+        text += f"⚠️ ناموفق: {progress['failed']}\n"
+    return text
+
+
+async def _show_progress(post: dict, progress: dict, done: bool = False):
+    if not post["progress_message_id"]:
+        return
+    await get_sender().send(lambda bot: bot.edit_message_text(
+        format_progress_text(post, progress, done),
+        chat_id=post["progress_chat_id"],
+        message_id=post["progress_message_id"]
+    ))
+
+
+# ==================== Fan-out ====================
+
+def _deliver(post: dict, chat_id: int, bot):
+    """Request coroutine sending the post to one subscriber"""
+    header = f"📻 {post['station_name']} | {post['station_identifier']}"
+    text = f"{header}\n\n{post['message_text']}" if post["message_text"] else header
+    file_id = post["message_file_id"]
+
+    if post["message_type"] == "photo":
+        return bot.send_photo(chat_id, file_id, caption=text)
+    if post["message_type"] == "voice":
+        return bot.send_voice(chat_id, file_id, caption=text)
+    if post["message_type"] == "audio":
+        return bot.send_audio(chat_id, file_id, caption=text)
+    if post["message_type"] == "video":
+        return bot.send_video(chat_id, file_id, caption=text)
+    return bot.send_message(chat_id, text)
+
+
+async def fan_out(post_id: int):
+    """Deliver a post to all subscribers (runs on the background loop)"""
+    try:
+        post = await asyncio.to_thread(_load_post, post_id)
+        if not post:
+            return
+
+        sender = get_sender()
+        after = post["last_user_id"]
+        progress = dict(post["progress"])
+        last_shown = time.monotonic()
+
+        while True:
+            user_ids = await asyncio.to_thread(_load_batch, post, after)
+            if not user_ids:
+                break
+
+            results = await asyncio.gather(*(
+                sender.send(partial(_deliver, post, user_id)) for user_id in user_ids
+            ))
+            counts = Counter(results)
+            after = user_ids[-1]
+            await asyncio.to_thread(_save_progress, post_id, after, counts)
+
+            for key, result in (("sent", SENT), ("blocked", BLOCKED), ("failed", FAILED)):
+                progress[key] += counts[result]
+            progress["total"] += len(user_ids)
+
+            if time.monotonic() - last_shown >= Config.BROADCAST_PROGRESS_INTERVAL:
+                await _show_progress(post, progress)
+                last_shown = time.monotonic()
+
+        await asyncio.to_thread(_save_progress, post_id, after, Counter(), "done")
+        await _show_progress(post, progress, done=True)
+        print(f"📢 Post {post_id} delivered: {progress}")
+
+    except Exception as e:
+        print(f"❌ Broadcast error (post {post_id}): {e}")
+        traceback.print_exc()
+        await asyncio.to_thread(_save_progress, post_id, None, Counter(), "failed")
+
+
+def resume_broadcasts() -> int:
+    """
+    Restart deliveries interrupted by a restart (call once at startup)
+
+    Returns:
+        Number of posts resumed
+    """
+    db = Session()
+    try:
+        post_ids = [row[0] for row in db.query(StationPost.id).filter(
+            StationPost.status.in_(["pending", "sending"])
+        )]
+    finally:
+        db.close()
+
+    for post_id in post_ids:
+        submit(fan_out(post_id))
+    return len(post_ids)
+
+
+# ==================== Handlers ====================
+
+async def start_station_post(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Owner pressed "send post" (radio_post_{id})"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    station_id = int(query.data.rsplit("_", 1)[1])
+
+    db = Session()
+    try:
+        station = get_station(db, station_id)
+        if not station or station.owner_id != user_id:
+            await query.answer("❌ فقط صاحب ایستگاه می‌تونه پست بفرسته!", show_alert=True)
+            return
+    finally:
+        db.close()
+
+    await query.answer()
+    set_state(user_id, STATE_RADIO_POST, {"station_id": station_id})
+    await query.edit_message_text(
+        "📢 پستت رو بفرست (متن، عکس، ویس، آهنگ یا ویدیو).\n"
+        "برای همه‌ی شنونده‌ها و دنبال‌کننده‌های تگ‌های ایستگاه ارسال می‌شه.",
+        reply_markup=get_back_button(f"radio_st_{station_id}")
+    )
+
+
+async def handle_station_post_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Post content sent after start_station_post"""
+    user_id = update.effective_user.id
+    state = get_state(user_id)
+    if state["state"] != STATE_RADIO_POST:
+        return
+
+    message = update.message
+    message_type, file_id = "text", None
+    if message.photo:
+        message_type, file_id = "photo", message.photo[-1].file_id
+    elif message.voice:
+        message_type, file_id = "voice", message.voice.file_id
+    elif message.audio:
+        message_type, file_id = "audio", message.audio.file_id
+    elif message.video:
+        message_type, file_id = "video", message.video.file_id
+    elif not message.text:
+        await message.reply_text("❌ این نوع پیام پشتیبانی نمی‌شه!")
+        return
+
+    clear_state(user_id)
+    db = Session()
+    try:
+        station = get_station(db, state["data"]["station_id"])
+        if not station or station.owner_id != user_id:
+            return
+
+        progress_message = await message.reply_text("📢 پستت در صف ارسال قرار گرفت...")
+
+        post = StationPost(
+            station_id=station.id,
+            author_id=user_id,
+            message_type=message_type,
+            message_text=message.text or message.caption,
+            message_file_id=file_id,
+            status="pending",
+            last_user_id=0,
+            sent_count=0,
+            blocked_count=0,
+            failed_count=0,
+            progress_chat_id=progress_message.chat_id,
+            progress_message_id=progress_message.message_id
+        )
+        db.add(post)
+        db.query(Station).filter(Station.id == station.id).update(
+            {Station.post_count: Station.post_count + 1, Station.updated_at: Station.updated_at},
+            synchronize_session=False
+        )
+        db.commit()
+
+        submit(fan_out(post.id))
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error creating station post: {e}")
+        traceback.print_exc()
+        await message.reply_text("❌ خطا در ارسال پست! دوباره تلاش کن.")
+    finally:
+        db.close()
@@ -0,0 +1,159 @@
+"""
+Station search
+Names, tags and descriptions go into an in-memory SearchIndex (see
+utils/search_index.py) built once from the stations table and updated
+in place when stations are created or removed. "#tag" queries browse
+station_tags instead, and an Rs identifier opens that station directly.
+"""
+
+import threading
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from models.station import Station
+from models.identifier import parse_identifier
+from features.cafe.radio.station import parse_tags, format_station_text, get_station_keyboard, is_listening
+from features.cafe.radio.leaderboard import get_tag_page, get_listing_keyboard, to_listing_rows
+from utils.search_index import SearchIndex
+from utils.keyboards import get_back_button
+from utils.state import set_state, get_state, clear_state, STATE_RADIO_SEARCH
+from config import Config
+
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "tags": 2.0,
+    "description": 1.0
+}
+
+# Stations loaded per query while building the index
+BUILD_BATCH_SIZE = 1000
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index(db) -> SearchIndex:
+    """Return the station index, building it from the stations table on first use"""
+    global _index
+    if _index is not None:
+        return _index
+
+    with _index_lock:
+        if _index is None:
+            index = SearchIndex(FIELD_WEIGHTS)
+            last_id = 0
+            while True:
+                batch = db.query(Station).filter(
+                    Station.is_active == True,
+                    Station.id > last_id
+                ).order_by(Station.id).limit(BUILD_BATCH_SIZE).all()
+                if not batch:
+                    break
+                for station in batch:
+                    index.add(station.id, station.get_search_fields())
+                last_id = batch[-1].id
+            _index = index
+            print(f"📻 Station index built: {len(index)} stations")
+    return _index
+
+
+def on_station_saved(station: Station):
+    if _index is None:
+        return  # Not built yet; the first search will load the station
+    with _index_lock:
+        _index.add(station.id, station.get_search_fields())
+
+
+def on_station_removed(station_id: int):
+    if _index is None:
+        return
+    with _index_lock:
+        _index.remove(station_id)
+
+
+def search_stations(db, query: str, limit: int = None) -> dict:
+    """
+    Ranked station search
+
+    Returns:
+        {"rows": [...], "total": int} (rows as in leaderboard pages)
+    """
+    result = get_index(db).search(query, limit=limit or Config.RADIO_PAGE_SIZE)
+    if not result.ids:
+        return {"rows": [], "total": 0}
+
+    stations = {
+        station.id: station for station in
+        db.query(Station).filter(Station.id.in_(result.ids), Station.is_active == True)
+    }
+    return {
+        "rows": to_listing_rows([stations[i] for i in result.ids if i in stations]),
+        "total": result.total
+    }
+
+
+# ==================== Handlers ====================
+
+async def start_radio_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Ask for a station name, #tag or identifier"""
+    query = update.callback_query
+    await query.answer()
+
+    set_state(update.effective_user.id, STATE_RADIO_SEARCH)
+    await query.edit_message_text(
+        "🔍 اسم ایستگاه، یه #تگ یا شناسه‌ی ایستگاه (Rs...) رو بفرست:",
+        reply_markup=get_back_button("cafe_radio")
+    )
+
+
+async def handle_radio_search_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Search text typed after start_radio_search"""
+    user_id = update.effective_user.id
+    if get_state(user_id)["state"] != STATE_RADIO_SEARCH or not update.message.text:
+        return
+
+    clear_state(user_id)
+    text = update.message.text.strip()
+
+    db = Session()
+    try:
+        # Rs identifier -> station page
+        parsed = parse_identifier(text)
+        if parsed["type"] == "station":
+            station = db.query(Station).filter(
+                Station.identifier == text, Station.is_active == True
+            ).first()
+            if station:
+                await update.message.reply_text(
+                    format_station_text(station),
+                    reply_markup=get_station_keyboard(
+                        station,
+                        listening=is_listening(db, station.id, user_id),
+                        is_owner=station.owner_id == user_id
+                    )
+                )
+                return
+
+        # #tag -> tag listing
+        tags = parse_tags(text) if text.startswith("#") else []
+        if tags:
+            page = get_tag_page(db, tags[0])
+            next_callback = f"radio_tag_{tags[0]}_{page['next']}" if page["next"] else None
+            title = f"🏷️ #{tags[0]}" + ("" if page["rows"] else "\n\n😕 ایستگاهی پیدا نشد.")
+            await update.message.reply_text(title, reply_markup=get_listing_keyboard(page, next_callback))
+            return
+
+        result = search_stations(db, text)
+        title = f"🔍 {text}\n\n"
+        title += f"📻 {result['total']} ایستگاه" if result["total"] else "😕 ایستگاهی پیدا نشد."
+        await update.message.reply_text(
+            title,
+            reply_markup=get_listing_keyboard({"rows": result["rows"], "next": None})
+        )
+    except Exception as e:
+        print(f"❌ Station search error: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در جستجو! دوباره تلاش کن.")
+    finally:
+        db.close()
@@ -0,0 +1,304 @@
+"""
+Radio stations
+Data helpers (create, listen/unlisten) plus the radio home and station pages.
+
+listener_count is kept on the station row and changed in the same
+transaction as the station_listeners insert/delete, so rankings read a
+single indexed column instead of counting listeners.
+"""
+
+import re
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from database import Session
+from models.station import Station, StationTag, StationListener, TagSubscription
+from models.identifier import generate_identifier, format_identifier_display
+from features.lists.bookmarks import get_bookmark_button, KIND_STATION
+from utils.cache import TTLCache
+from utils.persian import normalize, ZWNJ
+from config import Config
+
+MAX_TAGS = 5
+MAX_TAG_LENGTH = 20  # Tags go into callback data (64 bytes)
+MAX_NAME_LENGTH = 64
+
+_TAG_RE = re.compile(r"#([\w\u200c]+)")
+
+# Cached listing pages (rankings, new stations, tags); dropped on create/delete
+listing_cache = TTLCache(ttl=Config.STATION_LISTING_TTL, max_size=500)
+
+
+# ==================== Data ====================
+
+def parse_tags(text: str) -> list:
+    """Normalized, unique #hashtags from text (at most MAX_TAGS)"""
+    tags = []
+    for tag in _TAG_RE.findall(normalize(text or "")):
+        tag = tag.replace(ZWNJ, "").replace("_", "")[:MAX_TAG_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags[:MAX_TAGS]
+
+
+def get_station(db, station_id: int) -> Station:
+    return db.query(Station).filter(Station.id == station_id, Station.is_active == True).first()
+
+
+def get_owned_station(db, owner_id: int) -> Station:
+    return db.query(Station).filter(Station.owner_id == owner_id, Station.is_active == True).first()
+
+
+def create_station(db, owner_id: int, name: str, tags: list = None, description: str = None) -> Station:
+    """
+    Create a station with an Rs identifier from the shared allocator space
+
+    Returns:
+        The new Station
+    """
+    from features.cafe.radio.search import on_station_saved
+    from features.search import global_search
+
+    station_number = (db.query(func.max(Station.station_number)).scalar() or 0) + 1
+    tags = tags or []
+
+    station = Station(
+        identifier=generate_identifier(Config.STATION_PREFIX, station_number, db),
+        station_number=station_number,
+        owner_id=owner_id,
+        name=name[:MAX_NAME_LENGTH],
+        description=description,
+        tags=" ".join(tags) or None,
+        listener_count=0,
+        post_count=0
+    )
+    db.add(station)
+    db.flush()
+
+    db.add_all(StationTag(tag=tag, station_id=station.id) for tag in tags)
+    db.commit()
+    db.refresh(station)
+
+    on_station_saved(station)
+    global_search.on_station_saved(station)
+    listing_cache.invalidate()
+    return station
+
+
+def deactivate_station(db, station_id: int) -> bool:
+    from features.cafe.radio.search import on_station_removed
+    from features.search import global_search
+
+    station = get_station(db, station_id)
+    if not station:
+        return False
+
+    station.is_active = False
+    db.query(StationTag).filter(StationTag.station_id == station_id).delete(synchronize_session=False)
+    db.commit()
+
+    on_station_removed(station_id)
+    global_search.on_item_removed("station", station_id)
+    listing_cache.invalidate()
+    return True
+
+
+def is_listening(db, station_id: int, user_id: int) -> bool:
+    return db.get(StationListener, (station_id, user_id)) is not None
+
+
+def _change_listener_count(db, station_id: int, delta: int):
+    db.query(Station).filter(Station.id == station_id).update(
+        {Station.listener_count: Station.listener_count + delta,
+         Station.updated_at: Station.updated_at},
+        synchronize_session=False
+    )
+
+
+def listen(db, station_id: int, user_id: int) -> bool:
+    """
+    Tune in to a station
+
+    Returns:
+        True if the user was added, False if already listening or the station is closed
+    """
+    # Old buttons and deep links can still point at a deactivated station
+    if get_station(db, station_id) is None:
+        return False
+
+    try:
+        db.add(StationListener(station_id=station_id, user_id=user_id))
+        db.flush()
+    except IntegrityError:
+        db.rollback()
+        return False
+
+    _change_listener_count(db, station_id, 1)
+    db.commit()
+    return True
+
+
+def unlisten(db, station_id: int, user_id: int) -> bool:
+    """
+    Stop listening to a station
+
+    Returns:
+        True if the user was removed, False if not listening
+    """
+    deleted = db.query(StationListener).filter(
+        StationListener.station_id == station_id,
+        StationListener.user_id == user_id
+    ).delete(synchronize_session=False)
+
+    if deleted:
+        _change_listener_count(db, station_id, -1)
+    db.commit()
+    return bool(deleted)
+
+
+def is_subscribed_to_tag(db, tag: str, user_id: int) -> bool:
+    return db.get(TagSubscription, (tag, user_id)) is not None
+
+
+def subscribe_tag(db, tag: str, user_id: int) -> bool:
+    """Receive posts from every station with this tag"""
+    try:
+        db.add(TagSubscription(tag=tag, user_id=user_id))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def unsubscribe_tag(db, tag: str, user_id: int) -> bool:
+    deleted = db.query(TagSubscription).filter(
+        TagSubscription.tag == tag,
+        TagSubscription.user_id == user_id
+    ).delete(synchronize_session=False)
+    db.commit()
+    return bool(deleted)
+
+
+# ==================== Display ====================
+
+def format_station_text(station: Station) -> str:
+    text = f"📻 {station.name}\n"
+    text += f"{format_identifier_display(station.identifier)}\n"
+    text += f"🎧 {station.listener_count} شنونده | 📢 {station.post_count} پست\n"
+
+    tags = station.get_tags()
+    if tags:
+        text += " ".join(f"#{tag}" for tag in tags) + "\n"
+
+    if station.description:
+        text += f"\n{station.description}"
+
+    return text
+
+
+def get_station_keyboard(station: Station, listening: bool, is_owner: bool):
+    keyboard = []
+    if listening:
+        listen_button = InlineKeyboardButton("🔕 قطع گوش دادن", callback_data=f"radio_unlisten_{station.id}")
+    else:
+        listen_button = InlineKeyboardButton("🎧 گوش دادن", callback_data=f"radio_listen_{station.id}")
+    keyboard.append([listen_button, get_bookmark_button(KIND_STATION, station.id)])
+
+    tags = station.get_tags()
+    if tags:
+        keyboard.append([
+            InlineKeyboardButton(f"#{tag}", callback_data=f"radio_tag_{tag}") for tag in tags[:3]
+        ])
+
+    if is_owner:
+        keyboard.append([InlineKeyboardButton("📢 ارسال پست", callback_data=f"radio_post_{station.id}")])
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به رادیو", callback_data="cafe_radio")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+def get_radio_menu_keyboard(owned_station: Station = None):
+    keyboard = [
+        [InlineKeyboardButton("🔍 جستجوی ایستگاه", callback_data="radio_search")],
+        [
+            InlineKeyboardButton("🏆 پرشنونده‌ترین‌ها", callback_data="radio_top"),
+            InlineKeyboardButton("🆕 تازه‌ها", callback_data="radio_new")
+        ]
+    ]
+
+    if owned_station:
+        keyboard.append([InlineKeyboardButton("📻 ایستگاه من", callback_data=f"radio_st_{owned_station.id}")])
+    else:
+        keyboard.append([InlineKeyboardButton("➕ ساخت ایستگاه", callback_data="radio_create")])
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت به کافه", callback_data="cafe_menu")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+# ==================== Handlers ====================
+
+async def radio_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Radio home (cafe_radio callback and /radio)"""
+    db = Session()
+    try:
+        owned = get_owned_station(db, update.effective_user.id)
+        text = "📻 میز رادیو\n\nایستگاه‌ها رو بگرد، گوش بده یا ایستگاه خودت رو بساز!"
+
+        if update.callback_query:
+            await update.callback_query.answer()
+            await update.callback_query.edit_message_text(text, reply_markup=get_radio_menu_keyboard(owned))
+        else:
+            await update.message.reply_text(text, reply_markup=get_radio_menu_keyboard(owned))
+    finally:
+        db.close()
+
+
+async def show_station(update: Update, context: ContextTypes.DEFAULT_TYPE, station_id: int = None):
+    """Station page (radio_st_{id})"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    station_id = station_id or int(query.data.rsplit("_", 1)[1])
+
+    db = Session()
+    try:
+        station = get_station(db, station_id)
+        if not station:
+            await query.answer("❌ این ایستگاه دیگه وجود نداره!", show_alert=True)
+            return
+
+        await query.answer()
+        await query.edit_message_text(
+            format_station_text(station),
+            reply_markup=get_station_keyboard(
+                station,
+                listening=is_listening(db, station.id, user_id),
+                is_owner=station.owner_id == user_id
+            )
+        )
+    finally:
+        db.close()
+
+
+async def handle_listen_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """radio_listen_{id} / radio_unlisten_{id}"""
+    query = update.callback_query
+    action, station_id = query.data[len("radio_"):].rsplit("_", 1)
+    station_id = int(station_id)
+
+    db = Session()
+    try:
+        if action == "listen":
+            listen(db, station_id, update.effective_user.id)
+        else:
+            unlisten(db, station_id, update.effective_user.id)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error updating listener: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
+
+    await show_station(update, context, station_id)
@@ -0,0 +1,247 @@
+"""
+Captcha challenges
+Every challenge is answered with one of its inline buttons, so nobody has
+to type in the group:
+
+- image:  a distorted code, pick it among similar-looking codes (needs Pillow)
+- math:   a small sum, pick the result
+- button: an emoji named in the text, pick it
+
+ChallengePool keeps challenges ready before anyone joins: main.py starts
+it (and so fills it) before the bot's threads start, and every take()
+tops it up. Images are rendered in a background process pool (CPU-bound
+work stays off the webhook threads); math and button challenges cost
+microseconds and are made on the spot. Without Pillow, or before start(),
+the pool serves math and button only.
+
+Benchmark:
+    python -m features.group_manager.captcha.generate
+"""
+
+import io
+import multiprocessing
+import random
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, ImageDraw, ImageFilter, ImageFont
+    HAS_PILLOW = True
+except ImportError:
+    HAS_PILLOW = False
+
+IMAGE = "image"
+MATH = "math"
+BUTTON = "button"
+
+# options: button labels, answer: index of the right one, image: PNG bytes or None
+Challenge = namedtuple("Challenge", ["kind", "question", "options", "answer", "image"])
+
+OPTIONS = 4
+
+# No 0/O, 1/I/L, 5/S, 8/B: they read the same once distorted
+_CODE_ALPHABET = "2346779ACDEFGHJKMNPQRTUVWXYZ"
+_CODE_LENGTH = 5
+
+_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+_EMOJI = {
+    "🍎": "سیب", "🐱": "گربه", "🚗": "ماشین", "⚽": "توپ", "🌙": "ماه",
+    "🔑": "کلید", "🎈": "بادکنک", "🐟": "ماهی", "🌳": "درخت", "☕": "قهوه",
+    "📚": "کتاب", "✈️": "هواپیما",
+}
+
+
+# ==================== Challenges ====================
+
+def _shuffle_options(rng: random.Random, right: str, wrong: list) -> tuple:
+    options = [right] + wrong[:OPTIONS - 1]
+    rng.shuffle(options)
+    return options, options.index(right)
+
+
+def make_math(rng: random.Random) -> Challenge:
+    a, b = rng.randint(2, 9), rng.randint(2, 9)
+    right = a + b
+    wrong = rng.sample([n for n in range(right - 5, right + 6) if n != right and n > 0], OPTIONS - 1)
+    options, answer = _shuffle_options(
+        rng, str(right).translate(_PERSIAN_DIGITS), [str(n).translate(_PERSIAN_DIGITS) for n in wrong]
+    )
+    question = f"🧮 حاصل {a} + {b} چند میشه؟".translate(_PERSIAN_DIGITS)
+    return Challenge(MATH, question, options, answer, None)
+
+
+def make_button(rng: random.Random) -> Challenge:
+    picked = rng.sample(list(_EMOJI), OPTIONS)
+    right = picked[0]
+    options, answer = _shuffle_options(rng, right, picked[1:])
+    return Challenge(BUTTON, f"👆 روی «{_EMOJI[right]}» بزن.", options, answer, None)
+
+
+def _similar_code(rng: random.Random, code: str) -> str:
+    """The code with two characters swapped for others"""
+    chars = list(code)
+    for position in rng.sample(range(len(chars)), 2):
+        chars[position] = rng.choice(_CODE_ALPHABET.replace(chars[position], ""))
+    return "".join(chars)
+
+
+def render_code(code: str, seed: int) -> bytes:
+    """PNG of a code with per-character jitter and rotation, noise lines and blur"""
+    rng = random.Random(seed)
+    font = ImageFont.load_default()
+    width, height = 60 + 45 * len(code), 90
+    image = Image.new("RGB", (width, height), (245, 245, 240))
+
+    for index, char in enumerate(code):
+        # Draw small, then scale: works with the bitmap default font of any Pillow version
+        glyph = Image.new("L", (16, 16), 0)
+        ImageDraw.Draw(glyph).text((3, 1), char, fill=255, font=font)
+        glyph = glyph.resize((52, 52), Image.NEAREST).rotate(rng.uniform(-30, 30), Image.BILINEAR, expand=True)
+        color = (rng.randint(0, 90), rng.randint(0, 90), rng.randint(60, 150))
+        image.paste(color, (30 + 45 * index + rng.randint(-6, 6), rng.randint(5, 25)), glyph)
+
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        points = [(rng.randint(0, width), rng.randint(0, height)) for _ in range(2)]
+        draw.line(points, fill=(rng.randint(80, 200),) * 3, width=rng.randint(1, 3))
+    for _ in range(width * height // 40):
+        draw.point((rng.randrange(width), rng.randrange(height)), fill=(rng.randint(0, 255),) * 3)
+
+    output = io.BytesIO()
+    image.filter(ImageFilter.SMOOTH).save(output, "PNG", optimize=True)
+    return output.getvalue()
+
+
+def make_image_batch(count: int, seed: int) -> list:
+    """Render `count` image challenges (top-level so a process pool can run it)"""
+    rng = random.Random(seed)
+    batch = []
+    for _ in range(count):
+        code = "".join(rng.choices(_CODE_ALPHABET, k=_CODE_LENGTH))
+        options, answer = _shuffle_options(rng, code, [_similar_code(rng, code) for _ in range(OPTIONS - 1)])
+        batch.append(Challenge(IMAGE, "🖼 کدی که توی عکس می‌بینی رو انتخاب کن.", options, answer,
+                               render_code(code, rng.getrandbits(32))))
+    return batch
+
+
+# ==================== Pool ====================
+
+class ChallengePool:
+    """
+    Ready-made challenges; take() never waits for a render
+
+    Example:
+        pool = ChallengePool(size=200, kinds=(IMAGE, MATH, BUTTON))
+        pool.start()  # at startup, before any thread
+        pool.take()  # -> Challenge (image when one is ready, else math / button)
+    """
+
+    def __init__(self, size: int = 200, kinds=(IMAGE, MATH, BUTTON), workers: int = 2,
+                 batch_size: int = 25, rng: random.Random = None):
+        self.size = size
+        self.kinds = tuple(kind for kind in kinds if kind != IMAGE or HAS_PILLOW)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.rng = rng or random.SystemRandom()
+        self._images = deque(maxlen=size)
+        self._rendering = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def _fallback_kinds(self) -> tuple:
+        return tuple(kind for kind in self.kinds if kind != IMAGE) or (MATH,)
+
+    def take(self) -> Challenge:
+        kind = self.rng.choice(self.kinds)
+        if kind == IMAGE:
+            try:
+                challenge = self._images.popleft()
+            except IndexError:
+                challenge = None
+            self.refill()
+            if challenge:
+                return challenge
+            kind = self.rng.choice(self._fallback_kinds())
+        return make_math(self.rng) if kind == MATH else make_button(self.rng)
+
+    def start(self):
+        """
+        Fork the render processes and fill the pool
+
+        Call once at startup while the process has no other thread: forking a
+        process with running threads (Flask, executors, the background loop)
+        can deadlock the child on a lock some thread held. The workers are
+        forked on the first submit, i.e. right here.
+        """
+        if IMAGE not in self.kinds:
+            return
+        with self._lock:
+            if self._executor is None:
+                # fork: a spawned (or forkserver) worker would re-import main.py and start a second bot
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("fork")
+                )
+        self.refill()
+
+    def refill(self):
+        """Queue image renders until the pool (plus renders in flight) is full; no-op before start()"""
+        with self._lock:
+            if self._executor is None:
+                return
+            while len(self._images) + self._rendering < self.size:
+                self._rendering += self.batch_size
+                future = self._executor.submit(make_image_batch, self.batch_size, self.rng.getrandbits(64))
+                future.add_done_callback(self._rendered)
+
+    def _rendered(self, future):
+        with self._lock:
+            self._rendering -= self.batch_size
+        if future.cancelled():
+            return
+        if future.exception() is None:
+            self._images.extend(future.result())
+        else:
+            print(f"❌ Captcha render failed: {future.exception()}")
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = random.Random(7)
+    for name, make in (("math", make_math), ("button", make_button)):
+        start = time.perf_counter()
+        for _ in range(10_000):
+            make(rng)
+        print(f"{name:>6}: {(time.perf_counter() - start) / 10_000 * 1e6:.1f} µs/challenge")
+
+    if HAS_PILLOW:
+        start = time.perf_counter()
+        batch = make_image_batch(50, 7)
+        elapsed = (time.perf_counter() - start) / len(batch)
+        print(f" image: {elapsed * 1000:.1f} ms/challenge, {sum(len(c.image) for c in batch) // len(batch)} bytes")
+
+        pool = ChallengePool(size=500, kinds=(IMAGE,), workers=4)
+        start = time.perf_counter()
+        pool.start()
+        while len(pool) < pool.size:
+            time.sleep(0.05)
+        print(f"  pool: {pool.size} images ready in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        taken = [pool.take() for _ in range(500)]
+        print(f"  take: {(time.perf_counter() - start) / 500 * 1e6:.1f} µs/challenge during a 500-join burst "
+              f"({sum(1 for c in taken if c.kind == IMAGE)} images)")
+        pool.shutdown()
+    else:
+        print(" image: Pillow is not installed")
@@ -0,0 +1,289 @@
+"""
+Anti-spam: flood, repeated content and join raids
+All state is in bounded memory that forgets old keys on its own:
+
+- flood: messages per (chat, user) over a sliding window
+- repeated content: SimHash fingerprints of longer messages, per chat,
+  so the same text (give or take a word) from one or many accounts is caught
+- raids: joins per chat, per user across all chats (account hopping) and
+  over all chats together; a chat over the limit stays in raid mode for a while
+  (joiners of chats with a captcha get the captcha instead of the action)
+
+Every check is O(1) per message. The group's action (warn / mute / ban) is
+handed to the background loop, so the message pipeline never waits on it;
+it goes through the moderation records (moderation/), so spam mutes expire
+with the other sanctions and spam warnings count toward WARN_LIMIT. The
+group is told in one notice per SPAM_NOTICE_WINDOW naming everyone punished
+meanwhile: a raid is one message, not hundreds (groups take ~20 bot
+messages a minute, and a RetryAfter would stall the shared sender).
+
+/antispam - /antispam off|warn|mute|ban (group admins)
+"""
+
+import asyncio
+import html
+import threading
+import time
+import traceback
+from collections import defaultdict
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager import settings
+from features.group_manager.filters.matcher import normalize_text
+from features.group_manager.moderation import sanctions
+from features.group_manager.moderation.warning import warn, describe_limit
+from features.group_manager.permissions.admins import is_group_admin
+from utils.background import submit
+from utils.cache import TTLCache
+from utils.sender import get_sender
+from utils.simhash import simhash, NearDuplicateIndex
+from utils.sliding_window import SlidingWindowCounter
+from config import Config
+
+OFF = "off"
+WARN = "warn"
+MUTE = "mute"
+BAN = "ban"
+
+ACTIONS = {
+    OFF: "خاموش",
+    WARN: "⚠️ اخطار",
+    MUTE: "🔇 سکوت",
+    BAN: "⛔ بن"
+}
+
+RAID_GLOBAL_KEY = "all"
+
+
+class SpamDetector:
+    """
+    Example:
+        detector = SpamDetector(clock=lambda: now)
+        detector.check_message(chat_id, user_id, text)  # -> None / "flood" / "repeat"
+        detector.record_join(chat_id, user_id)  # -> None / "hopping" / "raid"
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.flood = SlidingWindowCounter(Config.SPAM_FLOOD_WINDOW, Config.SPAM_MAX_KEYS, clock)
+        self.repeats = NearDuplicateIndex(Config.SPAM_REPEAT_WINDOW, Config.SPAM_REPEAT_DISTANCE, clock=clock)
+        self.chat_joins = SlidingWindowCounter(Config.RAID_WINDOW, Config.SPAM_MAX_KEYS, clock)
+        self.user_joins = SlidingWindowCounter(Config.RAID_WINDOW, Config.SPAM_MAX_KEYS, clock)
+        self.all_joins = SlidingWindowCounter(Config.RAID_WINDOW, 1, clock)
+        self.raids = TTLCache(ttl=Config.RAID_MODE_SECONDS, max_size=Config.SPAM_MAX_KEYS, clock=clock)
+
+    def check_message(self, chat_id: int, user_id: int, text: str = None) -> str:
+        if self.flood.hit((chat_id, user_id)) > Config.SPAM_FLOOD_LIMIT:
+            return "flood"
+
+        if text and len(text) >= Config.SPAM_REPEAT_MIN_LENGTH:
+            fingerprint = simhash(normalize_text(text[:Config.SPAM_REPEAT_MAX_LENGTH]).split())
+            if self.repeats.add(chat_id, fingerprint) >= Config.SPAM_REPEAT_LIMIT:
+                return "repeat"
+
+        return None
+
+    def record_join(self, chat_id: int, user_id: int) -> str:
+        if self.chat_joins.hit(chat_id) > Config.RAID_CHAT_JOINS:
+            self.raids.set(chat_id, True)
+        if self.all_joins.hit(RAID_GLOBAL_KEY) > Config.RAID_GLOBAL_JOINS:
+            self.raids.set(RAID_GLOBAL_KEY, True)
+
+        if self.user_joins.hit(user_id) > Config.RAID_USER_CHATS:
+            return "hopping"
+        return "raid" if self.is_raid(chat_id) else None
+
+    def is_raid(self, chat_id: int) -> bool:
+        return bool(self.raids.get(chat_id) or self.raids.get(RAID_GLOBAL_KEY))
+
+
+detector = SpamDetector()
+
+# (chat_id, user_id) already punished recently: one action per burst
+_punished = TTLCache(ttl=Config.SPAM_PUNISH_COOLDOWN, max_size=Config.SPAM_MAX_KEYS)
+
+REASONS = {
+    "flood": "🌊 ارسال پشت سر هم",
+    "repeat": "🔁 پیام تکراری",
+    "hopping": "🕵️ عضویت پشت سر هم در گروه‌ها",
+    "raid": "🚨 حمله‌ی دسته‌جمعی"
+}
+
+
+# ==================== Actions ====================
+
+def punish(chat_id: int, user_id: int, action: str, reason: str):
+    """Queue the group's spam action on the background loop (returns immediately)"""
+    if action == OFF or _punished.get((chat_id, user_id)):
+        return
+    _punished.set((chat_id, user_id), True)
+    submit(_apply(chat_id, user_id, action, reason))
+
+
+def is_punished(chat_id: int, user_id: int) -> bool:
+    """True if the user got a spam action in this chat within the cooldown"""
+    return bool(_punished.get((chat_id, user_id)))
+
+
+async def _apply(chat_id: int, user_id: int, action: str, reason: str):
+    label = REASONS.get(reason, reason)
+    try:
+        if action == BAN:
+            await sanctions.impose(chat_id, user_id, sanctions.BAN, reason=label)
+        elif action == MUTE:
+            await sanctions.impose(chat_id, user_id, sanctions.MUTE, Config.SPAM_MUTE_SECONDS, reason=label)
+        elif action == WARN:
+            # Counts toward WARN_LIMIT like an admin's /warn
+            if await warn(chat_id, user_id, reason=label) >= Config.WARN_LIMIT:
+                label += f" (اخطار {Config.WARN_LIMIT}م: {describe_limit()})"
+        notices.add(chat_id, user_id, action, label)
+    except Exception as e:
+        print(f"❌ Spam action {action} failed in {chat_id}: {e}")
+        traceback.print_exc()
+
+
+# ==================== Notices ====================
+
+_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+
+def render_notice(entries: list) -> str:
+    """entries: [(user_id, action, label)]; one paragraph per (action, label)"""
+    groups = defaultdict(list)
+    for user_id, action, label in entries:
+        groups[(action, label)].append(user_id)
+
+    paragraphs = []
+    for (action, label), user_ids in groups.items():
+        if len(user_ids) == 1:
+            who = f'<a href="tg://user?id={user_ids[0]}">این کاربر</a>'
+        else:
+            shown = user_ids[:Config.SPAM_NOTICE_MAX_MENTIONS]
+            who = f"{str(len(user_ids)).translate(_PERSIAN_DIGITS)} کاربر: " + "، ".join(
+                f'<a href="tg://user?id={user_id}">{str(index).translate(_PERSIAN_DIGITS)}</a>'
+                for index, user_id in enumerate(shown, 1)
+            )
+            if len(user_ids) > len(shown):
+                who += f" و {str(len(user_ids) - len(shown)).translate(_PERSIAN_DIGITS)} نفر دیگه"
+        paragraphs.append(f"{ACTIONS[action]} برای {who}\nدلیل: {html.escape(label)}")
+    return "\n\n".join(paragraphs)
+
+
+class SpamNotices:
+    """
+    Example:
+        notices = SpamNotices(sender=Sender(bot=FakeBot()), clock=lambda: now)
+        notices.add(chat_id, user_id, MUTE, "🌊 ارسال پشت سر هم")
+        await notices.flush()  # one message per chat whose window has closed
+    """
+
+    def __init__(self, sender=None, clock=time.monotonic):
+        self.sender = sender  # None = shared sender
+        self.clock = clock
+        self._pending = {}  # chat_id -> [due at, [(user_id, action, label)]]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, chat_id: int, user_id: int, action: str, label: str):
+        with self._lock:
+            entry = self._pending.get(chat_id)
+            if entry is None:
+                entry = self._pending[chat_id] = [self.clock() + Config.SPAM_NOTICE_WINDOW, []]
+            entry[1].append((user_id, action, label))
+
+    async def flush(self):
+        """Send every notice whose window has closed; run periodically on the background loop"""
+        now = self.clock()
+        with self._lock:
+            due = [(chat_id, entry[1]) for chat_id, entry in self._pending.items() if entry[0] <= now]
+            for chat_id, _ in due:
+                del self._pending[chat_id]
+
+        sender = self.sender or get_sender()
+        await asyncio.gather(*(self._send(sender, chat_id, entries) for chat_id, entries in due))
+
+    async def _send(self, sender, chat_id: int, entries: list):
+        text = render_notice(entries)
+        try:
+            await sender.send(lambda bot: bot.send_message(chat_id, text, parse_mode="HTML"))
+        except Exception as e:
+            print(f"❌ Spam notice failed in {chat_id}: {e}")
+            traceback.print_exc()
+
+
+notices = SpamNotices()
+
+
+# ==================== Pipeline ====================
+
+def check_spam(message) -> tuple:
+    """
+    Flood / repeated content check for the group guard
+
+    Returns:
+        (reason, action) or None
+    """
+    action = settings.get_settings(message.chat_id).spam_action
+    if action == OFF or not message.from_user:
+        return None
+
+    reason = detector.check_message(message.chat_id, message.from_user.id, message.text or message.caption)
+    return (reason, action) if reason else None
+
+
+async def handle_new_members(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Count joins; account hopping and joins during a raid get the group's action,
+    except that in chats with a captcha raid joiners get the captcha instead
+    """
+    from features.group_manager.captcha.verify import needs_captcha  # verify imports this module
+
+    message = update.effective_message
+    action = settings.get_settings(message.chat_id).spam_action
+
+    for member in message.new_chat_members:
+        if member.is_bot:
+            continue
+        reason = detector.record_join(message.chat_id, member.id)
+        if reason == "raid" and needs_captcha(message.chat_id):
+            continue
+        if reason and action != OFF:
+            # A warning means nothing to an account that only joined; mute it instead
+            punish(message.chat_id, member.id, MUTE if action == WARN else action, reason)
+
+
+# ==================== Handlers ====================
+
+async def antispam_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /antispam off|warn|mute|ban"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    action = (context.args or [""])[0].lower()
+    if action not in ACTIONS:
+        current = settings.get_settings(chat.id).spam_action
+        await update.message.reply_text(
+            f"🛡️ ضد اسپم: {ACTIONS[current]}\n\n"
+            "استفاده: /antispam off|warn|mute|ban\n"
+            f"🌊 بیش از {Config.SPAM_FLOOD_LIMIT} پیام در {Config.SPAM_FLOOD_WINDOW} ثانیه\n"
+            f"🔁 یک متن (یا خیلی شبیهش) {Config.SPAM_REPEAT_LIMIT + 1} بار در {Config.SPAM_REPEAT_WINDOW} ثانیه"
+        )
+        return
+
+    db = Session()
+    try:
+        group = settings.get_or_create_group(db, chat.id, chat.title)
+        group.spam_action = action
+        settings.save(db, group)
+        await update.message.reply_text(f"🛡️ ضد اسپم: {ACTIONS[action]}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing anti-spam action in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در تغییر تنظیمات!")
+    finally:
+        db.close()
@@ -0,0 +1,171 @@
+"""
+Banned-word filter
+Each group's list, and the global list (chat_id 0), is kept as a
+WordFilter (see matcher.py) so a message is checked against every
+pattern in one pass. Edits through the commands update the cached filter
+in place; the TTL picks up edits made by other workers.
+
+/addword  - /addword <word or phrase> (group admins; bot admins in private = global list)
+/delword  - /delword <word or phrase>
+/words    - current list
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from sqlalchemy.exc import IntegrityError
+from database import Session
+from models.group import BannedWord
+from features.group_manager.filters.matcher import WordFilter, normalize_text, to_pattern
+from features.group_manager.permissions.admins import is_group_admin
+from utils.cache import TTLCache
+from config import Config
+
+GLOBAL = BannedWord.GLOBAL_CHAT_ID
+
+# chat_id -> WordFilter
+_filters = TTLCache(ttl=Config.GROUP_SETTINGS_TTL, max_size=10_000)
+
+
+# ==================== Data ====================
+
+def _load_filter(chat_id: int) -> WordFilter:
+    db = Session()
+    try:
+        rows = db.query(BannedWord.word).filter(BannedWord.chat_id == chat_id).order_by(BannedWord.id)
+        return WordFilter(word for word, in rows)
+    finally:
+        db.close()
+
+
+def get_filter(chat_id: int) -> WordFilter:
+    """A chat's filter (GLOBAL for the shared list), loaded once per TTL"""
+    return _filters.get_or_set(chat_id, lambda: _load_filter(chat_id))
+
+
+def find_banned_word(chat_id: int, text: str):
+    """First banned word (global list, then the chat's own) in text, or None"""
+    if not text:
+        return None
+    global_filter = get_filter(GLOBAL)
+    chat_filter = get_filter(chat_id)
+    if not global_filter and not chat_filter:
+        return None
+
+    text = normalize_text(text)
+    return (global_filter.find(text) if global_filter else None) or \
+        (chat_filter.find(text) if chat_filter else None)
+
+
+def add_word(db, chat_id: int, word: str, added_by: int = None) -> bool:
+    """
+    Returns:
+        False if the word (or a spelling of it) is already on the list or the list is full
+    """
+    if word in get_filter(chat_id):
+        return False
+    if db.query(BannedWord).filter(BannedWord.chat_id == chat_id).count() >= Config.MAX_BANNED_WORDS:
+        return False
+
+    db.add(BannedWord(chat_id=chat_id, word=word, added_by=added_by))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+
+    cached = _filters.get(chat_id)
+    if cached is not None:
+        cached.add(word)
+    return True
+
+
+def remove_word(db, chat_id: int, word: str) -> bool:
+    deleted = db.query(BannedWord).filter(
+        BannedWord.chat_id == chat_id,
+        BannedWord.word == word
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    cached = _filters.get(chat_id)
+    if cached is not None and deleted:
+        cached.remove(word)
+    return bool(deleted)
+
+
+# ==================== Handlers ====================
+
+async def _resolve_scope(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """chat_id the command edits (GLOBAL from a bot admin's private chat), None if not allowed"""
+    chat = update.effective_chat
+    user_id = update.effective_user.id
+    if chat.type == "private":
+        return GLOBAL if Config.is_admin(user_id) else None
+    if await is_group_admin(context.bot, chat.id, user_id):
+        return chat.id
+    return None
+
+
+async def add_word_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addword <word or phrase>"""
+    chat_id = await _resolve_scope(update, context)
+    if chat_id is None:
+        return
+
+    word = " ".join(context.args or []).strip()[:100]
+    if not to_pattern(word):
+        await update.message.reply_text("استفاده: /addword <کلمه یا عبارت>\n💡 با * در ابتدا یا انتها، بخشی از کلمه هم فیلتر میشه.")
+        return
+
+    db = Session()
+    try:
+        if add_word(db, chat_id, word, added_by=update.effective_user.id):
+            scope = "لیست سراسری" if chat_id == GLOBAL else "فیلتر گروه"
+            await update.message.reply_text(f"🚫 «{word}» به {scope} اضافه شد.")
+        else:
+            await update.message.reply_text(
+                f"⚠️ این کلمه قبلاً اضافه شده یا لیست پره ({Config.MAX_BANNED_WORDS} کلمه)."
+            )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error adding banned word: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در افزودن کلمه!")
+    finally:
+        db.close()
+
+
+async def delete_word_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delword <word or phrase>"""
+    chat_id = await _resolve_scope(update, context)
+    if chat_id is None:
+        return
+
+    word = " ".join(context.args or []).strip()
+    if not word:
+        await update.message.reply_text("استفاده: /delword <کلمه یا عبارت>")
+        return
+
+    db = Session()
+    try:
+        if remove_word(db, chat_id, word):
+            await update.message.reply_text(f"✅ «{word}» از فیلتر حذف شد.")
+        else:
+            await update.message.reply_text("❌ این کلمه توی لیست نیست!")
+    finally:
+        db.close()
+
+
+async def list_words_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /words"""
+    chat_id = await _resolve_scope(update, context)
+    if chat_id is None:
+        return
+
+    words = get_filter(chat_id).words()
+    if not words:
+        await update.message.reply_text("📭 لیست فیلتر خالیه.")
+        return
+
+    title = "🚫 لیست سراسری" if chat_id == GLOBAL else "🚫 کلمات فیلتر گروه"
+    await update.message.reply_text(f"{title} ({len(words)})\n\n" + "، ".join(words)[:3500])
@@ -0,0 +1,79 @@
+"""
+Group message guard
+Runs every group message through the cheap in-memory checks (locks, link
+and forward deny lists, word filter, anti-spam) in order and deletes it at the first hit. Only then is
+the sender checked against the cached admin roster and VIPs, and any spam
+action is queued in the background.
+"""
+
+from telegram import Update
+from telegram.error import TelegramError
+from telegram.ext import ContextTypes
+from features.group_manager import settings
+from features.group_manager.locks.manager import check_locks
+from features.group_manager.lists.allowed_links import find_denied_link
+from features.group_manager.lists.allowed_forwards import is_denied_forward
+from features.group_manager.filters.words import find_banned_word
+from features.group_manager.filters.spam import check_spam, punish
+from features.group_manager.permissions.admins import is_exempt
+
+
+def _check_locks(message) -> tuple:
+    label = check_locks(message)
+    return (label, None) if label else None
+
+
+def _check_lists(message) -> tuple:
+    host = find_denied_link(message)
+    if host:
+        return (f"🔗 {host}", None)
+    return ("↪️ منبع فوروارد ممنوع", None) if is_denied_forward(message) else None
+
+
+def _check_words(message) -> tuple:
+    if not settings.get_settings(message.chat_id).word_filter:
+        return None
+    word = find_banned_word(message.chat_id, message.text or message.caption)
+    return (f"🚫 {word}", None) if word else None
+
+
+# Each check: message -> (reason, action or None) or None; no I/O beyond cached settings
+CHECKS = (
+    _check_locks,
+    _check_lists,
+    _check_words,
+    check_spam,
+)
+
+
+async def guard_group_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Delete group messages that break a lock, contain a banned word or look like spam"""
+    message = update.effective_message
+    if not message:
+        return
+
+    verdict = None
+    for check in CHECKS:
+        verdict = check(message)
+        if verdict:
+            break
+    if not verdict:
+        return
+
+    # Anonymous admins post as the group itself
+    if message.sender_chat and message.sender_chat.id == message.chat_id:
+        return
+    user = message.from_user
+    if not user or user.id == context.bot.id:
+        return
+    if await is_exempt(context.bot, message.chat_id, user.id):
+        return
+
+    reason, action = verdict
+    if action:
+        punish(message.chat_id, user.id, action, reason)
+
+    try:
+        await message.delete()
+    except TelegramError as e:
+        print(f"❌ Could not delete message in {message.chat_id} ({reason}): {e}")
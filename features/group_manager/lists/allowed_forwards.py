@@ -0,0 +1,202 @@
+"""
+Forward allow / deny lists
+A group's forward sources (channels, groups, users) are cached per chat as
+two sets of Telegram ids, so checking a forward is one set lookup.
+
+- forwards from allowed sources pass the ↪️ forward lock
+- forwards from denied sources are removed even when forwards aren't locked
+
+/allowforward - reply to a forwarded message (or /allowforward <chat id>) (group admins)
+/denyforward  - same, for a source that is always removed
+/delforward   - same, to take a source off the lists
+/forwards     - this group's sources
+"""
+
+import traceback
+from collections import namedtuple
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from models.group import ForwardRule
+from features.group_manager.permissions.admins import is_group_admin
+from utils.cache import TTLCache
+from config import Config
+
+ForwardRules = namedtuple("ForwardRules", ["allowed", "denied"])  # frozensets of source ids
+
+# chat_id -> ForwardRules
+_rules = TTLCache(ttl=Config.GROUP_SETTINGS_TTL, max_size=10_000)
+
+
+# ==================== Data ====================
+
+def forward_source(message) -> tuple:
+    """
+    Original sender of a forwarded message
+
+    Returns:
+        (source id, title) or (None, None) if not forwarded or the sender is hidden
+    """
+    if message.forward_from_chat:
+        return message.forward_from_chat.id, message.forward_from_chat.title
+    if message.forward_from:
+        return message.forward_from.id, message.forward_from.full_name
+    return None, None
+
+
+def _load_rules(chat_id: int) -> ForwardRules:
+    db = Session()
+    try:
+        rows = db.query(ForwardRule.source_id, ForwardRule.allowed).filter(ForwardRule.chat_id == chat_id).all()
+        return ForwardRules(
+            allowed=frozenset(source_id for source_id, allowed in rows if allowed),
+            denied=frozenset(source_id for source_id, allowed in rows if not allowed)
+        )
+    finally:
+        db.close()
+
+
+def get_rules(chat_id: int) -> ForwardRules:
+    """A chat's sources, loaded once per TTL"""
+    return _rules.get_or_set(chat_id, lambda: _load_rules(chat_id))
+
+
+def is_allowed_forward(message) -> bool:
+    source_id, _ = forward_source(message)
+    return source_id is not None and source_id in get_rules(message.chat_id).allowed
+
+
+def is_denied_forward(message) -> bool:
+    if not message.forward_date:
+        return False
+    rules = get_rules(message.chat_id)
+    if not rules.denied:
+        return False
+    source_id, _ = forward_source(message)
+    return source_id in rules.denied
+
+
+def set_rule(db, chat_id: int, source_id: int, allowed: bool, title: str = None, added_by: int = None) -> bool:
+    """
+    Allow / deny a source (replacing an existing rule for it)
+
+    Returns:
+        False if the list is full
+    """
+    rule = db.query(ForwardRule).filter(
+        ForwardRule.chat_id == chat_id,
+        ForwardRule.source_id == source_id
+    ).first()
+    if rule is None:
+        if db.query(ForwardRule).filter(ForwardRule.chat_id == chat_id).count() >= Config.MAX_FORWARD_RULES:
+            return False
+        db.add(ForwardRule(chat_id=chat_id, source_id=source_id, title=title, allowed=allowed, added_by=added_by))
+    else:
+        rule.allowed = allowed
+        rule.title = title or rule.title
+    db.commit()
+
+    _rules.invalidate(chat_id)
+    return True
+
+
+def remove_rule(db, chat_id: int, source_id: int) -> bool:
+    deleted = db.query(ForwardRule).filter(
+        ForwardRule.chat_id == chat_id,
+        ForwardRule.source_id == source_id
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    _rules.invalidate(chat_id)
+    return bool(deleted)
+
+
+# ==================== Handlers ====================
+
+def _parse_source(update: Update, context: ContextTypes.DEFAULT_TYPE) -> tuple:
+    """(source id, title) from the replied-to forward or the first argument, or (None, None)"""
+    reply = update.message.reply_to_message
+    if reply and reply.forward_date:
+        return forward_source(reply)
+
+    arg = (context.args or [""])[0]
+    if arg.lstrip("-").isdigit():
+        return int(arg), None
+    return None, None
+
+
+async def _change_rule(update: Update, context: ContextTypes.DEFAULT_TYPE, allowed):
+    """allowed: True / False to set a rule, None to remove it"""
+    chat = update.effective_chat
+    user_id = update.effective_user.id
+    if not await is_group_admin(context.bot, chat.id, user_id):
+        return
+
+    source_id, title = _parse_source(update, context)
+    if source_id is None:
+        await update.message.reply_text(
+            "↩️ روی یه پیام فورواردی ریپلای کن (یا آیدی عددی کانال / گروه رو بنویس).\n"
+            "⚠️ فوروارد از کاربرهایی که حسابشون رو مخفی کردن قابل شناسایی نیست."
+        )
+        return
+
+    name = title or source_id
+    db = Session()
+    try:
+        if allowed is None:
+            if remove_rule(db, chat.id, source_id):
+                await update.message.reply_text(f"✅ {name} از لیست حذف شد.")
+            else:
+                await update.message.reply_text("❌ این منبع توی لیست نیست!")
+        elif set_rule(db, chat.id, source_id, allowed, title=title, added_by=user_id):
+            if allowed:
+                await update.message.reply_text(f"✅ فوروارد از {name} مجازه (حتی با قفل فوروارد).")
+            else:
+                await update.message.reply_text(f"🚫 فوروارد از {name} همیشه پاک میشه.")
+        else:
+            await update.message.reply_text(f"⚠️ لیست منابع پره ({Config.MAX_FORWARD_RULES} منبع).")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing forward rule in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ذخیره‌ی منبع!")
+    finally:
+        db.close()
+
+
+async def allow_forward_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /allowforward"""
+    await _change_rule(update, context, allowed=True)
+
+
+async def deny_forward_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /denyforward"""
+    await _change_rule(update, context, allowed=False)
+
+
+async def delete_forward_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delforward"""
+    await _change_rule(update, context, allowed=None)
+
+
+async def list_forwards_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /forwards"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    db = Session()
+    try:
+        rules = db.query(ForwardRule).filter(ForwardRule.chat_id == chat.id).order_by(ForwardRule.id).all()
+    finally:
+        db.close()
+
+    if not rules:
+        await update.message.reply_text("📭 لیست منابع فوروارد خالیه.\n\nافزودن: /allowforward یا /denyforward")
+        return
+
+    lines = [f"↪️ منابع فوروارد ({len(rules)})\n"]
+    for rule in rules:
+        state = "✅" if rule.allowed else "🚫"
+        lines.append(f"{state} {rule.title or '—'} ({rule.source_id})")
+    await update.message.reply_text("\n".join(lines)[:3500])
@@ -0,0 +1,196 @@
+"""
+Link allow / deny lists
+A group's domain rules are compiled into a DomainTrie (utils/domain_trie.py)
+and cached per chat, so checking a link walks its host's few labels however
+long the list is. Links come from the message entities (locks/links.py).
+
+- allowed domains pass the link locks (🔗 link, ✈️ telegram_link)
+- denied domains are removed even when links aren't locked
+
+/allowlink - /allowlink example.com or *.example.com (group admins)
+/denylink  - /denylink ads.example.com
+/dellink   - /dellink <domain>
+/links     - this group's rules
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from models.group import LinkRule
+from features.group_manager.locks.links import message_links
+from features.group_manager.permissions.admins import is_group_admin
+from utils.cache import TTLCache
+from utils.domain_trie import DomainTrie, normalize_host, normalize_pattern
+from config import Config
+
+# chat_id -> DomainTrie (pattern -> allowed)
+_rules = TTLCache(ttl=Config.GROUP_SETTINGS_TTL, max_size=10_000)
+
+
+# ==================== Data ====================
+
+def _load_rules(chat_id: int) -> DomainTrie:
+    db = Session()
+    try:
+        rows = db.query(LinkRule.pattern, LinkRule.allowed).filter(LinkRule.chat_id == chat_id)
+        return DomainTrie(rows)
+    finally:
+        db.close()
+
+
+def get_rules(chat_id: int) -> DomainTrie:
+    """A chat's compiled rules, loaded once per TTL"""
+    return _rules.get_or_set(chat_id, lambda: _load_rules(chat_id))
+
+
+def find_denied_link(message) -> str:
+    """Host of the first link on the chat's deny list, or None"""
+    rules = get_rules(message.chat_id)
+    if not rules:
+        return None
+    for link in message_links(message):
+        host = normalize_host(link or "")
+        if host and rules.get(host) is False:
+            return host
+    return None
+
+
+def all_links_allowed(message) -> bool:
+    """True if the message has links and every one of them is on the chat's allow list"""
+    rules = get_rules(message.chat_id)
+    if not rules:
+        return False
+    links = message_links(message)
+    return bool(links) and all(rules.get(normalize_host(link or "")) for link in links)
+
+
+def set_rule(db, chat_id: int, pattern: str, allowed: bool, added_by: int = None) -> bool:
+    """
+    Allow / deny a normalized pattern (replacing an existing rule for it)
+
+    Returns:
+        False if the list is full
+    """
+    rule = db.query(LinkRule).filter(
+        LinkRule.chat_id == chat_id,
+        LinkRule.pattern == pattern
+    ).first()
+    if rule is None:
+        if db.query(LinkRule).filter(LinkRule.chat_id == chat_id).count() >= Config.MAX_LINK_RULES:
+            return False
+        db.add(LinkRule(chat_id=chat_id, pattern=pattern, allowed=allowed, added_by=added_by))
+    else:
+        rule.allowed = allowed
+    db.commit()
+
+    cached = _rules.get(chat_id)
+    if cached is not None:
+        cached.add(pattern, allowed)
+    return True
+
+
+def remove_rule(db, chat_id: int, pattern: str) -> bool:
+    deleted = db.query(LinkRule).filter(
+        LinkRule.chat_id == chat_id,
+        LinkRule.pattern == pattern
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    if deleted:
+        # Rare; the next message rebuilds the trie
+        _rules.invalidate(chat_id)
+    return bool(deleted)
+
+
+# ==================== Handlers ====================
+
+async def _change_rule(update: Update, context: ContextTypes.DEFAULT_TYPE, allowed: bool):
+    chat = update.effective_chat
+    user_id = update.effective_user.id
+    if not await is_group_admin(context.bot, chat.id, user_id):
+        return
+
+    command = "/allowlink" if allowed else "/denylink"
+    pattern = normalize_pattern(" ".join(context.args or []))
+    if not pattern:
+        await update.message.reply_text(
+            f"استفاده: {command} example.com\n💡 با *.example.com همه‌ی زیردامنه‌ها هم شامل میشن."
+        )
+        return
+
+    db = Session()
+    try:
+        if set_rule(db, chat.id, pattern, allowed, added_by=user_id):
+            if allowed:
+                await update.message.reply_text(f"✅ لینک‌های {pattern} مجازه (حتی با قفل لینک).")
+            else:
+                await update.message.reply_text(f"🚫 لینک‌های {pattern} همیشه پاک میشن.")
+        else:
+            await update.message.reply_text(f"⚠️ لیست دامنه‌ها پره ({Config.MAX_LINK_RULES} دامنه).")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing link rule in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ذخیره‌ی دامنه!")
+    finally:
+        db.close()
+
+
+async def allow_link_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /allowlink <domain>"""
+    await _change_rule(update, context, allowed=True)
+
+
+async def deny_link_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /denylink <domain>"""
+    await _change_rule(update, context, allowed=False)
+
+
+async def delete_link_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /dellink <domain>"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    pattern = normalize_pattern(" ".join(context.args or []))
+    if not pattern:
+        await update.message.reply_text("استفاده: /dellink example.com")
+        return
+
+    db = Session()
+    try:
+        if remove_rule(db, chat.id, pattern):
+            await update.message.reply_text(f"✅ {pattern} از لیست حذف شد.")
+        else:
+            await update.message.reply_text("❌ این دامنه توی لیست نیست!")
+    finally:
+        db.close()
+
+
+async def list_links_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /links"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    db = Session()
+    try:
+        rules = db.query(LinkRule.pattern, LinkRule.allowed).filter(
+            LinkRule.chat_id == chat.id
+        ).order_by(LinkRule.pattern).all()
+    finally:
+        db.close()
+
+    if not rules:
+        await update.message.reply_text("📭 لیست دامنه‌ها خالیه.\n\nافزودن: /allowlink یا /denylink")
+        return
+
+    allowed = [pattern for pattern, is_allowed in rules if is_allowed]
+    denied = [pattern for pattern, is_allowed in rules if not is_allowed]
+    text = f"🔗 دامنه‌های گروه ({len(rules)})\n"
+    if allowed:
+        text += "\n✅ مجاز:\n" + "\n".join(allowed)
+    if denied:
+        text += "\n\n🚫 ممنوع:\n" + "\n".join(denied)
+    await update.message.reply_text(text[:3500])
@@ -0,0 +1,47 @@
+"""
+Banned members of a group (active ban sanctions)
+
+/banlist - group admins
+"""
+
+from datetime import datetime, timezone
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager.moderation.sanctions import list_active, format_duration, BAN
+from features.group_manager.permissions.admins import is_group_admin
+
+
+async def send_sanction_list(update: Update, context: ContextTypes.DEFAULT_TYPE, kind: str, title: str, empty: str):
+    """Reply with a chat's active sanctions of one kind, soonest to end first"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    db = Session()
+    try:
+        sanctions = list_active(db, chat.id, kind)
+    finally:
+        db.close()
+
+    if not sanctions:
+        await update.message.reply_text(empty)
+        return
+
+    now = datetime.now(timezone.utc)
+    lines = [f"{title} ({len(sanctions)})\n"]
+    for sanction in sanctions:
+        if sanction.expires_at:
+            left = format_duration(max(1, int((sanction.expires_at - now).total_seconds())))
+            line = f"• {sanction.user_id} — ⏳ {left}"
+        else:
+            line = f"• {sanction.user_id} — نامحدود"
+        if sanction.reason:
+            line += f" ({sanction.reason})"
+        lines.append(line)
+    await update.message.reply_text("\n".join(lines)[:3500])
+
+
+async def ban_list_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /banlist"""
+    await send_sanction_list(update, context, BAN, "⛔ اعضای بن‌شده", "📭 کسی بن نیست.")
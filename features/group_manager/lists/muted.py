@@ -0,0 +1,15 @@
+"""
+Muted members of a group (active mute sanctions)
+
+/mutelist - group admins
+"""
+
+from telegram import Update
+from telegram.ext import ContextTypes
+from features.group_manager.moderation.sanctions import MUTE
+from features.group_manager.lists.banned import send_sanction_list
+
+
+async def mute_list_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /mutelist"""
+    await send_sanction_list(update, context, MUTE, "🔇 اعضای ساکت", "📭 کسی ساکت نیست.")
@@ -0,0 +1,420 @@
+"""
+Auto lock: daily lock windows
+A window turns some locks on at its start and off at its end, every day
+(times are Iran time, Config.AUTO_LOCK_UTC_OFFSET). At every transition a
+group's locks are set to its manual locks (groups.manual_locks, what
+/lock and the panel set) plus the locks of its windows active right then,
+so a window's end never lifts a lock an admin set or another window still
+covers. /unlock inside a window holds until the group's next transition.
+
+One scheduler serves every group: each window has its next transition in
+a heap, a tick pops what is due and pushes that window's following
+transition. Groups with transitions due together (every "night" window
+at 00:00) are written with one UPDATE per distinct set of active window
+locks, not one per chat, and told through the rate-limited sender.
+Transitions missed while the bot restarted (up to AUTO_LOCK_CATCHUP) are
+applied on the first tick.
+
+Testing with a fake clock and bot (tests/test_auto_lock.py):
+    scheduler = AutoLockScheduler(clock=lambda: now, sender=Sender(bot=FakeBot()))
+    await scheduler.tick()
+
+/autolock - /autolock 23:00-07:00 photo video ... (group admins)
+            /autolock del <id>, /autolock = this group's windows
+"""
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+import traceback
+from collections import namedtuple, defaultdict
+from functools import partial
+from sqlalchemy import update
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from models.group import Group, LockSchedule
+from features.group_manager import settings
+from features.group_manager.locks.manager import lock_set
+from features.group_manager.permissions.admins import is_group_admin
+from utils.sender import get_sender
+from config import Config
+
+DAY = 86400
+
+# start / end: minutes after local midnight
+Window = namedtuple("Window", ["id", "chat_id", "mask", "start", "end"])
+
+
+def next_transition(window: Window, after: float) -> tuple:
+    """
+    The window's first start or end strictly after a timestamp
+
+    Returns:
+        (timestamp, locking)
+    """
+    offset = Config.AUTO_LOCK_UTC_OFFSET * 60
+    midnight = after + offset - (after + offset) % DAY - offset
+    return min(
+        (midnight + day * DAY + minute * 60, locking)
+        for day in (0, 1)
+        for minute, locking in ((window.start, True), (window.end, False))
+        if midnight + day * DAY + minute * 60 > after
+    )
+
+
+def is_active(window: Window, at: float) -> bool:
+    """Whether a timestamp falls inside the window (start inclusive, end exclusive)"""
+    minute = (at + Config.AUTO_LOCK_UTC_OFFSET * 60) % DAY // 60
+    if window.start < window.end:
+        return window.start <= minute < window.end
+    return minute >= window.start or minute < window.end
+
+
+def _notice_call(chat_id: int, text: str, bot):
+    return bot.send_message(chat_id, text)
+
+
+class AutoLockScheduler:
+    def __init__(self, clock=time.time, sender=None, session_factory=Session):
+        self.clock = clock
+        self.sender = sender
+        self.session_factory = session_factory
+        self._windows = {}  # schedule id -> Window (heap entries of removed / replaced windows are skipped)
+        self._by_chat = defaultdict(set)  # chat_id -> schedule ids
+        self._heap = []     # (when, serial, locking, Window)
+        self._serials = itertools.count()
+        self._dirty = {}    # chat_id -> (started, ended) masks still to apply (edited, or a failed UPDATE)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._windows)
+
+    def _push(self, window: Window, after: float):
+        when, locking = next_transition(window, after)
+        heapq.heappush(self._heap, (when, next(self._serials), locking, window))
+
+    def _mark(self, chat_id: int, started: int = 0, ended: int = 0):
+        old_started, old_ended = self._dirty.get(chat_id, (0, 0))
+        self._dirty[chat_id] = (old_started | started, old_ended | ended)
+
+    def _track(self, window: Window, after: float):
+        self._windows[window.id] = window
+        self._by_chat[window.chat_id].add(window.id)
+        self._push(window, after)
+
+    def add(self, window: Window):
+        """Start scheduling a window (applied on the next tick if it is active now)"""
+        with self._lock:
+            if self._loaded:
+                self._track(window, self.clock())
+                self._mark(window.chat_id, started=window.mask)
+
+    def remove(self, schedule_id: int):
+        with self._lock:
+            window = self._windows.pop(schedule_id, None)
+            if window is not None:
+                self._by_chat[window.chat_id].discard(schedule_id)
+                if not self._by_chat[window.chat_id]:
+                    del self._by_chat[window.chat_id]
+                self._mark(window.chat_id, ended=window.mask)
+
+    def active_mask(self, chat_id: int, at: float) -> int:
+        """Locks of the chat's windows active at a timestamp"""
+        mask = 0
+        for schedule_id in self._by_chat.get(chat_id, ()):
+            window = self._windows[schedule_id]
+            if is_active(window, at):
+                mask |= window.mask
+        return mask
+
+    def _load(self):
+        db = self.session_factory()
+        try:
+            rows = db.query(
+                LockSchedule.id, LockSchedule.chat_id, LockSchedule.locks,
+                LockSchedule.start_minute, LockSchedule.end_minute
+            ).all()
+        finally:
+            db.close()
+
+        since = self.clock() - Config.AUTO_LOCK_CATCHUP
+        with self._lock:
+            for row in rows:
+                self._track(Window(*row), since)
+            self._loaded = True
+
+    def _pop_due(self, now: float) -> dict:
+        """
+        Take due transitions (queueing each window's next one) and the chats marked by edits
+
+        Returns:
+            chat_id -> (locks of windows that started, locks of windows that ended)
+        """
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, _, locking, window = heapq.heappop(self._heap)
+                if self._windows.get(window.id) is not window:
+                    continue
+                if locking:
+                    self._mark(window.chat_id, started=window.mask)
+                else:
+                    self._mark(window.chat_id, ended=window.mask)
+                self._push(window, when)
+            due, self._dirty = self._dirty, {}
+        return due
+
+    def _apply(self, targets: dict) -> dict:
+        """
+        Set locks = manual_locks | active window locks; one UPDATE per distinct active mask
+
+        Args:
+            targets: chat_id -> active window locks
+
+        Returns:
+            chat_id -> the chat's new locks (chats without a groups row are left out)
+        """
+        chats = defaultdict(list)
+        for chat_id, active in targets.items():
+            chats[active].append(chat_id)
+
+        db = self.session_factory()
+        try:
+            rows = []
+            for active, chat_ids in chats.items():
+                rows += db.execute(
+                    update(Group).where(Group.chat_id.in_(chat_ids)).values(
+                        locks=Group.manual_locks.op("|")(active).op("&")(lock_set.all_mask),
+                        settings_version=Group.settings_version + 1
+                    ).returning(*settings.COLUMNS)
+                ).all()
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        for row in rows:
+            settings.store(row)
+        return {row.chat_id: row.locks for row in rows}
+
+    async def tick(self) -> int:
+        """
+        Apply every transition that is due
+
+        Returns:
+            Number of groups whose locks changed
+        """
+        if not self._loaded:
+            try:
+                await asyncio.to_thread(self._load)
+            except Exception as e:
+                print(f"❌ Loading lock schedules failed: {e}")
+                traceback.print_exc()
+                return 0
+
+        now = self.clock()
+        due = self._pop_due(now)
+        if not due:
+            return 0
+
+        with self._lock:
+            targets = {chat_id: self.active_mask(chat_id, now) for chat_id in due}
+        try:
+            locks = await asyncio.to_thread(self._apply, targets)
+        except Exception as e:
+            print(f"❌ Applying {len(due)} auto locks failed: {e}")
+            traceback.print_exc()
+            with self._lock:  # Retried next tick
+                for chat_id, (started, ended) in due.items():
+                    self._mark(chat_id, started, ended)
+            return 0
+
+        # Tell each group what its windows actually changed
+        notices = {}
+        for chat_id, (started, ended) in due.items():
+            if chat_id in locks:
+                text = _describe_change(started & locks[chat_id], ended & ~locks[chat_id])
+                if text:
+                    notices[chat_id] = text
+        sender = self.sender or get_sender()
+        await asyncio.gather(*(
+            sender.send(partial(_notice_call, chat_id, text)) for chat_id, text in notices.items()
+        ))
+        return len(locks)
+
+
+def _describe_change(locked: int, unlocked: int) -> str:
+    lines = []
+    if locked:
+        lines.append("🌙 قفل خودکار فعال شد: " + "، ".join(lock_set.labels(locked)))
+    if unlocked:
+        lines.append("☀️ قفل خودکار تموم شد: " + "، ".join(lock_set.labels(unlocked)))
+    return "\n".join(lines)
+
+
+# Shared scheduler used by the background job
+scheduler = AutoLockScheduler()
+
+
+# ==================== Data ====================
+
+def list_windows(db, chat_id: int) -> list:
+    return db.query(LockSchedule).filter(LockSchedule.chat_id == chat_id).order_by(LockSchedule.id).all()
+
+
+def add_window(db, chat_id: int, mask: int, start: int, end: int, title: str = None, added_by: int = None) -> LockSchedule:
+    settings.get_or_create_group(db, chat_id, title)
+    schedule = LockSchedule(chat_id=chat_id, locks=mask, start_minute=start, end_minute=end, added_by=added_by)
+    db.add(schedule)
+    db.commit()
+    scheduler.add(Window(schedule.id, chat_id, mask, start, end))
+    return schedule
+
+
+def remove_window(db, chat_id: int, schedule_id: int) -> bool:
+    deleted = db.query(LockSchedule).filter(
+        LockSchedule.chat_id == chat_id,
+        LockSchedule.id == schedule_id
+    ).delete(synchronize_session=False)
+    db.commit()
+    if deleted:
+        scheduler.remove(schedule_id)
+    return bool(deleted)
+
+
+# ==================== Handlers ====================
+
+_WINDOW_RE = re.compile(r"^(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})$")
+
+
+def parse_window(text: str) -> tuple:
+    """"23:00-07:00" -> (1380, 420), or None"""
+    match = _WINDOW_RE.match(text)
+    if not match:
+        return None
+    start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+    if start_hour > 23 or end_hour > 23 or start_minute > 59 or end_minute > 59:
+        return None
+    start, end = start_hour * 60 + start_minute, end_hour * 60 + end_minute
+    return (start, end) if start != end else None
+
+
+def _format_minute(minute: int) -> str:
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def _format_windows(schedules: list) -> str:
+    if not schedules:
+        return "⏰ قفل خودکاری تنظیم نشده."
+    lines = ["⏰ قفل‌های خودکار (به وقت ایران)\n"]
+    for schedule in schedules:
+        lines.append(
+            f"#{schedule.id} — {_format_minute(schedule.start_minute)} تا {_format_minute(schedule.end_minute)}: "
+            + "، ".join(lock_set.labels(schedule.locks))
+        )
+    return "\n".join(lines)
+
+
+async def auto_lock_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /autolock [HH:MM-HH:MM <type> ... | del <id>]"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    args = context.args or []
+    db = Session()
+    try:
+        if not args:
+            await update.message.reply_text(
+                _format_windows(list_windows(db, chat.id))
+                + "\n\nاستفاده: /autolock 23:00-07:00 photo video ...\nحذف: /autolock del <شماره>"
+            )
+            return
+
+        if args[0].lower() == "del":
+            schedule_id = args[1].lstrip("#") if len(args) > 1 else ""
+            if not schedule_id.isdigit():
+                await update.message.reply_text("استفاده: /autolock del <شماره>")
+            elif remove_window(db, chat.id, int(schedule_id)):
+                await update.message.reply_text(f"✅ قفل خودکار #{schedule_id} حذف شد.")
+            else:
+                await update.message.reply_text("❌ قفل خودکاری با این شماره پیدا نشد.")
+            return
+
+        window = parse_window(args[0])
+        mask, unknown = lock_set.parse(args[1:])
+        if window is None or not mask:
+            await update.message.reply_text("استفاده: /autolock 23:00-07:00 photo video ... (نوع‌ها: /locks)")
+            return
+        if len(list_windows(db, chat.id)) >= Config.MAX_LOCK_SCHEDULES:
+            await update.message.reply_text(f"❌ حداکثر {Config.MAX_LOCK_SCHEDULES} قفل خودکار برای هر گروه.")
+            return
+
+        schedule = add_window(db, chat.id, mask, *window, title=chat.title, added_by=update.effective_user.id)
+        text = (
+            f"⏰ قفل خودکار #{schedule.id}: هر روز {_format_minute(window[0])} تا {_format_minute(window[1])}\n"
+            + "🔒 " + "، ".join(lock_set.labels(mask))
+        )
+        if unknown:
+            text += f"\n\n❓ ناشناخته: {' '.join(unknown)} (لیست: /locks)"
+        await update.message.reply_text(text)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing auto locks in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در تغییر قفل خودکار!")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import random
+    from collections import Counter
+    from utils.sender import Sender
+
+    class FakeBot:
+        def __init__(self):
+            self.calls = Counter()
+
+        def __getattr__(self, method):
+            async def call(*args, **kwargs):
+                self.calls[method] += 1
+            return call
+
+    async def simulate():
+        now = [1_800_000_000.0]
+        bot = FakeBot()
+        demo = AutoLockScheduler(clock=lambda: now[0], sender=Sender(rate=100_000, concurrency=50, bot=bot))
+        demo._loaded = True
+        # No database: count the UPDATEs instead
+        updates = []
+        def fake_apply(targets):
+            updates.append(len(set(targets.values())))
+            return dict(targets)  # No manual locks: locks = active windows
+        demo._apply = fake_apply
+
+        rng = random.Random(7)
+        masks = [lock_set.parse(keys)[0] for keys in (["photo", "video"], ["link"], ["all"])]
+        for schedule_id in range(5000):
+            # Most groups lock at midnight; the rest at random quarter hours
+            start = 0 if schedule_id % 2 else rng.randrange(96) * 15
+            demo.add(Window(schedule_id, -schedule_id, rng.choice(masks), start, (start + 7 * 60) % 1440))
+        demo._dirty.clear()  # As if loaded at startup
+
+        start = time.perf_counter()
+        changed = ticks = 0
+        for _ in range(DAY // Config.AUTO_LOCK_TICK_INTERVAL):
+            now[0] += Config.AUTO_LOCK_TICK_INTERVAL
+            changed += await demo.tick()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+        print(f"5000 windows, one simulated day: {ticks} ticks in {elapsed:.2f} s, "
+              f"{changed} group changes, {sum(updates)} UPDATEs, {bot.calls['send_message']} notices")
+
+    asyncio.run(simulate())
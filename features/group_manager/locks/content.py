@@ -0,0 +1,25 @@
+"""
+Content locks (bits 22-27)
+"""
+
+import re
+from features.group_manager.locks.engine import Lock
+
+_LATIN_WORD_RE = re.compile(r"[A-Za-z]{2,}")
+
+
+def has_english(message) -> bool:
+    text = message.text or message.caption
+    return bool(text) and _LATIN_WORD_RE.search(text) is not None
+
+
+CONTENT_LOCKS = [
+    Lock("text", 22, "💬 متن", attrs=("text",)),
+    Lock("forward", 23, "↪️ فوروارد", attrs=("forward_date",)),
+    Lock("english", 24, "🔤 انگلیسی", probe=has_english),
+    Lock("spoiler", 25, "🫣 اسپویلر", entities=("spoiler",)),
+    Lock("custom_emoji", 26, "✨ ایموجی پریمیوم", entities=("custom_emoji",)),
+    Lock("service", 27, "🔔 پیام سرویس (ورود/خروج)", attrs=(
+        "new_chat_members", "left_chat_member", "new_chat_title", "new_chat_photo", "pinned_message"
+    )),
+]
@@ -0,0 +1,157 @@
+"""
+Group lock engine
+Every lock is one bit of groups.locks. A chat's mask is compiled once into
+a CompiledLocks predicate that holds only the checks its locks need
+(attribute lookups, one pass over the entities, and text probes such as
+Telegram links), so checking a message against all 28 locks is a few
+attribute reads with no database access. Chats with the same mask share
+one compiled predicate.
+
+Benchmark:
+    python -m features.group_manager.locks.engine
+"""
+
+from collections import namedtuple
+
+# key: name used in /lock, bit: position in groups.locks (never reuse one)
+# attrs: Message attributes whose presence trips the lock
+# entities: MessageEntity types (text and caption) that trip the lock
+# probe: callable(message) -> bool for checks the above can't express
+Lock = namedtuple("Lock", ["key", "bit", "label", "attrs", "entities", "probe"])
+Lock.__new__.__defaults__ = ((), (), None)
+
+
+class CompiledLocks:
+    """Lock predicate for one mask"""
+
+    __slots__ = ("mask", "_attrs", "_entities", "_probes")
+
+    def __init__(self, mask: int, locks: list):
+        self.mask = mask
+        self._attrs = tuple(
+            (attr, 1 << lock.bit) for lock in locks for attr in lock.attrs
+        )
+        self._entities = {
+            entity_type: 1 << lock.bit for lock in locks for entity_type in lock.entities
+        }
+        self._probes = tuple(
+            (lock.probe, 1 << lock.bit) for lock in locks if lock.probe
+        )
+
+    def __bool__(self):
+        return self.mask != 0
+
+    def check(self, message) -> int:
+        """
+        Classify a message against the compiled locks
+
+        Returns:
+            Bitmask of the locks the message breaks (0 = allowed)
+        """
+        found = 0
+        for attr, flag in self._attrs:
+            if getattr(message, attr, None):
+                found |= flag
+
+        if self._entities:
+            for entities in (message.entities, message.caption_entities):
+                for entity in entities or ():
+                    flag = self._entities.get(entity.type)
+                    if flag:
+                        found |= flag
+
+        for probe, flag in self._probes:
+            if not found & flag and probe(message):
+                found |= flag
+
+        return found
+
+
+class LockSet:
+    """
+    Registry of lock types
+
+    Example:
+        locks = LockSet(MEDIA_LOCKS + LINK_LOCKS + CONTENT_LOCKS)
+        mask, unknown = locks.parse(["photo", "link"])
+        locks.compile(mask).check(message)  # -> bits of the broken locks
+    """
+
+    def __init__(self, locks):
+        self.locks = {}
+        self.all_mask = 0
+        for lock in locks:
+            if lock.key in self.locks or self.all_mask & (1 << lock.bit):
+                raise ValueError(f"Duplicate lock {lock.key} / bit {lock.bit}")
+            self.locks[lock.key] = lock
+            self.all_mask |= 1 << lock.bit
+        self._compiled = {0: CompiledLocks(0, [])}
+
+    def __len__(self):
+        return len(self.locks)
+
+    def compile(self, mask: int) -> CompiledLocks:
+        """Return the (shared) predicate for a mask"""
+        compiled = self._compiled.get(mask)
+        if compiled is None:
+            compiled = CompiledLocks(mask, [
+                lock for lock in self.locks.values() if mask & (1 << lock.bit)
+            ])
+            self._compiled[mask] = compiled
+        return compiled
+
+    def parse(self, keys) -> tuple:
+        """
+        Turn lock names into a mask
+
+        Returns:
+            (mask, [unknown names]); "all" selects every lock
+        """
+        mask = 0
+        unknown = []
+        for key in keys:
+            key = key.lower().lstrip("#")
+            if key == "all":
+                mask |= self.all_mask
+            elif key in self.locks:
+                mask |= 1 << self.locks[key].bit
+            else:
+                unknown.append(key)
+        return mask, unknown
+
+    def labels(self, mask: int) -> list:
+        return [lock.label for lock in self.locks.values() if mask & (1 << lock.bit)]
+
+
+if __name__ == "__main__":
+    import time
+    from datetime import datetime
+    from telegram import Chat, Message, MessageEntity, User, PhotoSize
+    from features.group_manager.locks.media import MEDIA_LOCKS
+    from features.group_manager.locks.links import LINK_LOCKS
+    from features.group_manager.locks.content import CONTENT_LOCKS
+
+    lock_set = LockSet(MEDIA_LOCKS + LINK_LOCKS + CONTENT_LOCKS)
+    chat = Chat(-100, "supergroup")
+    user = User(1, "test", False)
+    date = datetime.now()
+
+    text = "سلام به همه، کسی لینک جلسه رو داره؟ https://t.me/joinchat/abc"
+    messages = [
+        Message(1, date, chat, from_user=user, text="سلام به همه، امروز جلسه ساعت چنده؟"),
+        Message(2, date, chat, from_user=user, text=text,
+                entities=(MessageEntity("url", text.index("https"), len("https://t.me/joinchat/abc")),)),
+        Message(3, date, chat, from_user=user, photo=(PhotoSize("f", "u", 90, 90),), caption="hello @someone",
+                caption_entities=(MessageEntity("mention", 6, 8),)),
+    ]
+
+    rounds = 100_000
+    for name, mask in (("no locks", 0), ("link + photo", lock_set.parse(["link", "photo"])[0]),
+                       ("all 28 locks", lock_set.all_mask)):
+        rules = lock_set.compile(mask)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for message in messages:
+                rules.check(message)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>14}: {elapsed / (rounds * len(messages)) * 1e6:.2f} µs/message")
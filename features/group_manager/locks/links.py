@@ -0,0 +1,60 @@
+"""
+Link and entity locks (bits 13-21)
+"""
+
+import re
+from features.group_manager.locks.engine import Lock
+
+_TELEGRAM_LINK_RE = re.compile(r"(?:\bt\.me|\btelegram\.(?:me|dog))/|^tg://", re.IGNORECASE)
+_LINK_ENTITIES = ("url", "text_link")
+
+# (message, links) of the last message seen: the guard's checks share one extraction
+_last = (None, ())
+
+
+def message_links(message) -> tuple:
+    """
+    Every link in a message's text and caption, visible or hidden (text_link)
+
+    Read from the entities Telegram already parsed, never from the raw text.
+    """
+    global _last
+    last_message, links = _last
+    if last_message is message:
+        return links
+
+    links = []
+    for text, entities in ((message.text, message.entities), (message.caption, message.caption_entities)):
+        if not entities:
+            continue
+        encoded = None
+        for entity in entities:
+            if entity.type == "text_link":
+                links.append(entity.url)
+            elif entity.type == "url":
+                # Offsets are in UTF-16 code units
+                if encoded is None:
+                    encoded = text.encode("utf-16-le")
+                links.append(encoded[entity.offset * 2:(entity.offset + entity.length) * 2].decode("utf-16-le"))
+
+    links = tuple(links)
+    _last = (message, links)
+    return links
+
+
+def has_telegram_link(message) -> bool:
+    """t.me / telegram.me links (group and channel invites), visible or hidden"""
+    return any(_TELEGRAM_LINK_RE.search(link) for link in message_links(message) if link)
+
+
+LINK_LOCKS = [
+    Lock("link", 13, "🔗 لینک", entities=_LINK_ENTITIES),
+    Lock("telegram_link", 14, "✈️ لینک تلگرام", probe=has_telegram_link),
+    Lock("mention", 15, "👤 منشن (@)", entities=("mention", "text_mention")),
+    Lock("hashtag", 16, "#️⃣ هشتگ", entities=("hashtag", "cashtag")),
+    Lock("email", 17, "📧 ایمیل", entities=("email",)),
+    Lock("phone", 18, "☎️ شماره تلفن", entities=("phone_number",)),
+    Lock("command", 19, "⌨️ دستور (/)", entities=("bot_command",)),
+    Lock("inline_bot", 20, "🤖 ربات اینلاین", attrs=("via_bot",)),
+    Lock("buttons", 21, "🔘 دکمه شیشه‌ای", attrs=("reply_markup",)),
+]
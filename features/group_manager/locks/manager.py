@@ -0,0 +1,124 @@
+"""
+Group locks: storage, per-chat rules and commands
+A chat's lock mask comes from the cached settings snapshot (settings.py)
+and is compiled into a shared predicate (engine.py); /lock and /unlock
+write the new snapshot through. Links and forwards on the group's allow
+lists (lists/) pass the link and forward locks.
+
+/lock    - /lock photo link ...  (or /lock all)
+/unlock  - /unlock photo ...     (or /unlock all)
+/locks   - this group's locks
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager.locks.engine import LockSet
+from features.group_manager.locks.media import MEDIA_LOCKS
+from features.group_manager.locks.links import LINK_LOCKS
+from features.group_manager.locks.content import CONTENT_LOCKS
+from features.group_manager.lists import allowed_links, allowed_forwards
+from features.group_manager.permissions.admins import is_group_admin
+from features.group_manager import settings
+
+lock_set = LockSet(MEDIA_LOCKS + LINK_LOCKS + CONTENT_LOCKS)
+
+# Locks the allow lists can lift
+LINK_MASK = lock_set.parse(["link", "telegram_link"])[0]
+FORWARD_MASK = lock_set.parse(["forward"])[0]
+
+
+# ==================== Data ====================
+
+
+def set_locks(db, chat_id: int, add: int = 0, remove: int = 0, title: str = None) -> int:
+    """
+    Turn locks on / off for a chat, now and as its manual locks
+    (what remains when auto-lock windows end)
+
+    Returns:
+        The new lock mask
+    """
+    group = settings.get_or_create_group(db, chat_id, title)
+    group.locks = (group.locks | add) & ~remove & lock_set.all_mask
+    group.manual_locks = (group.manual_locks | add) & ~remove & lock_set.all_mask
+    return settings.save(db, group).locks
+
+
+def get_rules(chat_id: int):
+    """Compiled lock predicate for a chat (no database access while the settings are cached)"""
+    return lock_set.compile(settings.get_settings(chat_id).locks)
+
+
+def check_locks(message) -> str:
+    """Label of the first lock the message breaks, or None"""
+    rules = get_rules(message.chat_id)
+    if not rules:
+        return None
+    broken = rules.check(message)
+    if broken & LINK_MASK and allowed_links.all_links_allowed(message):
+        broken &= ~LINK_MASK
+    if broken & FORWARD_MASK and allowed_forwards.is_allowed_forward(message):
+        broken &= ~FORWARD_MASK
+    return lock_set.labels(broken)[0] if broken else None
+
+
+# ==================== Handlers ====================
+
+def _format_locks(mask: int) -> str:
+    lines = ["🔐 قفل‌های گروه\n"]
+    for key, lock in lock_set.locks.items():
+        state = "🔒" if mask & (1 << lock.bit) else "🔓"
+        lines.append(f"{state} {lock.label} — {key}")
+    return "\n".join(lines)
+
+
+async def _change_locks(update: Update, context: ContextTypes.DEFAULT_TYPE, locking: bool):
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        await update.message.reply_text("⛔ فقط مدیرهای گروه می‌تونن قفل‌ها رو تغییر بدن.")
+        return
+
+    command = "/lock" if locking else "/unlock"
+    mask, unknown = lock_set.parse(context.args or [])
+    if not mask:
+        await update.message.reply_text(
+            f"استفاده: {command} <نوع> ... یا {command} all\n\n"
+            + _format_locks(get_rules(chat.id).mask)
+        )
+        return
+
+    db = Session()
+    try:
+        if locking:
+            set_locks(db, chat.id, add=mask, title=chat.title)
+        else:
+            set_locks(db, chat.id, remove=mask, title=chat.title)
+
+        text = ("🔒 قفل شد: " if locking else "🔓 باز شد: ") + "، ".join(lock_set.labels(mask))
+        if unknown:
+            text += f"\n\n❓ ناشناخته: {' '.join(unknown)} (لیست: /locks)"
+        await update.message.reply_text(text)
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing locks in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در تغییر قفل‌ها!")
+    finally:
+        db.close()
+
+
+async def lock_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /lock <type> ..."""
+    await _change_locks(update, context, locking=True)
+
+
+async def unlock_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /unlock <type> ..."""
+    await _change_locks(update, context, locking=False)
+
+
+async def locks_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /locks"""
+    await update.message.reply_text(_format_locks(get_rules(update.effective_chat.id).mask))
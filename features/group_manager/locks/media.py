@@ -0,0 +1,27 @@
+"""
+Media locks (bits 0-12)
+"""
+
+from features.group_manager.locks.engine import Lock
+
+
+def _is_file(message) -> bool:
+    # GIFs also carry a document; they have their own lock
+    return bool(message.document) and not message.animation
+
+
+MEDIA_LOCKS = [
+    Lock("photo", 0, "🖼️ عکس", attrs=("photo",)),
+    Lock("video", 1, "🎬 ویدیو", attrs=("video",)),
+    Lock("gif", 2, "🎞️ گیف", attrs=("animation",)),
+    Lock("music", 3, "🎵 موزیک", attrs=("audio",)),
+    Lock("voice", 4, "🎤 ویس", attrs=("voice",)),
+    Lock("video_note", 5, "⏺️ ویدیو مسیج", attrs=("video_note",)),
+    Lock("file", 6, "📎 فایل", probe=_is_file),
+    Lock("sticker", 7, "🐱 استیکر", attrs=("sticker",)),
+    Lock("contact", 8, "📇 مخاطب", attrs=("contact",)),
+    Lock("location", 9, "📍 لوکیشن", attrs=("location", "venue")),
+    Lock("poll", 10, "📊 نظرسنجی", attrs=("poll",)),
+    Lock("dice", 11, "🎲 تاس", attrs=("dice",)),
+    Lock("game", 12, "🎮 بازی", attrs=("game",)),
+]
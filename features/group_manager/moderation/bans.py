@@ -0,0 +1,21 @@
+"""
+Bans
+Stored and lifted by sanctions.py; a ban without a duration lasts until /unban.
+
+/ban   - reply: /ban [1d|7d] [reason] (or /ban <user id>) (group admins)
+/unban - /unban <user id> (or reply)
+"""
+
+from telegram import Update
+from telegram.ext import ContextTypes
+from features.group_manager.moderation.sanctions import sanction_command, BAN
+
+
+async def ban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /ban"""
+    await sanction_command(update, context, BAN)
+
+
+async def unban_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /unban"""
+    await sanction_command(update, context, BAN, lifting=True)
@@ -0,0 +1,45 @@
+"""
+Kick: remove a member who may join again (nothing is stored)
+
+/kick - reply: /kick (group admins)
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from features.group_manager.moderation.sanctions import resolve_target, send_action
+from features.group_manager.permissions.admins import is_group_admin
+from utils.sender import SENT
+
+
+async def kick(chat_id: int, user_id: int, sender=None) -> bool:
+    """Ban + unban: out of the group now, free to join again (sender None = shared sender)"""
+    if await send_action(lambda bot: bot.ban_chat_member(chat_id, user_id), sender) != SENT:
+        return False
+    await send_action(lambda bot: bot.unban_chat_member(chat_id, user_id, only_if_banned=True), sender)
+    return True
+
+
+async def kick_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /kick"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    user_id, name, _ = resolve_target(update, context)
+    if user_id is None:
+        await update.message.reply_text("استفاده: روی پیام کاربر ریپلای کن و بنویس /kick")
+        return
+    if user_id == context.bot.id or await is_group_admin(context.bot, chat.id, user_id):
+        await update.message.reply_text("⛔ مدیرهای گروه رو نمیشه حذف کرد.")
+        return
+
+    try:
+        if await kick(chat.id, user_id):
+            await update.message.reply_text(f"👢 {name} از گروه حذف شد.")
+        else:
+            await update.message.reply_text("❌ تلگرام اجازه نداد؛ ربات باید ادمین با دسترسی حذف اعضا باشه.")
+    except Exception as e:
+        print(f"❌ Error kicking {user_id} from {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در حذف کاربر!")
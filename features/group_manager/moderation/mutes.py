@@ -0,0 +1,21 @@
+"""
+Mutes
+Stored and lifted by sanctions.py; a mute without a duration lasts until /unmute.
+
+/mute   - reply: /mute [30m|2h|7d] [reason] (group admins)
+/unmute - reply: /unmute
+"""
+
+from telegram import Update
+from telegram.ext import ContextTypes
+from features.group_manager.moderation.sanctions import sanction_command, MUTE
+
+
+async def mute_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /mute"""
+    await sanction_command(update, context, MUTE)
+
+
+async def unmute_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /unmute"""
+    await sanction_command(update, context, MUTE, lifting=True)
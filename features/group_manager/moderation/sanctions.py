@@ -0,0 +1,337 @@
+"""
+Group sanctions: storage, Telegram calls and the expiry scheduler
+A mute or ban is a sanctions row while it is in force. Telegram is told
+to restrict / ban with no end date and one scheduler lifts what expired,
+so the row is the single source of truth (and /mutelist, /banlist read it).
+
+Every SANCTION_TICK_INTERVAL the scheduler leases the due rows in batches
+(UPDATE ... SET expires_at = now + SANCTION_RETRY_SECONDS RETURNING, over
+the expires_at index) and lifts them through the rate-limited sender: a
+tick costs as much as what expired, not as much as what is outstanding.
+A row is deleted only once its lift went through; if Telegram refused or
+the process died mid-tick, the lease runs out and the lift is retried, up
+to SANCTION_MAX_LIFT_ATTEMPTS times (a bot that lost its admin rights
+would otherwise retry forever).
+
+Testing with a fake clock and bot:
+    scheduler = SanctionScheduler(clock=lambda: now, sender=Sender(bot=FakeBot()))
+    await scheduler.tick()
+"""
+
+import asyncio
+import re
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from sqlalchemy import delete, select, update
+from telegram import ChatPermissions
+from database import Session
+from models.group import Sanction
+from features.group_manager.permissions.admins import is_group_admin
+from utils.background import run_in_background
+from utils.sender import get_sender, SENT, FAILED
+from config import Config
+
+MUTE = Sanction.MUTE
+BAN = Sanction.BAN
+
+
+# ==================== Data ====================
+
+def record(db, chat_id: int, user_id: int, kind: str, seconds: int = None,
+           reason: str = None, issued_by: int = None) -> Sanction:
+    """Store a sanction (replacing the user's current one of the same kind); seconds None = no end"""
+    sanction = db.query(Sanction).filter(
+        Sanction.chat_id == chat_id,
+        Sanction.user_id == user_id,
+        Sanction.kind == kind
+    ).with_for_update().first()
+    if sanction is None:
+        sanction = Sanction(chat_id=chat_id, user_id=user_id, kind=kind)
+        db.add(sanction)
+
+    sanction.expires_at = datetime.now(timezone.utc) + timedelta(seconds=seconds) if seconds else None
+    sanction.lift_attempts = 0
+    sanction.reason = (reason or "")[:255] or None
+    sanction.issued_by = issued_by
+    db.commit()
+    return sanction
+
+
+def remove(db, chat_id: int, user_id: int, kind: str) -> bool:
+    deleted = db.query(Sanction).filter(
+        Sanction.chat_id == chat_id,
+        Sanction.user_id == user_id,
+        Sanction.kind == kind
+    ).delete(synchronize_session=False)
+    db.commit()
+    return bool(deleted)
+
+
+def list_active(db, chat_id: int, kind: str, limit: int = 100) -> list:
+    """A chat's sanctions of one kind, soonest to expire first (no end date last)"""
+    return db.query(Sanction).filter(
+        Sanction.chat_id == chat_id,
+        Sanction.kind == kind
+    ).order_by(Sanction.expires_at.is_(None), Sanction.expires_at).limit(limit).all()
+
+
+def _in_session(func, *args, **kwargs):
+    db = Session()
+    try:
+        return func(db, *args, **kwargs)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ==================== Telegram ====================
+
+async def _shared_send(call) -> str:
+    return await get_sender().send(call)
+
+
+async def send_action(call, sender=None) -> str:
+    """
+    Send a moderation call through `sender`, or the shared sender
+
+    The shared sender's rate limiter and Bot belong to the background loop,
+    so from a command handler (its own loop) the call is run there.
+    """
+    if sender is not None:
+        return await sender.send(call)
+    return await run_in_background(_shared_send(call))
+
+
+def _impose_call(kind: str, chat_id: int, user_id: int, bot):
+    if kind == BAN:
+        return bot.ban_chat_member(chat_id, user_id)
+    return bot.restrict_chat_member(chat_id, user_id, ChatPermissions.no_permissions())
+
+
+def _lift_call(kind: str, chat_id: int, user_id: int, bot):
+    if kind == BAN:
+        return bot.unban_chat_member(chat_id, user_id, only_if_banned=True)
+    return bot.restrict_chat_member(chat_id, user_id, ChatPermissions.all_permissions())
+
+
+async def impose(chat_id: int, user_id: int, kind: str, seconds: int = None,
+                 reason: str = None, issued_by: int = None, sender=None) -> bool:
+    """
+    Mute / ban a user and keep the record the scheduler lifts it from
+
+    Returns:
+        True if Telegram applied it
+    """
+    await asyncio.to_thread(_in_session, record, chat_id, user_id, kind, seconds, reason, issued_by)
+    result = await send_action(partial(_impose_call, kind, chat_id, user_id), sender)
+    if result != SENT:
+        await asyncio.to_thread(_in_session, remove, chat_id, user_id, kind)
+    return result == SENT
+
+
+async def lift(chat_id: int, user_id: int, kind: str, sender=None) -> bool:
+    """
+    Unmute / unban now
+
+    Returns:
+        True if there was a record for it
+    """
+    existed = await asyncio.to_thread(_in_session, remove, chat_id, user_id, kind)
+    await send_action(partial(_lift_call, kind, chat_id, user_id), sender)
+    return existed
+
+
+# ==================== Scheduler ====================
+
+class SanctionScheduler:
+    def __init__(self, clock=time.time, sender=None, session_factory=Session, batch_size: int = None):
+        self.clock = clock
+        self.sender = sender
+        self.session_factory = session_factory
+        self.batch_size = batch_size or Config.SANCTION_BATCH_SIZE
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), timezone.utc)
+
+    def _lease_due(self, now: datetime, lease_until: datetime) -> list:
+        """Push up to batch_size expired sanctions to lease_until, count the attempt and return them (skips rows another worker holds)"""
+        db = self.session_factory()
+        try:
+            due = select(Sanction.id).where(
+                Sanction.expires_at <= now
+            ).order_by(Sanction.expires_at).limit(self.batch_size).with_for_update(skip_locked=True)
+            rows = db.execute(
+                update(Sanction).where(Sanction.id.in_(due.scalar_subquery())).values(
+                    expires_at=lease_until,
+                    lift_attempts=Sanction.lift_attempts + 1
+                ).returning(Sanction.id, Sanction.chat_id, Sanction.user_id, Sanction.kind, Sanction.lift_attempts)
+            ).all()
+            db.commit()
+            return rows
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _delete_lifted(self, ids: list, lease_until: datetime):
+        """Drop lifted rows, unless the user got a new sanction meanwhile (record() moved expires_at)"""
+        db = self.session_factory()
+        try:
+            db.execute(delete(Sanction).where(Sanction.id.in_(ids), Sanction.expires_at == lease_until))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def tick(self) -> int:
+        """
+        Lift every sanction that has expired, batch by batch
+
+        Returns:
+            Number of sanctions lifted
+        """
+        sender = self.sender or get_sender()
+        lifted = 0
+        while True:
+            now = self._now()
+            lease_until = now + timedelta(seconds=Config.SANCTION_RETRY_SECONDS)
+            try:
+                batch = await asyncio.to_thread(self._lease_due, now, lease_until)
+            except Exception as e:
+                print(f"❌ Loading expired sanctions failed: {e}")
+                traceback.print_exc()
+                break
+            if not batch:
+                break
+
+            results = await asyncio.gather(*(
+                sender.send(partial(_lift_call, row.kind, row.chat_id, row.user_id)) for row in batch
+            ))
+            finished = []
+            for row, result in zip(batch, results):
+                if result != FAILED:
+                    # BLOCKED: the bot left the chat, nothing left to lift
+                    finished.append(row.id)
+                    lifted += 1
+                elif row.lift_attempts >= Config.SANCTION_MAX_LIFT_ATTEMPTS:
+                    # Refused every time (the bot lost its rights, ...): retrying won't change that
+                    print(f"⚠️ Giving up lifting {row.kind} of {row.user_id} in {row.chat_id} "
+                          f"after {row.lift_attempts} attempts")
+                    finished.append(row.id)
+                # Other FAILED rows keep their lease and are retried
+            if finished:
+                try:
+                    await asyncio.to_thread(self._delete_lifted, finished, lease_until)
+                except Exception as e:
+                    # The lease runs out and the (harmless) lift is repeated
+                    print(f"❌ Deleting {len(finished)} finished sanctions failed: {e}")
+                    traceback.print_exc()
+
+            if len(batch) < self.batch_size:
+                break
+        return lifted
+
+
+# Shared scheduler used by the background job
+scheduler = SanctionScheduler()
+
+
+# ==================== Command helpers ====================
+
+_DURATION_RE = re.compile(r"^(\d+)([smhd])$")
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(text: str):
+    """"30m", "2h", "7d" -> seconds; None if text isn't a duration"""
+    match = _DURATION_RE.match(text.lower())
+    if not match:
+        return None
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def format_duration(seconds: int) -> str:
+    if not seconds:
+        return "نامحدود"
+    for unit, size in (("روز", 86400), ("ساعت", 3600), ("دقیقه", 60)):
+        if seconds >= size:
+            return f"{seconds // size} {unit}"
+    return f"{seconds} ثانیه"
+
+
+def resolve_target(update, context) -> tuple:
+    """
+    Member a moderation command is about: the replied-to message's sender,
+    or a numeric id as the first argument
+
+    Returns:
+        (user_id, name, remaining args) or (None, None, args)
+    """
+    args = list(context.args or [])
+    reply = update.message.reply_to_message
+    if reply and reply.from_user and not reply.from_user.is_bot:
+        return reply.from_user.id, reply.from_user.full_name, args
+    if args and args[0].isdigit():
+        return int(args[0]), args[0], args[1:]
+    return None, None, args
+
+
+_TEXTS = {
+    MUTE: {
+        "usage": "استفاده: روی پیام کاربر ریپلای کن و بنویس /mute [مدت مثل 30m، 2h، 7d] [دلیل]",
+        "done": "🔇 {name} برای {duration} ساکت شد.",
+        "lifted": "🔊 {name} دیگه ساکت نیست.",
+        "missing": "ℹ️ {name} ساکت نبود (محدودیت تلگرام برداشته شد).",
+    },
+    BAN: {
+        "usage": "استفاده: روی پیام کاربر ریپلای کن و بنویس /ban [مدت مثل 1d، 7d] [دلیل]",
+        "done": "⛔ {name} برای {duration} از گروه بن شد.",
+        "lifted": "✅ {name} از بن خارج شد.",
+        "missing": "ℹ️ {name} بن نبود.",
+    },
+}
+
+
+async def sanction_command(update, context, kind: str, lifting: bool = False):
+    """Shared body of /mute, /unmute, /ban and /unban (group admins, not against admins)"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    texts = _TEXTS[kind]
+    user_id, name, args = resolve_target(update, context)
+    if user_id is None:
+        await update.message.reply_text(texts["usage"])
+        return
+    if user_id == context.bot.id or await is_group_admin(context.bot, chat.id, user_id):
+        await update.message.reply_text("⛔ مدیرهای گروه رو نمیشه محدود کرد.")
+        return
+
+    try:
+        if lifting:
+            existed = await lift(chat.id, user_id, kind)
+            await update.message.reply_text(texts["lifted" if existed else "missing"].format(name=name))
+            return
+
+        seconds = parse_duration(args[0]) if args else None
+        if seconds is not None:
+            args = args[1:]
+        reason = " ".join(args) or None
+        if await impose(chat.id, user_id, kind, seconds, reason, issued_by=update.effective_user.id):
+            text = texts["done"].format(name=name, duration=format_duration(seconds))
+            if reason:
+                text += f"\nدلیل: {reason}"
+            await update.message.reply_text(text)
+        else:
+            await update.message.reply_text("❌ تلگرام اجازه نداد؛ ربات باید ادمین با دسترسی محدود کردن اعضا باشه.")
+    except Exception as e:
+        print(f"❌ Error applying {kind} in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در اعمال محدودیت!")
@@ -0,0 +1,175 @@
+"""
+Warnings
+Each warning is a group_warnings row; /warns reads the count per
+(chat, user) from a cache (one COUNT per member per TTL). Adding a warning
+counts again inside its transaction, with the chat's groups row locked, so
+warnings given at once (anti-spam, an admin, another worker) are counted
+one after the other. The WARN_LIMIT-th warning applies WARN_ACTION and
+clears the member's warnings.
+
+/warn   - reply: /warn [reason] (group admins)
+/unwarn - reply: clear a member's warnings
+/warns  - reply: a member's warnings (or your own)
+"""
+
+import asyncio
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from models.group import GroupWarning
+from features.group_manager import settings
+from features.group_manager.moderation.sanctions import impose, resolve_target, format_duration, BAN
+from features.group_manager.permissions.admins import is_group_admin
+from utils.cache import TTLCache
+from config import Config
+
+# (chat_id, user_id) -> warning count
+_counts = TTLCache(ttl=Config.GROUP_SETTINGS_TTL, max_size=100_000)
+
+
+# ==================== Data ====================
+
+def _member_warnings(db, chat_id: int, user_id: int):
+    return db.query(GroupWarning).filter(
+        GroupWarning.chat_id == chat_id,
+        GroupWarning.user_id == user_id
+    )
+
+
+def _load_count(chat_id: int, user_id: int) -> int:
+    db = Session()
+    try:
+        return _member_warnings(db, chat_id, user_id).count()
+    finally:
+        db.close()
+
+
+def get_warning_count(chat_id: int, user_id: int) -> int:
+    return _counts.get_or_set((chat_id, user_id), lambda: _load_count(chat_id, user_id))
+
+
+def add_warning(db, chat_id: int, user_id: int, reason: str = None, issued_by: int = None) -> int:
+    """
+    Add a warning; the WARN_LIMIT-th one clears the member's warnings
+
+    Returns:
+        The member's warning count with this one
+    """
+    # The chat's row lock makes concurrent warnings count one after the other
+    settings.get_or_create_group(db, chat_id)
+    db.add(GroupWarning(chat_id=chat_id, user_id=user_id, reason=(reason or "")[:255] or None, issued_by=issued_by))
+    db.flush()
+    count = _member_warnings(db, chat_id, user_id).count()
+    if count >= Config.WARN_LIMIT:
+        _member_warnings(db, chat_id, user_id).delete(synchronize_session=False)
+    db.commit()
+    # Not set in place: a warning committed just before this one could overwrite it with less
+    _counts.invalidate((chat_id, user_id))
+    return count
+
+
+def clear_warnings(db, chat_id: int, user_id: int) -> int:
+    deleted = _member_warnings(db, chat_id, user_id).delete(synchronize_session=False)
+    db.commit()
+    _counts.set((chat_id, user_id), 0)
+    return deleted
+
+
+def _add_in_session(chat_id: int, user_id: int, reason: str, issued_by: int) -> int:
+    db = Session()
+    try:
+        return add_warning(db, chat_id, user_id, reason, issued_by)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def warn(chat_id: int, user_id: int, reason: str = None, issued_by: int = None, sender=None) -> int:
+    """
+    Warn a member; the WARN_LIMIT-th warning applies WARN_ACTION
+
+    Returns:
+        The warning count (WARN_LIMIT when the action was applied)
+    """
+    count = await asyncio.to_thread(_add_in_session, chat_id, user_id, reason, issued_by)
+    if count >= Config.WARN_LIMIT:
+        await impose(
+            chat_id, user_id, Config.WARN_ACTION, Config.WARN_ACTION_SECONDS or None,
+            reason=f"{Config.WARN_LIMIT} اخطار", sender=sender
+        )
+    return count
+
+
+def describe_limit() -> str:
+    action = "بن" if Config.WARN_ACTION == BAN else "سکوت"
+    return f"{action} ({format_duration(Config.WARN_ACTION_SECONDS)})"
+
+
+# ==================== Handlers ====================
+
+async def warn_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /warn [reason]"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    user_id, name, args = resolve_target(update, context)
+    if user_id is None:
+        await update.message.reply_text("استفاده: روی پیام کاربر ریپلای کن و بنویس /warn [دلیل]")
+        return
+    if user_id == context.bot.id or await is_group_admin(context.bot, chat.id, user_id):
+        await update.message.reply_text("⛔ به مدیرهای گروه نمیشه اخطار داد.")
+        return
+
+    reason = " ".join(args) or None
+    try:
+        count = await warn(chat.id, user_id, reason, issued_by=update.effective_user.id)
+        if count >= Config.WARN_LIMIT:
+            text = f"🚨 {name} به {Config.WARN_LIMIT} اخطار رسید: {describe_limit()}"
+        else:
+            text = f"⚠️ {name} اخطار گرفت ({count} از {Config.WARN_LIMIT})."
+        if reason:
+            text += f"\nدلیل: {reason}"
+        await update.message.reply_text(text)
+    except Exception as e:
+        print(f"❌ Error warning {user_id} in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ثبت اخطار!")
+
+
+async def unwarn_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /unwarn"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    user_id, name, _ = resolve_target(update, context)
+    if user_id is None:
+        await update.message.reply_text("استفاده: روی پیام کاربر ریپلای کن و بنویس /unwarn")
+        return
+
+    db = Session()
+    try:
+        if clear_warnings(db, chat.id, user_id):
+            await update.message.reply_text(f"✅ اخطارهای {name} پاک شد.")
+        else:
+            await update.message.reply_text(f"ℹ️ {name} اخطاری نداشت.")
+    finally:
+        db.close()
+
+
+async def warns_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /warns"""
+    chat = update.effective_chat
+    user_id, name, _ = resolve_target(update, context)
+    if user_id is None:
+        user_id, name = update.effective_user.id, update.effective_user.full_name
+
+    count = await asyncio.to_thread(get_warning_count, chat.id, user_id)
+    await update.message.reply_text(
+        f"⚠️ {name}: {count} از {Config.WARN_LIMIT} اخطار\n"
+        f"با اخطار {Config.WARN_LIMIT}م: {describe_limit()}"
+    )
@@ -0,0 +1,165 @@
+"""
+Group settings panel
+An inline keyboard for the group's settings: locks, word filter,
+anti-spam action, captcha and welcome. The panel is drawn from the cached
+settings snapshot; each button carries the snapshot's version, and a
+change is only written if the row still has that version, so two admins
+pressing buttons on old panels can't undo each other's changes (the
+second one gets a fresh panel instead).
+
+/panel - open the panel (group admins)
+"""
+
+import traceback
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager import settings
+from features.group_manager.locks.manager import lock_set
+from features.group_manager.filters.spam import ACTIONS
+from features.group_manager.captcha.verify import MODES
+from features.group_manager.permissions.admins import is_group_admin
+
+MAIN = "main"
+LOCKS = "locks"
+CLOSE = "close"
+
+
+def _next(options: dict, current: str) -> str:
+    keys = list(options)
+    return keys[(keys.index(current) + 1) % len(keys)] if current in keys else keys[0]
+
+
+def _toggle_lock(group, key: str):
+    """Flip a lock now and make that its manual state (kept when auto-lock windows end)"""
+    bit = 1 << lock_set.locks[key].bit
+    group.locks ^= bit
+    group.manual_locks = (group.manual_locks & ~bit) | (group.locks & bit)
+
+
+# Toggles: action -> function(group row, arg) changing it
+TOGGLES = {
+    "lock": _toggle_lock,
+    "words": lambda group, _: setattr(group, "word_filter", not group.word_filter),
+    "spam": lambda group, _: setattr(group, "spam_action", _next(ACTIONS, group.spam_action)),
+    "captcha": lambda group, _: setattr(group, "captcha", _next(MODES, group.captcha)),
+    "welcome": lambda group, _: setattr(group, "welcome", not group.welcome),
+}
+
+
+# ==================== Keyboards ====================
+
+def _on_off(value: bool) -> str:
+    return "✅ روشن" if value else "❌ خاموش"
+
+
+def render_panel(snapshot: settings.GroupSettings, page: str = MAIN) -> tuple:
+    """
+    Returns:
+        (text, InlineKeyboardMarkup)
+    """
+    prefix = f"gp_{snapshot.version}_"
+    if page == LOCKS:
+        buttons = [
+            InlineKeyboardButton(
+                f"{'🔒' if snapshot.locks & (1 << lock.bit) else '🔓'} {lock.label}",
+                callback_data=f"{prefix}lock_{key}"
+            )
+            for key, lock in lock_set.locks.items()
+        ]
+        rows = [buttons[i:i + 2] for i in range(0, len(buttons), 2)]
+        rows.append([InlineKeyboardButton("🔙 برگشت", callback_data=f"{prefix}{MAIN}")])
+        return "🔐 قفل‌ها\nهر دکمه قفل رو روشن / خاموش می‌کنه.", InlineKeyboardMarkup(rows)
+
+    locked = bin(snapshot.locks).count("1")
+    rows = [
+        [InlineKeyboardButton(f"🔐 قفل‌ها ({locked} از {len(lock_set)})", callback_data=f"{prefix}{LOCKS}")],
+        [InlineKeyboardButton(f"🚫 فیلتر کلمات: {_on_off(snapshot.word_filter)}", callback_data=f"{prefix}words")],
+        [InlineKeyboardButton(f"🛡️ ضد اسپم: {ACTIONS[snapshot.spam_action]}", callback_data=f"{prefix}spam")],
+        [InlineKeyboardButton(f"🧩 کپچا: {MODES[snapshot.captcha]}", callback_data=f"{prefix}captcha")],
+        [InlineKeyboardButton(f"👋 خوش‌آمدگویی: {_on_off(snapshot.welcome)}", callback_data=f"{prefix}welcome")],
+        [InlineKeyboardButton("✖️ بستن", callback_data=f"{prefix}{CLOSE}")],
+    ]
+    return "⚙️ تنظیمات گروه\nبرای تغییر روی هر گزینه بزن.", InlineKeyboardMarkup(rows)
+
+
+# ==================== Data ====================
+
+def apply_toggle(chat, version: int, action: str, arg: str = None):
+    """
+    Change one setting if the row is still at `version`
+
+    Returns:
+        The new snapshot, or None if the settings changed since the panel was drawn
+    """
+    db = Session()
+    try:
+        group = settings.get_or_create_group(db, chat.id, chat.title)
+        if group.settings_version != version:
+            db.rollback()
+            return None
+        TOGGLES[action](group, arg)
+        return settings.save(db, group)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+# ==================== Handlers ====================
+
+async def panel_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /panel"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        await update.message.reply_text("⛔ فقط مدیرهای گروه به پنل دسترسی دارن.")
+        return
+
+    text, keyboard = render_panel(settings.get_settings(chat.id))
+    await update.message.reply_text(text, reply_markup=keyboard)
+
+
+async def handle_panel_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle gp_<version>_<action>[_<arg>]"""
+    query = update.callback_query
+    chat = query.message.chat
+    if not await is_group_admin(context.bot, chat.id, query.from_user.id):
+        await query.answer("⛔ فقط مدیرهای گروه", show_alert=True)
+        return
+
+    _, version, action, *rest = query.data.split("_", 3)
+    arg = rest[0] if rest else None
+
+    if action == CLOSE:
+        await query.answer()
+        await query.message.delete()
+        return
+
+    page = LOCKS if action in (LOCKS, "lock") else MAIN
+    if action not in TOGGLES or (action == "lock" and arg not in lock_set.locks):
+        await query.answer()
+        snapshot = settings.get_settings(chat.id)
+    else:
+        try:
+            snapshot = apply_toggle(chat, int(version), action, arg)
+        except Exception as e:
+            print(f"❌ Error changing settings in {chat.id}: {e}")
+            traceback.print_exc()
+            await query.answer("❌ خطا در تغییر تنظیمات!", show_alert=True)
+            return
+        if snapshot is None:
+            # The panel was stale: show what is current instead of overwriting it
+            await query.answer("⚠️ تنظیمات همین الان عوض شده بود؛ پنل به‌روز شد.", show_alert=True)
+            snapshot = settings.refresh(chat.id)
+        else:
+            await query.answer("✅")
+
+    text, keyboard = render_panel(snapshot, page)
+    try:
+        await query.edit_message_text(text, reply_markup=keyboard)
+    except BadRequest as e:
+        # Telegram rejects edits that don't change the message
+        if "not modified" not in str(e):
+            raise
@@ -0,0 +1,131 @@
+"""
+Group admin checks, served from memory
+Who may moderate a chat:
+
+- the chat's Telegram admins: one get_chat_administrators call per chat,
+  cached for ADMIN_CACHE_TTL and patched in place by chat_member updates
+  (promotions, demotions, the bot's own rights)
+- the bot's admins (Config.ADMIN_IDS), in every group
+- owners granted through the bot in that chat (owners.py)
+
+Concurrent misses for one chat share a single fetch. Every update runs on
+its own event loop, so the in-flight fetch is a concurrent.futures.Future
+the other loops wait on.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import namedtuple
+from telegram import Update
+from telegram.constants import ChatMemberStatus
+from telegram.error import TelegramError
+from telegram.ext import ContextTypes
+from features.group_manager.permissions import roles
+from utils.cache import TTLCache
+from config import Config
+
+ADMIN_STATUSES = (ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.OWNER)
+
+Roster = namedtuple("Roster", ["admins", "creator"])  # frozenset of user ids, creator id or None
+
+
+class AdminCache:
+    """
+    Example:
+        cache = AdminCache(ttl=600)
+        roster = await cache.get(bot, chat_id)  # at most one API call per chat per TTL
+        cache.apply(chat_member_updated)        # promotions / demotions
+    """
+
+    def __init__(self, ttl: float, max_size: int = 10_000, clock=time.monotonic):
+        self._rosters = TTLCache(ttl=ttl, max_size=max_size, clock=clock)
+        self._inflight = {}  # chat_id -> concurrent.futures.Future
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._rosters)
+
+    async def get(self, bot, chat_id: int) -> Roster:
+        """A chat's roster; raises TelegramError if it can't be fetched"""
+        roster = self._rosters.get(chat_id)
+        if roster is not None:
+            return roster
+
+        with self._lock:
+            future = self._inflight.get(chat_id)
+            leader = future is None
+            if leader:
+                future = self._inflight[chat_id] = concurrent.futures.Future()
+        if not leader:
+            return await asyncio.wrap_future(future)
+
+        try:
+            members = await bot.get_chat_administrators(chat_id)
+            roster = Roster(
+                admins=frozenset(member.user.id for member in members),
+                creator=next((member.user.id for member in members if member.status == ChatMemberStatus.OWNER), None)
+            )
+            self._rosters.set(chat_id, roster)
+            future.set_result(roster)
+            return roster
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(chat_id, None)
+
+    def apply(self, change):
+        """Patch a cached roster from a ChatMemberUpdated (uncached chats load fresh later)"""
+        roster = self._rosters.get(change.chat.id)
+        if roster is None:
+            return
+        member = change.new_chat_member
+        user_id = member.user.id
+        if member.status in ADMIN_STATUSES:
+            admins = roster.admins | {user_id}
+        else:
+            admins = roster.admins - {user_id}
+        if member.status == ChatMemberStatus.OWNER:
+            creator = user_id
+        else:
+            creator = None if roster.creator == user_id else roster.creator
+        self._rosters.set(change.chat.id, Roster(admins, creator))
+
+    def invalidate(self, chat_id: int):
+        self._rosters.invalidate(chat_id)
+
+
+admin_cache = AdminCache(ttl=Config.ADMIN_CACHE_TTL)
+
+
+async def get_roster(bot, chat_id: int) -> Roster:
+    """A chat's roster, or an empty one if Telegram can't be asked"""
+    try:
+        return await admin_cache.get(bot, chat_id)
+    except TelegramError as e:
+        print(f"❌ Admin list failed in {chat_id}: {e}")
+        return Roster(frozenset(), None)
+
+
+async def is_group_admin(bot, chat_id: int, user_id: int) -> bool:
+    """Telegram admin of chat_id, bot admin, or owner granted through the bot"""
+    if Config.is_admin(user_id):
+        return True
+    if user_id in (await get_roster(bot, chat_id)).admins:
+        return True
+    return roles.get_role(chat_id, user_id) == roles.OWNER
+
+
+async def is_exempt(bot, chat_id: int, user_id: int) -> bool:
+    """Skipped by the group guard: admins (as above) and VIPs"""
+    return roles.get_role(chat_id, user_id) == roles.VIP or await is_group_admin(bot, chat_id, user_id)
+
+
+async def handle_chat_member_update(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Keep cached rosters current (chat_member and my_chat_member updates)"""
+    change = update.chat_member or update.my_chat_member
+    if change:
+        admin_cache.apply(change)
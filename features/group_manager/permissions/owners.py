@@ -0,0 +1,87 @@
+"""
+Owners granted through the bot
+An owner may use every moderation command in the group without being a
+Telegram admin (is_group_admin counts them). Only the group's creator and
+the bot's admins can grant or take the role.
+
+/addowner - reply: /addowner
+/delowner - reply: /delowner (or /delowner <user id>)
+/owners   - this group's owners
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager.moderation.sanctions import resolve_target
+from features.group_manager.permissions import roles
+from features.group_manager.permissions.admins import get_roster
+from config import Config
+
+
+def is_owner(chat_id: int, user_id: int) -> bool:
+    return roles.get_role(chat_id, user_id) == roles.OWNER
+
+
+async def _can_grant(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+    user_id = update.effective_user.id
+    if Config.is_admin(user_id):
+        return True
+    roster = await get_roster(context.bot, update.effective_chat.id)
+    return roster.creator == user_id
+
+
+async def _change_owner(update: Update, context: ContextTypes.DEFAULT_TYPE, adding: bool):
+    chat = update.effective_chat
+    if not await _can_grant(update, context):
+        await update.message.reply_text("⛔ فقط سازنده‌ی گروه می‌تونه مالک اضافه یا حذف کنه.")
+        return
+
+    user_id, name, _ = resolve_target(update, context)
+    if user_id is None:
+        command = "/addowner" if adding else "/delowner"
+        await update.message.reply_text(f"استفاده: روی پیام کاربر ریپلای کن و بنویس {command}")
+        return
+
+    db = Session()
+    try:
+        if adding:
+            roles.set_role(db, chat.id, user_id, roles.OWNER, name=name, added_by=update.effective_user.id)
+            await update.message.reply_text(f"👑 {name} مالک گروه شد و به همه‌ی دستورهای مدیریتی دسترسی داره.")
+        elif roles.remove_role(db, chat.id, user_id, roles.OWNER):
+            await update.message.reply_text(f"✅ {name} دیگه مالک نیست.")
+        else:
+            await update.message.reply_text(f"ℹ️ {name} مالک نبود.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing owners in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ذخیره!")
+    finally:
+        db.close()
+
+
+async def add_owner_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /addowner"""
+    await _change_owner(update, context, adding=True)
+
+
+async def delete_owner_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /delowner"""
+    await _change_owner(update, context, adding=False)
+
+
+async def list_owners_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /owners"""
+    db = Session()
+    try:
+        owners = roles.list_members(db, update.effective_chat.id, roles.OWNER)
+    finally:
+        db.close()
+
+    if not owners:
+        await update.message.reply_text("📭 مالکی از طریق ربات اضافه نشده.")
+        return
+    lines = [f"👑 مالک‌های گروه ({len(owners)})\n"]
+    lines += [f"• {owner.name or '—'} ({owner.user_id})" for owner in owners]
+    await update.message.reply_text("\n".join(lines)[:3500])
@@ -0,0 +1,74 @@
+"""
+Per-group roles granted through the bot (owners.py, vip.py)
+A chat's roles are loaded once per GROUP_SETTINGS_TTL into a dict and
+edited in place by the commands, so role checks never query.
+"""
+
+from database import Session
+from models.group import GroupRole
+from utils.cache import TTLCache
+from config import Config
+
+OWNER = GroupRole.OWNER
+VIP = GroupRole.VIP
+
+# chat_id -> {user_id: role}
+_roles = TTLCache(ttl=Config.GROUP_SETTINGS_TTL, max_size=10_000)
+
+
+def _load_roles(chat_id: int) -> dict:
+    db = Session()
+    try:
+        rows = db.query(GroupRole.user_id, GroupRole.role).filter(GroupRole.chat_id == chat_id)
+        return dict(rows)
+    finally:
+        db.close()
+
+
+def get_roles(chat_id: int) -> dict:
+    return _roles.get_or_set(chat_id, lambda: _load_roles(chat_id))
+
+
+def get_role(chat_id: int, user_id: int) -> str:
+    """owner / vip / None"""
+    return get_roles(chat_id).get(user_id)
+
+
+def set_role(db, chat_id: int, user_id: int, role: str, name: str = None, added_by: int = None):
+    """Give a member a role (replacing any role they had)"""
+    entry = db.query(GroupRole).filter(
+        GroupRole.chat_id == chat_id,
+        GroupRole.user_id == user_id
+    ).first()
+    if entry is None:
+        db.add(GroupRole(chat_id=chat_id, user_id=user_id, role=role, name=name, added_by=added_by))
+    else:
+        entry.role = role
+        entry.name = name or entry.name
+        entry.added_by = added_by
+    db.commit()
+
+    cached = _roles.get(chat_id)
+    if cached is not None:
+        cached[user_id] = role
+
+
+def remove_role(db, chat_id: int, user_id: int, role: str) -> bool:
+    deleted = db.query(GroupRole).filter(
+        GroupRole.chat_id == chat_id,
+        GroupRole.user_id == user_id,
+        GroupRole.role == role
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    cached = _roles.get(chat_id)
+    if cached is not None and deleted:
+        cached.pop(user_id, None)
+    return bool(deleted)
+
+
+def list_members(db, chat_id: int, role: str) -> list:
+    return db.query(GroupRole).filter(
+        GroupRole.chat_id == chat_id,
+        GroupRole.role == role
+    ).order_by(GroupRole.id).all()
@@ -0,0 +1,79 @@
+"""
+VIP members
+VIPs are not admins, but the group guard skips them: no locks, word
+filter or anti-spam. Group admins grant and take the role.
+
+/vip    - reply: /vip
+/unvip  - reply: /unvip (or /unvip <user id>)
+/vips   - this group's VIPs
+"""
+
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager.moderation.sanctions import resolve_target
+from features.group_manager.permissions import roles
+from features.group_manager.permissions.admins import is_group_admin
+
+
+def is_vip(chat_id: int, user_id: int) -> bool:
+    return roles.get_role(chat_id, user_id) == roles.VIP
+
+
+async def _change_vip(update: Update, context: ContextTypes.DEFAULT_TYPE, adding: bool):
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    user_id, name, _ = resolve_target(update, context)
+    if user_id is None:
+        command = "/vip" if adding else "/unvip"
+        await update.message.reply_text(f"استفاده: روی پیام کاربر ریپلای کن و بنویس {command}")
+        return
+
+    db = Session()
+    try:
+        if adding:
+            if roles.get_role(chat.id, user_id) == roles.OWNER:
+                await update.message.reply_text(f"ℹ️ {name} مالک گروهه.")
+                return
+            roles.set_role(db, chat.id, user_id, roles.VIP, name=name, added_by=update.effective_user.id)
+            await update.message.reply_text(f"⭐ {name} ویژه شد؛ قفل‌ها و فیلترها شاملش نمیشن.")
+        elif roles.remove_role(db, chat.id, user_id, roles.VIP):
+            await update.message.reply_text(f"✅ {name} دیگه ویژه نیست.")
+        else:
+            await update.message.reply_text(f"ℹ️ {name} ویژه نبود.")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error changing VIPs in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ذخیره!")
+    finally:
+        db.close()
+
+
+async def vip_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /vip"""
+    await _change_vip(update, context, adding=True)
+
+
+async def unvip_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /unvip"""
+    await _change_vip(update, context, adding=False)
+
+
+async def list_vips_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /vips"""
+    db = Session()
+    try:
+        vips = roles.list_members(db, update.effective_chat.id, roles.VIP)
+    finally:
+        db.close()
+
+    if not vips:
+        await update.message.reply_text("📭 عضو ویژه‌ای نیست.")
+        return
+    lines = [f"⭐ اعضای ویژه ({len(vips)})\n"]
+    lines += [f"• {vip.name or '—'} ({vip.user_id})" for vip in vips]
+    await update.message.reply_text("\n".join(lines)[:3500])
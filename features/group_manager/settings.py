@@ -0,0 +1,142 @@
+"""
+Group settings snapshot
+The settings the message pipeline reads on every group message (locks,
+anti-spam action, captcha, word filter, welcome) are loaded from the
+groups row on a chat's first message and cached per chat for good (only
+the least recently used chats past the size bound are dropped), so
+reading them is a dict lookup and never a query again.
+
+Every snapshot carries the row's settings_version. Writers go through
+get_or_create_group() and save(), which bumps the version, commits and
+writes the new snapshot through to the cache; a snapshot never replaces
+a newer one, so a slow reader can't undo a write. Other workers pick up
+the change within GROUP_SETTINGS_SYNC_INTERVAL: sync() reads the rows
+updated since its last run (one indexed query for all chats) and replaces
+the cached snapshots that are older.
+"""
+
+import threading
+from collections import namedtuple
+from datetime import timedelta
+from sqlalchemy import select, func, DateTime
+from database import Session
+from models.group import Group
+from utils.cache import TTLCache
+from config import Config
+
+GroupSettings = namedtuple("GroupSettings", [
+    "locks", "spam_action", "captcha", "word_filter", "welcome", "welcome_text", "version"
+])
+
+# Columns of a snapshot, in GroupSettings order (chat_id first)
+COLUMNS = (
+    Group.chat_id, Group.locks, Group.spam_action, Group.captcha, Group.word_filter,
+    Group.welcome, Group.welcome_text, Group.settings_version
+)
+
+DEFAULT_SETTINGS = GroupSettings(
+    locks=0,
+    spam_action=Config.SPAM_DEFAULT_ACTION,
+    captcha=Config.CAPTCHA_DEFAULT_MODE,
+    word_filter=True,
+    welcome=False,
+    welcome_text=None,
+    version=0
+)
+
+# Never expires: sync() keeps the snapshots fresh
+_settings = TTLCache(ttl=float("inf"), max_size=10_000)
+_lock = threading.Lock()
+_synced_at = None  # Database time of the last sync
+
+
+def get_or_create_group(db, chat_id: int, title: str = None) -> Group:
+    """Return the chat's row (locked for update), creating it on first use"""
+    group = db.query(Group).filter(Group.chat_id == chat_id).with_for_update().first()
+    if group is None:
+        group = Group(
+            chat_id=chat_id,
+            title=title,
+            locks=DEFAULT_SETTINGS.locks,
+            manual_locks=DEFAULT_SETTINGS.locks,
+            spam_action=DEFAULT_SETTINGS.spam_action,
+            captcha=DEFAULT_SETTINGS.captcha,
+            word_filter=DEFAULT_SETTINGS.word_filter,
+            welcome=DEFAULT_SETTINGS.welcome,
+            settings_version=DEFAULT_SETTINGS.version
+        )
+        db.add(group)
+        db.flush()
+    elif title and group.title != title:
+        group.title = title
+    return group
+
+
+def store(row) -> GroupSettings:
+    """
+    Cache a snapshot from a row of COLUMNS unless a newer one is cached
+
+    Returns:
+        The snapshot now cached for the chat
+    """
+    snapshot = GroupSettings(*row[1:])
+    with _lock:
+        cached = _settings.get(row[0])
+        if cached is not None and cached.version > snapshot.version:
+            return cached
+        _settings.set(row[0], snapshot)
+    return snapshot
+
+
+def save(db, group: Group) -> GroupSettings:
+    """Commit a change to a row from get_or_create_group() and write it through to the cache"""
+    group.settings_version = Group.settings_version + 1
+    db.commit()
+    return store(tuple(getattr(group, column.key) for column in COLUMNS))
+
+
+def _load(chat_id: int) -> GroupSettings:
+    db = Session()
+    try:
+        row = db.query(*COLUMNS).filter(Group.chat_id == chat_id).first()
+    finally:
+        db.close()
+    return store(row or (chat_id, *DEFAULT_SETTINGS))
+
+
+def get_settings(chat_id: int) -> GroupSettings:
+    """A chat's settings (one query on the chat's first use, defaults for unknown chats)"""
+    snapshot = _settings.get(chat_id)
+    return snapshot if snapshot is not None else _load(chat_id)
+
+
+def refresh(chat_id: int) -> GroupSettings:
+    """Read a chat's row now (after a write lost to a newer version)"""
+    return _load(chat_id)
+
+
+def sync() -> int:
+    """
+    Replace cached snapshots other workers made stale (runs periodically)
+
+    Returns:
+        Number of cached snapshots replaced
+    """
+    global _synced_at
+    db = Session()
+    try:
+        now = db.scalar(select(func.now(type_=DateTime(timezone=True))))
+        since = (_synced_at or now) - timedelta(seconds=Config.GROUP_SETTINGS_SYNC_SLACK)
+        rows = db.query(*COLUMNS).filter(Group.updated_at >= since).all()
+    finally:
+        db.close()
+    _synced_at = now
+
+    replaced = 0
+    for row in rows:
+        cached = _settings.get(row.chat_id)
+        # Chats this worker hasn't cached load fresh when first needed
+        if cached is not None and cached.version < row.settings_version:
+            store(row)
+            replaced += 1
+    return replaced
@@ -0,0 +1,287 @@
+"""
+Welcome messages
+A group's template is compiled once (shared by every chat using the same
+text) and joins are coalesced: the first join in a chat opens a
+WELCOME_WINDOW, everyone joining meanwhile is named in one message, and a
+chat gets at most one welcome per WELCOME_MIN_INTERVAL. The previous
+welcome is deleted when the next one goes out. A join burst therefore
+costs two calls (send + delete) per interval, however many people join.
+
+Members of chats with a captcha are welcomed once they pass it.
+
+Placeholders: {mention} (linked names), {name}, {group}, {count}
+
+/welcome    - /welcome on|off (group admins)
+/setwelcome - /setwelcome <text> (no text = default)
+"""
+
+import html
+import re
+import threading
+import time
+import traceback
+from telegram import Update
+from telegram.ext import ContextTypes
+from database import Session
+from features.group_manager import settings
+from features.group_manager.permissions.admins import is_group_admin
+from utils.cache import TTLCache
+from utils.sender import get_sender, SENT
+from config import Config
+
+DEFAULT_TEMPLATE = "👋 {mention} به {group} خوش اومدین!"
+
+_FIELD_RE = re.compile(r"\{(\w+)\}")
+_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+
+class WelcomeTemplate:
+    """
+    Template split once into literal HTML and placeholders
+
+    Example:
+        template = WelcomeTemplate("سلام {name}!")
+        template.render(mention=..., name="Sara", group="...", count="۱")
+    """
+
+    FIELDS = ("mention", "name", "group", "count")
+
+    def __init__(self, text: str):
+        self.parts = []  # (is the part a field, literal HTML or field name)
+        position = 0
+        for match in _FIELD_RE.finditer(text):
+            if match.group(1) not in self.FIELDS:
+                continue
+            self.parts.append((False, html.escape(text[position:match.start()])))
+            self.parts.append((True, match.group(1)))
+            position = match.end()
+        self.parts.append((False, html.escape(text[position:])))
+
+    def render(self, **values) -> str:
+        return "".join(values[part] if is_field else part for is_field, part in self.parts)
+
+
+# template text -> WelcomeTemplate
+_templates = TTLCache(ttl=3600, max_size=10_000)
+
+
+def get_template(text: str = None) -> WelcomeTemplate:
+    text = text or DEFAULT_TEMPLATE
+    return _templates.get_or_set(text, lambda: WelcomeTemplate(text))
+
+
+def render_welcome(template: WelcomeTemplate, members: list, title: str) -> str:
+    """members: [(user_id, name)]; the ones past WELCOME_MAX_MENTIONS are counted, not named"""
+    shown = members[:Config.WELCOME_MAX_MENTIONS]
+    mention = "، ".join(
+        f'<a href="tg://user?id={user_id}">{html.escape(name or "کاربر")}</a>' for user_id, name in shown
+    )
+    if len(members) > len(shown):
+        mention += f" و {str(len(members) - len(shown)).translate(_PERSIAN_DIGITS)} نفر دیگه"
+    return template.render(
+        mention=mention,
+        name="، ".join(html.escape(name or "کاربر") for _, name in shown),
+        group=html.escape(title or "گروه"),
+        count=str(len(members)).translate(_PERSIAN_DIGITS)
+    )
+
+
+# ==================== Coalescing ====================
+
+class WelcomeCoalescer:
+    """
+    Example:
+        welcomes = WelcomeCoalescer(sender=Sender(bot=FakeBot()), clock=lambda: now)
+        welcomes.join(chat_id, user_id, "Sara", "گروه")
+        await welcomes.flush()  # sends the welcomes that are due
+    """
+
+    def __init__(self, sender=None, clock=time.monotonic):
+        self.sender = sender  # None = shared sender
+        self.clock = clock
+        self._pending = {}       # chat_id -> [due at, title, [(user_id, name)]]
+        self._last_sent = {}     # chat_id -> when the last welcome went out
+        self._last_message = {}  # chat_id -> message id of the last welcome
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def join(self, chat_id: int, user_id: int, name: str, title: str = None):
+        now = self.clock()
+        with self._lock:
+            entry = self._pending.get(chat_id)
+            if entry is None:
+                due = max(now + Config.WELCOME_WINDOW, self._last_sent.get(chat_id, 0) + Config.WELCOME_MIN_INTERVAL)
+                entry = self._pending[chat_id] = [due, title, []]
+            entry[1] = title or entry[1]
+            entry[2].append((user_id, name))
+
+    async def flush(self):
+        """Send every welcome whose window has closed; run periodically on the background loop"""
+        now = self.clock()
+        with self._lock:
+            due = [(chat_id, entry) for chat_id, entry in self._pending.items() if entry[0] <= now]
+            for chat_id, _ in due:
+                del self._pending[chat_id]
+                self._last_sent[chat_id] = now
+            # Chats quiet for a full interval no longer need their timestamps
+            for chat_id in [chat_id for chat_id, sent in self._last_sent.items()
+                            if sent + Config.WELCOME_MIN_INTERVAL < now and chat_id not in self._pending]:
+                del self._last_sent[chat_id]
+
+        for chat_id, (_, title, members) in due:
+            try:
+                await self._send(chat_id, title, members)
+            except Exception as e:
+                print(f"❌ Welcome failed in {chat_id}: {e}")
+                traceback.print_exc()
+
+    async def _send(self, chat_id: int, title: str, members: list):
+        group = settings.get_settings(chat_id)
+        if not group.welcome:
+            return
+
+        text = render_welcome(get_template(group.welcome_text), members, title)
+        sender = self.sender or get_sender()
+        sent = {}
+
+        async def _deliver(bot):
+            sent["message"] = await bot.send_message(chat_id, text, parse_mode="HTML")
+
+        if await sender.send(_deliver) != SENT:
+            return
+
+        previous = self._last_message.get(chat_id)
+        self._last_message[chat_id] = sent["message"].message_id
+        if previous:
+            await sender.send(lambda bot: bot.delete_message(chat_id, previous))
+
+
+welcomer = WelcomeCoalescer()
+
+
+# ==================== Handlers ====================
+
+async def handle_welcome_join(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Collect new members into the chat's next welcome (captcha chats: see welcome_verified)"""
+    from features.group_manager.captcha.verify import needs_captcha  # verify imports this module
+
+    message = update.effective_message
+    if not settings.get_settings(message.chat_id).welcome or needs_captcha(message.chat_id):
+        return
+
+    for member in message.new_chat_members:
+        if not member.is_bot:
+            welcomer.join(message.chat_id, member.id, member.first_name, message.chat.title)
+
+
+def welcome_verified(chat, user):
+    """A member who just passed the captcha"""
+    if settings.get_settings(chat.id).welcome:
+        welcomer.join(chat.id, user.id, user.first_name, chat.title)
+
+
+async def welcome_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /welcome on|off"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    action = (context.args or [""])[0].lower()
+    current = settings.get_settings(chat.id)
+    if action not in ("on", "off"):
+        preview = render_welcome(get_template(current.welcome_text), [(update.effective_user.id, update.effective_user.first_name)], chat.title)
+        await update.message.reply_text(
+            f"👋 خوش‌آمدگویی: {'روشن' if current.welcome else 'خاموش'}\n\n"
+            "استفاده: /welcome on|off\n"
+            "متن دلخواه: /setwelcome <متن> با {mention} {name} {group} {count}\n\n"
+            f"پیش‌نمایش:\n{preview}",
+            parse_mode="HTML"
+        )
+        return
+
+    await _save(update, chat, welcome=(action == "on"))
+
+
+async def set_welcome_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /setwelcome <text>"""
+    chat = update.effective_chat
+    if not await is_group_admin(context.bot, chat.id, update.effective_user.id):
+        return
+
+    # Keep the admin's line breaks: take the text after the command, not the split args
+    parts = update.message.text.split(maxsplit=1)
+    text = parts[1].strip() if len(parts) > 1 else None
+    if text and len(text) > Config.WELCOME_MAX_LENGTH:
+        await update.message.reply_text(f"❌ متن خیلی طولانیه (حداکثر {Config.WELCOME_MAX_LENGTH} کاراکتر).")
+        return
+
+    await _save(update, chat, welcome=True, welcome_text=text)
+
+
+async def _save(update: Update, chat, **values):
+    db = Session()
+    try:
+        group = settings.get_or_create_group(db, chat.id, chat.title)
+        for key, value in values.items():
+            setattr(group, key, value)
+        current = settings.save(db, group)
+
+        preview = render_welcome(get_template(current.welcome_text), [(update.effective_user.id, update.effective_user.first_name)], chat.title)
+        state = "روشن" if current.welcome else "خاموش"
+        await update.message.reply_text(f"✅ خوش‌آمدگویی: {state}\n\nپیش‌نمایش:\n{preview}", parse_mode="HTML")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error saving welcome in {chat.id}: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در ذخیره‌ی تنظیمات!")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import asyncio
+    import itertools
+    from collections import Counter
+    from utils.sender import Sender
+
+    class FakeMessage:
+        def __init__(self, message_id):
+            self.message_id = message_id
+
+    class FakeBot:
+        """Records calls and answers like Telegram"""
+
+        def __init__(self):
+            self.calls = Counter()
+            self.ids = itertools.count(1)
+
+        def __getattr__(self, method):
+            async def call(*args, **kwargs):
+                self.calls[method] += 1
+                return FakeMessage(next(self.ids))
+            return call
+
+    async def simulate():
+        now = [0.0]
+        bot = FakeBot()
+        demo = WelcomeCoalescer(sender=Sender(rate=10_000, concurrency=10, bot=bot), clock=lambda: now[0])
+        chat_id = -100
+        # Skip the database: the chat's settings snapshot, welcome on
+        settings._settings.set(chat_id, settings.DEFAULT_SETTINGS._replace(welcome=True))
+
+        # A raid: 200 joins over two minutes, flushed every second
+        for second in range(120):
+            now[0] = second
+            for user_id in range(second * 2, second * 2 + 2):
+                demo.join(chat_id, user_id, f"user {user_id}", "گروه تست")
+            await demo.flush()
+        now[0] += Config.WELCOME_MIN_INTERVAL
+        await demo.flush()
+        print(f"240 joins in 120 s: calls {dict(bot.calls)}")
+
+        template = get_template("سلام {name} <b>{unknown}</b>، عضو {count}م {group}!")
+        print(render_welcome(template, [(1, "Sara <3")], "گروه & دوستان"))
+
+    asyncio.run(simulate())
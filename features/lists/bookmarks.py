@@ -0,0 +1,317 @@
+"""
+Bookmarks: saved messages, books, stations and playlists
+All kinds live in one table (kind + target_id). A page is one keyset query
+on ix_bookmarks_user_page plus one IN query per kind present on the page,
+however many bookmarks the user has.
+
+Benchmark (in-memory SQLite):
+    python -m features.lists.bookmarks
+"""
+
+import traceback
+from collections import namedtuple
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from database import Session
+from models.bookmark import Bookmark
+from models.message import AnonymousMessage
+from models.book import Book
+from models.station import Station
+from models.playlist import Playlist
+
+# Bookmarks per page
+PAGE_SIZE = 10
+
+
+# ==================== Kinds ====================
+
+def _load_messages(db, ids: list, user_id: int) -> dict:
+    rows = db.query(AnonymousMessage.id, AnonymousMessage.message_type, AnonymousMessage.message_text).filter(
+        AnonymousMessage.id.in_(ids),
+        or_(AnonymousMessage.recipient_telegram_id == user_id, AnonymousMessage.sender_telegram_id == user_id),
+        AnonymousMessage.is_deleted == False
+    )
+    return {
+        row.id: ((row.message_text or f"[{row.message_type}]")[:40], f"bm_msg_{row.id}")
+        for row in rows
+    }
+
+
+def _load_books(db, ids: list, user_id: int) -> dict:
+    rows = db.query(Book.id, Book.title).filter(Book.id.in_(ids), Book.is_active == True)
+    return {row.id: (row.title, f"library_book_{row.id}") for row in rows}
+
+
+def _load_stations(db, ids: list, user_id: int) -> dict:
+    rows = db.query(Station.id, Station.name).filter(Station.id.in_(ids), Station.is_active == True)
+    return {row.id: (row.name, f"radio_st_{row.id}") for row in rows}
+
+
+def _load_playlists(db, ids: list, user_id: int) -> dict:
+    rows = db.query(Playlist.id, Playlist.name).filter(Playlist.id.in_(ids), Playlist.owner_id == user_id)
+    return {row.id: (row.name, f"pl_view_{row.id}") for row in rows}
+
+
+BookmarkKind = namedtuple("BookmarkKind", ["code", "icon", "loader"])
+
+# Stored kind -> definition (code is used in callback data)
+KINDS = {
+    1: BookmarkKind("m", "✉️", _load_messages),
+    2: BookmarkKind("b", "📖", _load_books),
+    3: BookmarkKind("s", "📻", _load_stations),
+    4: BookmarkKind("p", "🎵", _load_playlists)
+}
+KIND_MESSAGE, KIND_BOOK, KIND_STATION, KIND_PLAYLIST = KINDS
+KIND_BY_CODE = {definition.code: kind for kind, definition in KINDS.items()}
+
+
+def get_bookmark_button(kind: int, target_id: int):
+    """Toggle button for item pages"""
+    return InlineKeyboardButton("🔖 بوکمارک", callback_data=f"bm_t_{KINDS[kind].code}_{target_id}")
+
+
+# ==================== Data ====================
+
+def add_bookmark(db, user_id: int, kind: int, target_id: int) -> bool:
+    """Returns False if it was already bookmarked"""
+    try:
+        db.add(Bookmark(user_id=user_id, kind=kind, target_id=target_id))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def remove_bookmark(db, user_id: int, kind: int = None, target_id: int = None, bookmark_id: int = None) -> bool:
+    """Remove by (kind, target_id) or by bookmark id"""
+    query = db.query(Bookmark).filter(Bookmark.user_id == user_id)
+    if bookmark_id is not None:
+        query = query.filter(Bookmark.id == bookmark_id)
+    else:
+        query = query.filter(Bookmark.kind == kind, Bookmark.target_id == target_id)
+    removed = query.delete(synchronize_session=False)
+    db.commit()
+    return bool(removed)
+
+
+def toggle_bookmark(db, user_id: int, kind: int, target_id: int) -> bool:
+    """
+    Returns:
+        True if the item is bookmarked now
+    """
+    if add_bookmark(db, user_id, kind, target_id):
+        return True
+    remove_bookmark(db, user_id, kind, target_id)
+    return False
+
+
+def get_bookmarks_page(db, user_id: int, before_id: int = None, page_size: int = PAGE_SIZE) -> dict:
+    """
+    Newest bookmarks first, with their targets loaded in one query per kind
+
+    Args:
+        before_id: Last bookmark id of the previous page
+
+    Returns:
+        {"items": [{"id", "kind", "target_id", "label", "callback"}, ...], "next": before_id or None}
+        Items whose target is gone (deleted book, message...) are left out.
+    """
+    query = db.query(Bookmark.id, Bookmark.kind, Bookmark.target_id).filter(Bookmark.user_id == user_id)
+    if before_id:
+        query = query.filter(Bookmark.id < before_id)
+    rows = query.order_by(Bookmark.id.desc()).limit(page_size + 1).all()
+
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+
+    ids_by_kind = {}
+    for row in rows:
+        ids_by_kind.setdefault(row.kind, []).append(row.target_id)
+
+    targets = {
+        kind: KINDS[kind].loader(db, ids, user_id)
+        for kind, ids in ids_by_kind.items()
+        if kind in KINDS
+    }
+
+    items = []
+    for row in rows:
+        target = targets.get(row.kind, {}).get(row.target_id)
+        if target:
+            label, callback = target
+            items.append({
+                "id": row.id,
+                "kind": row.kind,
+                "target_id": row.target_id,
+                "label": label,
+                "callback": callback
+            })
+
+    return {"items": items, "next": rows[-1].id if has_next else None}
+
+
+# ==================== Display ====================
+
+def get_bookmarks_keyboard(page: dict, before_id: int = None):
+    cursor = before_id or 0
+    keyboard = [
+        [
+            InlineKeyboardButton(f"{KINDS[item['kind']].icon} {item['label']}"[:60], callback_data=item["callback"]),
+            InlineKeyboardButton("❌", callback_data=f"bm_rm_{item['id']}_{cursor}")
+        ]
+        for item in page["items"]
+    ]
+
+    nav = []
+    if before_id:
+        nav.append(InlineKeyboardButton("⏮️ اول", callback_data="lists_bookmarks"))
+    if page["next"]:
+        nav.append(InlineKeyboardButton("⏭️ بعدی", callback_data=f"bm_page_{page['next']}"))
+    if nav:
+        keyboard.append(nav)
+
+    keyboard.append([InlineKeyboardButton("🔙 برگشت", callback_data="lists")])
+    return InlineKeyboardMarkup(keyboard)
+
+
+async def _show_page(query, user_id: int, before_id: int = None):
+    db = Session()
+    try:
+        page = get_bookmarks_page(db, user_id, before_id)
+    finally:
+        db.close()
+
+    text = "🔖 بوکمارک‌ها\n\n"
+    text += "روی هر مورد بزن تا بازش کنی." if page["items"] else "هنوز چیزی بوکمارک نکردی! دکمه‌ی 🔖 رو زیر کتاب‌ها، ایستگاه‌ها و پیام‌ها پیدا می‌کنی."
+    await query.edit_message_text(text, reply_markup=get_bookmarks_keyboard(page, before_id))
+
+
+# ==================== Handlers ====================
+
+async def bookmarks_menu(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """First bookmarks page (lists_bookmarks / bm_page_{before_id} callbacks)"""
+    query = update.callback_query
+    await query.answer()
+
+    before_id = int(query.data[len("bm_page_"):]) if query.data.startswith("bm_page_") else None
+    await _show_page(query, update.effective_user.id, before_id)
+
+
+async def handle_bookmark_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """bm_t_{code}_{target_id} (toggle), bm_rm_{bookmark_id}_{page}, bm_msg_{message_id}"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    _, action, rest = query.data.split("_", 2)
+
+    db = Session()
+    try:
+        if action == "t":
+            code, target_id = rest.split("_")
+            if toggle_bookmark(db, user_id, KIND_BY_CODE[code], int(target_id)):
+                await query.answer("🔖 بوکمارک شد!")
+            else:
+                await query.answer("🗑️ از بوکمارک‌ها برداشته شد")
+
+        elif action == "rm":
+            bookmark_id, before_id = (int(part) for part in rest.split("_"))
+            remove_bookmark(db, user_id, bookmark_id=bookmark_id)
+            await query.answer("🗑️ برداشته شد")
+            await _show_page(query, user_id, before_id or None)
+
+        elif action == "msg":
+            message = db.query(AnonymousMessage).filter(
+                AnonymousMessage.id == int(rest),
+                or_(AnonymousMessage.recipient_telegram_id == user_id, AnonymousMessage.sender_telegram_id == user_id),
+                AnonymousMessage.is_deleted == False
+            ).first()
+            if not message:
+                await query.answer("❌ این پیام دیگه وجود نداره!", show_alert=True)
+                return
+
+            await query.answer()
+            chat_id = update.effective_chat.id
+            header = f"🔖 پیام بوکمارک‌شده ({message.sent_at:%Y-%m-%d})\n━━━━━━━━━━━━━━━━━━━━\n\n"
+            if message.message_type == "photo":
+                await context.bot.send_photo(chat_id, message.message_file_id, caption=header + (message.message_text or ""))
+            elif message.message_type == "voice":
+                await context.bot.send_voice(chat_id, message.message_file_id, caption=header)
+            else:
+                await context.bot.send_message(chat_id, header + (message.message_text or ""))
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Bookmark callback error: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+def _benchmark(users: int = 20, per_user: int = 5000, pages: int = 50):
+    """Page load with batched targets vs one lookup per bookmark (N+1)"""
+    import random
+    import time
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+    from database import Base
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[
+        Bookmark.__table__, AnonymousMessage.__table__, Book.__table__,
+        Station.__table__, Playlist.__table__
+    ])
+    db = sessionmaker(bind=engine)()
+
+    random.seed(7)
+    targets = 2000
+    db.add_all(Book(id=i, title=f"book {i}", file_id="f", category="other", is_active=True)
+               for i in range(1, targets + 1))
+    db.add_all(Station(id=i, identifier=f"Rs{i}", station_number=i, owner_id=i, name=f"station {i}", is_active=True)
+               for i in range(1, targets + 1))
+    db.add_all(Playlist(id=i, owner_id=i % users, name=f"playlist {i}", track_count=0)
+               for i in range(1, targets + 1))
+    db.add_all(AnonymousMessage(
+        id=i, sender_id=0, sender_telegram_id=-1, sender_identifier="x", recipient_id=0,
+        recipient_telegram_id=i % users, recipient_identifier="y", message_text=f"message {i}"
+    ) for i in range(1, targets + 1))
+
+    for user_id in range(users):
+        picked = random.sample([(kind, target) for kind in KINDS for target in range(1, targets + 1)], per_user)
+        db.add_all(Bookmark(user_id=user_id, kind=kind, target_id=target) for kind, target in picked)
+    db.commit()
+
+    statements = [0]
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.__setitem__(0, statements[0] + 1))
+
+    def walk(load_page):
+        statements[0] = 0
+        started = time.perf_counter()
+        for _ in range(pages):
+            user_id, before_id = random.randrange(users), None
+            for _ in range(random.randint(1, 5)):  # Browse a few pages deep
+                page = load_page(user_id, before_id)
+                before_id = page["next"]
+        return (time.perf_counter() - started) * 1000, statements[0]
+
+    def naive_page(user_id, before_id):
+        query = db.query(Bookmark).filter(Bookmark.user_id == user_id)
+        if before_id:
+            query = query.filter(Bookmark.id < before_id)
+        rows = query.order_by(Bookmark.id.desc()).limit(PAGE_SIZE + 1).all()
+        for row in rows[:PAGE_SIZE]:
+            KINDS[row.kind].loader(db, [row.target_id], user_id)
+        return {"next": rows[PAGE_SIZE - 1].id if len(rows) > PAGE_SIZE else None}
+
+    random.seed(1)
+    batched_ms, batched_statements = walk(lambda user_id, before_id: get_bookmarks_page(db, user_id, before_id))
+    random.seed(1)
+    naive_ms, naive_statements = walk(naive_page)
+
+    print(f"🔖 {users} users x {per_user} bookmarks")
+    print(f"📦 Batched: {batched_ms:.0f}ms, {batched_statements} statements")
+    print(f"🐢 N+1:     {naive_ms:.0f}ms, {naive_statements} statements")
+
+
+if __name__ == "__main__":
+    _benchmark()
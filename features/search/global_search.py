@@ -0,0 +1,407 @@
+"""
+Global search (/search and inline mode)
+Books, stations and playlists share one SearchIndex, so a query is scored
+once and hits of every type come back already merged by BM25 score. Each
+document also keeps its title / subtitle in memory, which lets a result
+page render without touching the database. Users are found by exact
+identifier only (names stay private).
+
+Inline queries arrive on every keystroke: each one waits
+SEARCH_INLINE_DEBOUNCE seconds and is dropped if the same user typed again
+meanwhile, and results are cached per (user, query, type).
+"""
+
+import asyncio
+import threading
+import traceback
+from collections import namedtuple
+from telegram import (
+    Update,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InlineQueryResultArticle,
+    InputTextMessageContent
+)
+from telegram.ext import ContextTypes
+from database import Session
+from models.book import Book
+from models.station import Station
+from models.playlist import Playlist
+from models.user import User
+from models.identifier import parse_identifier
+from utils.search_index import SearchIndex
+from utils.persian import normalize
+from utils.cache import TTLCache
+from features.cafe.library.categories import get_category_label
+from config import Config
+
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "subtitle": 2.0,
+    "description": 1.0
+}
+
+# kind -> (icon, label)
+KINDS = {
+    "user": ("👤", "کاربر"),
+    "book": ("📚", "کتاب"),
+    "station": ("📻", "ایستگاه"),
+    "playlist": ("🎵", "پلی‌لیست")
+}
+
+# "book: ..." / "کتاب: ..." restricts a query to one kind (keys are normalized below)
+KIND_ALIASES = {
+    "user": "user", "کاربر": "user",
+    "book": "book", "کتاب": "book",
+    "station": "station", "radio": "station", "ایستگاه": "station", "رادیو": "station",
+    "playlist": "playlist", "پلی‌لیست": "playlist", "پلی لیست": "playlist"
+}
+KIND_ALIASES = {normalize(alias): kind for alias, kind in KIND_ALIASES.items()}
+
+# Rows loaded per query while building the index
+BUILD_BATCH_SIZE = 1000
+
+# One hit; "ref" is what the result links to (share code / identifier)
+SearchDoc = namedtuple("SearchDoc", ["kind", "id", "title", "subtitle", "ref"])
+
+_index = None
+_docs = {}  # (kind, id) -> SearchDoc
+_index_lock = threading.Lock()
+
+result_cache = TTLCache(ttl=Config.SEARCH_CACHE_TTL, max_size=5000)
+_last_queries = TTLCache(ttl=Config.SEARCH_CACHE_TTL, max_size=5000)  # user_id -> text, for type buttons
+_pending_inline = {}  # user_id -> id of the newest inline query
+
+
+# ==================== Documents ====================
+
+def _book_document(book: Book) -> tuple:
+    doc = SearchDoc("book", book.id, book.title, book.author or get_category_label(book.category), None)
+    fields = {"title": book.title, "subtitle": book.author, "description": book.description}
+    return doc, fields, {"kind": "book"}
+
+
+def _station_document(station: Station) -> tuple:
+    tags = " ".join(f"#{tag}" for tag in (station.tags or "").split())
+    doc = SearchDoc("station", station.id, station.name, f"{station.identifier} {tags}".strip(), station.identifier)
+    fields = {"title": station.name, "subtitle": station.tags, "description": station.description}
+    return doc, fields, {"kind": "station"}
+
+
+def _playlist_document(playlist: Playlist) -> tuple:
+    doc = SearchDoc("playlist", playlist.id, playlist.name, "پلی‌لیست تو", None)
+    return doc, {"title": playlist.name}, {"kind": "playlist", "owner": playlist.owner_id}
+
+
+def _add(index: SearchIndex, document: tuple):
+    doc, fields, facets = document
+    key = (doc.kind, doc.id)
+    index.add(key, fields, facets=facets)
+    _docs[key] = doc
+
+
+# ==================== Index ====================
+
+def _load_batches(db, model, *conditions):
+    last_id = 0
+    while True:
+        batch = db.query(model).filter(
+            model.id > last_id, *conditions
+        ).order_by(model.id).limit(BUILD_BATCH_SIZE).all()
+        if not batch:
+            return
+        yield from batch
+        last_id = batch[-1].id
+
+
+def get_index(db) -> SearchIndex:
+    """Return the combined index, building it from the catalog tables on first use"""
+    global _index
+    if _index is not None:
+        return _index
+
+    with _index_lock:
+        if _index is None:
+            index = SearchIndex(FIELD_WEIGHTS)
+            for book in _load_batches(db, Book, Book.is_active == True):
+                _add(index, _book_document(book))
+            for station in _load_batches(db, Station, Station.is_active == True):
+                _add(index, _station_document(station))
+            for playlist in _load_batches(db, Playlist):
+                _add(index, _playlist_document(playlist))
+            _index = index
+            print(f"🔍 Global search index built: {len(index)} items")
+    return _index
+
+
+def warm_index():
+    """Build the index ahead of the first (latency-bound) inline query"""
+    db = Session()
+    try:
+        get_index(db)
+    except Exception as e:
+        print(f"❌ Global search index build failed: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
+
+
+def on_book_saved(book: Book):
+    if book.is_active:
+        _on_saved(_book_document(book))
+    else:
+        on_item_removed("book", book.id)
+
+
+def on_station_saved(station: Station):
+    _on_saved(_station_document(station))
+
+
+def on_playlist_saved(playlist: Playlist):
+    _on_saved(_playlist_document(playlist))
+
+
+def _on_saved(document: tuple):
+    if _index is None:
+        return  # Not built yet; the build will load the row
+    with _index_lock:
+        _add(_index, document)
+    result_cache.invalidate()
+
+
+def on_item_removed(kind: str, item_id: int):
+    if _index is None:
+        return
+    with _index_lock:
+        _index.remove((kind, item_id))
+        _docs.pop((kind, item_id), None)
+    result_cache.invalidate()
+
+
+# ==================== Search ====================
+
+def parse_query(text: str) -> tuple:
+    """
+    Split an optional kind prefix off a query
+
+    Returns:
+        (kind or None, query text)
+    """
+    head, colon, rest = text.partition(":")
+    kind = KIND_ALIASES.get(normalize(head.strip())) if colon else None
+    if kind:
+        return kind, rest.strip()
+    return None, text.strip()
+
+
+def _find_identifier(db, text: str) -> list:
+    """Exact Ua / Rs identifier match"""
+    kind = parse_identifier(text)["type"]
+    if kind == "user":
+        user = db.query(User).filter(
+            User.identifier == text,
+            User.is_blocked == False,
+            User.is_kicked == False
+        ).first()
+        if user and user.share_code:
+            return [SearchDoc("user", user.id, user.nickname or "کاربر ناشناس", user.identifier, user.share_code)]
+    elif kind == "station":
+        station = db.query(Station).filter(Station.identifier == text, Station.is_active == True).first()
+        if station:
+            return [_station_document(station)[0]]
+    return []
+
+
+def search(db, user_id: int, text: str, kind: str = None) -> dict:
+    """
+    Ranked search across all kinds
+
+    Args:
+        user_id: Searcher (only their own playlists match)
+        text: Query, optionally with a kind prefix ("book: ...")
+        kind: Kind filter; overrides the prefix
+
+    Returns:
+        {"hits": [SearchDoc], "total": int, "counts": {kind: n}, "kind": str or None, "query": str}
+    """
+    prefix_kind, query = parse_query(text)
+    kind = kind or prefix_kind
+    key = (user_id, normalize(query), kind)
+
+    result = result_cache.get(key)
+    if result is not None:
+        return result
+
+    hits = _find_identifier(db, query)
+    if hits and kind in (None, hits[0].kind):
+        result = {"hits": hits, "total": 1, "counts": {hits[0].kind: 1}, "kind": kind, "query": query}
+    else:
+        found = get_index(db).search(
+            query,
+            limit=Config.SEARCH_RESULT_LIMIT,
+            filters={"kind": kind} if kind else None,
+            where=lambda facets: facets.get("owner", user_id) == user_id
+        )
+        result = {
+            "hits": [_docs[doc_id] for doc_id in found.ids if doc_id in _docs],
+            "total": found.total,
+            "counts": found.facets.get("kind", {}),
+            "kind": kind,
+            "query": query
+        }
+
+    result_cache.set(key, result)
+    return result
+
+
+# ==================== Display ====================
+
+def _hit_button(hit: SearchDoc, bot_username: str) -> InlineKeyboardButton:
+    icon = KINDS[hit.kind][0]
+    label = f"{icon} {hit.title}"[:60]
+    if hit.kind == "user":
+        return InlineKeyboardButton(f"{icon} ✉️ {hit.subtitle}", url=f"https://t.me/{bot_username}?start={hit.ref}")
+    if hit.kind == "book":
+        return InlineKeyboardButton(label, callback_data=f"library_book_{hit.id}")
+    if hit.kind == "station":
+        return InlineKeyboardButton(label, callback_data=f"radio_st_{hit.id}")
+    return InlineKeyboardButton(label, callback_data=f"pl_view_{hit.id}")
+
+
+def format_results(result: dict, bot_username: str) -> tuple:
+    """
+    Render a /search result
+
+    Returns:
+        (text, reply_markup)
+    """
+    text = f"🔍 {result['query']}\n\n"
+    if not result["hits"]:
+        text += "😕 چیزی پیدا نشد."
+    else:
+        text += f"{result['total']} نتیجه"
+        if result["kind"]:
+            text += f" در {KINDS[result['kind']][1]}"
+
+    keyboard = [
+        [_hit_button(hit, bot_username)]
+        for hit in result["hits"][:Config.SEARCH_PAGE_SIZE]
+    ]
+
+    # Type filter row from the facet counts
+    filters = [
+        InlineKeyboardButton(f"{KINDS[kind][0]} {count}", callback_data=f"search_f_{kind}")
+        for kind, count in sorted(result["counts"].items(), key=lambda item: -item[1])
+        if kind != result["kind"]
+    ]
+    if result["kind"]:
+        filters.append(InlineKeyboardButton("🔍 همه", callback_data="search_f_all"))
+    if filters and (result["kind"] or len(result["counts"]) > 1):
+        keyboard.append(filters)
+
+    keyboard.append([InlineKeyboardButton("🔙 منوی اصلی", callback_data="back_to_main")])
+    return text, InlineKeyboardMarkup(keyboard)
+
+
+def _inline_article(hit: SearchDoc, bot_username: str) -> InlineQueryResultArticle:
+    icon, label = KINDS[hit.kind]
+    if hit.kind == "user":
+        button = InlineKeyboardButton("✉️ پیام ناشناس", url=f"https://t.me/{bot_username}?start={hit.ref}")
+        message = f"{icon} {hit.subtitle}\n✉️ برای من پیام ناشناس بفرست!"
+    else:
+        button = InlineKeyboardButton(f"{icon} باز کردن در ربات", url=f"https://t.me/{bot_username}")
+        message = f"{icon} {hit.title}\n{hit.subtitle}"
+
+    return InlineQueryResultArticle(
+        id=f"{hit.kind}_{hit.id}",
+        title=f"{icon} {hit.title}",
+        description=f"{label} • {hit.subtitle}",
+        input_message_content=InputTextMessageContent(message),
+        reply_markup=InlineKeyboardMarkup([[button]])
+    )
+
+
+# ==================== Handlers ====================
+
+async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /search [type:] <query>"""
+    user_id = update.effective_user.id
+    text = " ".join(context.args or []).strip()
+
+    if len(parse_query(text)[1]) < Config.SEARCH_MIN_QUERY_LENGTH:
+        await update.message.reply_text(
+            "🔍 استفاده: /search <عبارت>\n\n"
+            "کتاب‌ها، ایستگاه‌ها و پلی‌لیست‌هات رو با هم می‌گرده. "
+            "برای یه نوع خاص: /search کتاب: هدایت\n"
+            "شناسه‌ی کاربر (Ua...) یا ایستگاه (Rs...) هم قبوله.\n\n"
+            f"💡 تو هر چتی هم می‌تونی بنویسی: @{context.bot.username} <عبارت>"
+        )
+        return
+
+    db = Session()
+    try:
+        result = search(db, user_id, text)
+        _last_queries.set(user_id, result["query"])
+        reply_text, keyboard = format_results(result, context.bot.username)
+        await update.message.reply_text(reply_text, reply_markup=keyboard)
+    except Exception as e:
+        print(f"❌ Global search error: {e}")
+        traceback.print_exc()
+        await update.message.reply_text("❌ خطا در جستجو! دوباره تلاش کن.")
+    finally:
+        db.close()
+
+
+async def handle_search_filter_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """search_f_{kind|all}: re-run the last /search with a type filter"""
+    query = update.callback_query
+    user_id = update.effective_user.id
+    kind = query.data[len("search_f_"):]
+
+    text = _last_queries.get(user_id)
+    if text is None:
+        await query.answer("⌛ این جستجو قدیمی شده، دوباره /search بزن.", show_alert=True)
+        return
+
+    await query.answer()
+    db = Session()
+    try:
+        result = search(db, user_id, text, kind=kind if kind in KINDS else None)
+        reply_text, keyboard = format_results(result, context.bot.username)
+        await query.edit_message_text(reply_text, reply_markup=keyboard)
+    finally:
+        db.close()
+
+
+async def handle_inline_query(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """@bot <query> in any chat"""
+    inline_query = update.inline_query
+    user_id = inline_query.from_user.id
+    text = inline_query.query.strip()
+
+    if len(parse_query(text)[1]) < Config.SEARCH_MIN_QUERY_LENGTH:
+        await inline_query.answer([], cache_time=Config.SEARCH_CACHE_TTL, is_personal=True)
+        return
+
+    # Debounce: only the newest keystroke of a burst reaches the index / database
+    kind, query = parse_query(text)
+    if result_cache.get((user_id, normalize(query), kind)) is None:
+        _pending_inline[user_id] = inline_query.id
+        await asyncio.sleep(Config.SEARCH_INLINE_DEBOUNCE)
+        if _pending_inline.get(user_id) != inline_query.id:
+            return  # Superseded; Telegram has already dropped this query on the client
+        _pending_inline.pop(user_id, None)
+
+    db = Session()
+    try:
+        result = search(db, user_id, text)
+        await inline_query.answer(
+            [_inline_article(hit, context.bot.username) for hit in result["hits"]],
+            cache_time=Config.SEARCH_CACHE_TTL,
+            is_personal=True  # Playlists differ per user
+        )
+    except Exception as e:
+        print(f"❌ Inline search error: {e}")
+        traceback.print_exc()
+    finally:
+        db.close()
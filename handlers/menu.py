@@ -3,21 +3,21 @@ from telegram.ext import ContextTypes
 from utils.keyboards import (
     get_main_menu_keyboard,
     get_send_letter_keyboard,
-    get_cafe_menu_keyboard
+    get_cafe_menu_keyboard,
+    get_lists_keyboard
 )
 from utils.messages import (
     get_main_menu_text,
     get_send_letter_text,
     get_cafe_menu_text
 )
+from features.billboard.display import with_billboard
 
 
 async def menu_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /menu command"""
-    await update.message.reply_text(
-        get_main_menu_text(),
-        reply_markup=get_main_menu_keyboard()
-    )
+    text, keyboard = with_billboard(get_main_menu_text(), get_main_menu_keyboard(), update.effective_user.id)
+    await update.message.reply_text(text, reply_markup=keyboard)
 
 
 async def handle_main_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -29,10 +29,8 @@ async def handle_main_menu_callback(update: Update, context: ContextTypes.DEFAUL
     
     # Back to main menu
     if callback_data == "back_to_main":
-        await query.edit_message_text(
-            get_main_menu_text(),
-            reply_markup=get_main_menu_keyboard()
-        )
+        text, keyboard = with_billboard(get_main_menu_text(), get_main_menu_keyboard(), update.effective_user.id)
+        await query.edit_message_text(text, reply_markup=keyboard)
     
     # Send letter menu
     elif callback_data == "send_letter":
@@ -43,10 +41,8 @@ async def handle_main_menu_callback(update: Update, context: ContextTypes.DEFAUL
     
     # Cafe menu
     elif callback_data == "cafe_menu":
-        await query.edit_message_text(
-            get_cafe_menu_text(),
-            reply_markup=get_cafe_menu_keyboard()
-        )
+        text, keyboard = with_billboard(get_cafe_menu_text(), get_cafe_menu_keyboard(), update.effective_user.id)
+        await query.edit_message_text(text, reply_markup=keyboard)
     
     # Other menus (placeholder)
     elif callback_data == "leaderboard":
@@ -57,8 +53,8 @@ async def handle_main_menu_callback(update: Update, context: ContextTypes.DEFAUL
     
     elif callback_data == "lists":
         await query.edit_message_text(
-            "📋 لیست‌ها\n\n🚧 این بخش در حال توسعه است...",
-            reply_markup=get_main_menu_keyboard()
+            "📋 لیست‌ها\n\nیه لیست انتخاب کن:",
+            reply_markup=get_lists_keyboard()
         )
     
     elif callback_data == "social_media":
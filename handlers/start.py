@@ -7,6 +7,7 @@ from models.identifier import generate_identifier
 from utils.share_code import generate_share_code, is_share_code_unique
 from utils.keyboards import get_main_menu_keyboard
 from utils.messages import get_welcome_message, get_main_menu_text
+from features.billboard.display import with_billboard
 from utils.state import set_state, STATE_WAITING_MESSAGE
 
 
@@ -45,15 +46,9 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 return
             
             # Existing user - show main menu
-            await update.message.reply_text(
-                get_main_menu_text(),
-                reply_markup=get_main_menu_keyboard()
-            )
-            
-            # Update last activity
-            from sqlalchemy import text
-            existing_user.last_activity = db.execute(text("SELECT NOW()")).scalar()
-            db.commit()
+            # (last_activity is tracked in batches by handlers/tracking.py)
+            text, keyboard = with_billboard(get_main_menu_text(), get_main_menu_keyboard(), user.id)
+            await update.message.reply_text(text, reply_markup=keyboard)
             
         else:
             # New user - register
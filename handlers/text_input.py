@@ -0,0 +1,37 @@
+from telegram import Update
+from telegram.ext import ContextTypes
+from utils.state import (
+    get_state,
+    STATE_LIBRARY_SEARCH,
+    STATE_RADIO_SEARCH,
+    STATE_RADIO_CREATE,
+    STATE_RADIO_POST,
+    STATE_PLAYLIST_CREATE,
+    STATE_PLAYLIST_ADD
+)
+from features.cafe.library.books import handle_library_search_input
+from features.cafe.radio.search import handle_radio_search_input
+from features.cafe.radio.create import handle_create_station_input
+from features.cafe.radio.player import handle_station_post_input
+from features.cafe.playlist.crete import handle_create_playlist_input
+from features.cafe.playlist.manage import handle_add_track_input
+
+# User state -> handler for the text the user sends next
+STATE_HANDLERS = {
+    STATE_LIBRARY_SEARCH: handle_library_search_input,
+    STATE_RADIO_SEARCH: handle_radio_search_input,
+    STATE_RADIO_CREATE: handle_create_station_input,
+    STATE_RADIO_POST: handle_station_post_input,
+    STATE_PLAYLIST_CREATE: handle_create_playlist_input,
+    STATE_PLAYLIST_ADD: handle_add_track_input
+}
+
+
+async def handle_feature_text_input(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Route private messages to the feature waiting for them
+    (runs in its own handler group, next to the anonymous message flow)
+    """
+    handler = STATE_HANDLERS.get(get_state(update.effective_user.id)["state"])
+    if handler:
+        await handler(update, context)
@@ -0,0 +1,92 @@
+from telegram import Update
+from telegram.ext import ContextTypes
+from utils.activity import touch
+from utils.presence import mark_active
+from utils import metrics
+
+# Callback data prefix -> presence feature
+CALLBACK_FEATURES = (
+    ("send_", "send"),
+    ("confirm_send", "send"),
+    ("cancel_send", "send"),
+    ("cafe_", "cafe"),
+    ("library_", "cafe"),
+    ("radio_", "cafe"),
+    ("gallery_", "cafe"),
+    ("playlist_", "cafe"),
+    ("pl_", "cafe"),
+    ("pod_", "cafe"),
+    ("code_", "cafe"),
+    ("bb_", "menu"),
+    ("lists_", "menu"),
+    ("bm_", "menu"),
+    ("search_", "menu"),
+    ("rule", "rules"),
+    ("dashboard_", "admin"),
+    ("back_to_main", "menu")
+)
+
+# Command -> presence feature
+COMMAND_FEATURES = {
+    "start": "menu",
+    "menu": "menu",
+    "search": "menu",
+    "rules": "rules",
+    "rule_as": "rules",
+    "dashboard": "admin",
+    "active": "admin",
+    "library": "cafe",
+    "radio": "cafe",
+    "slideshow": "cafe",
+    "book": "cafe",
+    "addbook": "admin",
+    "delbook": "admin",
+    "addimage": "admin",
+    "delimage": "admin",
+    "addepisode": "admin",
+    "addchapter": "admin",
+    "delepisode": "admin",
+    "addsnippet": "admin",
+    "addlink": "admin",
+    "editresource": "admin",
+    "delresource": "admin",
+    "addbillboard": "admin",
+    "billboards": "admin",
+    "bbweight": "admin",
+    "delbillboard": "admin"
+}
+
+
+def classify_feature(update: Update) -> str:
+    """Map an update to the feature it belongs to (None if unknown)"""
+    if update.callback_query and update.callback_query.data:
+        data = update.callback_query.data
+        for prefix, feature in CALLBACK_FEATURES:
+            if data.startswith(prefix):
+                return feature
+        return None
+
+    message = update.message
+    if message and message.text and message.text.startswith("/"):
+        command = message.text[1:].split()[0].split("@")[0]
+        return COMMAND_FEATURES.get(command)
+
+    # Plain messages in a private chat are part of the send flow
+    if message and message.chat.type == "private":
+        return "send"
+
+    return None
+
+
+async def track_update(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Runs before every other handler (group -1)
+    Records user activity in memory only; nothing here touches the database
+    """
+    user = update.effective_user
+    if not user or user.is_bot:
+        return
+
+    touch(user.id)
+    metrics.record_distinct("active_users", user.id)
+    mark_active(user.id, classify_feature(update))
@@ -3,12 +3,97 @@ import os
 import asyncio
 from flask import Flask, request
 from telegram import Update
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, filters
+from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ChatMemberHandler, InlineQueryHandler, MessageHandler, TypeHandler, filters
 from config import Config
 from database import init_db, test_connection
 from handlers.start import start_command
+from handlers.tracking import track_update
 from handlers.menu import menu_command, handle_main_menu_callback
 from handlers.rules import rules_command, rule_as_command, show_rule_as, back_to_rules, close_rules
+from features.admin_panel.dashboard import dashboard_command, active_users_command, handle_dashboard_callback
+from features.cafe.library.books import (
+    library_menu,
+    start_library_search,
+    book_search_command,
+    handle_library_callback
+)
+from features.admin_panel.content.books import add_book_command, delete_book_command
+from features.cafe.radio.station import radio_menu, show_station, handle_listen_callback
+from features.cafe.radio.leaderboard import handle_listing_callback, handle_tag_subscription_callback
+from features.cafe.radio.player import start_station_post, resume_broadcasts
+from features.cafe.radio.search import start_radio_search
+from features.cafe.radio.create import start_create_station
+from features.cafe.gallery.manager import gallery_menu, handle_gallery_callback, slideshow_command
+from features.cafe.gallery.slideshow import engine as slideshow_engine
+from features.admin_panel.content.gallery import add_image_command, delete_image_command
+from features.cafe.playlist.manage import playlist_menu, handle_playlist_callback
+from features.cafe.playlist.crete import start_create_playlist
+from features.cafe.playlist.player import play_playlist
+from features.cafe.podcast.player import podcast_menu, show_episode, play_chapter
+from features.cafe.podcast.progress import flush_podcast_progress
+from features.admin_panel.content.podcasts import add_episode_command, add_chapter_command, delete_episode_command
+from features.cafe.code_cafe.resources import code_cafe_menu, handle_code_callback
+from features.admin_panel.content.code_cafe import (
+    add_snippet_command,
+    add_link_command,
+    edit_resource_command,
+    delete_resource_command
+)
+from features.billboard.display import handle_billboard_callback
+from features.lists.bookmarks import bookmarks_menu, handle_bookmark_callback
+from features.search.global_search import (
+    search_command,
+    handle_search_filter_callback,
+    handle_inline_query,
+    warm_index
+)
+from features.billboard.manager import refresh_rotation, flush_billboard_counters
+from features.admin_panel.content.billboard import (
+    add_billboard_command,
+    list_billboards_command,
+    billboard_weight_command,
+    delete_billboard_command
+)
+from features.group_manager.locks.manager import lock_command, unlock_command, locks_command
+from features.group_manager.locks.auto_lock import scheduler as auto_lock_scheduler, auto_lock_command
+from features.group_manager.lists.allowed_links import (
+    allow_link_command, deny_link_command, delete_link_command, list_links_command
+)
+from features.group_manager.lists.allowed_forwards import (
+    allow_forward_command, deny_forward_command, delete_forward_command, list_forwards_command
+)
+from features.group_manager.filters.words import add_word_command, delete_word_command, list_words_command
+from features.group_manager.filters.spam import antispam_command, handle_new_members, notices as spam_notices
+from features.group_manager.moderation.mutes import mute_command, unmute_command
+from features.group_manager.moderation.bans import ban_command, unban_command
+from features.group_manager.moderation.kick import kick_command
+from features.group_manager.moderation.warning import warn_command, unwarn_command, warns_command
+from features.group_manager.moderation.sanctions import scheduler as sanction_scheduler
+from features.group_manager.permissions.admins import handle_chat_member_update
+from features.group_manager.permissions.owners import add_owner_command, delete_owner_command, list_owners_command
+from features.group_manager.permissions.vip import vip_command, unvip_command, list_vips_command
+from features.group_manager.lists.muted import mute_list_command
+from features.group_manager.lists.banned import ban_list_command
+from features.group_manager.captcha.verify import (
+    manager as captcha_manager,
+    captcha_command,
+    handle_captcha_join,
+    handle_captcha_callback
+)
+from features.group_manager.welcome import (
+    welcomer,
+    welcome_command,
+    set_welcome_command,
+    handle_welcome_join
+)
+from features.group_manager.panel import panel_command, handle_panel_callback
+from features.group_manager import settings as group_settings
+from features.group_manager.guard import guard_group_message
+from handlers.text_input import handle_feature_text_input
+from utils.background import run_every
+from utils.metrics import flush_metrics
+from utils.activity import flush_activity
+from utils.presence import flush_presence
 from features.anonymous.send import (
     start_send_to_admin,
     start_send_to_admins,
@@ -48,11 +133,36 @@ print(f"🔑 Admin ID: {Config.ADMIN_ID}")
 # setup bot application
 bot_application = Application.builder().token(Config.BOT_TOKEN).build()
 
+# Activity tracking (runs before every other handler)
+bot_application.add_handler(TypeHandler(Update, track_update), group=-1)
+
 # Add handlers
 bot_application.add_handler(CommandHandler("start", start_command))
 bot_application.add_handler(CommandHandler("menu", menu_command))
+bot_application.add_handler(CommandHandler("search", search_command))
 bot_application.add_handler(CommandHandler("rules", rules_command))
 bot_application.add_handler(CommandHandler("rule_as", rule_as_command))
+bot_application.add_handler(CommandHandler("dashboard", dashboard_command))
+bot_application.add_handler(CommandHandler("active", active_users_command))
+bot_application.add_handler(CommandHandler("radio", radio_menu))
+bot_application.add_handler(CommandHandler("slideshow", slideshow_command))
+bot_application.add_handler(CommandHandler("addimage", add_image_command))
+bot_application.add_handler(CommandHandler("delimage", delete_image_command))
+bot_application.add_handler(CommandHandler("library", library_menu))
+bot_application.add_handler(CommandHandler("book", book_search_command))
+bot_application.add_handler(CommandHandler("addbook", add_book_command))
+bot_application.add_handler(CommandHandler("delbook", delete_book_command))
+bot_application.add_handler(CommandHandler("addepisode", add_episode_command))
+bot_application.add_handler(CommandHandler("addchapter", add_chapter_command))
+bot_application.add_handler(CommandHandler("delepisode", delete_episode_command))
+bot_application.add_handler(CommandHandler("addsnippet", add_snippet_command))
+bot_application.add_handler(CommandHandler("addlink", add_link_command))
+bot_application.add_handler(CommandHandler("editresource", edit_resource_command))
+bot_application.add_handler(CommandHandler("delresource", delete_resource_command))
+bot_application.add_handler(CommandHandler("addbillboard", add_billboard_command))
+bot_application.add_handler(CommandHandler("billboards", list_billboards_command))
+bot_application.add_handler(CommandHandler("bbweight", billboard_weight_command))
+bot_application.add_handler(CommandHandler("delbillboard", delete_billboard_command))
 
 # Main menu callback handler
 bot_application.add_handler(CallbackQueryHandler(
@@ -68,19 +178,163 @@ bot_application.add_handler(CallbackQueryHandler(start_send_to_specific, pattern
 bot_application.add_handler(CallbackQueryHandler(confirm_send, pattern="^confirm_send$"))
 bot_application.add_handler(CallbackQueryHandler(cancel_send, pattern="^cancel_send$"))
 
+# Library handlers
+bot_application.add_handler(CallbackQueryHandler(library_menu, pattern="^cafe_library$"))
+bot_application.add_handler(CallbackQueryHandler(start_library_search, pattern="^library_search$"))
+bot_application.add_handler(CallbackQueryHandler(handle_library_callback, pattern="^library_(cat|res|book|get)_"))
+
+# Radio handlers
+bot_application.add_handler(CallbackQueryHandler(radio_menu, pattern="^cafe_radio$"))
+bot_application.add_handler(CallbackQueryHandler(start_radio_search, pattern="^radio_search$"))
+bot_application.add_handler(CallbackQueryHandler(start_create_station, pattern="^radio_create$"))
+bot_application.add_handler(CallbackQueryHandler(show_station, pattern="^radio_st_"))
+bot_application.add_handler(CallbackQueryHandler(handle_listen_callback, pattern="^radio_(listen|unlisten)_"))
+bot_application.add_handler(CallbackQueryHandler(handle_listing_callback, pattern="^radio_(top|new|tag)"))
+bot_application.add_handler(CallbackQueryHandler(handle_tag_subscription_callback, pattern="^radio_(tsub|tunsub)_"))
+bot_application.add_handler(CallbackQueryHandler(start_station_post, pattern="^radio_post_"))
+
+# Gallery handlers
+bot_application.add_handler(CallbackQueryHandler(gallery_menu, pattern="^cafe_gallery$"))
+bot_application.add_handler(CallbackQueryHandler(handle_gallery_callback, pattern="^gallery_(start|stop|random)$"))
+
+# Playlist handlers
+bot_application.add_handler(CallbackQueryHandler(playlist_menu, pattern="^cafe_playlist$"))
+bot_application.add_handler(CallbackQueryHandler(start_create_playlist, pattern="^playlist_create$"))
+bot_application.add_handler(CallbackQueryHandler(play_playlist, pattern="^pl_play_"))
+bot_application.add_handler(CallbackQueryHandler(handle_playlist_callback, pattern="^pl_(view|edit|add|delete|up|down|rm)_"))
+
+# Podcast handlers
+bot_application.add_handler(CallbackQueryHandler(podcast_menu, pattern="^(cafe_podcast$|pod_page_)"))
+bot_application.add_handler(CallbackQueryHandler(show_episode, pattern="^pod_ep_"))
+bot_application.add_handler(CallbackQueryHandler(play_chapter, pattern="^pod_ch_"))
+
+# Code cafe handlers
+bot_application.add_handler(CallbackQueryHandler(code_cafe_menu, pattern="^cafe_code$"))
+bot_application.add_handler(CallbackQueryHandler(handle_code_callback, pattern="^code_(lang|res)_"))
+
+# Billboard handlers
+bot_application.add_handler(CallbackQueryHandler(handle_billboard_callback, pattern="^bb_"))
+
+# Bookmark handlers
+bot_application.add_handler(CallbackQueryHandler(bookmarks_menu, pattern="^(lists_bookmarks$|bm_page_)"))
+bot_application.add_handler(CallbackQueryHandler(handle_bookmark_callback, pattern="^bm_(t|rm|msg)_"))
+
+# Global search handlers
+bot_application.add_handler(CallbackQueryHandler(handle_search_filter_callback, pattern="^search_f_"))
+bot_application.add_handler(InlineQueryHandler(handle_inline_query))
+
 # Rules handlers
 bot_application.add_handler(CallbackQueryHandler(show_rule_as, pattern="^rule_as$"))
 bot_application.add_handler(CallbackQueryHandler(back_to_rules, pattern="^back_to_rules$"))
 bot_application.add_handler(CallbackQueryHandler(close_rules, pattern="^close_rules$"))
 
+# Admin panel handlers
+bot_application.add_handler(CallbackQueryHandler(handle_dashboard_callback, pattern="^dashboard_(minute|hour)$"))
+
+# Group manager handlers
+bot_application.add_handler(CommandHandler("lock", lock_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("unlock", unlock_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("locks", locks_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("autolock", auto_lock_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("panel", panel_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("allowlink", allow_link_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("denylink", deny_link_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("dellink", delete_link_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("links", list_links_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("allowforward", allow_forward_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("denyforward", deny_forward_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("delforward", delete_forward_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("forwards", list_forwards_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("addword", add_word_command))
+bot_application.add_handler(CommandHandler("delword", delete_word_command))
+bot_application.add_handler(CommandHandler("words", list_words_command))
+bot_application.add_handler(CommandHandler("antispam", antispam_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("captcha", captcha_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("welcome", welcome_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("setwelcome", set_welcome_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("mute", mute_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("unmute", unmute_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("ban", ban_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("unban", unban_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("kick", kick_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("warn", warn_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("unwarn", unwarn_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("warns", warns_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("mutelist", mute_list_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("banlist", ban_list_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("addowner", add_owner_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("delowner", delete_owner_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("owners", list_owners_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("vip", vip_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("unvip", unvip_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(CommandHandler("vips", list_vips_command, filters=filters.ChatType.GROUPS))
+bot_application.add_handler(ChatMemberHandler(handle_chat_member_update, ChatMemberHandler.ANY_CHAT_MEMBER))
+bot_application.add_handler(CallbackQueryHandler(handle_captcha_callback, pattern="^captcha_"))
+bot_application.add_handler(CallbackQueryHandler(handle_panel_callback, pattern="^gp_"))
+
 # Message handler (must be last!)
 bot_application.add_handler(MessageHandler(
-    filters.TEXT | filters.PHOTO | filters.VOICE,
+    (filters.TEXT | filters.PHOTO | filters.VOICE) & filters.ChatType.PRIVATE,
     handle_message_input
 ))
 
+# Feature text input (separate group, routed by user state)
+bot_application.add_handler(MessageHandler(
+    ((filters.TEXT & ~filters.COMMAND) | filters.PHOTO | filters.VOICE | filters.AUDIO | filters.VIDEO)
+    & filters.ChatType.PRIVATE,
+    handle_feature_text_input
+), group=1)
+
+# Group guard: locks and word filter (separate group, sees every group message including commands)
+bot_application.add_handler(MessageHandler(filters.ChatType.GROUPS, guard_group_message), group=2)
+
+# Group joins: raid / account-hopping detection
+bot_application.add_handler(MessageHandler(
+    filters.StatusUpdate.NEW_CHAT_MEMBERS & filters.ChatType.GROUPS,
+    handle_new_members
+), group=3)
+
+# Group joins: captcha (after the anti-spam check has counted the join)
+bot_application.add_handler(MessageHandler(
+    filters.StatusUpdate.NEW_CHAT_MEMBERS & filters.ChatType.GROUPS,
+    handle_captcha_join
+), group=4)
+
+# Group joins: welcome (chats with a captcha welcome members once they pass it)
+bot_application.add_handler(MessageHandler(
+    filters.StatusUpdate.NEW_CHAT_MEMBERS & filters.ChatType.GROUPS,
+    handle_welcome_join
+), group=5)
+
 print("✅ Handlers registered")
 
+# Captcha image renderers are forked from this process: before any thread starts
+captcha_manager.pool.start()
+
+# Background jobs
+run_every(Config.METRICS_FLUSH_INTERVAL, flush_metrics, flush_on_exit=True)
+run_every(Config.ACTIVITY_FLUSH_INTERVAL, flush_activity, flush_on_exit=True)
+run_every(Config.PRESENCE_FLUSH_INTERVAL, flush_presence, flush_on_exit=True)
+run_every(Config.PODCAST_PROGRESS_FLUSH_INTERVAL, flush_podcast_progress, flush_on_exit=True)
+run_every(Config.GALLERY_TICK_INTERVAL, slideshow_engine.tick, name="gallery_slideshow")
+run_every(Config.BILLBOARD_FLUSH_INTERVAL, flush_billboard_counters, flush_on_exit=True)
+run_every(Config.BILLBOARD_REFRESH_INTERVAL, refresh_rotation, name="billboard_rotation")
+run_every(Config.CAPTCHA_FLUSH_INTERVAL, captcha_manager.flush, name="captcha")
+run_every(Config.SANCTION_TICK_INTERVAL, sanction_scheduler.tick, name="sanctions")
+run_every(Config.WELCOME_FLUSH_INTERVAL, welcomer.flush, name="welcome")
+run_every(Config.SPAM_NOTICE_FLUSH_INTERVAL, spam_notices.flush, name="spam_notices")
+run_every(Config.AUTO_LOCK_TICK_INTERVAL, auto_lock_scheduler.tick, name="auto_lock")
+run_every(Config.GROUP_SETTINGS_SYNC_INTERVAL, group_settings.sync, name="group_settings")
+
+refresh_rotation()
+warm_index()
+
+resumed = resume_broadcasts()
+if resumed:
+    print(f"📢 Resumed {resumed} unfinished broadcasts")
+
+print("✅ Background jobs started")
+
 # Initialize bot
 loop = asyncio.new_event_loop()
 asyncio.set_event_loop(loop)
@@ -94,7 +348,8 @@ try:
     webhook_url = os.getenv('RENDER_EXTERNAL_URL')
     if webhook_url:
         webhook_url = f"{webhook_url}/{Config.BOT_TOKEN}"
-        loop.run_until_complete(bot_application.bot.set_webhook(url=webhook_url))
+        # chat_member updates keep the group admin cache current; Telegram only sends them when asked
+        loop.run_until_complete(bot_application.bot.set_webhook(url=webhook_url, allowed_updates=Update.ALL_TYPES))
         print(f"✅ Webhook set to: {webhook_url}")
     else:
         print("⚠️  No RENDER_EXTERNAL_URL found")
@@ -0,0 +1,56 @@
+"""
+Alembic environment for eynVu
+Uses the application's engine and models so migrations and the bot
+always point at the same database
+"""
+
+from logging.config import fileConfig
+from alembic import context
+from database import Base, engine
+
+# Register every model on Base.metadata
+import models  # noqa: F401
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """Emit SQL to stdout instead of running it (alembic upgrade head --sql)"""
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        transaction_per_migration=True
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Run migrations against the database
+
+    One transaction per migration file, so a file that uses
+    autocommit blocks (concurrent index builds, batched backfills)
+    never holds locks taken by earlier files.
+    """
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
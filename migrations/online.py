@@ -0,0 +1,211 @@
+"""
+Helpers for online (zero-downtime) migrations on PostgreSQL
+
+Rules these helpers follow so deploys never lock users / anonymous_messages:
+- DDL runs with a short lock_timeout and is retried, instead of queueing
+  behind a long transaction and blocking every query queued behind it
+- Indexes are built with CREATE INDEX CONCURRENTLY (outside a transaction)
+- Backfills update small batches, each committed on its own, with a pause
+- Constraints are added NOT VALID (instant) and validated in a separate step,
+  which only takes a SHARE UPDATE EXCLUSIVE lock
+
+Example:
+    from migrations.online import add_column, create_index_concurrently, batched_backfill
+
+    def upgrade():
+        add_column("users", sa.Column("share_code", sa.String(9), nullable=True))
+        create_index_concurrently("ix_users_share_code", "users", ["share_code"], unique=True)
+        batched_backfill("users", "share_code = ...", "share_code IS NULL")
+"""
+
+import time
+from alembic import op
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+DEFAULT_LOCK_TIMEOUT = "3s"
+DDL_RETRIES = 5
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_BATCH_PAUSE = 0.05  # seconds between backfill batches
+
+
+def _bind():
+    return op.get_bind()
+
+
+def _is_lock_timeout(error: DBAPIError) -> bool:
+    # 55P03 = lock_not_available
+    return getattr(error.orig, "pgcode", None) == "55P03"
+
+
+def run_ddl(sql: str, lock_timeout: str = DEFAULT_LOCK_TIMEOUT, retries: int = DDL_RETRIES):
+    """
+    Run one DDL statement outside the migration transaction with a short
+    lock_timeout, retrying with backoff if the lock isn't available
+    """
+    with op.get_context().autocommit_block():
+        bind = _bind()
+        for attempt in range(1, retries + 1):
+            try:
+                bind.execute(text(f"SET lock_timeout = '{lock_timeout}'"))
+                bind.execute(text(sql))
+                return
+            except DBAPIError as e:
+                if not _is_lock_timeout(e) or attempt == retries:
+                    raise
+                print(f"  ⏳ Lock busy, retrying ({attempt}/{retries})...")
+                time.sleep(attempt)
+            finally:
+                bind.execute(text("RESET lock_timeout"))
+
+
+def column_exists(table: str, column: str) -> bool:
+    return _bind().execute(text(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = :table AND column_name = :column"
+    ), {"table": table, "column": column}).first() is not None
+
+
+def index_exists(name: str) -> bool:
+    return _bind().execute(
+        text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+    ).scalar()
+
+
+def constraint_exists(name: str) -> bool:
+    return _bind().execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": name}
+    ).first() is not None
+
+
+def add_column(table: str, column):
+    """
+    Add a column (must be nullable or have a constant default; both are
+    catalog-only changes that don't rewrite the table)
+    """
+    if column_exists(table, column.name):
+        return
+
+    column_sql = column.type.compile(dialect=_bind().dialect)
+    default = f" DEFAULT {column.server_default.arg}" if column.server_default is not None else ""
+    not_null = "" if column.nullable else " NOT NULL"
+
+    run_ddl(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column.name} {column_sql}{default}{not_null}")
+
+
+def create_index_concurrently(name: str, table: str, columns: list, unique: bool = False,
+                              where: str = None):
+    """
+    Build an index without blocking writes
+
+    A failed concurrent build leaves an INVALID index behind; it is
+    dropped and rebuilt, so re-running the migration is safe.
+    """
+    invalid = _bind().execute(text(
+        "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+    ), {"name": name}).scalar()
+
+    with op.get_context().autocommit_block():
+        if invalid:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+        op.create_index(
+            name, table, columns,
+            unique=unique,
+            postgresql_concurrently=True,
+            postgresql_where=text(where) if where else None,
+            if_not_exists=True
+        )
+
+
+def drop_index_concurrently(name: str):
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def batched_backfill(table: str, set_sql: str, where_sql: str, key: str = "id",
+                     batch_size: int = DEFAULT_BATCH_SIZE, pause: float = DEFAULT_BATCH_PAUSE,
+                     max_retries: int = 5) -> int:
+    """
+    Update rows matching `where_sql` in small self-committing batches
+
+    Each batch locks at most `batch_size` rows (skipping rows that are
+    locked by the bot right now; they are picked up by a later batch).
+    A batch that hits a unique violation (e.g. random codes) is retried.
+
+    Args:
+        table: Table name
+        set_sql: SET clause, e.g. "share_code = substr(md5(random()::text), 1, 8)"
+        where_sql: Rows still to backfill; must become false once a row is updated
+        key: Indexed key column
+        batch_size: Rows per batch
+        pause: Seconds to sleep between batches (throttling)
+
+    Returns:
+        Number of rows updated
+    """
+    sql = text(
+        f"UPDATE {table} SET {set_sql} WHERE {key} IN ("
+        f"SELECT {key} FROM {table} WHERE {where_sql} "
+        f"ORDER BY {key} LIMIT {int(batch_size)} FOR UPDATE SKIP LOCKED)"
+    )
+
+    total = 0
+    failures = 0
+    with op.get_context().autocommit_block():
+        bind = _bind()
+        while True:
+            try:
+                updated = bind.execute(sql).rowcount
+            except IntegrityError:
+                failures += 1
+                if failures > max_retries:
+                    raise
+                continue
+
+            if not updated:
+                break
+
+            total += updated
+            print(f"  [{total}] {table} backfilled")
+            time.sleep(pause)
+
+    return total
+
+
+def add_check_constraint_not_valid(name: str, table: str, condition: str):
+    """
+    Add a CHECK constraint for new rows only (no table scan, brief lock)
+    Call validate_constraint() afterwards, ideally in a later migration
+    """
+    if not constraint_exists(name):
+        run_ddl(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+
+
+def add_foreign_key_not_valid(name: str, table: str, columns: list, ref_table: str,
+                              ref_columns: list, on_delete: str = None):
+    """Add a foreign key for new rows only; validate it separately"""
+    if constraint_exists(name):
+        return
+
+    action = f" ON DELETE {on_delete}" if on_delete else ""
+    run_ddl(
+        f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({', '.join(columns)}) "
+        f"REFERENCES {ref_table} ({', '.join(ref_columns)}){action} NOT VALID"
+    )
+
+
+def validate_constraint(name: str, table: str):
+    """
+    Check existing rows against a NOT VALID constraint
+    Scans the table under SHARE UPDATE EXCLUSIVE: reads and writes continue.
+    Runs in its own transaction, so the scan holds no other migration's locks.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def add_unique_constraint_using_index(name: str, table: str, index_name: str):
+    """Promote a concurrently built unique index to a named constraint (instant)"""
+    if not constraint_exists(name):
+        run_ddl(f"ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {index_name}")
@@ -0,0 +1,101 @@
+"""baseline: schema before Alembic (users without share_code, logs, anonymous_messages)
+
+Databases created before Alembic was introduced: run `alembic stamp 0001`
+and then `alembic upgrade head`; every later revision is idempotent.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("telegram_id", sa.BigInteger(), nullable=False),
+        sa.Column("username", sa.String(100), nullable=True),
+        sa.Column("first_name", sa.String(100), nullable=False),
+        sa.Column("last_name", sa.String(100), nullable=True),
+        sa.Column("identifier", sa.String(20), nullable=False),
+        sa.Column("nickname", sa.String(13), nullable=True),
+        sa.Column("join_date", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("member_number", sa.Integer(), nullable=False),
+        sa.Column("total_messages_sent", sa.Integer()),
+        sa.Column("total_messages_received", sa.Integer()),
+        sa.Column("leaderboard_score", sa.Integer()),
+        sa.Column("is_vip", sa.Boolean()),
+        sa.Column("is_admin", sa.Boolean()),
+        sa.Column("titles", sa.Text(), nullable=True),
+        sa.Column("is_blocked", sa.Boolean()),
+        sa.Column("is_kicked", sa.Boolean()),
+        sa.Column("muted_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_activity", sa.DateTime(timezone=True)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True))
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_telegram_id", "users", ["telegram_id"], unique=True)
+    op.create_index("ix_users_identifier", "users", ["identifier"], unique=True)
+
+    op.create_table(
+        "logs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("telegram_id", sa.BigInteger(), nullable=True),
+        sa.Column("identifier", sa.String(20), nullable=True),
+        sa.Column("action", sa.String(100), nullable=True),
+        sa.Column("target", sa.String(100), nullable=True),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("success", sa.Integer()),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("ip_address", sa.String(45), nullable=True),
+        sa.Column("user_agent", sa.String(255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_logs_id", "logs", ["id"])
+    op.create_index("ix_logs_event_type", "logs", ["event_type"])
+    op.create_index("ix_logs_created_at", "logs", ["created_at"])
+
+    op.create_table(
+        "anonymous_messages",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("sender_id", sa.Integer(), nullable=False),
+        sa.Column("sender_telegram_id", sa.BigInteger(), nullable=False),
+        sa.Column("sender_identifier", sa.String(20), nullable=False),
+        sa.Column("recipient_id", sa.Integer(), nullable=False),
+        sa.Column("recipient_telegram_id", sa.BigInteger(), nullable=False),
+        sa.Column("recipient_identifier", sa.String(20), nullable=False),
+        sa.Column("message_type", sa.String(20)),
+        sa.Column("message_text", sa.Text(), nullable=True),
+        sa.Column("message_file_id", sa.String(255), nullable=True),
+        sa.Column("is_read", sa.Boolean()),
+        sa.Column("is_replied", sa.Boolean()),
+        sa.Column("is_deleted", sa.Boolean()),
+        sa.Column("sender_message_id", sa.BigInteger(), nullable=True),
+        sa.Column("recipient_message_id", sa.BigInteger(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("replied_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True))
+    )
+    op.create_index("ix_anonymous_messages_id", "anonymous_messages", ["id"])
+    op.create_index("ix_anonymous_messages_sender_identifier", "anonymous_messages", ["sender_identifier"])
+    op.create_index("ix_anonymous_messages_recipient_identifier", "anonymous_messages", ["recipient_identifier"])
+    op.create_index("ix_anonymous_messages_sent_at", "anonymous_messages", ["sent_at"])
+
+
+def downgrade():
+    op.drop_table("anonymous_messages")
+    op.drop_table("logs")
+    op.drop_table("users")
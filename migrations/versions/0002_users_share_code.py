@@ -0,0 +1,39 @@
+"""users.share_code, added online (replaces migrate_add_share_code.py)
+
+- ADD COLUMN nullable: catalog-only, short lock_timeout with retries
+- unique index built CONCURRENTLY: writes to users continue
+- backfill in 1000-row self-committing batches
+
+Idempotent, so it is safe on databases where the old script already ran.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column, create_index_concurrently, drop_index_concurrently, batched_backfill
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column("users", sa.Column("share_code", sa.String(9), nullable=True))
+
+    create_index_concurrently("ix_users_share_code", "users", ["share_code"], unique=True)
+
+    # 8 hex chars; a batch that collides with an existing code is retried
+    batched_backfill(
+        "users",
+        set_sql="share_code = substr(md5(random()::text || id::text), 1, 8)",
+        where_sql="share_code IS NULL OR share_code = ''"
+    )
+
+
+def downgrade():
+    drop_index_concurrently("ix_users_share_code")
+    op.drop_column("users", "share_code")
@@ -0,0 +1,28 @@
+"""check constraint on users.share_code length, validated separately
+
+ADD ... NOT VALID only checks new rows and is instant; the VALIDATE that
+scans existing rows is its own revision (0024), in its own transaction.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from migrations.online import add_check_constraint_not_valid, run_ddl
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_check_constraint_not_valid(
+        "ck_users_share_code_length",
+        "users",
+        "share_code IS NULL OR length(share_code) BETWEEN 6 AND 9"
+    )
+
+
+def downgrade():
+    run_ddl("ALTER TABLE users DROP CONSTRAINT IF EXISTS ck_users_share_code_length")
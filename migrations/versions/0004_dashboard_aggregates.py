@@ -0,0 +1,37 @@
+"""metric_buckets and presence_sketches for the admin dashboard
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "metric_buckets",
+        sa.Column("granularity", sa.String(10), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("metric", sa.String(50), primary_key=True),
+        sa.Column("value", sa.BigInteger(), nullable=False)
+    )
+
+    op.create_table(
+        "presence_sketches",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("feature", sa.String(30), primary_key=True),
+        sa.Column("sketch", sa.LargeBinary(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+
+
+def downgrade():
+    op.drop_table("presence_sketches")
+    op.drop_table("metric_buckets")
@@ -0,0 +1,49 @@
+"""books table for the cafe library
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "books",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("author", sa.String(150), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(30), nullable=False),
+        sa.Column("language", sa.String(5), nullable=True),
+        sa.Column("file_id", sa.String(255), nullable=False),
+        sa.Column("cover_file_id", sa.String(255), nullable=True),
+        sa.Column("search_text", sa.Text(), nullable=True),
+        sa.Column("download_count", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_books_id", "books", ["id"])
+    op.create_index("ix_books_category", "books", ["category"])
+    op.create_index("ix_books_is_active", "books", ["is_active"])
+
+    # Only used by LIBRARY_SEARCH_BACKEND=postgres; the table is new, so no CONCURRENTLY needed
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_books_search_text_fts", "books",
+            [sa.text("to_tsvector('simple', search_text)")],
+            postgresql_using="gin"
+        )
+
+
+def downgrade():
+    op.drop_table("books")
@@ -0,0 +1,57 @@
+"""stations, station_tags and station_listeners for the cafe radio
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "stations",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("identifier", sa.String(20), nullable=False),
+        sa.Column("station_number", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.BigInteger(), nullable=False),
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("tags", sa.String(200), nullable=True),
+        sa.Column("listener_count", sa.Integer(), nullable=False),
+        sa.Column("post_count", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_stations_id", "stations", ["id"])
+    op.create_index("ix_stations_identifier", "stations", ["identifier"], unique=True)
+    op.create_index("ix_stations_owner_id", "stations", ["owner_id"])
+    op.create_index("ix_stations_ranking", "stations", ["is_active", "listener_count", "id"])
+
+    op.create_table(
+        "station_tags",
+        sa.Column("tag", sa.String(30), primary_key=True),
+        sa.Column("station_id", sa.Integer(), primary_key=True)
+    )
+    op.create_index("ix_station_tags_station_id", "station_tags", ["station_id"])
+
+    op.create_table(
+        "station_listeners",
+        sa.Column("station_id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.BigInteger(), primary_key=True),
+        sa.Column("joined_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_station_listeners_user_id", "station_listeners", ["user_id"])
+
+
+def downgrade():
+    op.drop_table("station_listeners")
+    op.drop_table("station_tags")
+    op.drop_table("stations")
@@ -0,0 +1,51 @@
+"""tag_subscriptions and station_posts for station broadcasts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "tag_subscriptions",
+        sa.Column("tag", sa.String(30), primary_key=True),
+        sa.Column("user_id", sa.BigInteger(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_tag_subscriptions_user_id", "tag_subscriptions", ["user_id"])
+
+    op.create_table(
+        "station_posts",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("station_id", sa.Integer(), nullable=False),
+        sa.Column("author_id", sa.BigInteger(), nullable=False),
+        sa.Column("message_type", sa.String(20), nullable=True),
+        sa.Column("message_text", sa.Text(), nullable=True),
+        sa.Column("message_file_id", sa.String(255), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("last_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("sent_count", sa.Integer(), nullable=False),
+        sa.Column("blocked_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column("progress_chat_id", sa.BigInteger(), nullable=True),
+        sa.Column("progress_message_id", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_station_posts_id", "station_posts", ["id"])
+    op.create_index("ix_station_posts_station_id", "station_posts", ["station_id"])
+    op.create_index("ix_station_posts_status", "station_posts", ["status"])
+
+
+def downgrade():
+    op.drop_table("station_posts")
+    op.drop_table("tag_subscriptions")
@@ -0,0 +1,44 @@
+"""gallery_images and gallery_subscriptions for the slideshow
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "gallery_images",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("file_id", sa.String(255), nullable=False),
+        sa.Column("caption", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_gallery_images_id", "gallery_images", ["id"])
+    op.create_index("ix_gallery_images_is_active", "gallery_images", ["is_active"])
+
+    op.create_table(
+        "gallery_subscriptions",
+        sa.Column("chat_id", sa.BigInteger(), primary_key=True),
+        sa.Column("slot", sa.SmallInteger(), nullable=False),
+        sa.Column("last_image_id", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_gallery_subscriptions_slot", "gallery_subscriptions", ["slot", "is_active", "chat_id"])
+
+
+def downgrade():
+    op.drop_table("gallery_subscriptions")
+    op.drop_table("gallery_images")
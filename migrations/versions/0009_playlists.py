@@ -0,0 +1,53 @@
+"""playlists and playlist_tracks with the song cap as a check constraint
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+# Config.MAX_PLAYLIST_SONGS at the time of this revision
+MAX_PLAYLIST_SONGS = 9
+
+
+def upgrade():
+    op.create_table(
+        "playlists",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("owner_id", sa.BigInteger(), nullable=False),
+        sa.Column("name", sa.String(64), nullable=False),
+        sa.Column("track_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            f"track_count >= 0 AND track_count <= {MAX_PLAYLIST_SONGS}",
+            name="ck_playlists_track_count"
+        )
+    )
+    op.create_index("ix_playlists_id", "playlists", ["id"])
+    op.create_index("ix_playlists_owner_id", "playlists", ["owner_id"])
+
+    op.create_table(
+        "playlist_tracks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("playlist_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("file_id", sa.String(255), nullable=False),
+        sa.Column("title", sa.String(128), nullable=True),
+        sa.Column("performer", sa.String(128), nullable=True),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("added_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_playlist_tracks_order", "playlist_tracks", ["playlist_id", "position"])
+
+
+def downgrade():
+    op.drop_table("playlist_tracks")
+    op.drop_table("playlists")
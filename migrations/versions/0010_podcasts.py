@@ -0,0 +1,59 @@
+"""podcast_episodes, podcast_chapters and podcast_progress
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "podcast_episodes",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("title", sa.String(128), nullable=False),
+        sa.Column("show", sa.String(64), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("file_id", sa.String(255), nullable=True),
+        sa.Column("file_unique_id", sa.String(64), nullable=True, unique=True),
+        sa.Column("chapter_count", sa.SmallInteger(), nullable=False),
+        sa.Column("play_count", sa.Integer(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_podcast_episodes_catalog", "podcast_episodes", ["is_active", "id"])
+
+    op.create_table(
+        "podcast_chapters",
+        sa.Column("episode_id", sa.Integer(), primary_key=True),
+        sa.Column("number", sa.SmallInteger(), primary_key=True),
+        sa.Column("title", sa.String(128), nullable=True),
+        sa.Column("start_seconds", sa.Integer(), nullable=True),
+        sa.Column("duration", sa.Integer(), nullable=True),
+        sa.Column("file_id", sa.String(255), nullable=False),
+        sa.Column("file_unique_id", sa.String(64), nullable=True)
+    )
+
+    op.create_table(
+        "podcast_progress",
+        sa.Column("user_id", sa.BigInteger(), primary_key=True),
+        sa.Column("episode_id", sa.Integer(), primary_key=True),
+        sa.Column("chapter", sa.SmallInteger(), nullable=False),
+        sa.Column("completed", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False)
+    )
+
+
+def downgrade():
+    op.drop_table("podcast_progress")
+    op.drop_table("podcast_chapters")
+    op.drop_table("podcast_episodes")
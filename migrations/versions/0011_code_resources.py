@@ -0,0 +1,42 @@
+"""code_resources and code_catalog_versions for the code cafe
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "code_resources",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("language", sa.String(32), nullable=False),
+        sa.Column("kind", sa.String(16), nullable=False),
+        sa.Column("title", sa.String(128), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_code_resources_language", "code_resources", ["language", "is_active", "id"])
+
+    op.create_table(
+        "code_catalog_versions",
+        sa.Column("language", sa.String(32), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False)
+    )
+
+
+def downgrade():
+    op.drop_table("code_catalog_versions")
+    op.drop_table("code_resources")
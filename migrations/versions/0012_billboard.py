@@ -0,0 +1,39 @@
+"""billboard_campaigns
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "billboard_campaigns",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("details", sa.Text(), nullable=True),
+        sa.Column("url", sa.String(512), nullable=True),
+        sa.Column("weight", sa.Integer(), nullable=False),
+        sa.Column("daily_cap", sa.SmallInteger(), nullable=True),
+        sa.Column("starts_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("ends_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("impressions", sa.BigInteger(), nullable=False),
+        sa.Column("clicks", sa.BigInteger(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.create_index("ix_billboard_campaigns_is_active", "billboard_campaigns", ["is_active"])
+
+
+def downgrade():
+    op.drop_table("billboard_campaigns")
@@ -0,0 +1,31 @@
+"""bookmarks (one table for every bookmarkable kind)
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0013"
+down_revision = "0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "bookmarks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("kind", sa.SmallInteger(), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("user_id", "kind", "target_id", name="uq_bookmarks_target")
+    )
+    op.create_index("ix_bookmarks_user_page", "bookmarks", ["user_id", "id"])
+
+
+def downgrade():
+    op.drop_table("bookmarks")
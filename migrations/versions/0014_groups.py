@@ -0,0 +1,29 @@
+"""groups (managed group settings, lock bitmask)
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0014"
+down_revision = "0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "groups",
+        sa.Column("chat_id", sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column("title", sa.String(255), nullable=True),
+        sa.Column("locks", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade():
+    op.drop_table("groups")
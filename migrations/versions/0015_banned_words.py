@@ -0,0 +1,30 @@
+"""banned_words (per-group and global word filter lists)
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0015"
+down_revision = "0014"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "banned_words",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("word", sa.String(100), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("chat_id", "word", name="uq_banned_words_chat_word")
+    )
+
+
+def downgrade():
+    op.drop_table("banned_words")
@@ -0,0 +1,24 @@
+"""groups.spam_action (anti-spam response per group)
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column
+
+revision = "0016"
+down_revision = "0015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Constant default: catalog-only on PostgreSQL
+    add_column("groups", sa.Column("spam_action", sa.String(8), nullable=False, server_default=sa.text("'mute'")))
+
+
+def downgrade():
+    op.drop_column("groups", "spam_action")
@@ -0,0 +1,43 @@
+"""link_rules, forward_rules (per-group link and forward allow / deny lists)
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0017"
+down_revision = "0016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "link_rules",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("pattern", sa.String(255), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("chat_id", "pattern", name="uq_link_rules_chat_pattern")
+    )
+    op.create_table(
+        "forward_rules",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("source_id", sa.BigInteger(), nullable=False),
+        sa.Column("title", sa.String(255), nullable=True),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("chat_id", "source_id", name="uq_forward_rules_chat_source")
+    )
+
+
+def downgrade():
+    op.drop_table("forward_rules")
+    op.drop_table("link_rules")
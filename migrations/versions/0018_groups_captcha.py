@@ -0,0 +1,24 @@
+"""groups.captcha (captcha mode per group)
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column
+
+revision = "0018"
+down_revision = "0017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Constant default: catalog-only on PostgreSQL
+    add_column("groups", sa.Column("captcha", sa.String(8), nullable=False, server_default=sa.text("'off'")))
+
+
+def downgrade():
+    op.drop_column("groups", "captcha")
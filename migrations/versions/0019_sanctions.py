@@ -0,0 +1,46 @@
+"""sanctions, group_warnings (group moderation records)
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0019"
+down_revision = "0018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sanctions",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("kind", sa.String(8), nullable=False),
+        sa.Column("reason", sa.String(255), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("issued_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("chat_id", "user_id", "kind", name="uq_sanctions_chat_user_kind")
+    )
+    op.create_index("ix_sanctions_expires_at", "sanctions", ["expires_at"])
+
+    op.create_table(
+        "group_warnings",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("reason", sa.String(255), nullable=True),
+        sa.Column("issued_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_group_warnings_chat_user", "group_warnings", ["chat_id", "user_id"])
+
+
+def downgrade():
+    op.drop_table("group_warnings")
+    op.drop_table("sanctions")
@@ -0,0 +1,32 @@
+"""group_roles (per-group bot owners and VIPs)
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0020"
+down_revision = "0019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "group_roles",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("role", sa.String(8), nullable=False),
+        sa.Column("name", sa.String(255), nullable=True),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.UniqueConstraint("chat_id", "user_id", name="uq_group_roles_chat_user")
+    )
+
+
+def downgrade():
+    op.drop_table("group_roles")
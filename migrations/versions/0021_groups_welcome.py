@@ -0,0 +1,26 @@
+"""groups.welcome, groups.welcome_text (welcome messages per group)
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column
+
+revision = "0021"
+down_revision = "0020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Constant default / nullable: catalog-only on PostgreSQL
+    add_column("groups", sa.Column("welcome", sa.Boolean(), nullable=False, server_default=sa.false()))
+    add_column("groups", sa.Column("welcome_text", sa.Text(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("groups", "welcome_text")
+    op.drop_column("groups", "welcome")
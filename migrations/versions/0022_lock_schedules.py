@@ -0,0 +1,33 @@
+"""lock_schedules (daily auto-lock windows)
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0022"
+down_revision = "0021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "lock_schedules",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("locks", sa.BigInteger(), nullable=False),
+        sa.Column("start_minute", sa.Integer(), nullable=False),
+        sa.Column("end_minute", sa.Integer(), nullable=False),
+        sa.Column("added_by", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now())
+    )
+    op.create_index("ix_lock_schedules_chat_id", "lock_schedules", ["chat_id"])
+
+
+def downgrade():
+    op.drop_index("ix_lock_schedules_chat_id", table_name="lock_schedules")
+    op.drop_table("lock_schedules")
@@ -0,0 +1,31 @@
+"""groups.word_filter, groups.settings_version (settings panel, cross-worker sync)
+
+- ADD COLUMN with constant defaults: catalog-only on PostgreSQL
+- index on updated_at built CONCURRENTLY: writes to groups continue
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column, create_index_concurrently, drop_index_concurrently
+
+revision = "0023"
+down_revision = "0022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column("groups", sa.Column("word_filter", sa.Boolean(), nullable=False, server_default=sa.true()))
+    add_column("groups", sa.Column("settings_version", sa.Integer(), nullable=False, server_default="0"))
+
+    create_index_concurrently("ix_groups_updated_at", "groups", ["updated_at"])
+
+
+def downgrade():
+    drop_index_concurrently("ix_groups_updated_at")
+    op.drop_column("groups", "settings_version")
+    op.drop_column("groups", "word_filter")
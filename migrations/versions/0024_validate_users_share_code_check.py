@@ -0,0 +1,25 @@
+"""validate ck_users_share_code_length (added NOT VALID in 0003)
+
+Separate from 0003 so the add and the table scan never share a deploy
+step or a transaction. A no-op where the constraint is already valid.
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-19
+"""
+
+from migrations.online import validate_constraint
+
+revision = "0024"
+down_revision = "0023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    validate_constraint("ck_users_share_code_length", "users")
+
+
+def downgrade():
+    # Nothing to undo: 0003's downgrade drops the constraint
+    pass
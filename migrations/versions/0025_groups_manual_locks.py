@@ -0,0 +1,36 @@
+"""groups.manual_locks (admins' own locks, kept apart from auto-lock windows)
+
+- ADD COLUMN with a constant default: catalog-only on PostgreSQL
+- backfill in self-committing batches: the current locks minus the bits
+  of the group's lock windows
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column, batched_backfill
+
+revision = "0025"
+down_revision = "0024"
+branch_labels = None
+depends_on = None
+
+_WINDOW_BITS = "COALESCE((SELECT bit_or(s.locks) FROM lock_schedules s WHERE s.chat_id = groups.chat_id), 0)"
+
+
+def upgrade():
+    add_column("groups", sa.Column("manual_locks", sa.BigInteger(), nullable=False, server_default="0"))
+
+    batched_backfill(
+        "groups",
+        set_sql=f"manual_locks = locks & ~{_WINDOW_BITS}",
+        where_sql=f"manual_locks <> (locks & ~{_WINDOW_BITS})",
+        key="chat_id"
+    )
+
+
+def downgrade():
+    op.drop_column("groups", "manual_locks")
@@ -0,0 +1,25 @@
+"""sanctions.lift_attempts (the expiry scheduler gives up on lifts Telegram keeps refusing)
+
+- ADD COLUMN with a constant default: catalog-only on PostgreSQL
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from migrations.online import add_column
+
+revision = "0026"
+down_revision = "0025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column("sanctions", sa.Column("lift_attempts", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade():
+    op.drop_column("sanctions", "lift_attempts")
@@ -6,6 +6,18 @@ Import all models here for easy access
 from models.user import User
 from models.log import Log
 from models.message import AnonymousMessage
+from models.metric import MetricBucket
+from models.presence import PresenceSketch
+from models.book import Book
+from models.station import Station, StationTag, StationListener, TagSubscription
+from models.station_post import StationPost
+from models.gallery import GalleryImage, GallerySubscription
+from models.playlist import Playlist, PlaylistTrack
+from models.podcast import PodcastEpisode, PodcastChapter, PodcastProgress
+from models.code_resource import CodeResource, CodeCatalogVersion
+from models.billboard import BillboardCampaign
+from models.bookmark import Bookmark
+from models.group import Group, BannedWord, LinkRule, ForwardRule, Sanction, GroupWarning, GroupRole, LockSchedule
 from models.identifier import (
     generate_identifier,
     is_identifier_unique,
@@ -17,6 +29,33 @@ __all__ = [
     "User",
     "Log",
     "AnonymousMessage",
+    "MetricBucket",
+    "PresenceSketch",
+    "Book",
+    "Station",
+    "StationTag",
+    "StationListener",
+    "TagSubscription",
+    "StationPost",
+    "GalleryImage",
+    "GallerySubscription",
+    "Playlist",
+    "PlaylistTrack",
+    "PodcastEpisode",
+    "PodcastChapter",
+    "PodcastProgress",
+    "CodeResource",
+    "CodeCatalogVersion",
+    "BillboardCampaign",
+    "Bookmark",
+    "Group",
+    "BannedWord",
+    "LinkRule",
+    "ForwardRule",
+    "Sanction",
+    "GroupWarning",
+    "GroupRole",
+    "LockSchedule",
     "generate_identifier",
     "is_identifier_unique",
     "parse_identifier",
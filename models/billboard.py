@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, SmallInteger
+from sqlalchemy.sql import func
+from database import Base
+
+
+class BillboardCampaign(Base):
+    """
+    Billboard campaign model - stores ads / announcements shown under menus
+    """
+    __tablename__ = "billboard_campaigns"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Content
+    text = Column(Text, nullable=False)  # Line shown under the menu
+    details = Column(Text, nullable=True)  # Shown when the billboard is opened
+    url = Column(String(512), nullable=True)
+
+    # Delivery
+    weight = Column(Integer, nullable=False, default=1)  # Relative share of impressions
+    daily_cap = Column(SmallInteger, nullable=True)  # Impressions per user per day (None = default)
+    starts_at = Column(DateTime(timezone=True), nullable=True)
+    ends_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Statistics (batched, see features/billboard/manager.py)
+    impressions = Column(BigInteger, nullable=False, default=0)
+    clicks = Column(BigInteger, nullable=False, default=0)
+
+    # Status
+    is_active = Column(Boolean, nullable=False, default=True, index=True)
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Admin telegram_id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<BillboardCampaign(id={self.id}, weight={self.weight}, active={self.is_active})>"
@@ -0,0 +1,64 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, Index, literal_column
+from sqlalchemy.sql import func
+from database import Base
+from utils.persian import tokenize
+
+
+class Book(Base):
+    """
+    Book model - stores library books (cafe library table)
+    """
+    __tablename__ = "books"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Book Info
+    title = Column(String(200), nullable=False)
+    author = Column(String(150), nullable=True)
+    description = Column(Text, nullable=True)
+    category = Column(String(30), nullable=False, default="other", index=True)
+    language = Column(String(5), default="fa")  # "fa" or "en"
+
+    # Telegram Files
+    file_id = Column(String(255), nullable=False)  # The book document
+    cover_file_id = Column(String(255), nullable=True)
+
+    # Normalized title + author + description (see utils/persian.py)
+    search_text = Column(Text, nullable=True)
+
+    # Stats
+    download_count = Column(Integer, default=0)
+
+    # Status
+    is_active = Column(Boolean, default=True, index=True)
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Admin telegram_id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Book(id={self.id}, title={self.title})>"
+
+    def get_search_fields(self) -> dict:
+        """Fields indexed by the library search engine"""
+        return {
+            "title": self.title,
+            "author": self.author,
+            "description": self.description
+        }
+
+    def refresh_search_text(self):
+        """Recompute search_text (normalized tokens) from the current fields"""
+        self.search_text = " ".join(tokenize(" ".join(
+            value for value in self.get_search_fields().values() if value
+        )))
+
+
+# Full-text index for the optional Postgres search backend
+Index(
+    "ix_books_search_text_fts",
+    func.to_tsvector(literal_column("'simple'"), Book.search_text),
+    postgresql_using="gin"
+).ddl_if(dialect="postgresql")
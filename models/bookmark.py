@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, SmallInteger, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from database import Base
+
+
+class Bookmark(Base):
+    """
+    Bookmark model - one saved item of any kind (message, book, station, playlist)
+    kind is a small integer (see features/lists/bookmarks.py), target_id the item's id.
+    """
+    __tablename__ = "bookmarks"
+    __table_args__ = (
+        # One bookmark per item; also answers "is this bookmarked?"
+        UniqueConstraint("user_id", "kind", "target_id", name="uq_bookmarks_target"),
+        # Bookmark pages: WHERE user_id ORDER BY id DESC (keyset)
+        Index("ix_bookmarks_user_page", "user_id", "id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Owner
+    user_id = Column(BigInteger, nullable=False)  # Telegram id
+
+    # Target
+    kind = Column(SmallInteger, nullable=False)
+    target_id = Column(Integer, nullable=False)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Bookmark(id={self.id}, user_id={self.user_id}, kind={self.kind}, target_id={self.target_id})>"
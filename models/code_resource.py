@@ -0,0 +1,52 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class CodeResource(Base):
+    """
+    Code resource model - stores snippets and links of the code cafe
+    """
+    __tablename__ = "code_resources"
+    __table_args__ = (
+        Index("ix_code_resources_language", "language", "is_active", "id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Resource Info
+    language = Column(String(32), nullable=False)  # Key from code_cafe/languages.py
+    kind = Column(String(16), nullable=False)  # snippet / link
+    title = Column(String(128), nullable=False)
+    content = Column(Text, nullable=False)  # Code for snippets, URL for links
+    description = Column(Text, nullable=True)
+
+    # Status
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Admin telegram_id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CodeResource(id={self.id}, language={self.language}, title={self.title})>"
+
+
+class CodeCatalogVersion(Base):
+    """
+    Code catalog version model - content version per language
+    Bumped in the same transaction as every edit; rendered pages are cached
+    under (language, version), so a bump retires only that language's pages.
+    """
+    __tablename__ = "code_catalog_versions"
+
+    # Primary Key
+    language = Column(String(32), primary_key=True)
+
+    # Version
+    version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CodeCatalogVersion(language={self.language}, version={self.version})>"
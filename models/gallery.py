@@ -0,0 +1,55 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, SmallInteger, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class GalleryImage(Base):
+    """
+    Gallery image model - stores images shown in the cafe gallery slideshow
+    """
+    __tablename__ = "gallery_images"
+
+    # Primary Key (rotation order)
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Image
+    file_id = Column(String(255), nullable=False)
+    caption = Column(Text, nullable=True)
+
+    # Status
+    is_active = Column(Boolean, default=True, index=True)
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Admin telegram_id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<GalleryImage(id={self.id})>"
+
+
+class GallerySubscription(Base):
+    """
+    Gallery subscription model - chats receiving the slideshow
+    Each chat belongs to one time slot; a tick only loads the chats of its slot.
+    """
+    __tablename__ = "gallery_subscriptions"
+    __table_args__ = (
+        Index("ix_gallery_subscriptions_slot", "slot", "is_active", "chat_id"),
+    )
+
+    # Primary Key
+    chat_id = Column(BigInteger, primary_key=True)  # User or group chat
+
+    # Schedule
+    slot = Column(SmallInteger, nullable=False)
+    last_image_id = Column(Integer, nullable=False, default=0)  # Rotation cursor
+
+    # Status
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<GallerySubscription(chat_id={self.chat_id}, slot={self.slot})>"
@@ -0,0 +1,244 @@
+from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, Text, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class Group(Base):
+    """
+    Group model - stores settings of groups the bot manages
+    """
+    __tablename__ = "groups"
+    __table_args__ = (
+        # Settings sync: WHERE updated_at >= since
+        Index("ix_groups_updated_at", "updated_at"),
+    )
+
+    # Primary Key
+    chat_id = Column(BigInteger, primary_key=True, autoincrement=False)  # Telegram chat id
+
+    # Group Info
+    title = Column(String(255), nullable=True)
+
+    # Locks (bitmask, bit positions in features/group_manager/locks/engine.py)
+    locks = Column(BigInteger, nullable=False, default=0)  # In force: manual_locks + active auto-lock windows
+    manual_locks = Column(BigInteger, nullable=False, default=0)  # Set by admins (/lock, panel)
+
+    # Anti-spam
+    spam_action = Column(String(8), nullable=False, default="mute")  # off / warn / mute / ban
+    captcha = Column(String(8), nullable=False, default="off")  # off / raid (only during raids) / on
+
+    # Filters
+    word_filter = Column(Boolean, nullable=False, default=True)  # Banned words (filters/words.py)
+
+    # Welcome
+    welcome = Column(Boolean, nullable=False, default=False)
+    welcome_text = Column(Text, nullable=True)  # Template ({mention}, {name}, {group}, {count}); NULL = default
+
+    # Metadata
+    settings_version = Column(Integer, nullable=False, default=0)  # Bumped by every settings write (settings.save)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())  # Read by settings.sync
+
+    def __repr__(self):
+        return f"<Group(chat_id={self.chat_id}, title={self.title}, locks={self.locks:#x})>"
+
+
+class BannedWord(Base):
+    """
+    Banned word model - one word / phrase of a group's filter
+    chat_id 0 holds the global list that applies to every group.
+    """
+    __tablename__ = "banned_words"
+    __table_args__ = (
+        # Loading a chat's list: WHERE chat_id (index prefix)
+        UniqueConstraint("chat_id", "word", name="uq_banned_words_chat_word"),
+    )
+
+    GLOBAL_CHAT_ID = 0
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Filter
+    chat_id = Column(BigInteger, nullable=False)
+    word = Column(String(100), nullable=False)  # As typed; "*" marks a prefix / suffix match
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Telegram id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<BannedWord(chat_id={self.chat_id}, word={self.word})>"
+
+
+class LinkRule(Base):
+    """
+    Link rule model - one allowed or denied domain of a group
+    "*.example.com" covers example.com and all of its subdomains.
+    """
+    __tablename__ = "link_rules"
+    __table_args__ = (
+        # Loading a chat's rules: WHERE chat_id (index prefix)
+        UniqueConstraint("chat_id", "pattern", name="uq_link_rules_chat_pattern"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Rule
+    chat_id = Column(BigInteger, nullable=False)
+    pattern = Column(String(255), nullable=False)  # Normalized host, optionally "*." prefixed
+    allowed = Column(Boolean, nullable=False)  # False = always removed, even without the link lock
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Telegram id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<LinkRule(chat_id={self.chat_id}, pattern={self.pattern}, allowed={self.allowed})>"
+
+
+class ForwardRule(Base):
+    """
+    Forward rule model - one allowed or denied forward source (channel, group or user) of a group
+    """
+    __tablename__ = "forward_rules"
+    __table_args__ = (
+        UniqueConstraint("chat_id", "source_id", name="uq_forward_rules_chat_source"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Rule
+    chat_id = Column(BigInteger, nullable=False)
+    source_id = Column(BigInteger, nullable=False)  # Telegram id of the original chat / user
+    title = Column(String(255), nullable=True)  # For /forwards; may be outdated
+    allowed = Column(Boolean, nullable=False)  # False = always removed, even without the forward lock
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Telegram id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ForwardRule(chat_id={self.chat_id}, source_id={self.source_id}, allowed={self.allowed})>"
+
+
+class Sanction(Base):
+    """
+    Sanction model - an active mute or ban in a group
+    Rows only exist while the sanction is in force: lifting deletes them.
+    """
+    __tablename__ = "sanctions"
+    __table_args__ = (
+        UniqueConstraint("chat_id", "user_id", "kind", name="uq_sanctions_chat_user_kind"),
+        # Scheduler: WHERE expires_at <= now ORDER BY expires_at LIMIT n
+        Index("ix_sanctions_expires_at", "expires_at"),
+    )
+
+    MUTE = "mute"
+    BAN = "ban"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Sanction
+    chat_id = Column(BigInteger, nullable=False)
+    user_id = Column(BigInteger, nullable=False)  # Telegram id
+    kind = Column(String(8), nullable=False)  # mute / ban
+    reason = Column(String(255), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # NULL = until lifted by hand
+    lift_attempts = Column(Integer, nullable=False, default=0)  # Scheduler leases so far (gives up at SANCTION_MAX_LIFT_ATTEMPTS)
+
+    # Metadata
+    issued_by = Column(BigInteger, nullable=True)  # Telegram id; NULL = the bot (anti-spam, warnings)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Sanction(chat_id={self.chat_id}, user_id={self.user_id}, kind={self.kind})>"
+
+
+class GroupWarning(Base):
+    """
+    Group warning model - one warning given to a member
+    Reaching WARN_LIMIT applies WARN_ACTION and clears the member's warnings.
+    """
+    __tablename__ = "group_warnings"
+    __table_args__ = (
+        Index("ix_group_warnings_chat_user", "chat_id", "user_id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Warning
+    chat_id = Column(BigInteger, nullable=False)
+    user_id = Column(BigInteger, nullable=False)  # Telegram id
+    reason = Column(String(255), nullable=True)
+
+    # Metadata
+    issued_by = Column(BigInteger, nullable=True)  # Telegram id; NULL = the bot
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<GroupWarning(chat_id={self.chat_id}, user_id={self.user_id})>"
+
+
+class GroupRole(Base):
+    """
+    Group role model - a member the bot treats specially in one group
+    owner: may use every moderation command without being a Telegram admin
+    vip: exempt from locks, filters and anti-spam
+    """
+    __tablename__ = "group_roles"
+    __table_args__ = (
+        # Loading a chat's roles: WHERE chat_id (index prefix)
+        UniqueConstraint("chat_id", "user_id", name="uq_group_roles_chat_user"),
+    )
+
+    OWNER = "owner"
+    VIP = "vip"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Role
+    chat_id = Column(BigInteger, nullable=False)
+    user_id = Column(BigInteger, nullable=False)  # Telegram id
+    role = Column(String(8), nullable=False)  # owner / vip
+    name = Column(String(255), nullable=True)  # For listings; may be outdated
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Telegram id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<GroupRole(chat_id={self.chat_id}, user_id={self.user_id}, role={self.role})>"
+
+
+class LockSchedule(Base):
+    """
+    Lock schedule model - a daily window during which some locks are on
+    Times are minutes after midnight in Config.AUTO_LOCK_UTC_OFFSET; a window
+    whose end is before its start runs past midnight (23:00-07:00).
+    """
+    __tablename__ = "lock_schedules"
+    __table_args__ = (
+        Index("ix_lock_schedules_chat_id", "chat_id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Schedule
+    chat_id = Column(BigInteger, nullable=False)
+    locks = Column(BigInteger, nullable=False)  # Lock bits turned on at start and off at end
+    start_minute = Column(Integer, nullable=False)  # 0-1439
+    end_minute = Column(Integer, nullable=False)  # 0-1439
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Telegram id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<LockSchedule(chat_id={self.chat_id}, {self.start_minute}-{self.end_minute}, locks={self.locks:#x})>"
@@ -1,6 +1,10 @@
 import random
 import string
 from sqlalchemy.orm import Session
+from config import Config
+
+# All identifier types share one allocator space (see identifier_tail)
+IDENTIFIER_PREFIXES = (Config.IDENTIFIER_PREFIX, Config.STATION_PREFIX)
 
 
 def generate_identifier(prefix: str, member_number: int, db: Session) -> str:
@@ -49,6 +53,19 @@ def generate_identifier(prefix: str, member_number: int, db: Session) -> str:
     return f"{prefix}{last_digit}@{random_part}"
 
 
+def identifier_tail(identifier: str) -> str:
+    """
+    Part of an identifier after its type prefix ("Ua1@gb2h" -> "1@gb2h")
+    
+    Users and stations share one allocator space: a tail used by
+    Ua1@gb2h can never be handed out as Rs1@gb2h and vice versa.
+    """
+    for prefix in IDENTIFIER_PREFIXES:
+        if identifier.startswith(prefix):
+            return identifier[len(prefix):]
+    return identifier
+
+
 def is_identifier_unique(identifier: str, db: Session) -> bool:
     """
     Check if identifier is unique in database
@@ -60,16 +77,80 @@ def is_identifier_unique(identifier: str, db: Session) -> bool:
     Returns:
         True if unique, False if exists
     """
+    return not find_existing_identifiers({identifier}, db)
+
+
+def find_existing_identifiers(candidates: set, db: Session) -> set:
+    """
+    Return the candidates that already exist (under any prefix), with one query per table
+    
+    Args:
+        candidates: Identifiers to check
+        db: Database session
+        
+    Returns:
+        Set of identifiers already in use
+    """
     from models.user import User
+    from models.station import Station
+    
+    if not candidates:
+        return set()
     
-    # Check in users table
-    existing_user = db.query(User).filter(User.identifier == identifier).first()
-    if existing_user:
-        return False
+    # Every prefixed form of every candidate tail
+    variants = {
+        prefix + identifier_tail(identifier)
+        for identifier in candidates
+        for prefix in IDENTIFIER_PREFIXES
+    }
     
-    # TODO: Add checks for other tables (stations, etc.) when implemented
+    taken_tails = set()
+    for column in (User.identifier, Station.identifier):
+        taken_tails.update(
+            identifier_tail(row[0]) for row in
+            db.query(column).filter(column.in_(variants))
+        )
+    
+    return {identifier for identifier in candidates if identifier_tail(identifier) in taken_tails}
+
+
+def generate_unique_identifiers(prefix: str, member_numbers: list, db: Session) -> list:
+    """
+    Generate one unique identifier per member number (bulk version of generate_identifier)
+    
+    Args:
+        prefix: "Ua" for users, "Rs" for radio stations
+        member_numbers: Member numbers, one identifier is generated for each
+        db: Database session to check uniqueness
+        
+    Returns:
+        Identifiers in the same order as member_numbers
+    """
+    chars = string.ascii_lowercase + string.digits
+    result = [None] * len(member_numbers)
+    used = set()
+    
+    for attempt in range(100):
+        missing = [i for i, value in enumerate(result) if value is None]
+        if not missing:
+            break
+        
+        # Widen the random part if the 4-char space is crowded
+        length = 4 if attempt < 20 else 6
+        
+        candidates = {}
+        for i in missing:
+            identifier = f"{prefix}{member_numbers[i] % 10}@{''.join(random.choices(chars, k=length))}"
+            if identifier not in used and identifier not in candidates:
+                candidates[identifier] = i
+        
+        taken = find_existing_identifiers(set(candidates), db)
+        for identifier, i in candidates.items():
+            if identifier not in taken:
+                result[i] = identifier
+                used.add(identifier)
     
-    return True
+    return result
 
 
 def parse_identifier(identifier: str) -> dict:
@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text
 from sqlalchemy.sql import func
 from database import Base
+from utils.metrics import record_log
 
 
 class Log(Base):
@@ -77,6 +78,9 @@ class Log(Base):
         db.commit()
         db.refresh(log_entry)
         
+        # Feed dashboard aggregates
+        record_log(event_type, telegram_id=telegram_id, success=success)
+        
         return log_entry
     
     @classmethod
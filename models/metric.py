@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from database import Base
+
+
+class MetricBucket(Base):
+    """
+    Metric bucket model - pre-aggregated counters for the admin dashboard
+    One row per (granularity, bucket start, metric), maintained incrementally
+    by utils.metrics so the dashboard never scans logs or messages
+    """
+    __tablename__ = "metric_buckets"
+
+    # Composite Primary Key
+    granularity = Column(String(10), primary_key=True)  # "minute" or "hour"
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    metric = Column(String(50), primary_key=True)
+    # Metrics: "signups", "messages", "events", "errors", "active_users"
+
+    # Value
+    value = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<MetricBucket({self.granularity} {self.bucket_start} {self.metric}={self.value})>"
+
+    @classmethod
+    def get_series(cls, db, granularity: str, since):
+        """Get all buckets of one granularity starting at or after `since`"""
+        return db.query(cls).filter(
+            cls.granularity == granularity,
+            cls.bucket_start >= since
+        ).order_by(cls.bucket_start).all()
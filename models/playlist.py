@@ -0,0 +1,79 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Index, CheckConstraint
+from sqlalchemy.sql import func
+from database import Base
+from config import Config
+
+
+class Playlist(Base):
+    """
+    Playlist model - stores user playlists (cafe playlist table)
+    """
+    __tablename__ = "playlists"
+    __table_args__ = (
+        # The song cap lives in the database: add_track() increments
+        # track_count with a conditional UPDATE, this constraint is the backstop
+        CheckConstraint(
+            f"track_count >= 0 AND track_count <= {Config.MAX_PLAYLIST_SONGS}",
+            name="ck_playlists_track_count"
+        ),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Owner
+    owner_id = Column(BigInteger, nullable=False, index=True)  # Owner telegram_id
+
+    # Playlist Info
+    name = Column(String(64), nullable=False)
+    track_count = Column(Integer, nullable=False, default=0)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Playlist(id={self.id}, name={self.name}, tracks={self.track_count})>"
+
+    def is_full(self) -> bool:
+        return self.track_count >= Config.MAX_PLAYLIST_SONGS
+
+
+class PlaylistTrack(Base):
+    """
+    Playlist track model - one song in a playlist
+
+    position is sparse (steps of POSITION_GAP), so moving a track only
+    rewrites that track's position; the list is renumbered only when
+    two neighbours run out of room between them.
+    """
+    __tablename__ = "playlist_tracks"
+    __table_args__ = (
+        Index("ix_playlist_tracks_order", "playlist_id", "position"),
+    )
+
+    POSITION_GAP = 1024
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Order
+    playlist_id = Column(Integer, nullable=False)
+    position = Column(Integer, nullable=False)
+
+    # Telegram Audio
+    file_id = Column(String(255), nullable=False)
+    title = Column(String(128), nullable=True)
+    performer = Column(String(128), nullable=True)
+    duration = Column(Integer, nullable=True)  # Seconds
+
+    # Metadata
+    added_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<PlaylistTrack(id={self.id}, playlist_id={self.playlist_id}, position={self.position})>"
+
+    def get_label(self) -> str:
+        if self.performer and self.title:
+            return f"{self.performer} - {self.title}"
+        return self.title or self.performer or "🎵 بدون نام"
@@ -0,0 +1,89 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, SmallInteger, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class PodcastEpisode(Base):
+    """
+    Podcast episode model - stores episodes of the cafe podcast desk
+    Audio is uploaded to Telegram once; every send reuses the cached file_id.
+    """
+    __tablename__ = "podcast_episodes"
+    __table_args__ = (
+        # Catalog pages: WHERE is_active ORDER BY id DESC (keyset)
+        Index("ix_podcast_episodes_catalog", "is_active", "id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    # Episode Info
+    title = Column(String(128), nullable=False)
+    show = Column(String(64), nullable=True)
+    description = Column(Text, nullable=True)
+    duration = Column(Integer, nullable=True)  # Seconds
+
+    # Telegram Audio (full episode; optional when it is only sent in chapters)
+    file_id = Column(String(255), nullable=True)
+    file_unique_id = Column(String(64), unique=True, nullable=True)  # Same file is never stored twice
+
+    # Chapters
+    chapter_count = Column(SmallInteger, nullable=False, default=0)
+
+    # Statistics (batched, see features/cafe/podcast/progress.py)
+    play_count = Column(Integer, nullable=False, default=0)
+
+    # Status
+    is_active = Column(Boolean, nullable=False, default=True)
+
+    # Metadata
+    added_by = Column(BigInteger, nullable=True)  # Admin telegram_id
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<PodcastEpisode(id={self.id}, title={self.title}, chapters={self.chapter_count})>"
+
+
+class PodcastChapter(Base):
+    """
+    Podcast chapter model - one separately uploaded part of an episode
+    """
+    __tablename__ = "podcast_chapters"
+
+    # Primary Key
+    episode_id = Column(Integer, primary_key=True)
+    number = Column(SmallInteger, primary_key=True)  # 1-based
+
+    # Chapter Info
+    title = Column(String(128), nullable=True)
+    start_seconds = Column(Integer, nullable=True)  # Offset within the full episode
+    duration = Column(Integer, nullable=True)
+
+    # Telegram Audio
+    file_id = Column(String(255), nullable=False)
+    file_unique_id = Column(String(64), nullable=True)
+
+    def __repr__(self):
+        return f"<PodcastChapter(episode_id={self.episode_id}, number={self.number})>"
+
+
+class PodcastProgress(Base):
+    """
+    Podcast progress model - last chapter a user reached in an episode
+    Written in batches by flush_podcast_progress(), never per action.
+    """
+    __tablename__ = "podcast_progress"
+
+    # Primary Key
+    user_id = Column(BigInteger, primary_key=True)
+    episode_id = Column(Integer, primary_key=True)
+
+    # Progress
+    chapter = Column(SmallInteger, nullable=False, default=0)  # 0 = full episode
+    completed = Column(Boolean, nullable=False, default=False)
+
+    # Metadata
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<PodcastProgress(user_id={self.user_id}, episode_id={self.episode_id}, chapter={self.chapter})>"
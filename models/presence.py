@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Date, DateTime, LargeBinary
+from sqlalchemy.sql import func
+from database import Base
+
+
+class PresenceSketch(Base):
+    """
+    Presence sketch model - one HyperLogLog sketch of active users per day and feature
+    Feature "all" counts every active user; others count per-feature reach
+    """
+    __tablename__ = "presence_sketches"
+
+    # Composite Primary Key
+    day = Column(Date, primary_key=True)
+    feature = Column(String(30), primary_key=True)
+    # Features: "all", "menu", "send", "cafe", "rules", "admin"
+
+    # Serialized HyperLogLog (see utils/hyperloglog.py)
+    sketch = Column(LargeBinary, nullable=False)
+
+    # Metadata
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<PresenceSketch(day={self.day}, feature={self.feature})>"
+
+    @classmethod
+    def get_range(cls, db, feature: str, first_day, last_day):
+        """Get sketches of one feature for an inclusive day range"""
+        return db.query(cls).filter(
+            cls.feature == feature,
+            cls.day >= first_day,
+            cls.day <= last_day
+        ).all()
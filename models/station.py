@@ -0,0 +1,102 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text, Boolean, Index
+from sqlalchemy.sql import func
+from database import Base
+
+
+class Station(Base):
+    """
+    Station model - stores radio stations (cafe radio table)
+    """
+    __tablename__ = "stations"
+    __table_args__ = (
+        # Rankings and "top stations" pages: keyset on (listener_count, id)
+        Index("ix_stations_ranking", "is_active", "listener_count", "id"),
+    )
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # eynVu Info
+    identifier = Column(String(20), unique=True, nullable=False, index=True)  # Rs1@gb2h
+    station_number = Column(Integer, nullable=False)
+
+    # Owner
+    owner_id = Column(BigInteger, nullable=False, index=True)  # Owner telegram_id
+
+    # Station Info
+    name = Column(String(64), nullable=False)
+    description = Column(Text, nullable=True)
+    tags = Column(String(200), nullable=True)  # Space separated, normalized (see station_tags)
+
+    # Stats (maintained incrementally, never recounted on read)
+    listener_count = Column(Integer, nullable=False, default=0)
+    post_count = Column(Integer, nullable=False, default=0)
+
+    # Status
+    is_active = Column(Boolean, default=True)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Station(id={self.id}, identifier={self.identifier}, name={self.name})>"
+
+    def get_tags(self) -> list:
+        return self.tags.split() if self.tags else []
+
+    def get_search_fields(self) -> dict:
+        """Fields indexed by the station search"""
+        return {
+            "name": self.name,
+            "tags": self.tags,
+            "description": self.description
+        }
+
+
+class StationTag(Base):
+    """
+    Station tag model - one row per (tag, station), so browsing a tag is an index range scan
+    """
+    __tablename__ = "station_tags"
+
+    # Composite Primary Key (tag first: lookups are by tag)
+    tag = Column(String(30), primary_key=True)
+    station_id = Column(Integer, primary_key=True, index=True)
+
+    def __repr__(self):
+        return f"<StationTag(tag={self.tag}, station_id={self.station_id})>"
+
+
+class StationListener(Base):
+    """
+    Station listener model - users tuned in to a station
+    """
+    __tablename__ = "station_listeners"
+
+    # Composite Primary Key
+    station_id = Column(Integer, primary_key=True)
+    user_id = Column(BigInteger, primary_key=True, index=True)  # Listener telegram_id
+
+    # Metadata
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<StationListener(station_id={self.station_id}, user_id={self.user_id})>"
+
+
+class TagSubscription(Base):
+    """
+    Tag subscription model - users following every station with a tag
+    """
+    __tablename__ = "tag_subscriptions"
+
+    # Composite Primary Key (tag first: fan-out reads by tag)
+    tag = Column(String(30), primary_key=True)
+    user_id = Column(BigInteger, primary_key=True, index=True)  # Subscriber telegram_id
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<TagSubscription(tag={self.tag}, user_id={self.user_id})>"
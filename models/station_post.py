@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, String, BigInteger, DateTime, Text
+from sqlalchemy.sql import func
+from database import Base
+
+
+class StationPost(Base):
+    """
+    Station post model - one broadcast from a station and its delivery progress
+    """
+    __tablename__ = "station_posts"
+
+    # Primary Key
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    # Station / Author
+    station_id = Column(Integer, nullable=False, index=True)
+    author_id = Column(BigInteger, nullable=False)  # Owner telegram_id
+
+    # Content
+    message_type = Column(String(20), default="text")  # text, photo, voice, audio, video
+    message_text = Column(Text, nullable=True)
+    message_file_id = Column(String(255), nullable=True)
+
+    # Delivery Progress
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    # Status: pending, sending, done, failed
+    last_user_id = Column(BigInteger, nullable=False, default=0)  # Keyset cursor, for resuming
+    sent_count = Column(Integer, nullable=False, default=0)
+    blocked_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+
+    # Progress message shown to the author
+    progress_chat_id = Column(BigInteger, nullable=True)
+    progress_message_id = Column(BigInteger, nullable=True)
+
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<StationPost(id={self.id}, station_id={self.station_id}, status={self.status})>"
+
+    def get_progress(self) -> dict:
+        return {
+            "sent": self.sent_count,
+            "blocked": self.blocked_count,
+            "failed": self.failed_count,
+            "total": self.sent_count + self.blocked_count + self.failed_count
+        }
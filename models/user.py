@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, BigInteger, Boolean, DateTime, Text, CheckConstraint
 from sqlalchemy.sql import func
 from database import Base
 
@@ -8,6 +8,12 @@ class User(Base):
     User model - stores all user information
     """
     __tablename__ = "users"
+    __table_args__ = (
+        CheckConstraint(
+            "share_code IS NULL OR length(share_code) BETWEEN 6 AND 9",
+            name="ck_users_share_code_length"
+        ),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
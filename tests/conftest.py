@@ -0,0 +1,87 @@
+"""
+Shared test setup
+config.py exits without its required variables, so tests get harmless
+ones, and a throwaway SQLite database instead of whatever .env points at.
+Nothing here talks to Telegram: FakeBot records calls and answers like it.
+"""
+
+import itertools
+import os
+import tempfile
+from collections import Counter
+
+os.environ.setdefault("BOT_TOKEN", "123456:test")
+os.environ.setdefault("ADMIN_ID", "1")
+os.environ.setdefault("DB_PASSWORD", "test")
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="eynvu-tests-"), "test.db")
+
+import pytest  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+
+class FakeMessage:
+    def __init__(self, message_id):
+        self.message_id = message_id
+
+
+class FakeBot:
+    """
+    Example:
+        bot = FakeBot()
+        await bot.send_message(chat_id, "سلام")
+        bot.calls["send_message"]  # -> 1
+        bot.sent  # -> [("send_message", (chat_id, "سلام"), {})]
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.sent = []
+        self.ids = itertools.count(1)
+        self.fail = {}  # method -> exception to raise
+
+    def __getattr__(self, method):
+        async def call(*args, **kwargs):
+            self.calls[method] += 1
+            self.sent.append((method, args, kwargs))
+            if method in self.fail:
+                raise self.fail[method]
+            return FakeMessage(next(self.ids))
+        return call
+
+    def texts(self, method: str = "send_message") -> list:
+        return [args[1] if len(args) > 1 else kwargs.get("text") for name, args, kwargs in self.sent if name == method]
+
+
+@pytest.fixture
+def bot():
+    return FakeBot()
+
+
+@pytest.fixture
+def sender(bot):
+    from utils.sender import Sender
+    # No real rate limit: tests check what is sent, not how fast
+    return Sender(rate=100_000, concurrency=50, bot=bot)
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on a fresh in-memory database with every table"""
+    from database import Base
+    __import__("models")  # Registers every table on Base.metadata
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_group_settings():
+    """Group settings snapshots are cached per process; each test starts empty"""
+    from features.group_manager import settings
+    settings._settings.invalidate()
+    yield
+    settings._settings.invalidate()
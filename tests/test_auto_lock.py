@@ -0,0 +1,175 @@
+"""AutoLockScheduler with a fake clock, a fake bot and an in-memory database"""
+
+import asyncio
+import pytest
+from config import Config
+from models.group import Group, LockSchedule
+from features.group_manager import settings
+from features.group_manager.locks.auto_lock import AutoLockScheduler, Window, DAY, is_active
+from features.group_manager.locks.manager import lock_set
+
+CHAT = -1001
+
+PHOTO = lock_set.parse(["photo"])[0]
+VIDEO = lock_set.parse(["video"])[0]
+LINK = lock_set.parse(["link"])[0]
+
+# Local (Config.AUTO_LOCK_UTC_OFFSET) midnight of some day
+MIDNIGHT = 1_800_000_000 // DAY * DAY - Config.AUTO_LOCK_UTC_OFFSET * 60
+
+
+def at(hour: float) -> float:
+    return MIDNIGHT + hour * 3600
+
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock(at(22))
+
+
+@pytest.fixture
+def scheduler(clock, sender, session_factory):
+    return AutoLockScheduler(clock=clock, sender=sender, session_factory=session_factory)
+
+
+def make_group(session_factory, manual_locks: int = 0):
+    db = session_factory()
+    try:
+        group = settings.get_or_create_group(db, CHAT)
+        group.locks = group.manual_locks = manual_locks
+        db.commit()
+    finally:
+        db.close()
+
+
+def add_schedule(session_factory, mask: int, start_hour: int, end_hour: int) -> int:
+    db = session_factory()
+    try:
+        schedule = LockSchedule(chat_id=CHAT, locks=mask, start_minute=start_hour * 60, end_minute=end_hour * 60)
+        db.add(schedule)
+        db.commit()
+        return schedule.id
+    finally:
+        db.close()
+
+
+def locks_in_db(session_factory) -> int:
+    db = session_factory()
+    try:
+        return db.query(Group.locks).filter(Group.chat_id == CHAT).scalar()
+    finally:
+        db.close()
+
+
+def tick_at(scheduler, clock, hour: float) -> int:
+    clock.now = at(hour)
+    return asyncio.run(scheduler.tick())
+
+
+def test_is_active_wraps_past_midnight():
+    window = Window(1, CHAT, PHOTO, 23 * 60, 7 * 60)
+    assert is_active(window, at(23.5))
+    assert is_active(window, at(3))
+    assert not is_active(window, at(7))
+    assert not is_active(window, at(12))
+
+
+def test_window_turns_its_locks_on_and_off(scheduler, clock, bot, session_factory):
+    make_group(session_factory)
+    add_schedule(session_factory, PHOTO | VIDEO, 23, 7)
+
+    assert tick_at(scheduler, clock, 22) == 0  # Loads the windows, nothing due yet
+    assert tick_at(scheduler, clock, 23) == 1
+    assert locks_in_db(session_factory) == PHOTO | VIDEO
+    assert settings.get_settings(CHAT).locks == PHOTO | VIDEO
+    assert "فعال شد" in bot.texts()[-1]
+
+    assert tick_at(scheduler, clock, 31) == 1  # 07:00 the next day
+    assert locks_in_db(session_factory) == 0
+    assert "تموم شد" in bot.texts()[-1]
+    assert bot.calls["send_message"] == 2
+
+
+def test_window_end_keeps_manual_locks(scheduler, clock, bot, session_factory):
+    make_group(session_factory, manual_locks=LINK | PHOTO)
+    add_schedule(session_factory, PHOTO | VIDEO, 23, 7)
+
+    tick_at(scheduler, clock, 22)
+    tick_at(scheduler, clock, 23)
+    assert locks_in_db(session_factory) == LINK | PHOTO | VIDEO
+
+    tick_at(scheduler, clock, 31)
+    assert locks_in_db(session_factory) == LINK | PHOTO
+    # Only what actually turned off is announced
+    assert lock_set.labels(PHOTO)[0] not in bot.texts()[-1]
+    assert lock_set.labels(VIDEO)[0] in bot.texts()[-1]
+
+
+def test_overlapping_windows_keep_the_outer_window(scheduler, clock, bot, session_factory):
+    make_group(session_factory, manual_locks=LINK)
+    add_schedule(session_factory, PHOTO | VIDEO, 0, 8)
+    add_schedule(session_factory, PHOTO, 2, 4)
+
+    tick_at(scheduler, clock, 22)
+    tick_at(scheduler, clock, 24)  # 00:00
+    assert locks_in_db(session_factory) == LINK | PHOTO | VIDEO
+
+    tick_at(scheduler, clock, 26)  # 02:00: the inner window adds nothing new
+    sent = bot.calls["send_message"]
+    tick_at(scheduler, clock, 28)  # 04:00: the inner window ends inside the outer one
+    assert locks_in_db(session_factory) == LINK | PHOTO | VIDEO
+    assert bot.calls["send_message"] == sent
+
+    tick_at(scheduler, clock, 32)  # 08:00
+    assert locks_in_db(session_factory) == LINK
+
+
+def test_restart_catches_up_missed_transitions(clock, sender, bot, session_factory):
+    make_group(session_factory)
+    add_schedule(session_factory, PHOTO, 23, 7)
+
+    # The bot was down at 23:00 and comes back within AUTO_LOCK_CATCHUP
+    clock.now = at(23) + Config.AUTO_LOCK_CATCHUP - 1
+    scheduler = AutoLockScheduler(clock=clock, sender=sender, session_factory=session_factory)
+    assert asyncio.run(scheduler.tick()) == 1
+    assert locks_in_db(session_factory) == PHOTO
+
+
+def test_added_and_removed_windows_apply_on_the_next_tick(scheduler, clock, session_factory):
+    make_group(session_factory, manual_locks=LINK)
+    tick_at(scheduler, clock, 22)
+
+    schedule_id = add_schedule(session_factory, VIDEO, 21, 23)
+    scheduler.add(Window(schedule_id, CHAT, VIDEO, 21 * 60, 23 * 60))
+    tick_at(scheduler, clock, 22.1)
+    assert locks_in_db(session_factory) == LINK | VIDEO
+
+    scheduler.remove(schedule_id)
+    tick_at(scheduler, clock, 22.2)
+    assert locks_in_db(session_factory) == LINK
+
+
+def test_failed_update_is_retried(scheduler, clock, session_factory, monkeypatch):
+    make_group(session_factory)
+    add_schedule(session_factory, PHOTO, 23, 7)
+    tick_at(scheduler, clock, 22)
+
+    def database_down(targets):
+        raise RuntimeError("database down")
+
+    apply = scheduler._apply
+    monkeypatch.setattr(scheduler, "_apply", database_down)
+    assert tick_at(scheduler, clock, 23) == 0
+    assert locks_in_db(session_factory) == 0
+
+    monkeypatch.setattr(scheduler, "_apply", apply)
+    assert tick_at(scheduler, clock, 23.1) == 1
+    assert locks_in_db(session_factory) == PHOTO
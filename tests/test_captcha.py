@@ -0,0 +1,168 @@
+"""CaptchaManager and the raid path with a fake clock and bot (no render processes)"""
+
+import asyncio
+from types import SimpleNamespace
+import pytest
+from telegram.error import BadRequest
+from config import Config
+from features.group_manager import settings
+from features.group_manager.captcha import verify
+from features.group_manager.captcha.generate import ChallengePool, MATH, BUTTON, IMAGE
+from features.group_manager.captcha.verify import CaptchaManager, PASSED, WRONG, FAILED, UNKNOWN
+from features.group_manager.filters import spam
+
+CHAT = -1002
+
+
+class Clock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def manager(clock, sender):
+    return CaptchaManager(sender=sender, pool=ChallengePool(kinds=(MATH, BUTTON)), clock=clock)
+
+
+def restricted(bot, permissions_open: bool) -> list:
+    """user ids restrict_chat_member was called for, lifting (True) or restricting (False)"""
+    return [
+        args[1] for name, args, _ in bot.sent
+        if name == "restrict_chat_member" and args[2].can_send_messages == permissions_open
+    ]
+
+
+def only_batch(manager):
+    (batch,) = manager._batches.values()
+    return batch
+
+
+def test_joins_are_restricted_and_challenged_in_batches(manager, bot):
+    for user_id in range(Config.CAPTCHA_BATCH_SIZE + 1):
+        assert manager.join(CHAT, user_id, f"user {user_id}")
+    assert not manager.join(CHAT, 0, "user 0")  # Already waiting
+
+    asyncio.run(manager.flush())
+    assert len(restricted(bot, False)) == Config.CAPTCHA_BATCH_SIZE + 1
+    assert bot.calls["send_message"] == 2
+    assert len(manager._batches) == 2
+
+
+def test_right_answer_lifts_the_restriction(manager, bot):
+    manager.join(CHAT, 7, "Sara")
+    asyncio.run(manager.flush())
+    batch = only_batch(manager)
+
+    assert manager.answer(batch.id, 8, batch.challenge.answer) == UNKNOWN  # Not their challenge
+    assert manager.answer(batch.id, 7, batch.challenge.answer) == PASSED
+    asyncio.run(manager.flush())
+    assert restricted(bot, True) == [7]
+    assert bot.calls["delete_message"] == 1  # Nobody left on the challenge
+    assert len(manager) == 0
+
+
+def test_wrong_answers_get_the_member_kicked(manager, bot):
+    manager.join(CHAT, 7, "Sara")
+    asyncio.run(manager.flush())
+    batch = only_batch(manager)
+    wrong = (batch.challenge.answer + 1) % len(batch.challenge.options)
+
+    results = [manager.answer(batch.id, 7, wrong) for _ in range(Config.CAPTCHA_MAX_ATTEMPTS)]
+    assert results == [WRONG] * (Config.CAPTCHA_MAX_ATTEMPTS - 1) + [FAILED]
+    asyncio.run(manager.flush())
+    assert bot.calls["ban_chat_member"] == 1
+    assert bot.calls["unban_chat_member"] == 1
+    assert restricted(bot, True) == []
+
+
+def test_timeout_kicks_who_did_not_answer(manager, bot, clock):
+    manager.join(CHAT, 7, "Sara")
+    manager.join(CHAT, 8, "Reza")
+    asyncio.run(manager.flush())
+    batch = only_batch(manager)
+    manager.answer(batch.id, 7, batch.challenge.answer)
+
+    clock.now += Config.CAPTCHA_TIMEOUT + 2
+    asyncio.run(manager.flush())
+    assert restricted(bot, True) == [7]
+    assert [args[1] for name, args, _ in bot.sent if name == "ban_chat_member"] == [8]
+    assert bot.calls["delete_message"] == 1
+    assert len(manager) == 0
+
+
+def test_members_the_bot_cannot_restrict_get_no_challenge(manager, bot):
+    bot.fail["restrict_chat_member"] = BadRequest("Not enough rights to restrict/unrestrict chat member")
+    manager.join(CHAT, 7, "Sara")
+    asyncio.run(manager.flush())
+    assert bot.calls["send_message"] == 0
+    assert len(manager) == 0
+
+
+def test_pool_serves_math_and_button_until_started():
+    pool = ChallengePool(kinds=(IMAGE, MATH, BUTTON))
+    pool.refill()  # Never forks on its own
+    assert pool._executor is None
+    assert {pool.take().kind for _ in range(200)} <= {MATH, BUTTON}
+
+
+# ==================== Raids ====================
+
+@pytest.fixture
+def raid(monkeypatch, manager, clock):
+    """Fresh detector, punishments and captcha queue; spam actions are collected, not run"""
+    detector = spam.SpamDetector(clock=clock)
+    monkeypatch.setattr(spam, "detector", detector)
+    monkeypatch.setattr(verify, "detector", detector)
+    monkeypatch.setattr(spam, "_punished", spam.TTLCache(ttl=Config.SPAM_PUNISH_COOLDOWN, max_size=1000, clock=clock))
+    monkeypatch.setattr(verify, "manager", manager)
+
+    punished = []
+    monkeypatch.setattr(spam, "_apply", lambda chat_id, user_id, action, reason: reason)
+    monkeypatch.setattr(spam, "submit", punished.append)
+    return punished
+
+
+def join(chat_id: int, user_id: int):
+    update = SimpleNamespace(effective_message=SimpleNamespace(
+        chat_id=chat_id,
+        new_chat_members=[SimpleNamespace(id=user_id, is_bot=False, first_name=f"user {user_id}")]
+    ))
+    asyncio.run(spam.handle_new_members(update, None))
+    asyncio.run(verify.handle_captcha_join(update, None))
+
+
+@pytest.mark.parametrize("captcha", [verify.RAID, verify.ON])
+def test_raid_joiners_get_the_captcha_not_the_spam_action(raid, manager, captcha):
+    settings._settings.set(CHAT, settings.DEFAULT_SETTINGS._replace(captcha=captcha, spam_action=spam.MUTE))
+    for user_id in range(500):
+        join(CHAT, user_id)
+
+    assert raid == []
+    # In raid mode the captcha starts with the join that started the raid
+    assert len(manager) == (500 if captcha == verify.ON else 500 - Config.RAID_CHAT_JOINS)
+
+
+def test_raid_joiners_get_the_spam_action_without_a_captcha(raid, manager):
+    settings._settings.set(CHAT, settings.DEFAULT_SETTINGS._replace(captcha=verify.OFF, spam_action=spam.MUTE))
+    for user_id in range(100):
+        join(CHAT, user_id)
+
+    assert raid == ["raid"] * (100 - Config.RAID_CHAT_JOINS)
+    assert len(manager) == 0
+
+
+def test_account_hopping_is_punished_even_with_a_captcha(raid, manager):
+    for chat_id in range(CHAT, CHAT - Config.RAID_USER_CHATS - 1, -1):
+        settings._settings.set(chat_id, settings.DEFAULT_SETTINGS._replace(captcha=verify.ON, spam_action=spam.MUTE))
+        join(chat_id, 7)
+
+    assert raid == ["hopping"]
+    assert len(manager) == Config.RAID_USER_CHATS  # The punished join is left to its restriction
@@ -0,0 +1,125 @@
+"""SlideshowEngine with a fake clock, a fake bot and an in-memory database"""
+
+import asyncio
+from collections import Counter
+import pytest
+from telegram.error import BadRequest, Forbidden
+from config import Config
+from models.gallery import GalleryImage, GallerySubscription
+from features.cafe.gallery.slideshow import SlideshowEngine, Rotation, SLOT_COUNT, slot_for
+
+CHATS = list(range(100, 100 + 3 * SLOT_COUNT))
+
+
+class Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    # The start of slot 0
+    return Clock(1_800_000_000 // Config.GALLERY_SLIDE_INTERVAL * Config.GALLERY_SLIDE_INTERVAL)
+
+
+@pytest.fixture
+def gallery(session_factory):
+    """Three images and a subscription per chat in CHATS; returns the image ids"""
+    db = session_factory()
+    try:
+        images = [GalleryImage(file_id=f"file-{n}", caption=f"#{n}") for n in range(3)]
+        db.add_all(images)
+        db.add_all(GallerySubscription(chat_id=chat_id, slot=slot_for(chat_id), last_image_id=0) for chat_id in CHATS)
+        db.commit()
+        return [image.id for image in images]
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def engine(clock, sender, session_factory):
+    return SlideshowEngine(clock=clock, sender=sender, session_factory=session_factory)
+
+
+def cursors(session_factory) -> dict:
+    db = session_factory()
+    try:
+        return dict(db.query(GallerySubscription.chat_id, GallerySubscription.last_image_id).all())
+    finally:
+        db.close()
+
+
+def run_round(engine, clock):
+    """One GALLERY_SLIDE_INTERVAL of ticks"""
+    for _ in range(SLOT_COUNT):
+        asyncio.run(engine.tick())
+        clock.now += Config.GALLERY_TICK_INTERVAL
+
+
+def photo_chats(bot) -> Counter:
+    return Counter(args[0] for name, args, _ in bot.sent if name == "send_photo")
+
+
+def test_rotation_wraps_around():
+    rotation = Rotation([(3, "a", None), (5, "b", None), (9, "c", None)])
+    assert rotation.next_after(0) == 3
+    assert rotation.next_after(5) == 9
+    assert rotation.next_after(9) == 3
+
+
+def test_a_tick_only_sends_to_its_slot(engine, bot, gallery):
+    asyncio.run(engine.tick())
+    assert set(photo_chats(bot)) == {chat_id for chat_id in CHATS if slot_for(chat_id) == 0}
+
+
+def test_every_chat_gets_one_image_per_round_in_rotation_order(engine, clock, bot, gallery, session_factory):
+    run_round(engine, clock)
+    assert photo_chats(bot) == Counter({chat_id: 1 for chat_id in CHATS})
+    assert set(cursors(session_factory).values()) == {gallery[0]}
+
+    run_round(engine, clock)
+    assert set(cursors(session_factory).values()) == {gallery[1]}
+
+
+def test_a_restart_resumes_each_chat_where_it_stopped(clock, sender, bot, gallery, session_factory):
+    run_round(SlideshowEngine(clock=clock, sender=sender, session_factory=session_factory), clock)
+    run_round(SlideshowEngine(clock=clock, sender=sender, session_factory=session_factory), clock)
+
+    files = Counter(args[1] for name, args, _ in bot.sent if name == "send_photo")
+    assert files == Counter({"file-0": len(CHATS), "file-1": len(CHATS)})
+
+
+def test_a_stall_catches_up_at_most_one_round(engine, clock, bot, gallery):
+    asyncio.run(engine.tick())
+    bot.sent.clear()
+
+    clock.now += 5 * Config.GALLERY_SLIDE_INTERVAL
+    asyncio.run(engine.tick())
+    assert max(photo_chats(bot).values()) == 1
+    assert set(photo_chats(bot)) == set(CHATS)
+
+
+def test_blocked_chats_are_unsubscribed_and_failed_ones_retried(engine, clock, bot, gallery, session_factory):
+    blocked, failing = CHATS[0], CHATS[1]
+
+    async def send_photo(chat_id, file_id, caption=None):
+        bot.sent.append(("send_photo", (chat_id, file_id), {"caption": caption}))
+        if chat_id == blocked:
+            raise Forbidden("bot was blocked by the user")
+        if chat_id == failing:
+            raise BadRequest("Wrong file identifier")
+
+    bot.send_photo = send_photo
+    run_round(engine, clock)
+
+    db = session_factory()
+    try:
+        active = dict(db.query(GallerySubscription.chat_id, GallerySubscription.is_active).all())
+    finally:
+        db.close()
+    assert not active[blocked]
+    assert active[failing]
+    assert cursors(session_factory)[failing] == 0  # Same image next round
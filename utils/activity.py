@@ -0,0 +1,89 @@
+"""
+Batched last_activity tracking
+touch() only records the latest time per user in memory; flush_activity()
+writes every pending touch with one UPDATE ... FROM (VALUES ...) per chunk
+"""
+
+import threading
+from datetime import datetime, timezone
+
+# Rows per UPDATE statement
+FLUSH_CHUNK_SIZE = 1000
+
+# Pending touches: telegram_id -> latest activity time
+_pending = {}
+_lock = threading.Lock()
+
+
+def touch(telegram_id: int, at: datetime = None):
+    """Record activity; repeated touches before a flush coalesce into one row"""
+    at = at or datetime.now(timezone.utc)
+    with _lock:
+        _pending[telegram_id] = at
+
+
+def take_pending() -> list:
+    """Swap out pending touches as a list of row dicts"""
+    global _pending
+
+    with _lock:
+        pending, _pending = _pending, {}
+
+    return [
+        {"telegram_id": telegram_id, "seen_at": seen_at}
+        for telegram_id, seen_at in pending.items()
+    ]
+
+
+def _restore(rows: list):
+    """Put touches back after a failed flush, keeping the newest time"""
+    with _lock:
+        for row in rows:
+            current = _pending.get(row["telegram_id"])
+            if current is None or current < row["seen_at"]:
+                _pending[row["telegram_id"]] = row["seen_at"]
+
+
+def flush_activity() -> int:
+    """
+    Write pending touches to users.last_activity
+
+    Returns:
+        Number of users flushed
+    """
+    from sqlalchemy import update, or_, BigInteger, DateTime
+    from database import Session
+    from models.user import User
+    from utils.helpers import chunked, values_table
+
+    rows = take_pending()
+    if not rows:
+        return 0
+
+    db = Session()
+    try:
+        for chunk in chunked(rows, FLUSH_CHUNK_SIZE):
+            v = values_table("v", {
+                "telegram_id": BigInteger(),
+                "seen_at": DateTime(timezone=True)
+            }, chunk)
+
+            stmt = update(User).where(
+                User.telegram_id == v.c.telegram_id,
+                or_(User.last_activity.is_(None), User.last_activity < v.c.seen_at)
+            ).values(
+                last_activity=v.c.seen_at,
+                updated_at=User.updated_at  # activity is not a profile change
+            )
+
+            db.execute(stmt.execution_options(synchronize_session=False))
+
+        db.commit()
+        return len(rows)
+    except Exception as e:
+        db.rollback()
+        _restore(rows)
+        print(f"❌ Activity flush failed: {e}")
+        return 0
+    finally:
+        db.close()
@@ -0,0 +1,86 @@
+"""
+Aho-Corasick automaton
+Finds any of thousands of patterns in one left-to-right pass over the
+text, so the cost of a scan depends on the text length, not on how many
+patterns there are. Patterns are plain strings; build once, scan many times.
+"""
+
+from collections import deque
+
+
+class Automaton:
+    """
+    Example:
+        automaton = Automaton([" bad ", " worse "])
+        automaton.search(" a bad day ")  # -> " bad "
+        list(automaton.iter(" bad worse "))  # -> [(4, " bad "), (10, " worse ")]
+    """
+
+    def __init__(self, patterns=()):
+        self._goto = [{}]   # state -> {char: state}
+        self._fail = [0]    # state -> longest proper suffix state
+        self._out = [()]    # state -> patterns ending here (including via fail links)
+        self.size = 0
+
+        for pattern in dict.fromkeys(patterns):
+            if pattern:
+                self._insert(pattern)
+        self._link()
+
+    def __len__(self):
+        return self.size
+
+    def _insert(self, pattern: str):
+        goto = self._goto
+        state = 0
+        for char in pattern:
+            next_state = goto[state].get(char)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][char] = next_state
+                goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        self._out[state] = self._out[state] + (pattern,)
+        self.size += 1
+
+    def _link(self):
+        """Breadth-first pass that sets failure links and merges outputs"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                target = goto[target].get(char, 0)
+                fail[next_state] = target if target != next_state else 0
+                if out[fail[next_state]]:
+                    out[next_state] = out[next_state] + out[fail[next_state]]
+
+    def iter(self, text: str):
+        """Yield (end index, pattern) for every occurrence, in text order"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for index, char in enumerate(text):
+            while True:
+                next_state = goto[state].get(char)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            if out[state]:
+                for pattern in out[state]:
+                    yield index, pattern
+
+    def search(self, text: str, skip=()):
+        """First pattern found in text (ignoring patterns in skip), or None"""
+        for _, pattern in self.iter(text):
+            if pattern not in skip:
+                return pattern
+        return None
@@ -0,0 +1,93 @@
+"""
+Background worker for eynVu bot
+One daemon thread with its own event loop for periodic jobs
+(counter flushes, schedulers) so they never run inside a webhook request
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_loop = None
+_thread = None
+_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting the worker thread on first use"""
+    global _loop, _thread
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_run_loop,
+                args=(_loop,),
+                name="eynvu-background",
+                daemon=True
+            )
+            _thread.start()
+
+    return _loop
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def submit(coro):
+    """
+    Schedule a coroutine on the background loop
+
+    Returns:
+        concurrent.futures.Future with the coroutine result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+async def run_in_background(coro):
+    """
+    Await a coroutine on the background loop from any event loop
+
+    For code that uses objects bound to the background loop (the shared
+    Sender's locks, its Bot) from a webhook update's own loop.
+    """
+    if asyncio.get_running_loop() is get_loop():
+        return await coro
+    return await asyncio.wrap_future(submit(coro))
+
+
+def run_every(interval: float, func, name: str = None, flush_on_exit: bool = False):
+    """
+    Run func every `interval` seconds on the background loop
+
+    Sync functions run in the default executor so database work
+    never blocks the loop. A failing run is logged and retried on the next tick.
+
+    Args:
+        interval: Seconds between runs
+        func: Sync function or coroutine function without arguments
+        name: Job name for logs
+        flush_on_exit: Also call func once at interpreter exit (sync funcs only)
+    """
+    job_name = name or func.__name__
+
+    async def _job():
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    await func()
+                else:
+                    await asyncio.get_running_loop().run_in_executor(None, func)
+            except Exception as e:
+                logger.error(f"Background job {job_name} failed: {e}", exc_info=True)
+
+    if flush_on_exit and not asyncio.iscoroutinefunction(func):
+        atexit.register(func)
+
+    return submit(_job())
@@ -0,0 +1,73 @@
+"""
+Small in-process TTL cache
+Used for read-heavy listings (station pages, rankings) that can be a few
+seconds stale. Thread-safe; least recently used entries are evicted first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Example:
+        pages = TTLCache(ttl=60, max_size=500)
+        page = pages.get_or_set(("top", 0), lambda: load_page(0))
+        pages.invalidate()  # after a write that changes listings
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1000, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= self.clock():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl: float = None):
+        with self._lock:
+            self._data[key] = (self.clock() + (ttl if ttl is not None else self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key, loader, ttl: float = None):
+        """Return the cached value, calling loader() to fill a miss"""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, match=None):
+        """
+        Drop entries
+
+        Args:
+            match: None drops everything; otherwise a key, or a callable
+                   that returns True for keys to drop
+        """
+        with self._lock:
+            if match is None:
+                self._data.clear()
+            elif callable(match):
+                for key in [key for key in self._data if match(key)]:
+                    del self._data[key]
+            else:
+                self._data.pop(match, None)
@@ -0,0 +1,90 @@
+"""
+Count-min sketch with saturating 8-bit counters
+Counts events per key in fixed memory (depth * width bytes) no matter
+how many keys are seen. Estimates never undercount: collisions can only
+make a key look more frequent, so a cap checked against the sketch is
+never exceeded. for_capacity() sizes a sketch for a number of keys and
+the rate at which a key may be wrongly seen as capped.
+"""
+
+import hashlib
+import math
+
+DEFAULT_WIDTH = 1 << 15  # 32768 counters per row
+DEFAULT_DEPTH = 4  # 4 rows -> 128 KB
+
+MAX_COUNT = 255
+
+# Hash bits beyond depth * log2(width), so each row's index is close to uniform
+_HASH_SLACK_BITS = 64
+_MAX_HASH_BITS = 512  # blake2b's largest digest
+
+
+class CountMinSketch:
+    """
+    Example:
+        seen = CountMinSketch.for_capacity(keys=100_000, error_rate=0.001)
+        seen.add((campaign_id, user_id))  # -> True
+        seen.add((campaign_id, user_id), limit=1)  # -> False (already at 1)
+        seen.estimate((campaign_id, user_id))  # -> 1
+    """
+
+    def __init__(self, width: int = DEFAULT_WIDTH, depth: int = DEFAULT_DEPTH):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        hash_bits = depth * (width - 1).bit_length()
+        if hash_bits > _MAX_HASH_BITS:
+            raise ValueError(f"depth * log2(width) must fit in a {_MAX_HASH_BITS}-bit hash")
+
+        self.width = width
+        self.depth = depth
+        self.counters = bytearray(width * depth)
+        self._digest_size = min(_MAX_HASH_BITS, hash_bits + _HASH_SLACK_BITS) // 8
+
+    @classmethod
+    def for_capacity(cls, keys: int, error_rate: float) -> "CountMinSketch":
+        """
+        Sketch in which, with `keys` distinct keys counted up to a cap, a key
+        under the cap reads as capped with probability about `error_rate`
+
+        That happens when each of the key's counters is shared with a capped
+        key. Rows of keys / ln 2 counters (about half of them in use) need the
+        fewest counters for a given rate: log2(1 / error_rate) rows.
+        """
+        depth = max(1, math.ceil(math.log2(1 / error_rate)))
+        width = max(1, math.ceil(keys / math.log(2)))
+        return cls(width, depth)
+
+    def _cells(self, item):
+        """One counter index per row, cut from a single hash (stable across processes, unlike hash())"""
+        digest = hashlib.blake2b(str(item).encode("utf-8"), digest_size=self._digest_size).digest()
+        h = int.from_bytes(digest, "big")
+        cells = []
+        for row in range(self.depth):
+            h, index = divmod(h, self.width)
+            cells.append(row * self.width + index)
+        return cells
+
+    def estimate(self, item) -> int:
+        counters = self.counters
+        return min(counters[cell] for cell in self._cells(item))
+
+    def add(self, item, limit: int = MAX_COUNT) -> bool:
+        """
+        Count one occurrence unless the estimate already reached `limit`
+        (conservative update: only the smallest counters grow)
+
+        Returns:
+            True if the occurrence was counted
+        """
+        cells = self._cells(item)
+        counters = self.counters
+        current = min(counters[cell] for cell in cells)
+        if current >= min(limit, MAX_COUNT):
+            return False
+
+        new = current + 1
+        for cell in cells:
+            if counters[cell] < new:
+                counters[cell] = new
+        return True
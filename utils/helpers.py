@@ -0,0 +1,54 @@
+"""
+Small shared helpers
+"""
+
+from sqlalchemy import values, column
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import Values
+
+
+def chunked(items: list, size: int):
+    """Yield successive slices of `items` with at most `size` elements"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def values_table(name: str, types: dict, rows: list):
+    """
+    Build a VALUES list usable as a FROM clause
+
+    Example:
+        v = values_table("v", {"telegram_id": BigInteger(), "seen_at": DateTime()}, rows)
+        update(User).where(User.telegram_id == v.c.telegram_id).values(last_activity=v.c.seen_at)
+
+    Renders as: UPDATE users SET ... FROM (VALUES (...), (...)) AS v (telegram_id, seen_at)
+
+    Args:
+        name: Alias of the VALUES list
+        types: Column name -> SQLAlchemy type, in column order
+        rows: List of dicts keyed by column name
+
+    Returns:
+        SQLAlchemy Values construct
+    """
+    columns = [column(col_name, col_type) for col_name, col_type in types.items()]
+    return values(*columns, name=name).data([
+        tuple(row[col_name] for col_name in types) for row in rows
+    ])
+
+
+@compiles(Values, "sqlite")
+def _values_sqlite(element, compiler, asfrom=False, from_linter=None, **kw):
+    """
+    SQLite has no column list on a VALUES alias ("AS v (a, b)"), its columns
+    are column1, column2, ...: rename them in a subquery instead
+    Renders as: (SELECT column1 AS telegram_id, column2 AS seen_at FROM (VALUES (...), (...))) AS v
+    """
+    if not asfrom or element._unnamed:
+        return compiler.visit_values(element, asfrom=asfrom, from_linter=from_linter, **kw)
+    if from_linter:
+        from_linter.froms[element._de_clone()] = element.name
+
+    quote = compiler.preparer.quote
+    renamed = ", ".join(f"column{i} AS {quote(col.name)}" for i, col in enumerate(element.columns, 1))
+    return f"(SELECT {renamed} FROM ({compiler.visit_values(element, **kw)})) AS {quote(element.name)}"
@@ -0,0 +1,99 @@
+"""
+HyperLogLog cardinality sketch
+Estimates the number of distinct items in fixed memory (2^p bytes).
+Sketches with the same precision merge by taking the register-wise max,
+so a day's sketches can be unioned into a week or month without re-reading events.
+"""
+
+import hashlib
+import math
+import zlib
+
+DEFAULT_PRECISION = 12  # 4096 registers, ~1.6% standard error
+
+_POW2_NEG = [2.0 ** -r for r in range(65)]
+
+
+def _hash64(item) -> int:
+    """Stable 64-bit hash (Python's hash() is salted per process)"""
+    digest = hashlib.blake2b(str(item).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch
+
+    Example:
+        hll = HyperLogLog()
+        hll.add(123456)
+        hll.count()  # -> 1
+    """
+
+    def __init__(self, p: int = DEFAULT_PRECISION, registers: bytes = None):
+        if not 4 <= p <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(registers) if registers else bytearray(self.m)
+
+        if len(self.registers) != self.m:
+            raise ValueError("Register count doesn't match precision")
+
+    def add(self, item):
+        """Add an item (any value with a stable str())"""
+        h = _hash64(item)
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        # Position of the first 1-bit in the remaining 64-p bits
+        rank = (64 - self.p) - rest.bit_length() + 1
+
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog"):
+        """Union another sketch into this one (in place)"""
+        if other.p != self.p:
+            raise ValueError("Can't merge sketches with different precision")
+
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        """Estimated number of distinct items"""
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(_POW2_NEG[r] for r in self.registers)
+
+        # Small range correction: linear counting while registers are still empty
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+
+        return int(round(estimate))
+
+    def is_empty(self) -> bool:
+        return not any(self.registers)
+
+    def to_bytes(self) -> bytes:
+        """Compact serialized form: precision byte + zlib-compressed registers"""
+        return bytes([self.p]) + zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        return cls(p=data[0], registers=zlib.decompress(data[1:]))
+
+    @classmethod
+    def union(cls, sketches, p: int = DEFAULT_PRECISION) -> "HyperLogLog":
+        """Merge any number of sketches into a new one"""
+        result = cls(p=p)
+        for sketch in sketches:
+            result.merge(sketch)
+        return result
+
+    def __len__(self):
+        return self.count()
+
+    def __repr__(self):
+        return f"<HyperLogLog(p={self.p}, count~{self.count()})>"
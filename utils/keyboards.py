@@ -69,6 +69,17 @@ def get_message_actions_keyboard(sender_identifier: str):
     return InlineKeyboardMarkup(keyboard)
 
 
+def get_lists_keyboard():
+    """
+    Lists menu
+    """
+    keyboard = [
+        [InlineKeyboardButton("🔖 بوکمارک‌ها", callback_data="lists_bookmarks")],
+        [InlineKeyboardButton("🔙 برگشت به منوی اصلی", callback_data="back_to_main")]
+    ]
+    return InlineKeyboardMarkup(keyboard)
+
+
 def get_cafe_menu_keyboard():
     """
     Cafe menu - choose table
@@ -0,0 +1,160 @@
+"""
+In-memory metric counters for the admin dashboard
+Write paths call record()/record_distinct(); flush_metrics() folds the
+pending counts into metric_buckets with one upsert per kind
+"""
+
+import threading
+from datetime import datetime, timezone, timedelta
+
+# Bucket sizes in seconds
+GRANULARITIES = {
+    "minute": 60,
+    "hour": 3600
+}
+
+# Minute buckets are only useful for the recent past
+MINUTE_RETENTION = timedelta(hours=48)
+
+# Log event types that map to dashboard metrics
+LOG_EVENT_METRICS = {
+    "user_join": "signups"
+}
+
+# Pending additive counts: (granularity, bucket_start, metric) -> int
+_counters = {}
+
+# Distinct members of still-open buckets: (granularity, bucket_start, metric) -> set
+_distinct = {}
+
+_lock = threading.Lock()
+
+
+def bucket_start(at: datetime, granularity: str) -> datetime:
+    """Floor a timestamp to the start of its bucket (UTC)"""
+    size = GRANULARITIES[granularity]
+    epoch = int(at.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % size, tz=timezone.utc)
+
+
+def record(metric: str, amount: int = 1, at: datetime = None):
+    """Add `amount` to a counter metric in every granularity"""
+    at = at or datetime.now(timezone.utc)
+    with _lock:
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(at, granularity), metric)
+            _counters[key] = _counters.get(key, 0) + amount
+
+
+def record_distinct(metric: str, member, at: datetime = None):
+    """Record `member` (e.g. a telegram_id) for a distinct-count metric"""
+    at = at or datetime.now(timezone.utc)
+    with _lock:
+        for granularity in GRANULARITIES:
+            key = (granularity, bucket_start(at, granularity), metric)
+            _distinct.setdefault(key, set()).add(member)
+
+
+def record_log(event_type: str, telegram_id: int = None, success: bool = True):
+    """Feed metrics from a Log write"""
+    at = datetime.now(timezone.utc)
+    record("events", at=at)
+
+    if not success:
+        record("errors", at=at)
+
+    metric = LOG_EVENT_METRICS.get(event_type)
+    if metric:
+        record(metric, at=at)
+
+    if telegram_id:
+        record_distinct("active_users", telegram_id, at=at)
+
+
+def take_pending(now: datetime = None):
+    """
+    Swap out pending counts
+
+    Counter buckets are handed over and reset. Distinct buckets report
+    their current size; closed buckets are dropped after this report.
+
+    Returns:
+        (counter_rows, distinct_rows) as lists of dicts
+    """
+    now = now or datetime.now(timezone.utc)
+
+    with _lock:
+        counters = dict(_counters)
+        _counters.clear()
+
+        distinct = {}
+        for key, members in list(_distinct.items()):
+            granularity, start, _ = key
+            distinct[key] = len(members)
+            if start + timedelta(seconds=GRANULARITIES[granularity]) <= now:
+                del _distinct[key]
+
+    def to_rows(values):
+        return [
+            {"granularity": g, "bucket_start": s, "metric": m, "value": v}
+            for (g, s, m), v in values.items()
+        ]
+
+    return to_rows(counters), to_rows(distinct)
+
+
+def _restore(counter_rows):
+    """Put counts back after a failed flush so they are not lost"""
+    with _lock:
+        for row in counter_rows:
+            key = (row["granularity"], row["bucket_start"], row["metric"])
+            _counters[key] = _counters.get(key, 0) + row["value"]
+
+
+def flush_metrics():
+    """
+    Write pending counts to metric_buckets
+
+    Counters are added to the stored value, distinct counts keep the
+    larger of stored/pending (per process they only grow within a bucket).
+    """
+    from sqlalchemy.dialects.postgresql import insert
+    from database import Session
+    from models.metric import MetricBucket
+
+    counter_rows, distinct_rows = take_pending()
+    if not counter_rows and not distinct_rows:
+        return 0
+
+    db = Session()
+    try:
+        if counter_rows:
+            stmt = insert(MetricBucket).values(counter_rows)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["granularity", "bucket_start", "metric"],
+                set_={"value": MetricBucket.value + stmt.excluded.value}
+            ))
+
+        if distinct_rows:
+            from sqlalchemy import func
+            stmt = insert(MetricBucket).values(distinct_rows)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["granularity", "bucket_start", "metric"],
+                set_={"value": func.greatest(MetricBucket.value, stmt.excluded.value)}
+            ))
+
+        # Drop minute buckets that fell out of the retention window
+        db.query(MetricBucket).filter(
+            MetricBucket.granularity == "minute",
+            MetricBucket.bucket_start < datetime.now(timezone.utc) - MINUTE_RETENTION
+        ).delete(synchronize_session=False)
+
+        db.commit()
+        return len(counter_rows) + len(distinct_rows)
+    except Exception as e:
+        db.rollback()
+        _restore(counter_rows)
+        print(f"❌ Metrics flush failed: {e}")
+        return 0
+    finally:
+        db.close()
@@ -0,0 +1,64 @@
+"""
+Persian/English text normalization for search and filtering
+Unifies Arabic/Persian letter variants, digits, diacritics and ZWNJ
+so "كتاب", "کتاب" and "كِتاب" compare equal
+"""
+
+import re
+
+ZWNJ = "\u200c"
+
+# Arabic -> Persian letter variants (and a few common simplifications)
+_CHAR_MAP = {
+    "ي": "ی", "ى": "ی", "ئ": "ی",
+    "ك": "ک",
+    "ة": "ه", "ۀ": "ه",
+    "أ": "ا", "إ": "ا", "ٱ": "ا", "آ": "ا",
+    "ؤ": "و",
+}
+
+# Persian and Arabic-Indic digits -> ASCII
+for _i, _digit in enumerate("۰۱۲۳۴۵۶۷۸۹"):
+    _CHAR_MAP[_digit] = str(_i)
+for _i, _digit in enumerate("٠١٢٣٤٥٦٧٨٩"):
+    _CHAR_MAP[_digit] = str(_i)
+
+# Harakat, tanwin, superscript alef, tatweel and other invisible marks are dropped
+_DROP = (
+    [chr(c) for c in range(0x064B, 0x0660)]
+    + ["\u0670", "\u0640", "\u200d", "\u200e", "\u200f", "\ufeff"]
+)
+
+_TRANSLATE = str.maketrans({**_CHAR_MAP, **{c: None for c in _DROP}})
+
+_TOKEN_RE = re.compile(r"[\w\u200c]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for comparison (keeps ZWNJ, see tokenize())
+
+    Example:
+        normalize("كتابِ من") -> "کتاب من"
+    """
+    if not text:
+        return ""
+    return text.translate(_TRANSLATE).lower()
+
+
+def tokenize(text: str) -> list:
+    """
+    Split normalized text into search tokens
+
+    ZWNJ-joined words produce the joined form and each part, so
+    "کتاب‌ها" matches queries for "کتابها", "کتاب‌ها" and "کتاب".
+    """
+    tokens = []
+    for word in _TOKEN_RE.findall(normalize(text)):
+        if ZWNJ in word:
+            parts = [part for part in word.split(ZWNJ) if part]
+            tokens.append("".join(parts))
+            tokens.extend(parts)
+        elif word:
+            tokens.append(word)
+    return tokens
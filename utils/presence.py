@@ -0,0 +1,136 @@
+"""
+Active-user presence with HyperLogLog sketches
+mark_active() adds users to in-memory per-day/per-feature sketches;
+flush_presence() merges them into presence_sketches.
+DAU/WAU/MAU for any range is a union of at most one sketch per day.
+"""
+
+import threading
+from datetime import datetime, timezone, timedelta
+from utils.hyperloglog import HyperLogLog
+
+# Feature recorded for every active user
+ALL_USERS = "all"
+
+# Pending sketches: (day, feature) -> HyperLogLog
+_pending = {}
+_lock = threading.Lock()
+
+
+def today():
+    return datetime.now(timezone.utc).date()
+
+
+def mark_active(telegram_id: int, feature: str = None, day=None):
+    """Record a user as active today, overall and for `feature`"""
+    day = day or today()
+
+    with _lock:
+        for key in ((day, ALL_USERS), (day, feature)):
+            if key[1] is None:
+                continue
+            sketch = _pending.get(key)
+            if sketch is None:
+                sketch = _pending[key] = HyperLogLog()
+            sketch.add(telegram_id)
+
+
+def take_pending() -> dict:
+    global _pending
+
+    with _lock:
+        pending, _pending = _pending, {}
+
+    return pending
+
+
+def _restore(pending: dict):
+    """Merge sketches back after a failed flush"""
+    with _lock:
+        for key, sketch in pending.items():
+            if key in _pending:
+                _pending[key].merge(sketch)
+            else:
+                _pending[key] = sketch
+
+
+def flush_presence() -> int:
+    """
+    Merge pending sketches into the database
+
+    Each (day, feature) row is locked, merged and rewritten;
+    there are only a handful of rows per flush.
+
+    Returns:
+        Number of sketches written
+    """
+    from database import Session
+    from models.presence import PresenceSketch
+
+    pending = take_pending()
+    if not pending:
+        return 0
+
+    db = Session()
+    try:
+        for (day, feature), sketch in sorted(pending.items()):
+            row = db.query(PresenceSketch).filter(
+                PresenceSketch.day == day,
+                PresenceSketch.feature == feature
+            ).with_for_update().first()
+
+            if row:
+                merged = HyperLogLog.from_bytes(row.sketch).merge(sketch)
+                row.sketch = merged.to_bytes()
+            else:
+                db.add(PresenceSketch(day=day, feature=feature, sketch=sketch.to_bytes()))
+
+        db.commit()
+        return len(pending)
+    except Exception as e:
+        db.rollback()
+        _restore(pending)
+        print(f"❌ Presence flush failed: {e}")
+        return 0
+    finally:
+        db.close()
+
+
+def count_active(db, first_day, last_day, feature: str = ALL_USERS) -> int:
+    """
+    Estimated distinct active users between two days (inclusive)
+    Includes sketches that have not been flushed yet
+    """
+    from models.presence import PresenceSketch
+
+    sketches = [
+        HyperLogLog.from_bytes(row.sketch)
+        for row in PresenceSketch.get_range(db, feature, first_day, last_day)
+    ]
+
+    with _lock:
+        sketches += [
+            HyperLogLog(sketch.p, sketch.registers)
+            for (day, key_feature), sketch in _pending.items()
+            if key_feature == feature and first_day <= day <= last_day
+        ]
+
+    return HyperLogLog.union(sketches).count()
+
+
+def get_active_summary(db, feature: str = ALL_USERS, day=None) -> dict:
+    """DAU, WAU (7 days) and MAU (30 days) ending at `day`"""
+    day = day or today()
+
+    dau = count_active(db, day, day, feature)
+    wau = count_active(db, day - timedelta(days=6), day, feature)
+    mau = count_active(db, day - timedelta(days=29), day, feature)
+
+    return {
+        "feature": feature,
+        "day": day.isoformat(),
+        "dau": dau,
+        "wau": wau,
+        "mau": mau,
+        "stickiness": round(dau / mau, 3) if mau else 0.0
+    }
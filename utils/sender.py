@@ -0,0 +1,128 @@
+"""
+Rate-limited message sender for bulk deliveries (broadcasts, notifications)
+Runs on the background loop (utils/background.py) with its own Bot instance,
+so long deliveries never hold a webhook request.
+
+- global token bucket: stays under Telegram's ~30 messages/second
+- semaphore: caps requests in flight
+- RetryAfter: the whole sender pauses for the requested time, then retries
+"""
+
+import asyncio
+import logging
+import time
+from telegram import Bot
+from telegram.error import RetryAfter, Forbidden, BadRequest, TimedOut, NetworkError
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Delivery results
+SENT = "sent"
+BLOCKED = "blocked"  # User blocked the bot / deleted the account
+FAILED = "failed"
+
+MAX_ATTEMPTS = 3
+
+_bot = None
+
+
+async def get_bot() -> Bot:
+    """Bot instance owned by the background loop"""
+    global _bot
+    if _bot is None:
+        bot = Bot(Config.BOT_TOKEN)
+        await bot.initialize()
+        _bot = bot
+    return _bot
+
+
+class RateLimiter:
+    """Async token bucket: `rate` acquisitions per second, bursts up to `burst`"""
+
+    def __init__(self, rate: float, burst: int = None, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (flood control)"""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+        self.tokens = 0.0
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self.clock()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class Sender:
+    """
+    Example:
+        sender = get_sender()
+        result = await sender.send(lambda bot: bot.send_message(chat_id, "سلام"))
+    """
+
+    def __init__(self, rate: float = None, concurrency: int = None, bot: Bot = None):
+        self.limiter = RateLimiter(rate or Config.SENDER_RATE)
+        self.semaphore = asyncio.Semaphore(concurrency or Config.SENDER_CONCURRENCY)
+        self.bot = bot  # None = shared background Bot (tests pass a fake)
+
+    async def send(self, call) -> str:
+        """
+        Deliver one message
+
+        Args:
+            call: Function taking the Bot and returning the request coroutine
+
+        Returns:
+            SENT, BLOCKED or FAILED
+        """
+        bot = self.bot or await get_bot()
+        async with self.semaphore:
+            for attempt in range(MAX_ATTEMPTS):
+                await self.limiter.acquire()
+                try:
+                    await call(bot)
+                    return SENT
+                except RetryAfter as e:
+                    retry_after = e.retry_after
+                    if hasattr(retry_after, "total_seconds"):
+                        retry_after = retry_after.total_seconds()
+                    logger.warning(f"Flood control: pausing sender for {retry_after}s")
+                    self.limiter.pause(retry_after)
+                except Forbidden:
+                    return BLOCKED
+                except BadRequest as e:
+                    if "chat not found" in str(e).lower():
+                        return BLOCKED
+                    logger.warning(f"Send failed: {e}")
+                    return FAILED
+                except (TimedOut, NetworkError):
+                    await asyncio.sleep(2 ** attempt)
+            return FAILED
+
+
+_sender = None
+
+
+def get_sender() -> Sender:
+    """Shared sender, so every bulk delivery counts against one rate limit"""
+    global _sender
+    if _sender is None:
+        _sender = Sender()
+    return _sender
@@ -21,3 +21,36 @@ def is_share_code_unique(share_code: str, db) -> bool:
     from models.user import User
     existing = db.query(User).filter(User.share_code == share_code).first()
     return existing is None
+
+
+def generate_unique_share_codes(count: int, db) -> list:
+    """
+    Generate `count` unique share codes for bulk backfills
+    
+    Candidates are checked against the database as a set,
+    one query per round instead of one query per code.
+    
+    Args:
+        count: Number of codes needed
+        db: Database session
+        
+    Returns:
+        List of unique share codes
+    """
+    from models.user import User
+    
+    codes = set()
+    while len(codes) < count:
+        candidates = set()
+        while len(candidates) < count - len(codes):
+            code = generate_share_code()
+            if code not in codes:
+                candidates.add(code)
+        
+        taken = {
+            row[0] for row in
+            db.query(User.share_code).filter(User.share_code.in_(candidates))
+        }
+        codes |= candidates - taken
+    
+    return list(codes)
@@ -0,0 +1,107 @@
+"""
+SimHash fingerprints and a near-duplicate index
+Similar texts get 64-bit fingerprints a few bits apart, so "the same spam
+with one word changed" still matches. The index splits each fingerprint
+into (max_distance + 1) bands: two fingerprints within max_distance bits
+must agree exactly on at least one band, so a lookup is a handful of
+dict reads instead of a scan of every recent message. Buckets are per
+scope (e.g. per chat), which keeps them small even with narrow bands.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+
+BITS = 64
+_MASK = (1 << BITS) - 1
+
+
+def simhash(tokens) -> int:
+    """
+    64-bit SimHash of a token sequence (words and adjacent word pairs)
+
+    Uses Python's hash(), so fingerprints are only comparable within one process.
+    """
+    tokens = list(tokens)
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    if not features:
+        return 0
+
+    weights = [0] * BITS
+    for feature in features:
+        bits = format(hash(feature) & _MASK, "064b")
+        weights = [weight + 1 if bit == "1" else weight - 1 for weight, bit in zip(weights, bits)]
+
+    fingerprint = 0
+    for weight in weights:
+        fingerprint = (fingerprint << 1) | (weight > 0)
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """
+    Recent fingerprints per scope, with bounded memory
+
+    Example:
+        recent = NearDuplicateIndex(window=120)
+        recent.add(chat_id, simhash(words))  # -> near-duplicates already seen in the window
+    """
+
+    def __init__(self, window: float, max_distance: int = 3, bucket_size: int = 16,
+                 max_buckets: int = 200_000, clock=time.monotonic):
+        self.window = window
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = BITS // self.bands
+        self.bucket_size = bucket_size
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self._buckets = OrderedDict()  # (scope, band, value) -> deque[(fingerprint, seen_at, serial)]
+        self._serials = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def _keys(self, scope, fingerprint: int) -> list:
+        band_mask = (1 << self.band_bits) - 1
+        return [
+            (scope, band, (fingerprint >> (band * self.band_bits)) & band_mask)
+            for band in range(self.bands)
+        ]
+
+    def add(self, scope, fingerprint: int) -> int:
+        """
+        Record a fingerprint
+
+        Returns:
+            Number of near-duplicates recorded in the same scope within the window
+        """
+        now = self.clock()
+        since = now - self.window
+        matches = set()
+        entry = (fingerprint, now, next(self._serials))
+
+        with self._lock:
+            for key in self._keys(scope, fingerprint):
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = deque(maxlen=self.bucket_size)
+                else:
+                    self._buckets.move_to_end(key)
+                    for seen in bucket:
+                        if seen[1] >= since and (seen[0] ^ fingerprint).bit_count() <= self.max_distance:
+                            matches.add(seen)
+                bucket.append(entry)
+            self._evict(since)
+
+        return len(matches)
+
+    def _evict(self, since: float):
+        buckets = self._buckets
+        while buckets:
+            oldest = next(iter(buckets.values()))
+            if len(buckets) <= self.max_buckets and oldest[-1][1] >= since:
+                break
+            buckets.popitem(last=False)
@@ -0,0 +1,72 @@
+"""
+Sliding-window event counters with bounded memory
+Each key keeps two fixed buckets (previous and current window) and the
+rate is the current bucket plus the overlapping share of the previous
+one. A hit is O(1), and keys that fall out of the window, or beyond
+max_keys, are evicted least recently used first.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class SlidingWindowCounter:
+    """
+    Example:
+        flood = SlidingWindowCounter(window=10, max_keys=100_000)
+        flood.hit((chat_id, user_id))  # -> events in the last 10 seconds, this one included
+    """
+
+    def __init__(self, window: float, max_keys: int = 100_000, clock=time.monotonic):
+        self.window = window
+        self.max_keys = max_keys
+        self.clock = clock
+        self._data = OrderedDict()  # key -> [bucket, previous count, current count]
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def hit(self, key, amount: int = 1) -> float:
+        """Record an event and return the key's estimated count over the last window"""
+        position = self.clock() / self.window
+        bucket = int(position)
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                entry = self._data[key] = [bucket, 0, 0]
+            else:
+                self._data.move_to_end(key)
+                if entry[0] != bucket:
+                    entry[1] = entry[2] if entry[0] == bucket - 1 else 0
+                    entry[2] = 0
+                    entry[0] = bucket
+            entry[2] += amount
+            count = entry[1] * (1 - (position - bucket)) + entry[2]
+            self._evict(bucket)
+
+        return count
+
+    def count(self, key) -> float:
+        """Estimated count over the last window without recording an event"""
+        position = self.clock() / self.window
+        bucket = int(position)
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < bucket - 1:
+                return 0.0
+            if entry[0] == bucket:
+                return entry[1] * (1 - (position - bucket)) + entry[2]
+            return entry[2] * (1 - (position - bucket))
+
+    def _evict(self, bucket: int):
+        # Least recently hit first: stop at the first key still inside the window
+        data = self._data
+        while data:
+            oldest = next(iter(data.values()))
+            if len(data) <= self.max_keys and oldest[0] >= bucket - 1:
+                break
+            data.popitem(last=False)
@@ -10,6 +10,12 @@ STATE_NONE = "none"
 STATE_WAITING_MESSAGE = "waiting_message"
 STATE_WAITING_CONFIRMATION = "waiting_confirmation"
 STATE_WAITING_REPLY = "waiting_reply"
+STATE_LIBRARY_SEARCH = "library_search"
+STATE_RADIO_SEARCH = "radio_search"
+STATE_RADIO_CREATE = "radio_create"
+STATE_RADIO_POST = "radio_post"
+STATE_PLAYLIST_CREATE = "playlist_create"
+STATE_PLAYLIST_ADD = "playlist_add"
 
 
 def set_state(user_id: int, state: str, data: dict = None):
@@ -0,0 +1,71 @@
+"""
+Hashed timer wheel
+Deadlines are dropped into one of `slots` buckets by tick; advancing the
+clock only visits the buckets whose ticks have passed. Scheduling and
+cancelling are O(1) and there is no per-timer task or heap, so hundreds of
+thousands of pending deadlines cost one dict entry each. Deadlines further
+out than one turn of the wheel wait for their turn (the stored tick is
+compared on each visit).
+"""
+
+import threading
+import time
+
+
+class TimerWheel:
+    """
+    Example:
+        wheel = TimerWheel(tick=1.0, slots=128)
+        wheel.schedule("key", delay=90)
+        wheel.advance()  # -> keys whose deadline has passed
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 128, clock=time.monotonic):
+        self.tick = tick
+        self.clock = clock
+        self._slots = [{} for _ in range(slots)]  # key -> deadline tick
+        self._where = {}  # key -> slot index
+        self._current = int(clock() / tick)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._where)
+
+    def __contains__(self, key):
+        return key in self._where
+
+    def schedule(self, key, delay: float):
+        """(Re)schedule key to expire `delay` seconds from now"""
+        deadline = max(int((self.clock() + delay) / self.tick), self._current + 1)
+        with self._lock:
+            self._remove(key)
+            index = deadline % len(self._slots)
+            self._slots[index][key] = deadline
+            self._where[key] = index
+
+    def cancel(self, key) -> bool:
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key) -> bool:
+        index = self._where.pop(key, None)
+        if index is None:
+            return False
+        del self._slots[index][key]
+        return True
+
+    def advance(self) -> list:
+        """Move the wheel to the current time and return the keys that expired"""
+        now = int(self.clock() / self.tick)
+        expired = []
+        with self._lock:
+            # After a long pause, one full turn visits every slot
+            for current in range(self._current + 1, min(now, self._current + len(self._slots)) + 1):
+                slot = self._slots[current % len(self._slots)]
+                due = [key for key, deadline in slot.items() if deadline <= now]
+                for key in due:
+                    del slot[key]
+                    del self._where[key]
+                expired.extend(due)
+            self._current = max(self._current, now)
+        return expired